@@ -0,0 +1,765 @@
+"""
+Benchmarks do núcleo do Simplex.
+
+Uso::
+
+    python benchmark_simplex.py pivo --linhas 1000 --colunas 2000
+    python benchmark_simplex.py cenarios --cenarios 500
+    python benchmark_simplex.py fases --problemas 200 --escala 3
+    python benchmark_simplex.py precificacao --linhas 100 --colunas 300 --metodo revisado
+    python benchmark_simplex.py io --modelos 50
+    python benchmark_simplex.py suite --saida resultados.json
+    python benchmark_simplex.py comparar antes.json resultados.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from cenarios_simplex import solve_cenarios
+from esparso_simplex import MatrizCSC
+from modelo_io import ModeloPL, exportar_modelo, ler_modelo
+from nucleo_simplex import MotorPivo, _dual_factivel, _normalizar_restricoes, solve
+from precificacao_simplex import REGRAS
+
+# Métodos exercitados pela suíte; o automático mede também o roteamento
+METODOS_SUITE = ('primal', 'dual', 'big_m', 'duas_fases', 'revisado', 'automatico')
+FAMILIAS = ('denso', 'esparso', 'klee_minty', 'degenerado', 'dual', 'misto', 'infactivel', 'ilimitado', 'tuplas')
+
+# Tolerância relativa na comparação de Z com o valor de referência
+TOLERANCIA_Z = 1e-6
+
+
+def _pivot_por_linhas(tableau, pivot_row, pivot_col):
+    """
+    Pivoteamento de referência, linha a linha em Python (implementação original).
+
+    :param tableau: Matriz do tableau a ser modificada.
+    :type tableau: np.ndarray
+    :param pivot_row: Índice da linha do elemento pivô.
+    :type pivot_row: int
+    :param pivot_col: Índice da coluna do elemento pivô.
+    :type pivot_col: int
+    """
+    pivot_element = tableau[pivot_row, pivot_col]
+    tableau[pivot_row] /= pivot_element
+    for i in range(tableau.shape[0]):
+        if i != pivot_row:
+            tableau[i] -= tableau[i, pivot_col] * tableau[pivot_row]
+
+def _melhor_tempo(funcao, repeticoes):
+    """Executa ``funcao`` ``repeticoes`` vezes e devolve o menor tempo em segundos."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def bench_pivo(linhas=1000, colunas=2000, pivos=20, repeticoes=3, densidade=1.0, seed=0):
+    """
+    Compara o pivoteamento linha a linha com o :class:`MotorPivo` vetorizado.
+
+    Cada repetição aplica a mesma sequência de ``pivos`` pivoteamentos em uma
+    cópia de um tableau aleatório de ``(linhas + 1) x colunas``.
+
+    :param linhas: Número de restrições do tableau.
+    :type linhas: int
+    :param colunas: Número de colunas do tableau.
+    :type colunas: int
+    :param pivos: Pivoteamentos por repetição.
+    :type pivos: int
+    :param repeticoes: Repetições (o melhor tempo é reportado).
+    :type repeticoes: int
+    :param densidade: Fração de elementos não nulos do tableau.
+    :type densidade: float
+    :param seed: Semente do gerador aleatório.
+    :type seed: int
+    :return: Tempos por pivô (s), speedup e diferença máxima entre os resultados.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(1.0, 2.0, (linhas + 1, colunas))
+    if densidade < 1.0:
+        base *= rng.random(base.shape) < densidade
+    # Sequência de pivôs bem condicionada: linhas distintas, maior |elemento| na linha
+    pivos_rc = []
+    ensaio = base.copy()
+    livres = np.ones(colunas, dtype=bool)
+    for linha in 1 + rng.choice(linhas, size=min(pivos, linhas), replace=False):
+        coluna = int(np.argmax(np.where(livres, np.abs(ensaio[linha]), -1.0)))
+        livres[coluna] = False
+        pivos_rc.append((int(linha), coluna))
+        MotorPivo(ensaio).pivotar(linha, coluna)
+    pivos = len(pivos_rc)
+
+    resultados = {}
+
+    def por_linhas():
+        tableau = base.copy()
+        for linha, coluna in pivos_rc:
+            _pivot_por_linhas(tableau, linha, coluna)
+        resultados['linhas'] = tableau
+
+    def vetorizado():
+        tableau = base.copy()
+        motor = MotorPivo(tableau)
+        for linha, coluna in pivos_rc:
+            motor.pivotar(linha, coluna)
+        resultados['motor'] = tableau
+
+    t_linhas = _melhor_tempo(por_linhas, repeticoes) / pivos
+    t_motor = _melhor_tempo(vetorizado, repeticoes) / pivos
+    escala = np.maximum(1.0, np.abs(resultados['linhas']))
+    return {
+        'forma': (linhas + 1, colunas),
+        'densidade': densidade,
+        'pivo_por_linhas_s': t_linhas,
+        'pivo_motor_s': t_motor,
+        'speedup': t_linhas / t_motor,
+        'diferenca_max': float(np.max(np.abs(resultados['linhas'] - resultados['motor']) / escala)),
+    }
+
+def bench_cenarios(cenarios=500, linhas=30, colunas=40, seed=0):
+    """
+    Compara :func:`solve_cenarios` com um laço Python de :func:`solve` por cenário.
+
+    Os cenários variam o vetor ``b`` de um PL ``max cx, Ax <= b`` aleatório.
+
+    :param cenarios: Número de cenários.
+    :type cenarios: int
+    :param linhas: Número de restrições.
+    :type linhas: int
+    :param colunas: Número de variáveis.
+    :type colunas: int
+    :param seed: Semente do gerador aleatório.
+    :type seed: int
+    :return: Tempos totais (s), speedup e maior diferença de Z.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0.0, 1.0, (linhas, colunas))
+    B = rng.uniform(5.0, 15.0, (cenarios, linhas))
+    c = rng.uniform(1.0, 2.0, colunas)
+
+    inicio = time.perf_counter()
+    lote = solve_cenarios(c, A, B, mode='max')
+    t_lote = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    z_laco = np.array([solve(c, A, b, mode='max', method='big_m').z for b in B])
+    t_laco = time.perf_counter() - inicio
+    return {
+        'cenarios': cenarios,
+        'forma': (linhas, colunas),
+        'laco_s': t_laco,
+        'lote_s': t_lote,
+        'speedup': t_laco / t_lote,
+        'diferenca_z': float(np.max(np.abs(lote.z - z_laco))),
+    }
+
+def _problema_misto(rng, linhas, colunas, escala):
+    """
+    Gera um PL ``min cx`` factível e limitado com restrições '≤', '≥' e '='.
+
+    ``b`` é construído a partir de um ponto ``x0 >= 0`` e cada linha é multiplicada
+    por ``10**u``, com ``u`` uniforme em [-escala, escala], para simular modelos
+    mal escalados.
+    """
+    A = rng.uniform(-1.0, 3.0, (linhas, colunas))
+    x0 = rng.uniform(0.0, 5.0, colunas)
+    tipos = list(rng.choice(['≤', '≥', '='], size=linhas, p=[0.4, 0.4, 0.2]))
+    folga = rng.uniform(0.0, 2.0, linhas) * np.select([np.array(tipos) == '≤', np.array(tipos) == '≥'], [1.0, -1.0])
+    b = A @ x0 + folga
+    fator = 10.0 ** rng.uniform(-escala, escala, (linhas, 1))
+    c = rng.uniform(1.0, 10.0, colunas)
+    return c, A * fator, b * fator[:, 0], tipos
+
+def bench_fases(problemas=200, linhas=20, colunas=20, escala=0.0, seed=0):
+    """
+    Compara o Big M com as Duas Fases nos mesmos problemas mistos.
+
+    :param problemas: Número de problemas gerados.
+    :type problemas: int
+    :param linhas: Número de restrições.
+    :type linhas: int
+    :param colunas: Número de variáveis.
+    :type colunas: int
+    :param escala: Ordem de grandeza máxima do fator aplicado a cada linha.
+    :type escala: float
+    :param seed: Semente do gerador aleatório.
+    :type seed: int
+    :return: Iterações, tempos e falhas de cada método, e a maior diferença de Z.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+    modelos = [_problema_misto(rng, linhas, colunas, escala) for _ in range(problemas)]
+    relatorio = {'problemas': problemas, 'forma': (linhas, colunas), 'escala': escala}
+    valores = {}
+    for metodo in ('big_m', 'duas_fases'):
+        inicio = time.perf_counter()
+        resultados = [solve(c, A, b, tipos, 'min', method=metodo) for c, A, b, tipos in modelos]
+        relatorio[f'{metodo}_s'] = time.perf_counter() - inicio
+        relatorio[f'{metodo}_iteracoes'] = sum(r.iteracoes for r in resultados)
+        # Todos os problemas são factíveis e limitados: qualquer outro status é falha
+        relatorio[f'{metodo}_falhas'] = sum(not r.otimo for r in resultados)
+        valores[metodo] = np.array([r.z if r.otimo else np.nan for r in resultados])
+    relatorio['duas_fases_iteracoes_fase1'] = sum(r.estatisticas['iteracoes_fase1'] for r in resultados)
+    ambos = ~np.isnan(valores['big_m']) & ~np.isnan(valores['duas_fases'])
+    diferenca = np.abs(valores['big_m'] - valores['duas_fases'])[ambos] / np.maximum(1.0, np.abs(valores['duas_fases'][ambos]))
+    relatorio['diferenca_z'] = float(diferenca.max(initial=0.0))
+    return relatorio
+
+def bench_precificacao(problemas=10, linhas=100, colunas=200, metodo='primal', seed=0):
+    """
+    Compara as regras de precificação nos mesmos PLs ``max cx, Ax <= b`` aleatórios.
+
+    :param problemas: Número de problemas gerados.
+    :type problemas: int
+    :param linhas: Número de restrições.
+    :type linhas: int
+    :param colunas: Número de variáveis.
+    :type colunas: int
+    :param metodo: Método de :func:`solve` ('primal', 'duas_fases', 'revisado', ...).
+    :type metodo: str
+    :param seed: Semente do gerador aleatório.
+    :type seed: int
+    :return: Por regra: iterações, tempo total, tempo dentro da regra, ativações de
+        Bland e a maior diferença de Z em relação a Dantzig.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+    modelos = [(rng.uniform(1.0, 10.0, colunas), rng.uniform(0.0, 1.0, (linhas, colunas)),
+                rng.uniform(10.0, 100.0, linhas)) for _ in range(problemas)]
+    relatorio = {}
+    referencia = None
+    for nome in REGRAS:
+        inicio = time.perf_counter()
+        resultados = [solve(c, A, b, mode='max', method=metodo, precificacao=nome) for c, A, b in modelos]
+        z = np.array([r.z for r in resultados])
+        referencia = z if referencia is None else referencia
+        relatorio[nome] = {
+            'iteracoes': sum(r.iteracoes for r in resultados),
+            'tempo_s': time.perf_counter() - inicio,
+            'tempo_regra_s': sum(r.estatisticas['precificacao']['tempo_s'] for r in resultados),
+            'ativacoes_bland': sum(r.estatisticas['precificacao']['ativacoes_bland'] for r in resultados),
+            'diferenca_z': float(np.max(np.abs(z - referencia) / np.maximum(1.0, np.abs(referencia)))),
+        }
+    return relatorio
+
+def _modelo_aleatorio(rng, linhas, colunas, densidade):
+    """PL esparso com limites, inteiras e colunas vazias de custo zero (que a exportação não pode perder)."""
+    A = np.where(rng.random((linhas, colunas)) < densidade, rng.integers(-9, 10, (linhas, colunas)), 0).astype(float)
+    c = rng.uniform(-5.0, 5.0, colunas).round(3)
+    vazias = rng.random(colunas) < 0.2
+    A[:, vazias] = 0.0
+    c[vazias & (rng.random(colunas) < 0.5)] = 0.0
+    inferiores = np.where(rng.random(colunas) < 0.3, rng.integers(-3, 3, colunas), 0).astype(float)
+    superiores = inferiores + rng.integers(0, 10, colunas)
+    limites = [(float(l), None if rng.random() < 0.5 else float(u)) for l, u in zip(inferiores, superiores)]
+    return ModeloPL(
+        c=c, A=A, b=rng.uniform(-10.0, 50.0, linhas).round(2),
+        tipos=list(rng.choice(['≤', '≥', '='], linhas)),
+        modo=str(rng.choice(['max', 'min'])),
+        limites=limites if rng.random() < 0.7 else None,
+        inteiras=sorted(int(j) for j in np.flatnonzero(rng.random(colunas) < 0.2)),
+    )
+
+def _mesmo_modelo(original, lido):
+    """Confere se o modelo lido reproduz exatamente o exportado (o CSV não guarda limites, por isso fica de fora)."""
+    n = len(original.c)
+    padrao = [(0.0, None)] * n
+    A = lido.A.densa() if isinstance(lido.A, MatrizCSC) else np.asarray(lido.A, dtype=float)
+    return (lido.forma == original.forma and lido.modo == original.modo and list(lido.tipos) == list(original.tipos)
+            and np.array_equal(lido.c, original.c) and np.array_equal(A, original.A)
+            and np.array_equal(lido.b, original.b) and list(lido.inteiras) == list(original.inteiras)
+            and [(l or 0.0, u) for l, u in lido.limites or padrao] == [(l or 0.0, u) for l, u in original.limites or padrao])
+
+# Trechos LP com a leitura esperada (c, A, b), ou None se o leitor deve recusá-los
+CASOS_LP = (
+    ("Maximize\n obj: x + y\nSubject To\n c1: x + y + 2 <= 4\nEnd\n", ([1, 1], [[1, 1]], [2])),
+    ("Maximize\n obj: x\nSubject To\n c1: - 2 + x - y - 3.5 >= -1\nEnd\n", ([1, 0], [[1, -1]], [4.5])),
+    ("Maximize\n obj: 3 x + 2 y + 10\nSubject To\n c1: x + y <= 4\nEnd\n", None),
+    ("Maximize\n obj: x + y\nSubject To\n c1: 3 x 2 y <= 6\nEnd\n", None),
+)
+
+def _casos_lp_errados():
+    """Quantos trechos de :data:`CASOS_LP` o leitor LP interpreta diferente do esperado."""
+    erros = 0
+    for texto, esperado in CASOS_LP:
+        try:
+            lido = ler_modelo(texto, 'lp', densa=True)
+        except ValueError:
+            erros += esperado is not None
+            continue
+        erros += esperado is None or not all(np.array_equal(np.asarray(a, dtype=float), v)
+                                             for a, v in zip((lido.c, lido.A, lido.b), esperado))
+    return erros
+
+def bench_io(modelos=50, linhas=40, colunas=60, densidade=0.1, formatos=('mps', 'lp'), seed=0):
+    """
+    Ida e volta :func:`modelo_io.exportar_modelo` → :func:`modelo_io.ler_modelo` em cada formato.
+
+    :param modelos: Número de modelos gerados.
+    :type modelos: int
+    :param linhas: Número de restrições.
+    :type linhas: int
+    :param colunas: Número de variáveis.
+    :type colunas: int
+    :param densidade: Fração de coeficientes não nulos de A.
+    :type densidade: float
+    :param formatos: Formatos exercitados.
+    :type formatos: tuple[str]
+    :param seed: Semente do gerador aleatório.
+    :type seed: int
+    :return: Por formato: tempos de escrita e leitura e modelos que não voltaram iguais;
+        no LP, também os trechos de :data:`CASOS_LP` lidos errado.
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+    casos = [_modelo_aleatorio(rng, linhas, colunas, densidade) for _ in range(modelos)]
+    relatorio = {}
+    for formato in formatos:
+        escrita = leitura = 0.0
+        falhas = 0
+        for modelo in casos:
+            inicio = time.perf_counter()
+            conteudo = exportar_modelo(modelo, formato)
+            meio = time.perf_counter()
+            try:
+                lido = ler_modelo(conteudo, formato, densa=True)
+            except ValueError:
+                lido = None
+            leitura += time.perf_counter() - meio
+            escrita += meio - inicio
+            falhas += lido is None or not _mesmo_modelo(modelo, lido)
+        relatorio[formato] = {'escrita_s': escrita, 'leitura_s': leitura, 'falhas': falhas}
+    if 'lp' in relatorio:
+        relatorio['lp']['casos_lp_errados'] = _casos_lp_errados()
+    return relatorio
+
+# ============================================================
+# Suíte reprodutível
+# ============================================================
+
+def _pl_com_otimo(rng, A, tipos, modo, degenerado=False):
+    """
+    Completa ``A`` e ``tipos`` com ``c`` e ``b`` cujo ótimo é conhecido por construção.
+
+    Sorteia um ponto ``x* >= 0`` e duais ``y*`` com o sinal exigido por cada tipo
+    ('≤': y ≥ 0, '≥': y ≤ 0, '=': livre) e impõe as folgas complementares: restrições
+    com dual não nulo ficam ativas e ``c = Aᵀy* - r`` com ``r >= 0`` nulo onde
+    ``x* > 0``. Pela dualidade forte, Z* = c·x*. Com ``degenerado``, metade das folgas
+    primais e duais que poderiam ser positivas é zerada.
+
+    :return: ``c``, ``b`` e o valor ótimo de referência.
+    :rtype: tuple(np.ndarray, np.ndarray, float)
+    """
+    m, n = A.shape
+    tipos = np.array(tipos)
+    produto = A.matvec if isinstance(A, MatrizCSC) else A.__matmul__
+    transposto = A.rmatvec if isinstance(A, MatrizCSC) else A.T.__matmul__
+
+    x = rng.uniform(1.0, 5.0, n) * (rng.random(n) < 0.5)
+    ativa = (rng.random(m) < 0.5) | (tipos == '=')
+    y = rng.uniform(1.0, 3.0, m) * ativa * np.select([tipos == '≤', tipos == '≥'], [1.0, -1.0], 1.0)
+    folga = rng.uniform(1.0, 5.0, m) * ~ativa
+    custo_reduzido = rng.uniform(1.0, 3.0, n) * (x == 0)
+    if degenerado:
+        folga *= rng.random(m) < 0.5
+        custo_reduzido *= rng.random(n) < 0.5
+
+    b = produto(x) + folga * np.select([tipos == '≤', tipos == '≥'], [1.0, -1.0], 0.0)
+    c = transposto(y) - custo_reduzido
+    if modo == 'min':
+        # min c'x = -max(-c'x): o mesmo ponto é ótimo para c' = -c
+        return -c, b, -float(c @ x)
+    return c, b, float(c @ x)
+
+def _caso(nome, familia, c, A, b, tipos, modo, status='otimo', z=None):
+    return {'nome': nome, 'familia': familia, 'c': np.asarray(c, dtype=float), 'A': A,
+            'b': np.asarray(b, dtype=float), 'tipos': list(tipos), 'modo': modo, 'status': status, 'z': z}
+
+def gerar_klee_minty(dimensao):
+    """
+    Cubo de Klee–Minty: ``max Σ 2^(d-j) x_j`` com ``2 Σ_{j<i} 2^(i-j) x_j + x_i <= 5^i``.
+
+    A regra de Dantzig visita os 2^d vértices; o ótimo é Z* = 5^d.
+
+    :param dimensao: Número de variáveis (e de restrições) ``d``.
+    :type dimensao: int
+    :rtype: dict
+    """
+    i, j = np.indices((dimensao, dimensao))
+    A = np.where(j < i, 2.0 ** (i - j + 1), 0.0) + np.eye(dimensao)
+    c = 2.0 ** np.arange(dimensao - 1, -1, -1)
+    b = 5.0 ** np.arange(1, dimensao + 1)
+    return _caso(f'klee_minty-{dimensao}', 'klee_minty', c, A, b, ['≤'] * dimensao, 'max', z=5.0 ** dimensao)
+
+def gerar_caso(familia, rng, linhas, colunas, densidade=0.05, indice=0):
+    """
+    Gera um caso da suíte com resultado de referência conhecido.
+
+    * ``denso``: ``max cx, Ax <= b`` com A densa não negativa (base de folgas factível).
+    * ``esparso``: como ``denso``, com A esparsa (:class:`MatrizCSC`) de ``densidade`` dada.
+    * ``degenerado``: A inteira pequena e folgas primais e duais zeradas (pivôs degenerados).
+    * ``dual``: ``min cx, Ax >= b`` com c >= 0 (base dual-factível, como em problemas de dieta).
+    * ``misto``: ``min cx`` com '≤', '≥' e '=' e coeficientes de sinal misto (Big M / Duas Fases).
+    * ``infactivel``: ``denso`` com o par contraditório ``Σx <= 1`` e ``Σx >= 2``.
+    * ``ilimitado``: ``denso`` com uma coluna lucrativa sem coeficientes positivos.
+    * ``tuplas``: ``denso`` com 3 linhas dadas como tupla de tuplas, que não pode ser
+      confundida com triplas ``(linhas, colunas, valores)``.
+
+    :param familia: Uma de :data:`FAMILIAS` (exceto ``klee_minty``, ver :func:`gerar_klee_minty`).
+    :type familia: str
+    :param rng: Gerador aleatório (a semente define o caso).
+    :type rng: np.random.Generator
+    :param linhas: Número de restrições.
+    :type linhas: int
+    :param colunas: Número de variáveis.
+    :type colunas: int
+    :param densidade: Fração de não nulos da família ``esparso``.
+    :type densidade: float
+    :param indice: Índice do caso dentro da família (compõe o nome).
+    :type indice: int
+    :rtype: dict
+    """
+    nome = f'{familia}-{indice}'
+    if familia == 'esparso':
+        nnz = max(1, int(densidade * linhas * colunas))
+        A = MatrizCSC.de_triplas(rng.integers(0, linhas, nnz), rng.integers(0, colunas, nnz),
+                                 rng.uniform(0.1, 1.0, nnz), (linhas, colunas))
+        c, b, z = _pl_com_otimo(rng, A, ['≤'] * linhas, 'max')
+        return _caso(nome, familia, c, A, b, ['≤'] * linhas, 'max', z=z)
+    if familia == 'degenerado':
+        A = rng.integers(0, 3, (linhas, colunas)).astype(float)
+        c, b, z = _pl_com_otimo(rng, A, ['≤'] * linhas, 'max', degenerado=True)
+        return _caso(nome, familia, c, A, b, ['≤'] * linhas, 'max', z=z)
+    if familia == 'dual':
+        A = rng.uniform(0.0, 1.0, (linhas, colunas))
+        c, b, z = _pl_com_otimo(rng, A, ['≥'] * linhas, 'min')
+        return _caso(nome, familia, c, A, b, ['≥'] * linhas, 'min', z=z)
+    if familia == 'misto':
+        A = rng.uniform(-1.0, 3.0, (linhas, colunas))
+        tipos = list(rng.choice(['≤', '≥', '='], size=linhas, p=[0.4, 0.4, 0.2]))
+        c, b, z = _pl_com_otimo(rng, A, tipos, 'min')
+        return _caso(nome, familia, c, A, b, tipos, 'min', z=z)
+    if familia == 'tuplas':
+        A = rng.uniform(0.0, 1.0, (3, colunas))
+        c, b, z = _pl_com_otimo(rng, A, ['≤'] * 3, 'max')
+        return _caso(nome, familia, c, tuple(map(tuple, A)), b, ['≤'] * 3, 'max', z=z)
+
+    A = rng.uniform(0.0, 1.0, (linhas, colunas))
+    c, b, z = _pl_com_otimo(rng, A, ['≤'] * linhas, 'max')
+    if familia == 'denso':
+        return _caso(nome, familia, c, A, b, ['≤'] * linhas, 'max', z=z)
+    if familia == 'infactivel':
+        A = np.vstack([A, np.ones(colunas), np.ones(colunas)])
+        return _caso(nome, familia, c, A, np.append(b, [1.0, 2.0]), ['≤'] * linhas + ['≤', '≥'], 'max',
+                     status='infactivel')
+    if familia == 'ilimitado':
+        j = rng.integers(colunas)
+        A[:, j] = -rng.uniform(0.0, 1.0, linhas)
+        c[j] = rng.uniform(1.0, 3.0)
+        return _caso(nome, familia, c, A, b, ['≤'] * linhas, 'max', status='ilimitado')
+    raise ValueError(f"Família desconhecida: {familia!r}. Use uma de {FAMILIAS}.")
+
+def _aplicavel(metodo, caso):
+    """
+    Indica se ``metodo`` pode ser chamado diretamente no caso: o Primal exige uma base
+    de folgas factível e o Dual, uma linha Z inicial dual-factível; nenhum aceita '='.
+    """
+    if metodo not in ('primal', 'dual'):
+        return True
+    if '=' in caso['tipos']:
+        return False
+    if metodo == 'dual':
+        return _dual_factivel(caso['c'], caso['modo'])
+    A = caso['A'].densa() if isinstance(caso['A'], MatrizCSC) else caso['A']
+    _, b_norm, _ = _normalizar_restricoes(A, caso['b'], caso['tipos'])
+    return bool(np.all(b_norm >= 0))
+
+def medir_caso(caso, metodo, repeticoes=3, precificacao='dantzig'):
+    """
+    Resolve ``caso`` com ``metodo`` (sem interface) e mede tempo, iterações e memória.
+
+    O tempo é o melhor de ``repeticoes`` execuções; o pico de memória vem de uma
+    execução separada sob :mod:`tracemalloc`, que não entra na medição de tempo.
+
+    :param caso: Caso gerado por :func:`gerar_caso` ou :func:`gerar_klee_minty`.
+    :type caso: dict
+    :param metodo: Método de :func:`solve`.
+    :type metodo: str
+    :param repeticoes: Execuções cronometradas.
+    :type repeticoes: int
+    :param precificacao: Regra de precificação.
+    :type precificacao: str
+    :return: Status, Z, iterações, tempo, pivôs por segundo, pico de memória e se o
+        resultado confere com a referência do caso.
+    :rtype: dict
+    """
+    def resolver():
+        return solve(caso['c'], caso['A'], caso['b'], caso['tipos'], caso['modo'], method=metodo,
+                     precificacao=precificacao)
+
+    resultado = resolver()
+    tempo = _melhor_tempo(resolver, repeticoes)
+    tracemalloc.start()
+    try:
+        resolver()
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    correto = resultado.status == caso['status']
+    erro_z = None
+    if correto and caso['z'] is not None:
+        erro_z = abs(resultado.z - caso['z']) / max(1.0, abs(caso['z']))
+        correto = erro_z <= TOLERANCIA_Z
+    return {
+        'caso': caso['nome'],
+        'familia': caso['familia'],
+        'metodo': metodo,
+        'metodo_executado': resultado.metodo,
+        'forma': list(np.shape(caso['A'].densa() if isinstance(caso['A'], MatrizCSC) else caso['A'])),
+        'status': resultado.status,
+        'z': resultado.z,
+        'z_referencia': caso['z'],
+        'erro_z': erro_z,
+        'correto': bool(correto),
+        'iteracoes': resultado.iteracoes,
+        'tempo_s': tempo,
+        'pivos_por_s': resultado.iteracoes / tempo if tempo > 0 else None,
+        'pico_memoria_kb': pico / 1024,
+    }
+
+def _versao_do_codigo():
+    """Commit atual do repositório (None fora de um repositório git)."""
+    try:
+        saida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                               capture_output=True, text=True, check=True)
+        return saida.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def bench_suite(linhas=30, colunas=40, instancias=3, klee_minty=(6, 8, 10), densidade=0.05,
+                metodos=METODOS_SUITE, familias=FAMILIAS, repeticoes=3, precificacao='dantzig', seed=0):
+    """
+    Executa a suíte reprodutível: cada família de casos contra cada método aplicável.
+
+    Os casos são gerados a partir de ``seed`` (o mesmo conjunto a cada execução) e
+    trazem o status e o Z de referência, de modo que cada medição também confere a
+    resposta. O relatório é serializável em JSON para comparar commits
+    (ver :func:`comparar_suites`).
+
+    :param linhas: Número de restrições dos casos aleatórios.
+    :type linhas: int
+    :param colunas: Número de variáveis dos casos aleatórios.
+    :type colunas: int
+    :param instancias: Casos aleatórios por família.
+    :type instancias: int
+    :param klee_minty: Dimensões dos cubos de Klee–Minty.
+    :type klee_minty: tuple[int]
+    :param densidade: Fração de não nulos da família ``esparso``.
+    :type densidade: float
+    :param metodos: Métodos de :func:`solve` a medir.
+    :type metodos: tuple[str]
+    :param familias: Famílias de casos (ver :data:`FAMILIAS`).
+    :type familias: tuple[str]
+    :param repeticoes: Execuções cronometradas por medição.
+    :type repeticoes: int
+    :param precificacao: Regra de precificação.
+    :type precificacao: str
+    :param seed: Semente dos geradores.
+    :type seed: int
+    :return: Metadados do ambiente, parâmetros e uma entrada por (caso, método).
+    :rtype: dict
+    """
+    casos = []
+    for familia in familias:
+        if familia == 'klee_minty':
+            casos.extend(gerar_klee_minty(d) for d in klee_minty)
+            continue
+        # Uma semente por família: incluir ou excluir famílias não altera os demais casos
+        rng = np.random.default_rng([seed, FAMILIAS.index(familia)])
+        casos.extend(gerar_caso(familia, rng, linhas, colunas, densidade, k) for k in range(instancias))
+
+    resultados = [medir_caso(caso, metodo, repeticoes, precificacao)
+                  for caso in casos for metodo in metodos if _aplicavel(metodo, caso)]
+    return {
+        'meta': {
+            'commit': _versao_do_codigo(),
+            'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+        },
+        'parametros': {
+            'linhas': linhas, 'colunas': colunas, 'instancias': instancias, 'klee_minty': list(klee_minty),
+            'densidade': densidade, 'metodos': list(metodos), 'familias': list(familias),
+            'repeticoes': repeticoes, 'precificacao': precificacao, 'seed': seed,
+        },
+        'resultados': resultados,
+    }
+
+def comparar_suites(antes, depois, limiar=1.10):
+    """
+    Compara dois relatórios de :func:`bench_suite` medição a medição.
+
+    :param antes: Relatório de referência (ex.: do commit anterior).
+    :type antes: dict
+    :param depois: Relatório novo.
+    :type depois: dict
+    :param limiar: Razão de tempo acima da qual a medição é marcada como regressão.
+    :type limiar: float
+    :return: Uma entrada por (caso, método) presente nos dois relatórios, com a razão
+        de tempo, a diferença de iterações e os indicadores de regressão e de erro.
+    :rtype: list[dict]
+    """
+    anteriores = {(r['caso'], r['metodo']): r for r in antes['resultados']}
+    comparacao = []
+    for novo in depois['resultados']:
+        velho = anteriores.get((novo['caso'], novo['metodo']))
+        if velho is None:
+            continue
+        razao = novo['tempo_s'] / velho['tempo_s'] if velho['tempo_s'] > 0 else float('inf')
+        comparacao.append({
+            'caso': novo['caso'],
+            'metodo': novo['metodo'],
+            'razao_tempo': razao,
+            'delta_iteracoes': novo['iteracoes'] - velho['iteracoes'],
+            'regressao': razao > limiar,
+            'passou_a_errar': velho['correto'] and not novo['correto'],
+        })
+    return comparacao
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do núcleo do Simplex.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_pivo = sub.add_parser('pivo', help="Micro-benchmark do pivoteamento.")
+    p_pivo.add_argument('--linhas', type=int, default=1000)
+    p_pivo.add_argument('--colunas', type=int, default=2000)
+    p_pivo.add_argument('--pivos', type=int, default=20)
+    p_pivo.add_argument('--repeticoes', type=int, default=3)
+    p_pivo.add_argument('--densidade', type=float, default=1.0)
+    p_pivo.add_argument('--seed', type=int, default=0)
+
+    p_cen = sub.add_parser('cenarios', help="Lote de cenários contra laço de solve().")
+    p_cen.add_argument('--cenarios', type=int, default=500)
+    p_cen.add_argument('--linhas', type=int, default=30)
+    p_cen.add_argument('--colunas', type=int, default=40)
+    p_cen.add_argument('--seed', type=int, default=0)
+
+    p_fases = sub.add_parser('fases', help="Big M contra Duas Fases em problemas mistos.")
+    p_fases.add_argument('--problemas', type=int, default=200)
+    p_fases.add_argument('--linhas', type=int, default=20)
+    p_fases.add_argument('--colunas', type=int, default=20)
+    p_fases.add_argument('--escala', type=float, default=0.0)
+    p_fases.add_argument('--seed', type=int, default=0)
+
+    p_prec = sub.add_parser('precificacao', help="Iterações e tempo de cada regra de precificação.")
+    p_prec.add_argument('--problemas', type=int, default=10)
+    p_prec.add_argument('--linhas', type=int, default=100)
+    p_prec.add_argument('--colunas', type=int, default=200)
+    p_prec.add_argument('--metodo', default='primal')
+    p_prec.add_argument('--seed', type=int, default=0)
+
+    p_io = sub.add_parser('io', help="Ida e volta exportar/ler modelos em MPS e LP.")
+    p_io.add_argument('--modelos', type=int, default=50)
+    p_io.add_argument('--linhas', type=int, default=40)
+    p_io.add_argument('--colunas', type=int, default=60)
+    p_io.add_argument('--densidade', type=float, default=0.1)
+    p_io.add_argument('--seed', type=int, default=0)
+
+    p_suite = sub.add_parser('suite', help="Suíte reprodutível: famílias de casos contra cada método, em JSON.")
+    p_suite.add_argument('--linhas', type=int, default=30)
+    p_suite.add_argument('--colunas', type=int, default=40)
+    p_suite.add_argument('--instancias', type=int, default=3)
+    p_suite.add_argument('--klee-minty', type=int, nargs='*', default=[6, 8, 10])
+    p_suite.add_argument('--densidade', type=float, default=0.05)
+    p_suite.add_argument('--metodos', nargs='+', default=list(METODOS_SUITE), choices=METODOS_SUITE)
+    p_suite.add_argument('--familias', nargs='+', default=list(FAMILIAS), choices=FAMILIAS)
+    p_suite.add_argument('--repeticoes', type=int, default=3)
+    p_suite.add_argument('--precificacao', default='dantzig', choices=list(REGRAS))
+    p_suite.add_argument('--seed', type=int, default=0)
+    p_suite.add_argument('--saida', help="Arquivo JSON com o relatório completo.")
+
+    p_comp = sub.add_parser('comparar', help="Compara dois relatórios JSON da suíte.")
+    p_comp.add_argument('antes')
+    p_comp.add_argument('depois')
+    p_comp.add_argument('--limiar', type=float, default=1.10)
+
+    args = parser.parse_args(argv)
+    if args.comando == 'pivo':
+        r = bench_pivo(args.linhas, args.colunas, args.pivos, args.repeticoes, args.densidade, args.seed)
+        print(f"Tableau {r['forma'][0]}x{r['forma'][1]} (densidade {r['densidade']:.2f})")
+        print(f"  linha a linha : {r['pivo_por_linhas_s'] * 1e3:8.2f} ms/pivô")
+        print(f"  MotorPivo     : {r['pivo_motor_s'] * 1e3:8.2f} ms/pivô")
+        print(f"  speedup       : {r['speedup']:8.1f}x  (diferença máx. {r['diferenca_max']:.1e})")
+    elif args.comando == 'cenarios':
+        r = bench_cenarios(args.cenarios, args.linhas, args.colunas, args.seed)
+        print(f"{r['cenarios']} cenários de {r['forma'][0]}x{r['forma'][1]}")
+        print(f"  laço de solve() : {r['laco_s']:8.3f} s")
+        print(f"  solve_cenarios  : {r['lote_s']:8.3f} s")
+        print(f"  speedup         : {r['speedup']:8.1f}x  (diferença máx. de Z {r['diferenca_z']:.1e})")
+    elif args.comando == 'fases':
+        r = bench_fases(args.problemas, args.linhas, args.colunas, args.escala, args.seed)
+        print(f"{r['problemas']} problemas mistos de {r['forma'][0]}x{r['forma'][1]} (escala 10^±{r['escala']:g})")
+        print(f"  Big M      : {r['big_m_iteracoes']:6d} iterações  {r['big_m_s']:7.3f} s  {r['big_m_falhas']} falha(s)")
+        print(f"  Duas Fases : {r['duas_fases_iteracoes']:6d} iterações  {r['duas_fases_s']:7.3f} s  "
+              f"{r['duas_fases_falhas']} falha(s)  (Fase I: {r['duas_fases_iteracoes_fase1']})")
+        print(f"  diferença máx. de Z (relativa): {r['diferenca_z']:.1e}")
+    elif args.comando == 'precificacao':
+        r = bench_precificacao(args.problemas, args.linhas, args.colunas, args.metodo, args.seed)
+        print(f"{args.problemas} problemas de {args.linhas}x{args.colunas} ({args.metodo})")
+        for nome, est in r.items():
+            print(f"  {nome:14s}: {est['iteracoes']:6d} iterações  {est['tempo_s']:7.3f} s  "
+                  f"(regra {est['tempo_regra_s']:6.3f} s, Bland {est['ativacoes_bland']})  "
+                  f"diferença de Z {est['diferenca_z']:.1e}")
+    elif args.comando == 'io':
+        r = bench_io(args.modelos, args.linhas, args.colunas, args.densidade, seed=args.seed)
+        print(f"{args.modelos} modelos de {args.linhas}x{args.colunas} (densidade {args.densidade:.2f})")
+        for formato, est in r.items():
+            print(f"  {formato:4s}: escrita {est['escrita_s']:7.3f} s  leitura {est['leitura_s']:7.3f} s  "
+                  f"{est['falhas']} modelo(s) diferente(s) após ida e volta")
+        if 'lp' in r:
+            print(f"  {r['lp']['casos_lp_errados']} de {len(CASOS_LP)} trecho(s) LP de referência lido(s) errado")
+    elif args.comando == 'suite':
+        r = bench_suite(args.linhas, args.colunas, args.instancias, tuple(args.klee_minty), args.densidade,
+                        tuple(args.metodos), tuple(args.familias), args.repeticoes, args.precificacao, args.seed)
+        print(f"Suíte (seed {args.seed}, commit {r['meta']['commit'] or '?'}): {len(r['resultados'])} medições")
+        print(f"  {'caso':16s} {'método':11s} {'status':10s} {'iter.':>6s} {'tempo (ms)':>11s} "
+              f"{'pivôs/s':>9s} {'memória (KB)':>13s}")
+        for m in r['resultados']:
+            pivos = f"{m['pivos_por_s']:9.0f}" if m['pivos_por_s'] is not None else f"{'-':>9s}"
+            print(f"  {m['caso']:16s} {m['metodo']:11s} {m['status']:10s} {m['iteracoes']:6d} "
+                  f"{m['tempo_s'] * 1e3:11.2f} {pivos} {m['pico_memoria_kb']:13.1f}"
+                  f"{'' if m['correto'] else '  ✗ difere da referência'}")
+        erros = sum(not m['correto'] for m in r['resultados'])
+        print(f"  {erros} resultado(s) diferente(s) da referência")
+        if args.saida:
+            Path(args.saida).write_text(json.dumps(r, indent=2, ensure_ascii=False), encoding='utf-8')
+            print(f"  relatório salvo em {args.saida}")
+    elif args.comando == 'comparar':
+        antes = json.loads(Path(args.antes).read_text(encoding='utf-8'))
+        depois = json.loads(Path(args.depois).read_text(encoding='utf-8'))
+        comparacao = comparar_suites(antes, depois, args.limiar)
+        print(f"{antes['meta']['commit'] or '?'} → {depois['meta']['commit'] or '?'}: "
+              f"{len(comparacao)} medições em comum")
+        for c in comparacao:
+            marca = ' ✗ passou a errar' if c['passou_a_errar'] else ' ⚠ regressão' if c['regressao'] else ''
+            print(f"  {c['caso']:16s} {c['metodo']:11s} {c['razao_tempo']:6.2f}x  "
+                  f"Δ iterações {c['delta_iteracoes']:+d}{marca}")
+        tempos = [c['razao_tempo'] for c in comparacao]
+        if tempos:
+            print(f"  média geométrica da razão de tempo: {np.exp(np.mean(np.log(tempos))):.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+Cache de resoluções indexado pela impressão digital canônica do problema.
+
+A chave é um SHA-256 de (c, A, b, tipos, mode, method) e de eventuais opções
+extras da resolução, calculado sobre uma representação canônica: A é sempre
+convertida para CSC (a mesma matriz densa ou esparsa gera a mesma chave) e
+``-0.0`` é normalizado para ``0.0``. O cache guarda o :class:`ResultadoSimplex`
+completo, com o ``trace``, e descarta o item menos usado recentemente (LRU)
+quando atinge a capacidade.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from esparso_simplex import MatrizCSC
+from nucleo_simplex import solve
+
+# Opções que acompanham a execução sem alterar um resultado guardado (os interrompidos
+# pelo tempo ou por cancelamento não são guardados)
+_FORA_DA_CHAVE = ('observador', 'cancelamento', 'tempo_limite')
+# Status que dependem do instante da interrupção, e não só do problema
+_NAO_GUARDADOS = ('limite_tempo', 'cancelado')
+
+
+def _atualizar_com_array(h, nome, v):
+    """Acrescenta ao hash o nome, a forma e os bytes canônicos de ``v``."""
+    v = np.ascontiguousarray(v)
+    if v.dtype.kind == 'f':
+        v = v.astype(np.float64) + 0.0   # normaliza -0.0
+    h.update(f"{nome}:{v.dtype.str}:{v.shape};".encode())
+    h.update(v.tobytes())
+
+def impressao_digital(c, A, b, tipos, mode, method, **extras):
+    """
+    Calcula a chave canônica de um problema.
+
+    :param c: Coeficientes da função objetivo.
+    :param A: Matriz de restrições (densa ou esparsa).
+    :param b: Termos independentes.
+    :param tipos: Tipos das restrições (None equivale a todas '≤').
+    :type tipos: list[str] or None
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param method: Método de resolução.
+    :type method: str
+    :param extras: Opções adicionais que alteram o resultado (ex.: ``trace``).
+    :return: Hash SHA-256 em hexadecimal.
+    :rtype: str
+    """
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    A = MatrizCSC.converter(A, (len(b), len(c)))
+    tipos = ['≤'] * len(b) if tipos is None else list(tipos)
+
+    h = hashlib.sha256()
+    _atualizar_com_array(h, 'c', c)
+    _atualizar_com_array(h, 'b', b)
+    h.update(f"A:{A.shape};".encode())
+    _atualizar_com_array(h, 'indptr', A.indptr)
+    _atualizar_com_array(h, 'indices', A.indices)
+    _atualizar_com_array(h, 'data', A.data)
+    h.update(f"tipos:{'|'.join(tipos)};mode:{mode};method:{method};".encode())
+    for chave in sorted(extras):
+        valor = extras[chave]
+        if isinstance(valor, (list, tuple)):
+            valor = '|'.join(map(str, valor))
+        h.update(f"{chave}:{valor};".encode())
+    return h.hexdigest()
+
+
+class CacheSimplex:
+    """
+    Cache LRU de resultados, seguro para uso por várias sessões (threads).
+
+    Os resultados devolvidos são compartilhados entre quem acerta a mesma chave
+    e não devem ser modificados.
+
+    :param capacidade: Número máximo de resultados guardados.
+    :type capacidade: int
+    """
+
+    def __init__(self, capacidade=128):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser de pelo menos 1 resultado.")
+        self.capacidade = capacidade
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+
+    def __len__(self):
+        return len(self._itens)
+
+    def obter(self, chave):
+        """
+        Devolve o resultado da chave (ou None), contabilizando acerto ou falha.
+
+        :param chave: Impressão digital do problema.
+        :type chave: str
+        :rtype: ResultadoSimplex or None
+        """
+        with self._trava:
+            resultado = self._itens.get(chave)
+            if resultado is None:
+                self.falhas += 1
+                return None
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return resultado
+
+    def guardar(self, chave, resultado):
+        """
+        Guarda um resultado, descartando o menos usado se a capacidade for excedida.
+
+        :param chave: Impressão digital do problema.
+        :type chave: str
+        :param resultado: Resultado a guardar.
+        :type resultado: ResultadoSimplex
+        """
+        with self._trava:
+            self._itens[chave] = resultado
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.capacidade:
+                self._itens.popitem(last=False)
+                self.descartes += 1
+
+    def resolver(self, c, A, b, tipos=None, mode='max', method='automatico', **opcoes):
+        """
+        Resolve com :func:`nucleo_simplex.solve`, reaproveitando resultados idênticos.
+
+        :param opcoes: Demais argumentos de :func:`nucleo_simplex.solve` (fazem parte da chave,
+            exceto o ``observador``, o ``cancelamento`` e o ``tempo_limite``, que só acompanham a
+            execução; em um acerto o observador não é chamado). Resoluções interrompidas pelo
+            tempo ou por cancelamento dependem do momento da interrupção e não são guardadas.
+        :rtype: ResultadoSimplex
+        """
+        chave = impressao_digital(c, A, b, tipos, mode, method,
+                                  **{nome: valor for nome, valor in opcoes.items()
+                                     if nome not in _FORA_DA_CHAVE})
+        resultado = self.obter(chave)
+        if resultado is None:
+            resultado = solve(c, A, b, tipos, mode, method, **opcoes)
+            if resultado.status not in _NAO_GUARDADOS:
+                self.guardar(chave, resultado)
+        return resultado
+
+    def limpar(self):
+        """Remove todos os resultados e zera os contadores."""
+        with self._trava:
+            self._itens.clear()
+            self.acertos = self.falhas = self.descartes = 0
+
+    def estatisticas(self):
+        """
+        Contadores do cache.
+
+        :return: Acertos, falhas, descartes, taxa de acerto, ocupação e capacidade.
+        :rtype: dict
+        """
+        with self._trava:
+            consultas = self.acertos + self.falhas
+            return {
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'descartes': self.descartes,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+                'tamanho': len(self._itens),
+                'capacidade': self.capacidade,
+            }
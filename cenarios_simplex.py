@@ -0,0 +1,249 @@
+"""
+Resolução em lote de vários cenários que compartilham a mesma matriz A.
+
+Os cenários diferem apenas no vetor de custos ``c`` e/ou no vetor de recursos
+``b``. Todos avançam juntos sobre um tableau 3-D ``(cenarios, m + 1, colunas)``:
+a escolha da coluna, o teste da razão e o pivoteamento são operações NumPy sobre
+o eixo dos cenários, e cada cenário que termina (ótimo, ilimitado) é retirado da
+pilha de trabalho antes do passo seguinte.
+
+Como no Simplex do núcleo, um cenário passa para a regra de Bland após uma
+sequência de pivôs degenerados (e volta à de Dantzig no primeiro pivô não
+degenerado), o que impede que um único cenário cicle e prenda o lote; com
+``max_iteracoes``, cenários que esgotam o orçamento de pivôs saem da pilha com
+status 'limite_iteracoes'.
+
+O tableau segue o Método Big M, com o mesmo leiaute de colunas para todos os
+cenários: variáveis de decisão, uma folga por restrição de desigualdade e uma
+artificial para cada linha que precisa dela em algum cenário.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from nucleo_simplex import M_CONST
+
+TOL_CUSTO = 1e-5
+TOL_PIVO = 1e-9
+# Pivôs degenerados seguidos que passam um cenário para a regra de Bland
+LIMITE_DEGENERADOS = 20
+
+
+@dataclass
+class ResultadoCenarios:
+    """
+    Resultados de um lote de cenários, um array por saída.
+
+    :ivar status: Status de cada cenário ('otimo', 'ilimitado', 'infactivel' ou 'limite_iteracoes').
+    :ivar z: Valor ótimo de cada cenário (NaN se não for ótimo).
+    :ivar x: Valores das variáveis de decisão, forma (cenarios, n); no limite de
+        iterações, os do último quadro.
+    :ivar iteracoes: Pivoteamentos de cada cenário.
+    """
+    status: np.ndarray
+    z: np.ndarray
+    x: np.ndarray
+    iteracoes: np.ndarray
+
+
+def _empilhar(v, tamanho, nome):
+    """
+    Converte ``v`` em uma pilha 2-D (cenarios, tamanho).
+
+    :raises ValueError: Se a última dimensão não for ``tamanho``.
+    """
+    v = np.asarray(v, dtype=float)
+    if v.ndim == 1:
+        v = v[None, :]
+    if v.ndim != 2 or v.shape[1] != tamanho:
+        raise ValueError(f"'{nome}' deve ter forma ({tamanho},) ou (cenarios, {tamanho}); recebido {v.shape}.")
+    return v
+
+def _coef_folga_por_linha(tipos):
+    """
+    Coeficiente da folga de cada linha (+1 em '≤', -1 em '≥', 0 em '=').
+
+    :param tipos: Tipos das restrições.
+    :type tipos: np.ndarray
+    :rtype: np.ndarray
+    """
+    return np.select([tipos == '≤', tipos == '≥'], [1.0, -1.0], 0.0)
+
+def _build_tableau_cenarios(c, A, b, tipos, mode):
+    """
+    Monta o tableau Big M 3-D de todos os cenários.
+
+    :param c: Custos, forma (S, n).
+    :type c: np.ndarray
+    :param A: Matriz de restrições comum, forma (m, n).
+    :type A: np.ndarray
+    :param b: Recursos, forma (S, m).
+    :type b: np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '=').
+    :type tipos: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :return: Tableau (S, m + 1, colunas + 1), base (S, m) e índice da primeira artificial.
+    :rtype: tuple(np.ndarray, np.ndarray, int)
+    """
+    S, m = b.shape
+    n = A.shape[1]
+    tipos = np.asarray(tipos)
+
+    # Linhas com RHS negativo são multiplicadas por -1 em cada cenário
+    sinal = np.where(b < 0, -1.0, 1.0)
+    folga = np.flatnonzero(tipos != '=')
+    coef_linha = _coef_folga_por_linha(tipos)
+    coef_folga = coef_linha[folga]
+    # Cenários em que a linha precisa de artificial: '≥' ou '=' após a inversão de sinal
+    precisa_artificial = (tipos == '=')[None, :] | (coef_linha[None, :] * sinal < 0)
+    artificial = np.flatnonzero(precisa_artificial.any(axis=0))
+
+    inicio_folga = n
+    inicio_artificial = n + len(folga)
+    num_colunas = inicio_artificial + len(artificial)
+    tableau = np.zeros((S, m + 1, num_colunas + 1))
+
+    cenarios = np.arange(S)[:, None]
+    tableau[:, 1:, :n] = sinal[:, :, None] * A[None, :, :]
+    tableau[cenarios, 1 + folga[None, :], inicio_folga + np.arange(len(folga))[None, :]] = sinal[:, folga] * coef_folga
+    tableau[cenarios, 1 + artificial[None, :], inicio_artificial + np.arange(len(artificial))[None, :]] = \
+        precisa_artificial[:, artificial].astype(float)
+    tableau[:, 1:, -1] = sinal * b
+
+    # Linha Z na convenção de maximização: max (±c)x - M·Σa
+    sentido = 1.0 if mode == 'max' else -1.0
+    tableau[:, 0, :n] = -sentido * c
+
+    base = np.empty((S, m), dtype=int)
+    posicao_folga = np.full(m, -1)
+    posicao_folga[folga] = inicio_folga + np.arange(len(folga))
+    posicao_artificial = np.full(m, -1)
+    posicao_artificial[artificial] = inicio_artificial + np.arange(len(artificial))
+    base[:] = posicao_folga[None, :]
+    base[precisa_artificial] = np.broadcast_to(posicao_artificial, (S, m))[precisa_artificial]
+
+    # Penalidade M nas artificiais básicas, agregada em uma única operação por cenário
+    peso = precisa_artificial.astype(float) * M_CONST
+    tableau[:, 0, :] -= np.einsum('si,sij->sj', peso, tableau[:, 1:, :])
+    tableau[:, 0, inicio_artificial:num_colunas] = 0.0
+    return tableau, base, inicio_artificial
+
+def solve_cenarios(c, A, b, tipos=None, mode='max', max_iteracoes=None):
+    """
+    Resolve um lote de cenários (custos e/ou recursos diferentes) com a mesma matriz A.
+
+    ``c`` pode ter forma (n,) ou (S, n) e ``b`` forma (m,) ou (S, m); um vetor
+    único é repetido para todos os S cenários. O cenário ``k`` usa ``c[k]`` e ``b[k]``.
+
+    :param c: Custos de cada cenário.
+    :type c: array_like
+    :param A: Matriz de restrições comum a todos os cenários.
+    :type A: array_like
+    :param b: Recursos de cada cenário.
+    :type b: array_like
+    :param tipos: Tipos das restrições ('≤', '≥', '='). Se None, todas são '≤'.
+    :type tipos: list[str] or None
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param max_iteracoes: Número máximo de pivôs de cada cenário (None para não limitar).
+    :type max_iteracoes: int or None
+    :rtype: ResultadoCenarios
+    :raises ValueError: Se as pilhas de ``c`` e ``b`` tiverem tamanhos incompatíveis ou
+        se o limite de iterações for negativo.
+    """
+    if mode not in ('max', 'min'):
+        raise ValueError(f"Modo desconhecido: {mode!r}. Use 'max' ou 'min'.")
+    if max_iteracoes is not None and max_iteracoes < 0:
+        raise ValueError("O limite de iterações não pode ser negativo.")
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    c = _empilhar(c, n, 'c')
+    b = _empilhar(b, m, 'b')
+    if len(c) != len(b) and 1 not in (len(c), len(b)):
+        raise ValueError(f"Número de cenários incompatível: {len(c)} custos e {len(b)} recursos.")
+    S = max(len(c), len(b))
+    c = np.broadcast_to(c, (S, n))
+    b = np.broadcast_to(b, (S, m))
+    tipos = ['≤'] * m if tipos is None else list(tipos)
+
+    tableau, base, inicio_artificial = _build_tableau_cenarios(c, A, b, tipos, mode)
+
+    status = np.full(S, 'otimo', dtype=object)
+    z = np.full(S, np.nan)
+    x = np.zeros((S, n))
+    iteracoes = np.zeros(S, dtype=int)
+
+    ativos = np.arange(S)   # índice original de cada cenário da pilha de trabalho
+    sentido = 1.0 if mode == 'max' else -1.0
+    produto = np.empty_like(tableau)
+    degenerados = np.zeros(S, dtype=int)   # pivôs degenerados seguidos de cada cenário ativo
+    bland = np.zeros(S, dtype=bool)
+
+    while len(ativos):
+        k = np.arange(len(ativos))
+        linha_z = tableau[:, 0, :-1]
+        coluna = np.argmin(linha_z, axis=1)
+        otimos = linha_z[k, coluna] >= -TOL_CUSTO
+        if bland.any():
+            # Bland: entra a coluna de menor índice com custo reduzido negativo
+            coluna = np.where(bland, np.argmax(linha_z < -TOL_CUSTO, axis=1), coluna)
+
+        col = tableau[k, 1:, coluna]
+        rhs = tableau[:, 1:, -1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razoes = np.where(col > TOL_PIVO, rhs / col, np.inf)
+        linha = np.argmin(razoes, axis=1)
+        passo = razoes[k, linha]
+        if bland.any():
+            # Bland: entre os empates do teste da razão, sai a variável de menor índice
+            empates = razoes == passo[:, None]
+            linha = np.where(bland, np.argmin(np.where(empates, base, np.iinfo(base.dtype).max), axis=1), linha)
+        ilimitados = ~otimos & np.isinf(passo)
+        esgotados = np.zeros(len(ativos), dtype=bool)
+        if max_iteracoes is not None:
+            esgotados = ~otimos & ~ilimitados & (iteracoes[ativos] >= max_iteracoes)
+
+        terminados = otimos | ilimitados | esgotados
+        if terminados.any():
+            fim = np.flatnonzero(terminados)
+            origem = ativos[fim]
+            valores = tableau[fim, 1:, -1]
+            basicas = base[fim]
+            artificial_positiva = ((basicas >= inicio_artificial) & (valores > 1e-5)).any(axis=1)
+            status[origem] = np.where(ilimitados[fim], 'ilimitado',
+                                      np.where(esgotados[fim], 'limite_iteracoes',
+                                               np.where(artificial_positiva, 'infactivel', 'otimo')))
+            otimo_real = status[origem] == 'otimo'
+            z[origem[otimo_real]] = sentido * tableau[fim[otimo_real], 0, -1]
+            estruturais = basicas < n
+            s_idx, pos = np.nonzero(estruturais)
+            x[origem[s_idx], basicas[s_idx, pos]] = valores[s_idx, pos]
+
+            # Cenários terminados saem da pilha de trabalho
+            continuam = ~terminados
+            ativos, tableau, base = ativos[continuam], tableau[continuam], base[continuam]
+            coluna, linha, passo = coluna[continuam], linha[continuam], passo[continuam]
+            degenerados, bland = degenerados[continuam], bland[continuam]
+            if not len(ativos):
+                break
+            k = np.arange(len(ativos))
+
+        # Pivoteamento em lote: atualização de posto 1 por cenário
+        linha_pivo = tableau[k, linha + 1, :] / tableau[k, linha + 1, coluna][:, None]
+        col_pivo = tableau[k, :, coluna]
+        col_pivo[k, linha + 1] = 0.0
+        buffer = produto[:len(ativos)]
+        np.multiply(col_pivo[:, :, None], linha_pivo[:, None, :], out=buffer)
+        tableau -= buffer
+        tableau[k, linha + 1, :] = linha_pivo
+        tableau[k, :, coluna] = 0.0
+        tableau[k, linha + 1, coluna] = 1.0
+        base[k, linha] = coluna
+        iteracoes[ativos] += 1
+
+        degenerado = passo <= 1e-12
+        degenerados = np.where(degenerado, degenerados + 1, 0)
+        bland = degenerado & (bland | (degenerados >= LIMITE_DEGENERADOS))
+
+    return ResultadoCenarios(status=status.astype(str), z=z, x=x, iteracoes=iteracoes)
@@ -0,0 +1,236 @@
+"""
+Matriz de restrições esparsa em formato CSC (Compressed Sparse Column).
+
+Implementação mínima em NumPy puro, com apenas as operações de que o Simplex
+Revisado precisa: acesso por coluna (teste da razão), produto Aᵀy (custos
+reduzidos) e produto Ax (verificação de factibilidade). A memória ocupada é
+proporcional ao número de elementos não nulos.
+
+Aceita matrizes do SciPy (qualquer formato com ``tocsc``), triplas de
+coordenadas ``(linhas, colunas, valores)`` em arrays do NumPy e arrays CSR, sem
+exigir o SciPy.
+"""
+import numpy as np
+
+
+class MatrizCSC:
+    """
+    Matriz esparsa armazenada por colunas.
+
+    Os elementos da coluna ``j`` são ``data[indptr[j]:indptr[j+1]]`` nas linhas
+    ``indices[indptr[j]:indptr[j+1]]``.
+
+    :param indptr: Ponteiros de início de cada coluna (tamanho n + 1).
+    :type indptr: np.ndarray
+    :param indices: Índices de linha de cada elemento não nulo.
+    :type indices: np.ndarray
+    :param data: Valores dos elementos não nulos.
+    :type data: np.ndarray
+    :param shape: Dimensões (m, n) da matriz.
+    :type shape: tuple(int, int)
+    """
+
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = (int(shape[0]), int(shape[1]))
+        # Coluna de cada elemento, usada para somar Aᵀy com um único bincount
+        self._coluna_do_elemento = np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+
+    @classmethod
+    def de_triplas(cls, linhas, colunas, valores, shape):
+        """
+        Monta a matriz a partir de triplas (i, j, a_ij); duplicatas são somadas.
+
+        :param linhas: Índices de linha.
+        :type linhas: array_like
+        :param colunas: Índices de coluna.
+        :type colunas: array_like
+        :param valores: Valores dos elementos.
+        :type valores: array_like
+        :param shape: Dimensões (m, n) da matriz.
+        :type shape: tuple(int, int)
+        :rtype: MatrizCSC
+        """
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        m, n = shape
+        if len(linhas) and (linhas.min() < 0 or linhas.max() >= m or colunas.min() < 0 or colunas.max() >= n):
+            raise ValueError(f"Triplas fora das dimensões {shape}.")
+
+        # Ordena por (coluna, linha) e soma as repetições
+        chave = colunas * m + linhas
+        ordem = np.argsort(chave, kind='stable')
+        chave, valores = chave[ordem], valores[ordem]
+        unicas, inicio = np.unique(chave, return_index=True)
+        valores = np.add.reduceat(valores, inicio) if len(valores) else valores
+        nao_nulos = valores != 0.0
+        unicas, valores = unicas[nao_nulos], valores[nao_nulos]
+
+        colunas, linhas = np.divmod(unicas, m)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(colunas, minlength=n), out=indptr[1:])
+        return cls(indptr, linhas, valores, shape)
+
+    @classmethod
+    def de_csr(cls, indptr, indices, data, shape):
+        """
+        Converte arrays no formato CSR (por linhas) para CSC.
+
+        :rtype: MatrizCSC
+        """
+        indptr = np.asarray(indptr, dtype=np.int64)
+        linhas = np.repeat(np.arange(shape[0]), np.diff(indptr))
+        return cls.de_triplas(linhas, indices, data, shape)
+
+    @classmethod
+    def de_densa(cls, A):
+        """
+        Converte uma matriz densa, descartando os zeros.
+
+        :rtype: MatrizCSC
+        """
+        A = np.asarray(A, dtype=float)
+        colunas, linhas = np.nonzero(A.T)
+        return cls.de_triplas(linhas, colunas, A[linhas, colunas], A.shape)
+
+    @classmethod
+    def converter(cls, A, shape=None):
+        """
+        Converte qualquer representação aceita para :class:`MatrizCSC`.
+
+        :param A: MatrizCSC, matriz esparsa do SciPy, triplas ``(linhas, colunas, valores)``
+            (ver :func:`eh_triplas`) ou matriz densa.
+        :param shape: Dimensões (m, n), obrigatórias para triplas.
+        :type shape: tuple(int, int) or None
+        :rtype: MatrizCSC
+        :raises ValueError: Se triplas forem dadas sem ``shape``.
+        """
+        if isinstance(A, cls):
+            return A
+        if hasattr(A, 'tocsc'):
+            csc = A.tocsc()
+            csc.sum_duplicates()
+            return cls(csc.indptr, csc.indices, csc.data, csc.shape)
+        if eh_triplas(A):
+            if shape is None:
+                raise ValueError("Triplas (linhas, colunas, valores) exigem as dimensões da matriz.")
+            return cls.de_triplas(*A, shape)
+        return cls.de_densa(A)
+
+    @property
+    def nnz(self):
+        """Número de elementos não nulos armazenados."""
+        return len(self.data)
+
+    def coluna(self, j):
+        """
+        Elementos não nulos da coluna ``j``.
+
+        :return: Índices de linha e valores.
+        :rtype: tuple(np.ndarray, np.ndarray)
+        """
+        inicio, fim = self.indptr[j], self.indptr[j + 1]
+        return self.indices[inicio:fim], self.data[inicio:fim]
+
+    def coluna_densa(self, j):
+        """
+        Coluna ``j`` como vetor denso de tamanho m.
+
+        :rtype: np.ndarray
+        """
+        col = np.zeros(self.shape[0])
+        linhas, valores = self.coluna(j)
+        col[linhas] = valores
+        return col
+
+    def matvec(self, x):
+        """
+        Produto A·x.
+
+        :rtype: np.ndarray
+        """
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.indices, weights=self.data * x[self._coluna_do_elemento], minlength=self.shape[0])
+
+    def rmatvec(self, y, colunas=None):
+        """
+        Produto Aᵀ·y, opcionalmente restrito a um subconjunto de colunas.
+
+        :param y: Vetor de tamanho m.
+        :type y: np.ndarray
+        :param colunas: Índices das colunas a calcular (None calcula todas).
+        :type colunas: np.ndarray or None
+        :rtype: np.ndarray
+        """
+        y = np.asarray(y, dtype=float)
+        if colunas is None:
+            return np.bincount(self._coluna_do_elemento, weights=self.data * y[self.indices], minlength=self.shape[1])
+        colunas = np.asarray(colunas, dtype=np.int64)
+        inicio = self.indptr[colunas]
+        tamanhos = self.indptr[colunas + 1] - inicio
+        # Posições dos elementos das colunas pedidas, concatenadas na ordem de ``colunas``
+        deslocamento = np.repeat(inicio - (np.cumsum(tamanhos) - tamanhos), tamanhos)
+        posicoes = deslocamento + np.arange(tamanhos.sum())
+        pesos = self.data[posicoes] * y[self.indices[posicoes]]
+        return np.bincount(np.repeat(np.arange(len(colunas)), tamanhos), weights=pesos, minlength=len(colunas))
+
+    def normas_colunas(self):
+        """
+        Soma dos quadrados dos elementos de cada coluna (||aⱼ||²).
+
+        :rtype: np.ndarray
+        """
+        return np.bincount(self._coluna_do_elemento, weights=self.data * self.data, minlength=self.shape[1])
+
+    def escalar_linhas(self, fatores):
+        """
+        Multiplica cada linha i por ``fatores[i]`` (in-place).
+
+        :param fatores: Fator de cada linha.
+        :type fatores: np.ndarray
+        """
+        self.data *= np.asarray(fatores, dtype=float)[self.indices]
+
+    def densa(self):
+        """
+        Converte para uma matriz densa.
+
+        :rtype: np.ndarray
+        """
+        A = np.zeros(self.shape)
+        A[self.indices, self._coluna_do_elemento] = self.data
+        return A
+
+    def copy(self):
+        """Cópia independente da matriz."""
+        return MatrizCSC(self.indptr.copy(), self.indices.copy(), self.data.copy(), self.shape)
+
+
+def eh_triplas(A):
+    """
+    Indica se ``A`` são triplas ``(linhas, colunas, valores)`` explícitas.
+
+    Só uma tupla de três arrays 1-D do NumPy, de mesmo tamanho e com índices
+    inteiros, conta como triplas; qualquer sequência de linhas, como a tupla
+    ``((1, 1), (1, 0), (0, 1))``, é uma matriz densa.
+
+    :rtype: bool
+    """
+    if not (isinstance(A, tuple) and len(A) == 3 and
+            all(isinstance(v, np.ndarray) and v.ndim == 1 for v in A)):
+        return False
+    linhas, colunas, valores = A
+    return (len(linhas) == len(colunas) == len(valores) and
+            np.issubdtype(linhas.dtype, np.integer) and np.issubdtype(colunas.dtype, np.integer))
+
+
+def eh_esparsa(A):
+    """
+    Indica se ``A`` está em uma representação esparsa aceita pelo solver.
+
+    :rtype: bool
+    """
+    return isinstance(A, MatrizCSC) or hasattr(A, 'tocsc') or eh_triplas(A)
@@ -0,0 +1,310 @@
+"""
+Fila de resolução em lote: muitos modelos independentes em um pool de processos.
+
+Cada tarefa é um arquivo de modelo (MPS, LP ou CSV, com ``.gz`` opcional). Só os
+bytes do arquivo vão para o processo, que lê o modelo e o resolve com o núcleo
+headless (:meth:`modelo_io.ModeloPL.resolver`, ou
+:meth:`~modelo_io.ModeloPL.resolver_inteiro` se houver variáveis inteiras). Como
+os modelos não dependem uns dos outros, o tempo de parede cai para cerca de
+(soma dos tempos) / processos. Um modelo inválido marca só a própria tarefa com
+status 'erro'.
+
+Uso::
+
+    python fila_simplex.py modelos/ --processos 4 --saida resultados.zip
+    python fila_simplex.py fechamento.zip --metodo revisado --presolve
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import tarfile
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from modelo_io import formato_do_arquivo, ler_modelo
+
+# Pacotes de modelos aceitos além dos próprios arquivos de modelo
+PACOTES = ('.zip', '.tar', '.tar.gz', '.tgz')
+
+
+@dataclass
+class TarefaSimplex:
+    """
+    Um modelo a resolver no lote.
+
+    :ivar nome: Nome do arquivo (com o caminho dentro da pasta ou do pacote).
+    :ivar conteudo: Bytes do arquivo, compactado com gzip ou não.
+    """
+    nome: str
+    conteudo: bytes = field(repr=False)
+
+
+@dataclass
+class ResultadoTarefa:
+    """
+    Desfecho de uma tarefa do lote.
+
+    :ivar nome: Nome do arquivo do modelo.
+    :ivar status: Status da resolução ('otimo', 'infactivel', ...) ou 'erro'.
+    :ivar z: Valor ótimo (None se não houver).
+    :ivar x: Valores das variáveis de decisão (None se não houver).
+    :ivar metodo: Método usado pelo núcleo.
+    :ivar iteracoes: Iterações (ou nós, no branch-and-bound).
+    :ivar forma: Dimensões (m, n) do modelo.
+    :ivar tempo_leitura_s: Segundos gastos lendo o arquivo.
+    :ivar tempo_s: Segundos gastos resolvendo.
+    :ivar erro: Mensagem do erro, se a tarefa falhou.
+    """
+    nome: str
+    status: str
+    z: float = None
+    x: list = None
+    metodo: str = None
+    iteracoes: int = 0
+    forma: tuple = None
+    tempo_leitura_s: float = 0.0
+    tempo_s: float = 0.0
+    erro: str = None
+
+
+@dataclass
+class RelatorioLote:
+    """
+    Resultados de um lote, na ordem em que as tarefas foram enviadas.
+
+    :ivar resultados: Um :class:`ResultadoTarefa` por tarefa.
+    :ivar processos: Tamanho do pool usado.
+    :ivar tempo_s: Tempo de parede do lote inteiro.
+    """
+    resultados: list
+    processos: int
+    tempo_s: float
+
+    @property
+    def tempo_tarefas_s(self):
+        """Soma dos tempos de leitura e resolução de todas as tarefas."""
+        return sum(r.tempo_leitura_s + r.tempo_s for r in self.resultados)
+
+    @property
+    def aceleracao(self):
+        """Razão entre a soma dos tempos das tarefas e o tempo de parede."""
+        return self.tempo_tarefas_s / self.tempo_s if self.tempo_s > 0 else 0.0
+
+    def contagem(self):
+        """Número de tarefas por status."""
+        return dict(Counter(r.status for r in self.resultados))
+
+    def como_dict(self):
+        """Relatório completo em tipos nativos do Python, pronto para JSON."""
+        return {
+            'processos': self.processos,
+            'tempo_s': self.tempo_s,
+            'tempo_tarefas_s': self.tempo_tarefas_s,
+            'aceleracao': self.aceleracao,
+            'contagem': self.contagem(),
+            'resultados': [asdict(r) for r in self.resultados],
+        }
+
+    def resumo_csv(self):
+        """Uma linha por tarefa (sem os valores de x), em CSV."""
+        saida = io.StringIO()
+        colunas = ('nome', 'status', 'z', 'metodo', 'iteracoes', 'linhas', 'colunas', 'tempo_leitura_s',
+                   'tempo_s', 'erro')
+        escritor = csv.writer(saida)
+        escritor.writerow(colunas)
+        for r in self.resultados:
+            m, n = r.forma or ('', '')
+            escritor.writerow((r.nome, r.status, '' if r.z is None else r.z, r.metodo or '', r.iteracoes, m, n,
+                               f"{r.tempo_leitura_s:.6f}", f"{r.tempo_s:.6f}", r.erro or ''))
+        return saida.getvalue()
+
+    def exportar(self):
+        """
+        Pacote zip com ``resumo.csv`` (uma linha por modelo) e ``resultados.json`` (com x).
+
+        :rtype: bytes
+        """
+        saida = io.BytesIO()
+        with zipfile.ZipFile(saida, 'w', zipfile.ZIP_DEFLATED) as pacote:
+            pacote.writestr('resumo.csv', self.resumo_csv())
+            pacote.writestr('resultados.json', json.dumps(self.como_dict(), indent=2, ensure_ascii=False))
+        return saida.getvalue()
+
+
+def _e_modelo(nome):
+    """Indica se o nome tem a extensão de um modelo (ver :data:`modelo_io.FORMATOS`)."""
+    try:
+        formato_do_arquivo(nome)
+    except ValueError:
+        return False
+    return True
+
+def _e_pacote(nome):
+    return nome.lower().endswith(PACOTES)
+
+def tarefas_do_pacote(conteudo, nome):
+    """
+    Extrai os modelos de um pacote zip ou tar; os demais arquivos são ignorados.
+
+    :param conteudo: Bytes do pacote.
+    :type conteudo: bytes
+    :param nome: Nome do pacote, cuja extensão define o formato (ver :data:`PACOTES`).
+    :type nome: str
+    :rtype: list[TarefaSimplex]
+    :raises ValueError: Se o pacote não for zip nem tar ou estiver corrompido.
+    """
+    try:
+        if nome.lower().endswith('.zip'):
+            with zipfile.ZipFile(io.BytesIO(conteudo)) as pacote:
+                return [TarefaSimplex(info.filename, pacote.read(info)) for info in pacote.infolist()
+                        if not info.is_dir() and _e_modelo(info.filename)]
+        with tarfile.open(fileobj=io.BytesIO(conteudo)) as pacote:
+            return [TarefaSimplex(membro.name, pacote.extractfile(membro).read()) for membro in pacote.getmembers()
+                    if membro.isfile() and _e_modelo(membro.name)]
+    except (zipfile.BadZipFile, tarfile.TarError) as e:
+        raise ValueError(f"Pacote inválido {nome!r}: {e}") from e
+
+def tarefas_do_arquivo(conteudo, nome):
+    """
+    Tarefas de um arquivo enviado: todos os modelos de um pacote zip/tar, ou o próprio modelo.
+
+    :param conteudo: Bytes do arquivo.
+    :type conteudo: bytes
+    :param nome: Nome do arquivo, cuja extensão define se é pacote ou modelo.
+    :type nome: str
+    :rtype: list[TarefaSimplex]
+    :raises ValueError: Se o arquivo não for um modelo nem um pacote válido.
+    """
+    if _e_pacote(nome):
+        return tarefas_do_pacote(conteudo, nome)
+    formato_do_arquivo(nome)
+    return [TarefaSimplex(nome, conteudo)]
+
+def tarefas_de(caminho):
+    """
+    Monta as tarefas de uma pasta (percorrida recursivamente), de um pacote zip/tar
+    ou de um único arquivo de modelo.
+
+    :param caminho: Pasta, pacote ou arquivo.
+    :type caminho: str or os.PathLike
+    :rtype: list[TarefaSimplex]
+    :raises ValueError: Se o arquivo não for um modelo nem um pacote.
+    """
+    caminho = Path(caminho)
+    if caminho.is_dir():
+        return [TarefaSimplex(str(arquivo.relative_to(caminho)), arquivo.read_bytes())
+                for arquivo in sorted(caminho.rglob('*')) if arquivo.is_file() and _e_modelo(arquivo.name)]
+    return tarefas_do_arquivo(caminho.read_bytes(), caminho.name)
+
+def resolver_tarefa(tarefa, opcoes=None):
+    """
+    Lê e resolve um modelo; executada dentro dos processos do pool.
+
+    :param tarefa: Modelo a resolver.
+    :type tarefa: TarefaSimplex
+    :param opcoes: Argumentos de :func:`nucleo_simplex.solve` (``method``, ``precificacao``,
+        ``presolve``...), repassados também aos nós do branch-and-bound.
+    :type opcoes: dict or None
+    :rtype: ResultadoTarefa
+    """
+    opcoes = opcoes or {}
+    inicio = time.perf_counter()
+    try:
+        modelo = ler_modelo(tarefa.conteudo, formato_do_arquivo(tarefa.nome))
+    except Exception as e:
+        return ResultadoTarefa(tarefa.nome, 'erro', tempo_leitura_s=time.perf_counter() - inicio,
+                               erro=f"{type(e).__name__}: {e}")
+    leitura = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    try:
+        if modelo.inteiras:
+            # O pool já ocupa os núcleos: os nós de cada modelo são avaliados no próprio processo
+            resultado = modelo.resolver_inteiro(processos=1, **opcoes)
+        else:
+            resultado = modelo.resolver(**opcoes)
+    except Exception as e:
+        return ResultadoTarefa(tarefa.nome, 'erro', forma=modelo.forma, tempo_leitura_s=leitura,
+                               tempo_s=time.perf_counter() - inicio, erro=f"{type(e).__name__}: {e}")
+    valores = None if resultado.x is None or np.isnan(resultado.x).all() else resultado.x.tolist()
+    return ResultadoTarefa(tarefa.nome, resultado.status, None if resultado.z is None else float(resultado.z),
+                           valores, resultado.metodo, resultado.iteracoes, modelo.forma, leitura,
+                           time.perf_counter() - inicio)
+
+def resolver_lote(tarefas, processos=None, ao_concluir=None, **opcoes):
+    """
+    Resolve as tarefas em um :class:`ProcessPoolExecutor`, uma tarefa por vez em cada processo.
+
+    :param tarefas: Modelos a resolver (ver :func:`tarefas_de`).
+    :type tarefas: list[TarefaSimplex]
+    :param processos: Tamanho do pool (padrão: número de núcleos); com 1, as tarefas
+        são resolvidas no próprio processo.
+    :type processos: int or None
+    :param ao_concluir: Chamada no processo principal a cada tarefa concluída, com
+        ``(resultado, concluidas, total)``, na ordem de conclusão (ex.: barra de progresso).
+    :type ao_concluir: callable or None
+    :param opcoes: Argumentos de :func:`nucleo_simplex.solve` aplicados a todas as tarefas.
+    :return: Resultados na ordem de ``tarefas``.
+    :rtype: RelatorioLote
+    """
+    inicio = time.perf_counter()
+    processos = (os.cpu_count() or 1) if processos is None else max(1, processos)
+    resultados = [None] * len(tarefas)
+
+    def registrar(indice, resultado):
+        resultados[indice] = resultado
+        if ao_concluir is not None:
+            ao_concluir(resultado, sum(r is not None for r in resultados), len(tarefas))
+
+    if processos == 1 or len(tarefas) <= 1:
+        for indice, tarefa in enumerate(tarefas):
+            registrar(indice, resolver_tarefa(tarefa, opcoes))
+    else:
+        with ProcessPoolExecutor(min(processos, len(tarefas))) as executor:
+            futuros = {executor.submit(resolver_tarefa, tarefa, opcoes): indice
+                       for indice, tarefa in enumerate(tarefas)}
+            for futuro in as_completed(futuros):
+                registrar(futuros[futuro], futuro.result())
+    return RelatorioLote(resultados, processos, time.perf_counter() - inicio)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve em lote os modelos de uma pasta ou de um pacote zip/tar.")
+    parser.add_argument('entrada', help="Pasta, pacote (.zip, .tar, .tar.gz) ou arquivo de modelo.")
+    parser.add_argument('--processos', type=int, default=None, help="Tamanho do pool (padrão: núcleos).")
+    parser.add_argument('--metodo', default='automatico')
+    parser.add_argument('--precificacao', default='dantzig')
+    parser.add_argument('--presolve', action='store_true')
+    parser.add_argument('--max-iteracoes', type=int, default=None, help="Limite de pivôs por modelo.")
+    parser.add_argument('--tempo-limite', type=float, default=None, help="Segundos disponíveis por modelo.")
+    parser.add_argument('--saida', help="Pacote zip com resumo.csv e resultados.json.")
+    args = parser.parse_args(argv)
+
+    tarefas = tarefas_de(args.entrada)
+    print(f"{len(tarefas)} modelo(s) em {args.entrada}")
+
+    def progresso(resultado, concluidas, total):
+        z = '' if resultado.z is None else f"  Z = {resultado.z:.6g}"
+        print(f"  [{concluidas:{len(str(total))}d}/{total}] {resultado.nome}: {resultado.status}"
+              f"{z}  ({resultado.tempo_s * 1e3:.1f} ms){'  ' + resultado.erro if resultado.erro else ''}")
+
+    relatorio = resolver_lote(tarefas, args.processos, progresso, method=args.metodo,
+                              precificacao=args.precificacao, presolve=args.presolve,
+                              max_iteracoes=args.max_iteracoes, tempo_limite=args.tempo_limite)
+    contagem = " · ".join(f"{status}: {n}" for status, n in sorted(relatorio.contagem().items()))
+    print(f"Lote em {relatorio.tempo_s:.2f} s com {relatorio.processos} processo(s) "
+          f"(soma das tarefas {relatorio.tempo_tarefas_s:.2f} s, {relatorio.aceleracao:.1f}x)")
+    print(f"  {contagem or 'nenhum modelo'}")
+    if args.saida:
+        Path(args.saida).write_bytes(relatorio.exportar())
+        print(f"  resultados salvos em {args.saida}")
+
+if __name__ == '__main__':
+    main()
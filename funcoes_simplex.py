@@ -1,141 +1,129 @@
+import json
+import os
+import time
+
 import numpy as np
 import pandas as pd
 import streamlit as st
 
-# Constante para o "Grande M"
-M_CONST = 1.0e5 
-
-def _build_tableau(c, A_ub, b_ub):
+from cache_simplex import CacheSimplex
+from esparso_simplex import MatrizCSC
+from fila_simplex import resolver_lote, tarefas_do_arquivo
+from inteiro_simplex import resolver_inteiro
+from modelo_io import FORMATOS, ModeloPL, exportar_modelo, formato_do_arquivo, ler_modelo
+from nucleo_simplex import M_CONST
+from parametrico_simplex import varrer_parametro
+from perfil_simplex import PerfilSimplex
+from rota_simplex import NOMES_ROTA
+
+# Títulos dos quadros e avisos de roteamento por método
+TITULOS_METODO = {
+    'primal': "Primal Simplex",
+    'dual': "Primal Simplex",
+    'big_m': "Big M",
+    'duas_fases': "Duas Fases",
+    'revisado': "Simplex Revisado",
+    'presolve': "Presolve",
+}
+NOMES_PRECIFICACAO = {
+    'dantzig': "Dantzig",
+    'devex': "Devex",
+    'steepest_edge': "Steepest Edge",
+    'parcial': "Parcial",
+    'multipla': "Múltipla",
+}
+NOMES_PRECIFICACAO_DUAL = {
+    'steepest_edge': "Dual steepest edge",
+    'dantzig': "Maior violação",
+}
+NOMES_SELECAO = {
+    'melhor_limite': "Melhor limitante",
+    'profundidade': "Profundidade",
+}
+MOTIVOS_PARADA_BB = {
+    'limite_nos': "pelo limite de nós",
+    'limite_tempo': "pelo limite de tempo",
+    'limite_iteracoes': "pelo limite de iterações de um nó",
+    'cancelado': "por cancelamento",
+}
+AVISOS_ROTA = {
+    'primal': (st.success, "✅ {motivo}. Usando **Primal Simplex**."),
+    'dual': (st.success, "✅ {motivo}. Usando **Dual Simplex**."),
+    'big_m': (st.warning, "⚠️ {motivo}: Usando **Método Big M**."),
+    'duas_fases': (st.warning, "⚠️ {motivo}: Usando **Método das Duas Fases**."),
+    'crash': (st.success, "✅ {motivo}. Usando **Primal Simplex** a partir da base de crash."),
+    'revisado': (st.success, "✅ {motivo}. Usando **Simplex Revisado**."),
+    'presolve': (st.success, "✅ {motivo}: nenhum pivô foi necessário."),
+}
+
+# Quadros exibidos por página no passo a passo
+QUADROS_POR_PAGINA = 5
+
+# Acima deste número de linhas ou colunas, só o log das iterações é exibido e as
+# variáveis finais aparecem em tabela
+LIMITE_QUADROS = 20
+
+# Acima deste número de linhas ou colunas, a análise de sensibilidade (densa) não é calculada
+LIMITE_SENSIBILIDADE = 500
+
+# Intervalo mínimo entre atualizações da tabela de tarefas durante um lote
+INTERVALO_TABELA_LOTE_S = 0.5
+
+# Capacidade do cache de resultados compartilhado entre sessões
+CAPACIDADE_CACHE = int(os.environ.get("SIMPLEX_CACHE_CAPACIDADE", 128))
+
+# Orçamento de cada resolução feita pela página: um modelo grande ou que cicla
+# devolve o ponto em que parou em vez de prender o servidor
+LIMITE_ITERACOES = int(os.environ.get("SIMPLEX_LIMITE_ITERACOES", 100_000))
+TEMPO_LIMITE_S = float(os.environ.get("SIMPLEX_TEMPO_LIMITE", 60))
+
+# Desfecho das resoluções interrompidas pelo orçamento
+AVISOS_INTERRUPCAO = {
+    'limite_iteracoes': "⏹️ Limite de {limite} iterações atingido",
+    'limite_tempo': "⏹️ Tempo limite de {limite:g} s atingido",
+    'cancelado': "⏹️ Resolução cancelada",
+}
+
+@st.cache_resource
+def cache_de_resultados():
     """
-    Constrói o tableau inicial padrão para o método Simplex (Primal ou Dual).
+    Cache LRU de resultados compartilhado por todas as sessões e reexecuções do app.
 
-    Esta função prepara a matriz para problemas que já estão na forma padrão
-    (restrições de desigualdade <=), adicionando apenas variáveis de folga.
+    :rtype: CacheSimplex
+    """
+    return CacheSimplex(capacidade=CAPACIDADE_CACHE)
 
-    :param c: Coeficientes da função objetivo.
-    :type c: list or np.ndarray
-    :param A_ub: Matriz de coeficientes das restrições (lado esquerdo).
-    :type A_ub: list or np.ndarray
-    :param b_ub: Vetor de termos independentes das restrições (lado direito).
-    :type b_ub: list or np.ndarray
-    :return: Uma tupla contendo o tableau inicial (numpy array), a lista de nomes das colunas e a lista das variáveis básicas iniciais.
-    :rtype: tuple(np.ndarray, list, list)
-    """
-    c, A_ub, b_ub = map(np.array, (c, A_ub, b_ub))
-    num_constraints, num_vars = A_ub.shape
-    tableau = np.zeros((num_constraints + 1, num_vars + num_constraints + 2))
-    tableau[0, :num_vars] = -c
-    tableau[0, -2] = 1
-    tableau[1:, :num_vars] = A_ub
-    tableau[1:, num_vars:num_vars + num_constraints] = np.eye(num_constraints)
-    tableau[1:, -1] = b_ub
-    columns = [f'x{i+1}' for i in range(num_vars)] + [f'f{i+1}' for i in range(num_constraints)] + ['Z', 'RHS']
-    base_vars = [f'f{i+1}' for i in range(num_constraints)]
-    return tableau, columns, base_vars
-
-def _build_big_m_tableau(c, A, b, tipos, mode='max'):
-    """
-    Constrói o tableau inicial para o Método Big M, lidando com restrições mistas (<=, >=, =).
-
-    Adiciona automaticamente variáveis de folga (s) e variáveis artificiais (a)
-    conforme necessário para cada tipo de restrição. Também aplica a penalidade M
-    na função objetivo para as variáveis artificiais.
+@st.cache_data(show_spinner="📂 Lendo o modelo...")
+def importar_modelo(conteudo, nome_arquivo):
+    """
+    Lê um modelo enviado pela página; o mesmo arquivo não é lido de novo a cada reexecução.
+
+    :param conteudo: Bytes do arquivo (compactado com gzip ou não).
+    :type conteudo: bytes
+    :param nome_arquivo: Nome do arquivo, cuja extensão define o formato (ver :data:`modelo_io.FORMATOS`).
+    :type nome_arquivo: str
+    :rtype: ModeloPL
+    :raises ValueError: Se o arquivo for inválido.
+    """
+    return ler_modelo(conteudo, formato_do_arquivo(nome_arquivo))
 
-    :param c: Coeficientes da função objetivo.
-    :type c: list or np.ndarray
-    :param A: Matriz de coeficientes das restrições.
-    :type A: list or np.ndarray
-    :param b: Termos independentes das restrições.
-    :type b: list or np.ndarray
-    :param tipos: Lista de strings indicando o tipo de cada restrição ('<=', '>=', '=').
-    :type tipos: list[str]
-    :param mode: Modo de otimização ('max' ou 'min'). O padrão é 'max'.
-    :type mode: str
-    :return: Tableau montado, lista completa de nomes das colunas e lista de variáveis básicas iniciais.
-    :rtype: tuple(np.ndarray, list, list)
-    """
-    num_vars = len(c)
-    num_rest = len(A)
-    
-    # 1. Listas separadas para garantir a ordem correta
-    x_names = [f'x{i+1}' for i in range(num_vars)]
-    s_names = [] 
-    a_names = [] 
-    
-    A_matrix = np.array(A, dtype=float)
-    slack_cols = [] 
-    artif_cols = []
-    
-    base_vars = [None] * num_rest 
-
-    # 2. Preenchimento das listas
-    for i, tipo in enumerate(tipos):
-        if tipo == '≤':
-            col = np.zeros(num_rest)
-            col[i] = 1.0
-            slack_cols.append(col)
-            name = f's{len(slack_cols)}'
-            s_names.append(name)
-            base_vars[i] = name
-            
-        elif tipo == '≥':
-            col_s = np.zeros(num_rest)
-            col_s[i] = -1.0
-            slack_cols.append(col_s)
-            name_s = f's{len(slack_cols)}'
-            s_names.append(name_s)
-            
-            col_a = np.zeros(num_rest)
-            col_a[i] = 1.0
-            artif_cols.append(col_a)
-            name_a = f'a{len(artif_cols)}'
-            a_names.append(name_a)
-            base_vars[i] = name_a
-            
-        elif tipo == '=':
-            col_a = np.zeros(num_rest)
-            col_a[i] = 1.0
-            artif_cols.append(col_a)
-            name_a = f'a{len(artif_cols)}'
-            a_names.append(name_a)
-            base_vars[i] = name_a
-
-    # 3. Montagem da Matriz
-    constraint_matrix = A_matrix
-    if slack_cols:
-        constraint_matrix = np.hstack([constraint_matrix, np.column_stack(slack_cols)])
-    if artif_cols:
-        constraint_matrix = np.hstack([constraint_matrix, np.column_stack(artif_cols)])
-        
-    # 4. Montagem da Lista de Nomes
-    col_names = x_names + s_names + a_names
-    
-    total_cols = len(col_names) + 2 
-    tableau = np.zeros((num_rest + 1, total_cols))
-    
-    tableau[1:, :len(col_names)] = constraint_matrix
-    tableau[1:, -1] = b
-    
-    tableau[0, :num_vars] = -np.array(c, dtype=float)
-    tableau[0, -2] = 1 
-    
-    full_col_names = col_names + ['Z', 'RHS']
-    
-    # Ajuste Big M na Função Objetivo
-    indices_artificiais = [idx for idx, nome in enumerate(full_col_names) if nome.startswith('a')]
-    
-    for idx_col_artif in indices_artificiais:
-        rows_with_1 = np.where(tableau[1:, idx_col_artif] == 1)[0]
-        if len(rows_with_1) > 0:
-            row_idx = rows_with_1[0] + 1
-            if mode == 'max':
-                tableau[0, :] -= M_CONST * tableau[row_idx, :]
-            else: # min
-                tableau[0, :] += M_CONST * tableau[row_idx, :]
-                
-    tableau[0, -2] = 1 
-
-    return tableau, full_col_names, base_vars
+def _resolver(c, A, b, tipos=None, mode='max', method='automatico', base_inicial=None, precificacao='dantzig',
+              presolve=False, limites=None, resumo=False):
+    """
+    Resolve com ``trace`` passando pelo cache: um problema idêntico já resolvido
+    devolve o resultado guardado, com o passo a passo, sem pivotear de novo.
+    Com ``resumo``, o passo a passo é só o log compacto, sem cópias dos quadros.
+    Cada resolução nova é medida por um :class:`PerfilSimplex` (ver :func:`show_metricas`)
+    e, até :data:`LIMITE_SENSIBILIDADE` linhas e colunas, traz a análise de sensibilidade.
+    A resolução respeita :data:`LIMITE_ITERACOES` e :data:`TEMPO_LIMITE_S`.
+
+    :rtype: ResultadoSimplex
+    """
+    return cache_de_resultados().resolver(c, A, b, tipos, mode, method, trace='resumo' if resumo else True,
+                                          base_inicial=base_inicial, precificacao=precificacao,
+                                          presolve=presolve, limites=limites, observador=PerfilSimplex(),
+                                          sensibilidade=max(len(b), len(c)) <= LIMITE_SENSIBILIDADE,
+                                          max_iteracoes=LIMITE_ITERACOES, tempo_limite=TEMPO_LIMITE_S)
 
 def show_tableau_streamlit(tableau, columns, base_vars, title="Quadro", iteration=None, ratios=None):
     """
@@ -158,25 +146,297 @@ def show_tableau_streamlit(tableau, columns, base_vars, title="Quadro", iteratio
     :type ratios: np.ndarray or None
     """
     st.markdown(f"#### {title} {'(' + str(iteration) + ')' if iteration else ''}")
-    df = pd.DataFrame(tableau, columns=columns)
-    df.insert(0, 'Base', ['Z'] + base_vars)
-    
-    def format_val(x):
-        if abs(x) >= M_CONST / 100: 
-            return f"{x/M_CONST:.1f}M"
-        return f"{x:.2f}"
-
-    df_display = df.copy()
-    for col in df.columns:
-        if col != 'Base' and col != 'Razão':
-             df_display[col] = df[col].apply(format_val)
+    # Formatação vetorizada: valores da ordem de M aparecem como múltiplos de M
+    valores = np.asarray(tableau, dtype=float)
+    texto = np.where(np.abs(valores) >= M_CONST / 100,
+                     np.char.add(np.char.mod('%.1f', valores / M_CONST), 'M'),
+                     np.char.mod('%.2f', valores))
+    df_display = pd.DataFrame(texto, columns=columns)
+    df_display.insert(0, 'Base', ['Z'] + list(base_vars))
 
     if ratios is not None:
         df_display['Razão'] = ['-'] + [f'{r:.2f}' if np.isfinite(r) else '-' for r in ratios]
-        
+
     st.dataframe(df_display, use_container_width=True)
 
-def solve_simplex_step_by_step(c, A_ub, b_ub, mode='max'):
+def _log_iteracoes(resultado):
+    """
+    Monta o log compacto das iterações: etapa, pivô, variáveis que entram e saem e Z.
+
+    :param resultado: Resultado com ``trace`` (completo ou resumido).
+    :type resultado: ResultadoSimplex
+    :rtype: pd.DataFrame
+    """
+    etapas = {'primal': "Primal", 'dual': "Dual", 'revisado': "Revisado"}
+    return pd.DataFrame({
+        'Iteração': [passo.iteracao for passo in resultado.trace],
+        'Etapa': [f"Fase {'I' * passo.fase}" if passo.fase else etapas[passo.tipo] for passo in resultado.trace],
+        'Entra': [passo.entra for passo in resultado.trace],
+        'Sai': [passo.sai if passo.linha is not None else "(troca de limite)" for passo in resultado.trace],
+        'Linha': [passo.linha for passo in resultado.trace],
+        'Coluna': [passo.coluna for passo in resultado.trace],
+        'Z': [passo.z for passo in resultado.trace],
+    })
+
+def _show_trace(resultado):
+    """
+    Exibe o log compacto das iterações e, página a página, os quadros registrados no ``trace``.
+
+    Apenas os quadros da página atual são montados e enviados ao navegador, de modo
+    que o tempo de resposta não cresce com o número de iterações.
+
+    :param resultado: Resultado devolvido por :func:`nucleo_simplex.solve` com ``trace``.
+    :type resultado: ResultadoSimplex
+    """
+    if not resultado.trace:
+        return
+    st.markdown("#### 🧾 Log das iterações")
+    st.dataframe(_log_iteracoes(resultado), use_container_width=True, hide_index=True)
+
+    quadros = [passo for passo in resultado.trace if passo.tableau is not None]
+    if not quadros:
+        return
+    paginas = -(-len(quadros) // QUADROS_POR_PAGINA)
+    pagina = 1
+    if paginas > 1:
+        if st.session_state.get("pagina_quadros", 1) > paginas:
+            st.session_state["pagina_quadros"] = 1
+        pagina = st.number_input(f"Página dos quadros (1 a {paginas})", min_value=1, max_value=paginas,
+                                 key="pagina_quadros")
+    inicio = (pagina - 1) * QUADROS_POR_PAGINA
+    fim = min(inicio + QUADROS_POR_PAGINA, len(quadros))
+    st.caption(f"Quadros {inicio + 1} a {fim} de {len(quadros)}.")
+
+    method_name = TITULOS_METODO[resultado.metodo]
+    for passo in quadros[inicio:fim]:
+        if passo.tipo == 'dual':
+            show_tableau_streamlit(passo.tableau, resultado.colunas, passo.base, title="Dual Quadro", iteration=passo.iteracao)
+            st.markdown(f"**Dual:** Sai `{passo.sai}` → Entra `{passo.entra}`")
+        else:
+            titulo = f"Quadro Fase {'I' * passo.fase}" if passo.fase else f"Quadro {method_name}"
+            show_tableau_streamlit(passo.tableau, passo.colunas or resultado.colunas, passo.base, title=titulo,
+                                   iteration=passo.iteracao, ratios=passo.razoes)
+            if passo.linha is None:
+                # Simplex com limites: a entrante só troca de limite, sem pivoteamento
+                st.markdown(f"**Troca de limite:** `{passo.entra}` vai ao outro limite, sem mudar a base.")
+
+def exibir_resultado(resultado, aviso_rota=False):
+    """
+    Exibe uma resolução já calculada; usada também para reexibir o resultado guardado
+    na sessão quando a página é reexecutada (ex.: ao trocar a página dos quadros).
+
+    :param resultado: Resultado devolvido por :func:`nucleo_simplex.solve`.
+    :type resultado: ResultadoSimplex
+    :param aviso_rota: Exibe o aviso de roteamento do modo automático.
+    :type aviso_rota: bool
+    :return: O próprio resultado.
+    :rtype: ResultadoSimplex
+    """
+    if aviso_rota:
+        chave = 'crash' if resultado.estatisticas.get('partida') == 'crash' else resultado.metodo
+        aviso, texto = AVISOS_ROTA[chave]
+        aviso(texto.format(motivo=resultado.motivo))
+        _show_rota(resultado)
+    if resultado.metodo == 'revisado':
+        st.info(f"⚙️ **Simplex Revisado**: {resultado.iteracoes} trocas de base, "
+                f"{resultado.estatisticas['refatoracoes']} fatorações LU da base.")
+    return _show_resultado(resultado)
+
+def _show_resultado(resultado):
+    """
+    Exibe o passo a passo e o desfecho de uma resolução, medindo o tempo de renderização.
+
+    :param resultado: Resultado devolvido por :func:`nucleo_simplex.solve` com ``trace=True``.
+    :type resultado: ResultadoSimplex
+    :return: O próprio resultado, para que a página possa guardá-lo.
+    :rtype: ResultadoSimplex
+    """
+    inicio = time.perf_counter()
+    _renderizar_resultado(resultado)
+    st.session_state["tempo_renderizacao"] = time.perf_counter() - inicio
+    return resultado
+
+def _renderizar_resultado(resultado):
+    """
+    Exibe o passo a passo e o desfecho de uma resolução.
+
+    :param resultado: Resultado da resolução.
+    :type resultado: ResultadoSimplex
+    """
+    if resultado.metodo == 'branch_and_bound':
+        _show_branch_and_bound(resultado)
+        return
+
+    partida = resultado.estatisticas.get('partida')
+    if partida == 'quente':
+        st.info(f"♻️ Partida quente: base anterior reaproveitada, reotimizada em {resultado.iteracoes} pivô(s).")
+    elif partida == 'crash':
+        st.info(f"🧱 Base de crash instalada: Fase I dispensada, {resultado.iteracoes} pivô(s) na Fase II.")
+    elif partida == 'fria':
+        st.info("♻️ A base anterior não é compatível com o modelo atual: resolvendo do zero.")
+    elif resultado.metodo == 'big_m':
+        st.info(f"⚙️ Inicializando **Método Big M** (M = {M_CONST:.0f})...")
+    elif resultado.metodo == 'duas_fases':
+        st.info("⚙️ Inicializando **Método das Duas Fases**: a Fase I minimiza a soma das artificiais.")
+
+    _show_presolve(resultado)
+    _show_trace(resultado)
+    _show_precificacao(resultado)
+
+    if resultado.status == 'ilimitado':
+        st.error("⚠️ Solução ilimitada.")
+        return
+    if resultado.status == 'infactivel' and resultado.metodo in ('dual', 'revisado', 'presolve'):
+        st.error("❌ Problema infactível.")
+        return
+    if resultado.status == 'infactivel' and resultado.metodo == 'duas_fases':
+        st.error("❌ **Problema Infactível:** a Fase I terminou com artificiais positivas.")
+        return
+
+    if resultado.status in AVISOS_INTERRUPCAO:
+        _show_interrupcao(resultado)
+        return
+
+    if resultado.metodo == 'dual':
+        st.success("✅ Solução Dual encontrada!")
+    _show_final_result(resultado)
+
+    if resultado.metodo == 'big_m':
+        # Validação Final: Variáveis Artificiais
+        if resultado.status == 'infactivel':
+            st.error("❌ **Solução Infactível:** Variáveis artificiais permanecem positivas. O problema não tem solução real.")
+        else:
+            st.success("✅ Solução Ótima Real encontrada (Artificiais zeradas)!")
+
+    show_sensibilidade(resultado)
+
+def _show_interrupcao(resultado):
+    """
+    Exibe uma resolução interrompida pelo orçamento e o ponto do último quadro.
+
+    :param resultado: Resultado com status em :data:`orcamento_simplex.STATUS_INTERROMPIDO`.
+    :type resultado: ResultadoSimplex
+    """
+    orcamento = resultado.estatisticas.get('orcamento', {})
+    limite = orcamento.get('max_iteracoes') if resultado.status == 'limite_iteracoes' else orcamento.get('tempo_limite')
+    ciclos = orcamento.get('ciclos_detectados', 0)
+    st.warning(AVISOS_INTERRUPCAO[resultado.status].format(limite=limite)
+               + f" após {resultado.iteracoes} pivô(s): exibindo o ponto do último quadro, "
+                 "que pode não ser ótimo nem factível.")
+    if ciclos:
+        st.caption(f"🔁 {ciclos} ciclo(s) detectado(s): a escolha da coluna passou à regra de Bland.")
+    _show_final_result(resultado)
+
+def _show_branch_and_bound(resultado):
+    """
+    Exibe a busca do branch-and-bound (nós, gap, melhorias da incumbente) e a solução inteira.
+
+    :param resultado: Resultado de :func:`inteiro_simplex.resolver_inteiro`.
+    :type resultado: ResultadoSimplex
+    """
+    est = resultado.estatisticas['branch_and_bound']
+    st.info(f"🌳 **Branch-and-bound** ({resultado.motivo}): seleção de nós por "
+            f"**{NOMES_SELECAO[est['selecao']].lower()}**, {est['processos']} processo(s).")
+    col_nos, col_vazao, col_gap, col_podados = st.columns(4)
+    col_nos.metric("Nós", est['nos'])
+    col_vazao.metric("Nós por segundo", f"{est['nos_por_segundo']:.0f}")
+    col_gap.metric("Gap", "—" if np.isinf(est['gap']) else f"{est['gap']:.2%}")
+    col_podados.metric("Podados", est['podados'])
+    st.caption(f"Profundidade máxima: {est['profundidade_max']} · Nós abertos: {est['abertos']} · "
+               f"Pivôs do Simplex: {est['iteracoes_simplex']} · Partidas quentes: {est['partidas_quentes']} · "
+               f"Tempo: {est['tempo_s'] * 1e3:.1f} ms.")
+    if est['melhorias']:
+        with st.expander("📉 Melhorias da incumbente"):
+            df = pd.DataFrame(est['melhorias']).rename(columns={'no': 'Nó', 'tempo_s': 'Tempo (s)', 'z': 'Z'})
+            st.line_chart(df, x='Nó', y='Z')
+            st.dataframe(df, use_container_width=True, hide_index=True)
+
+    if resultado.status == 'ilimitado':
+        st.error("⚠️ A relaxação linear é ilimitada.")
+        return
+    if resultado.status == 'infactivel':
+        st.error("❌ Não há solução com as variáveis inteiras.")
+        return
+    if resultado.status in MOTIVOS_PARADA_BB:
+        motivo = MOTIVOS_PARADA_BB[resultado.status]
+        if resultado.z is None:
+            st.warning(f"⏹️ Busca interrompida {motivo} sem solução inteira.")
+            return
+        extremo = "no máximo" if resultado.modo == 'max' else "no mínimo"
+        st.warning(f"⏹️ Busca interrompida {motivo}: exibindo a melhor solução encontrada "
+                   f"(o ótimo inteiro vale {extremo} {est['limitante']:.4g}).")
+    else:
+        st.success("✅ Solução inteira ótima encontrada!")
+    _show_final_result(resultado)
+
+def _show_rota(resultado):
+    """
+    Exibe as estimativas de pivôs de cada rota considerada pelo modo automático.
+
+    :param resultado: Resultado da resolução.
+    :type resultado: ResultadoSimplex
+    """
+    rota = resultado.estatisticas.get('rota')
+    if not rota:
+        return
+    with st.expander("🧭 Rota do modo automático"):
+        linhas = []
+        for metodo, est in rota['estimativas'].items():
+            linhas.append({
+                "Rota": NOMES_ROTA[metodo] + (" ✔️" if metodo == rota['metodo'] else ""),
+                "Aplicável": "Sim" if est['aplicavel'] else "Não",
+                "Pivôs estimados": f"{est['iteracoes']:.0f}" if est['aplicavel'] else "-",
+                "Pivôs poupados": f"{rota['economia'][metodo]:.0f}" if metodo in rota['economia'] else "-",
+                "Detalhe": est['detalhe'],
+            })
+        st.dataframe(pd.DataFrame(linhas), use_container_width=True, hide_index=True)
+        if rota['regra_fixa'] != rota['metodo']:
+            st.caption(f"A regra fixa escolheria **{NOMES_ROTA.get(rota['regra_fixa'], rota['regra_fixa'])}**.")
+
+def _show_presolve(resultado):
+    """
+    Exibe as reduções do presolve; os quadros seguintes são do modelo reduzido e escalado.
+
+    :param resultado: Resultado da resolução.
+    :type resultado: ResultadoSimplex
+    """
+    resumo = resultado.estatisticas.get('presolve')
+    if not resumo:
+        return
+    (m0, n0), (m, n) = resumo['forma_original'], resumo['forma']
+    st.info(f"🧹 **Presolve**: {m0}×{n0} → {m}×{n} "
+            f"({resumo['nnz_original']} → {resumo['nnz']} não nulos). "
+            "Os quadros abaixo são do modelo reduzido e escalado.")
+    with st.expander("🧹 Reduções do presolve"):
+        for linha in resultado.estatisticas['presolve_log']:
+            st.markdown(f"- {linha}")
+
+def _show_precificacao(resultado):
+    """
+    Exibe as estatísticas das regras de precificação (primal e dual) usadas na resolução.
+
+    :param resultado: Resultado da resolução.
+    :type resultado: ResultadoSimplex
+    """
+    dual = resultado.estatisticas.get('precificacao_dual')
+    if dual:
+        texto = (f"🔄 Linha do Dual Simplex por **{NOMES_PRECIFICACAO_DUAL.get(dual['regra'], dual['regra'])}**: "
+                 f"{dual['iteracoes']} pivô(s) dual(is), {dual['pivos_degenerados']} degenerado(s)")
+        if dual['trocas_de_limite']:
+            texto += f", {dual['trocas_de_limite']} variável(is) levada(s) ao limite pelo teste da razão"
+        st.caption(f"{texto}.")
+    est = resultado.estatisticas.get('precificacao')
+    if not est:
+        return
+    texto = (f"📐 Precificação **{NOMES_PRECIFICACAO.get(est['regra'], est['regra'])}**: "
+             f"{est['iteracoes']} pivô(s) primal(is), {est['tempo_s'] * 1e3:.2f} ms na regra, "
+             f"{est['pivos_degenerados']} pivô(s) degenerado(s)")
+    if est['ativacoes_bland']:
+        texto += f", regra de Bland ativada {est['ativacoes_bland']} vez(es)"
+    st.caption(f"{texto}. Tempo total: {resultado.estatisticas['tempo_s'] * 1e3:.2f} ms.")
+
+def solve_simplex_step_by_step(c, A_ub, b_ub, mode='max', base_inicial=None, precificacao='dantzig',
+                               presolve=False, limites=None, resumo=False):
     """
     Executa o algoritmo Simplex Primal passo a passo.
 
@@ -190,12 +450,24 @@ def solve_simplex_step_by_step(c, A_ub, b_ub, mode='max'):
     :type b_ub: list
     :param mode: 'max' ou 'min'.
     :type mode: str
+    :param base_inicial: Base final de uma resolução anterior (partida quente).
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra (ver :data:`precificacao_simplex.REGRAS`).
+    :type precificacao: str
+    :param presolve: Reduz e escala o modelo antes de resolver (ver :mod:`presolve_simplex`).
+    :type presolve: bool
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    :param resumo: Registra apenas o log compacto das iterações, sem os quadros.
+    :type resumo: bool
+    :return: Resultado da resolução.
+    :rtype: ResultadoSimplex
     """
-    tableau, columns, base_vars = _build_tableau(c, A_ub, b_ub)
-    # Passamos 'c' para saber quantas variáveis exibir no final
-    _run_simplex_loop(tableau, columns, base_vars, mode, method_name="Primal Simplex", c_original=c)
+    return _show_resultado(_resolver(c, A_ub, b_ub, mode=mode, method='primal', base_inicial=base_inicial,
+                                     precificacao=precificacao, presolve=presolve, limites=limites, resumo=resumo))
 
-def solve_dual_simplex_step_by_step(c, A_ub, b_ub, mode='max'):
+def solve_dual_simplex_step_by_step(c, A_ub, b_ub, mode='max', base_inicial=None, precificacao='dantzig',
+                                    presolve=False, limites=None, resumo=False):
     """
     Executa o algoritmo Dual Simplex passo a passo.
 
@@ -209,38 +481,24 @@ def solve_dual_simplex_step_by_step(c, A_ub, b_ub, mode='max'):
     :type b_ub: list
     :param mode: 'max' ou 'min'.
     :type mode: str
+    :param base_inicial: Base final de uma resolução anterior (partida quente).
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra (ver :data:`precificacao_simplex.REGRAS`).
+    :type precificacao: str
+    :param presolve: Reduz e escala o modelo antes de resolver (ver :mod:`presolve_simplex`).
+    :type presolve: bool
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    :param resumo: Registra apenas o log compacto das iterações, sem os quadros.
+    :type resumo: bool
+    :return: Resultado da resolução.
+    :rtype: ResultadoSimplex
     """
-    tableau, columns, base_vars = _build_tableau(c, A_ub, b_ub)
-    iteration = 1
-    
-    while np.any(tableau[1:, -1] < -1e-9): # Tolerância pequena
-        pivot_row = np.argmin(tableau[1:, -1]) + 1
-        pivot_row_values = tableau[pivot_row, :-2]
-        z_row_values = tableau[0, :-2]
-        ratios_dual = np.full(len(pivot_row_values), np.inf)
-        
-        for i in range(len(pivot_row_values)):
-            if pivot_row_values[i] < 0:
-                ratios_dual[i] = np.abs(z_row_values[i] / pivot_row_values[i])
-        
-        if np.all(ratios_dual == np.inf):
-            st.error("❌ Problema infactível.")
-            return
+    return _show_resultado(_resolver(c, A_ub, b_ub, mode=mode, method='dual', base_inicial=base_inicial,
+                                     precificacao=precificacao, presolve=presolve, limites=limites, resumo=resumo))
 
-        pivot_col = np.argmin(ratios_dual)
-        entering_var, leaving_var = columns[pivot_col], base_vars[pivot_row - 1]
-        
-        show_tableau_streamlit(tableau, columns, base_vars, title="Dual Quadro", iteration=iteration)
-        st.markdown(f"**Dual:** Sai `{leaving_var}` → Entra `{entering_var}`")
-        
-        base_vars[pivot_row - 1] = entering_var
-        _pivot(tableau, pivot_row, pivot_col)
-        iteration += 1
-
-    st.success("✅ Solução Dual encontrada!")
-    _show_final_result(tableau, columns, base_vars, mode, c)
-
-def solve_big_m_step_by_step(c, A, b, tipos, mode='max'):
+def solve_big_m_step_by_step(c, A, b, tipos, mode='max', base_inicial=None, precificacao='dantzig',
+                             presolve=False, limites=None, resumo=False):
     """
     Executa o Método Big M passo a passo.
 
@@ -256,160 +514,199 @@ def solve_big_m_step_by_step(c, A, b, tipos, mode='max'):
     :type tipos: list[str]
     :param mode: 'max' ou 'min'.
     :type mode: str
+    :param base_inicial: Base final de uma resolução anterior (partida quente).
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra (ver :data:`precificacao_simplex.REGRAS`).
+    :type precificacao: str
+    :param presolve: Reduz e escala o modelo antes de resolver (ver :mod:`presolve_simplex`).
+    :type presolve: bool
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    :param resumo: Registra apenas o log compacto das iterações, sem os quadros.
+    :type resumo: bool
+    :return: Resultado da resolução.
+    :rtype: ResultadoSimplex
     """
-    st.info(f"⚙️ Inicializando **Método Big M** (M = {M_CONST:.0f})...")
-    tableau, columns, base_vars = _build_big_m_tableau(c, A, b, tipos, mode)
-    
-    # Passamos 'c' para o display final
-    _run_simplex_loop(tableau, columns, base_vars, mode, method_name="Big M", c_original=c)
-    
-    # Validação Final: Variáveis Artificiais
-    final_base = base_vars
-    artificiais_na_base = [var for var in final_base if var.startswith('a')]
-    
-    tem_artificial_positiva = False
-    for artif in artificiais_na_base:
-        row_idx = final_base.index(artif) + 1
-        val = tableau[row_idx, -1]
-        if val > 1e-5: 
-            tem_artificial_positiva = True
-    
-    if tem_artificial_positiva:
-        st.error("❌ **Solução Infactível:** Variáveis artificiais permanecem positivas. O problema não tem solução real.")
-    else:
-        st.success("✅ Solução Ótima Real encontrada (Artificiais zeradas)!")
+    return _show_resultado(_resolver(c, A, b, tipos, mode, method='big_m', base_inicial=base_inicial,
+                                     precificacao=precificacao, presolve=presolve, limites=limites, resumo=resumo))
 
-def _run_simplex_loop(tableau, columns, base_vars, mode, method_name="Simplex", c_original=None):
+def solve_duas_fases_step_by_step(c, A, b, tipos, mode='max', base_inicial=None, precificacao='dantzig',
+                                  presolve=False, limites=None, resumo=False):
     """
-    Loop principal genérico do algoritmo Simplex (Primal).
+    Executa o Método das Duas Fases passo a passo.
 
-    Itera sobre o tableau até encontrar a solução ótima ou ilimitada, exibindo cada passo no Streamlit.
+    A Fase I minimiza a soma das artificiais; a Fase II parte da base obtida, já
+    sem as colunas artificiais, e otimiza a função objetivo original.
 
-    :param tableau: Matriz do tableau inicial.
-    :type tableau: np.ndarray
-    :param columns: Nomes das colunas.
-    :type columns: list[str]
-    :param base_vars: Nomes das variáveis básicas iniciais.
-    :type base_vars: list[str]
+    :param c: Coeficientes da função objetivo.
+    :type c: list
+    :param A: Coeficientes das restrições.
+    :type A: list
+    :param b: Termos independentes.
+    :type b: list
+    :param tipos: Lista de tipos das restrições ('<=', '>=', '=').
+    :type tipos: list[str]
     :param mode: 'max' ou 'min'.
     :type mode: str
-    :param method_name: Nome do método para exibição nos títulos (ex: "Big M").
-    :type method_name: str
-    :param c_original: Coeficientes originais para formatação do resultado final.
-    :type c_original: list or None
-    """
-    iteration = 1
-    while True:
-        linha_z = tableau[0, :-2]
-        
-        # Critério de parada
-        if mode == 'max':
-            if np.all(linha_z >= -1e-5):
-                break
-            pivot_col = np.argmin(linha_z)
-        elif mode == 'min':
-            if np.all(linha_z <= 1e-5):
-                break
-            pivot_col = np.argmax(linha_z)
-
-        # Razão
-        col = tableau[1:, pivot_col]
-        rhs = tableau[1:, -1]
-        
-        with np.errstate(divide='ignore'):
-            ratios = np.where(col > 1e-9, rhs / col, np.inf)
-
-        if np.all(ratios == np.inf):
-            st.error("⚠️ Solução ilimitada.")
-            return
-
-        pivot_row = np.argmin(ratios) + 1
-        entering_var, leaving_var = columns[pivot_col], base_vars[pivot_row - 1]
-
-        show_tableau_streamlit(tableau, columns, base_vars, title=f"Quadro {method_name}", iteration=iteration, ratios=ratios)
-        
-        base_vars[pivot_row - 1] = entering_var
-        _pivot(tableau, pivot_row, pivot_col)
-        iteration += 1
-
-    _show_final_result(tableau, columns, base_vars, mode, c_original)
-
-def _pivot(tableau, pivot_row, pivot_col):
+    :param base_inicial: Base final de uma resolução anterior (partida quente).
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra (ver :data:`precificacao_simplex.REGRAS`).
+    :type precificacao: str
+    :param presolve: Reduz e escala o modelo antes de resolver (ver :mod:`presolve_simplex`).
+    :type presolve: bool
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    :param resumo: Registra apenas o log compacto das iterações, sem os quadros.
+    :type resumo: bool
+    :return: Resultado da resolução.
+    :rtype: ResultadoSimplex
     """
-    Realiza a operação de pivoteamento Gaussiano no tableau.
+    return _show_resultado(_resolver(c, A, b, tipos, mode, method='duas_fases', base_inicial=base_inicial,
+                                     precificacao=precificacao, presolve=presolve, limites=limites, resumo=resumo))
 
-    Altera o tableau in-place, tornando a coluna pivô um vetor unitário.
+def solve_revisado_step_by_step(c, A, b, tipos, mode='max', base_inicial=None, precificacao='dantzig',
+                                presolve=False, limites=None, resumo=False):
+    """
+    Executa o Simplex Revisado (base fatorada LU + eta), exibindo as trocas de base.
 
-    :param tableau: Matriz do tableau a ser modificada.
-    :type tableau: np.ndarray
-    :param pivot_row: Índice da linha do elemento pivô.
-    :type pivot_row: int
-    :param pivot_col: Índice da coluna do elemento pivô.
-    :type pivot_col: int
+    :param c: Coeficientes da função objetivo.
+    :type c: list
+    :param A: Coeficientes das restrições.
+    :type A: list
+    :param b: Termos independentes.
+    :type b: list
+    :param tipos: Lista de tipos das restrições ('<=', '>=', '=').
+    :type tipos: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param base_inicial: Base final de uma resolução anterior (partida quente).
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra (ver :data:`precificacao_simplex.REGRAS`).
+    :type precificacao: str
+    :param presolve: Reduz e escala o modelo antes de resolver (ver :mod:`presolve_simplex`).
+    :type presolve: bool
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    :param resumo: Registra apenas o log compacto das iterações, sem os quadros.
+    :type resumo: bool
+    :return: Resultado da resolução.
+    :rtype: ResultadoSimplex
     """
-    pivot_element = tableau[pivot_row, pivot_col]
-    tableau[pivot_row] /= pivot_element
-    for i in range(tableau.shape[0]):
-        if i != pivot_row:
-            tableau[i] -= tableau[i, pivot_col] * tableau[pivot_row]
+    return exibir_resultado(_resolver(c, A, b, tipos, mode, method='revisado', base_inicial=base_inicial,
+                                      precificacao=precificacao, presolve=presolve, limites=limites,
+                                      resumo=resumo))
 
-def _show_final_result(tableau, columns, base_vars, mode, c_original):
+def _show_final_result(resultado):
     """
     Exibe o resultado final formatado com métricas e valores das variáveis de decisão.
 
-    :param tableau: Tableau final otimizado.
-    :type tableau: np.ndarray
-    :param columns: Lista de nomes das colunas.
-    :type columns: list[str]
-    :param base_vars: Variáveis que terminaram na base.
-    :type base_vars: list[str]
-    :param mode: 'max' ou 'min'.
-    :type mode: str
-    :param c_original: Lista de coeficientes originais para determinar o número de variáveis de decisão.
-    :type c_original: list or None
+    :param resultado: Resultado da resolução.
+    :type resultado: ResultadoSimplex
     """
-    final_z_value = tableau[0, -1]
-    
     st.markdown("### 🏁 Solução Final")
     col1, col2 = st.columns(2)
     with col1:
-        st.metric(label="Z ótimo", value=f"{final_z_value:.2f}")
+        st.metric(label="Z ótimo" if resultado.status not in AVISOS_INTERRUPCAO else "Z no último quadro",
+                  value=f"{resultado.z:.2f}")
     with col2:
-        st.metric(label="Modo", value="Maximização" if mode == 'max' else "Minimização")
+        st.metric(label="Modo", value="Maximização" if resultado.modo == 'max' else "Minimização")
 
     st.markdown("### 📈 Variáveis de Decisão:")
 
-    # Define número de variáveis originais para exibir
-    if c_original is not None:
-        total_vars = len(c_original)
-    else:
-        # Fallback: conta colunas que começam com 'x'
-        total_vars = sum(1 for c in columns if c.startswith('x'))
-
+    total_vars = len(resultado.x)
+    if total_vars > LIMITE_QUADROS:
+        # Modelos importados podem ter milhares de variáveis: tabela em vez de cartões
+        st.dataframe(pd.DataFrame({'Variável': [f'x{i+1}' for i in range(total_vars)], 'Valor': resultado.x}),
+                     use_container_width=True, hide_index=True)
+        return
     num_cols = min(max(2, total_vars // 3 + 1), 5)  # entre 2 e 5 colunas
     cols = st.columns(num_cols)
 
-    for i in range(total_vars):
-        var_name = f'x{i+1}'
-        valor = "0.00"
-        
-        if var_name in base_vars:
-            # Pega o valor da coluna RHS (-1) na linha correspondente à variável básica
-            idx_linha = base_vars.index(var_name) + 1
-            valor_float = tableau[idx_linha, -1]
-            valor = f"{valor_float:.2f}"
-        
+    for i, valor in enumerate(resultado.x):
         with cols[i % num_cols]:
-            st.metric(label=var_name, value=valor)
+            st.metric(label=f'x{i+1}', value=f"{valor:.2f}")
+
+def _formatar_limite(valor):
+    """Extremidade de uma faixa: ±∞ ou o valor com 4 algarismos significativos."""
+    if np.isinf(valor):
+        return "∞" if valor > 0 else "−∞"
+    return f"{valor:.4g}"
+
+def show_sensibilidade(resultado):
+    """
+    Painel recolhível com a análise de sensibilidade da solução ótima.
+
+    :param resultado: Resultado com ``resultado.sensibilidade`` preenchido.
+    :type resultado: ResultadoSimplex
+    """
+    relatorio = resultado.sensibilidade
+    if relatorio is None:
+        return
+    with st.expander("🔍 Análise de sensibilidade"):
+        st.caption("Faixas em que cada valor pode variar, isoladamente, sem mudar a base ótima: "
+                   "dentro delas, Z varia linearmente com o preço sombra (b) ou com x (c).")
+        if relatorio.degenerada:
+            st.warning("⚠️ Solução degenerada: algumas faixas podem terminar no valor atual.")
+        st.markdown("**Restrições**")
+        st.dataframe(pd.DataFrame({
+            'Restrição': [f'R{i+1}' for i in range(len(relatorio.folgas))],
+            'Folga': relatorio.folgas,
+            'Preço sombra': relatorio.precos_sombra,
+            'b mínimo': [_formatar_limite(v) for v in relatorio.faixa_rhs[:, 0]],
+            'b máximo': [_formatar_limite(v) for v in relatorio.faixa_rhs[:, 1]],
+        }), use_container_width=True, hide_index=True)
+        st.markdown("**Variáveis**")
+        st.dataframe(pd.DataFrame({
+            'Variável': [f'x{j+1}' for j in range(len(resultado.x))],
+            'Valor': resultado.x,
+            'Básica': relatorio.basicas,
+            'Custo reduzido': relatorio.custos_reduzidos,
+            'c mínimo': [_formatar_limite(v) for v in relatorio.faixa_custos[:, 0]],
+            'c máximo': [_formatar_limite(v) for v in relatorio.faixa_custos[:, 1]],
+        }), use_container_width=True, hide_index=True)
+
+def solve_automatico(c, A, b, tipos, mode='max', base_inicial=None, precificacao='dantzig',
+                     presolve=False, limites=None, resumo=False):
+    """
+    Analisa o problema e roteia automaticamente para o algoritmo mais barato (Primal, Dual,
+    base de crash ou Duas Fases).
 
-def solve_automatico(c, A, b, tipos, mode='max'):
+    A escolha é feita por :func:`rota_simplex.escolher_rota`, que estima os pivôs de cada
+    rota; esta função apenas exibe o aviso de roteamento, as estimativas e o passo a passo.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list
+    :param A: Coeficientes das restrições.
+    :type A: list
+    :param b: Termos independentes.
+    :type b: list
+    :param tipos: Lista de tipos das restrições.
+    :type tipos: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param base_inicial: Base final de uma resolução anterior (partida quente).
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra (ver :data:`precificacao_simplex.REGRAS`).
+    :type precificacao: str
+    :param presolve: Reduz e escala o modelo antes de resolver (ver :mod:`presolve_simplex`).
+    :type presolve: bool
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    :param resumo: Registra apenas o log compacto das iterações, sem os quadros.
+    :type resumo: bool
+    :return: Resultado da resolução.
+    :rtype: ResultadoSimplex
+    """
+    return exibir_resultado(_resolver(c, A, b, tipos, mode, method='automatico', base_inicial=base_inicial,
+                                      precificacao=precificacao, presolve=presolve, limites=limites,
+                                      resumo=resumo), aviso_rota=True)
+
+def solve_inteiro(c, A, b, tipos, mode='max', inteiras=None, selecao='melhor_limite', limites=None,
+                  max_nos=10000):
     """
-    Analisa o problema e roteia automaticamente para o algoritmo mais adequado (Primal, Dual ou Big M).
+    Resolve um problema com variáveis inteiras por branch-and-bound e exibe a busca.
 
-    1. Se houver igualdades ('='), roteia para Big M.
-    2. Tenta converter restrições '>=' para '<=' multiplicando por -1.
-    3. Analisa a factibilidade Primal (b >= 0) e Dual (otimalidade de Z).
-    4. Escolhe entre Primal Simplex, Dual Simplex ou Big M.
+    Os nós são PLs relaxados resolvidos pelo modo automático, cada um partindo da base do pai.
 
     :param c: Coeficientes da função objetivo.
     :type c: list
@@ -421,39 +718,264 @@ def solve_automatico(c, A, b, tipos, mode='max'):
     :type tipos: list[str]
     :param mode: 'max' ou 'min'.
     :type mode: str
+    :param inteiras: Índices (a partir de 0) das variáveis inteiras.
+    :type inteiras: list[int]
+    :param selecao: Ordem de exploração dos nós (ver :data:`inteiro_simplex.SELECOES`).
+    :type selecao: str
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    :param max_nos: Número máximo de nós avaliados.
+    :type max_nos: int
+    :return: Resultado da resolução.
+    :rtype: ResultadoSimplex
+    """
+    return exibir_resultado(resolver_inteiro(c, A, b, tipos, mode, inteiras=inteiras, limites=limites,
+                                             selecao=selecao, max_nos=max_nos, tempo_limite=TEMPO_LIMITE_S,
+                                             max_iteracoes=LIMITE_ITERACOES))
+
+def show_modelo_importado(modelo, nome_arquivo):
     """
-    c_np = np.array(c, dtype=float)
-    A_np = np.array(A, dtype=float)
-    b_np = np.array(b, dtype=float)
+    Exibe o resumo de um modelo importado, que substitui os campos de entrada da página.
 
-    if "=" in tipos:
-        st.warning("⚠️ Igualdades detectadas: Usando **Método Big M**.")
-        solve_big_m_step_by_step(c, A, b, tipos, mode)
+    :param modelo: Modelo lido do arquivo.
+    :type modelo: ModeloPL
+    :param nome_arquivo: Nome do arquivo enviado.
+    :type nome_arquivo: str
+    """
+    m, n = modelo.forma
+    densidade = modelo.nnz / (m * n) if m * n else 0.0
+    st.success(f"📂 Modelo **{modelo.nome}** importado de `{nome_arquivo}`: {m} restrição(ões) × "
+               f"{n} variável(is), {modelo.nnz} não nulos ({densidade:.1%} da matriz).")
+    contagem = " · ".join(f"{tipo}: {modelo.tipos.count(tipo)}" for tipo in ("≤", "≥", "=") if tipo in modelo.tipos)
+    limitadas = sum(1 for inferior, superior in modelo.limites or [] if inferior or superior is not None)
+    st.caption(f"Objetivo: {'Maximizar' if modelo.modo == 'max' else 'Minimizar'} · Restrições {contagem or '—'} · "
+               f"{limitadas} variável(is) com limites.")
+    if modelo.inteiras:
+        st.info(f"🌳 {len(modelo.inteiras)} variável(is) declarada(s) inteira(s): a resolução usa branch-and-bound.")
+
+    with st.expander("🔎 Visualizar o modelo"):
+        linhas, colunas = min(m, LIMITE_QUADROS), min(n, LIMITE_QUADROS)
+        if (m, n) != (linhas, colunas):
+            st.caption(f"Exibindo as primeiras {linhas} restrições e {colunas} variáveis.")
+        nomes = (modelo.nomes_variaveis or [f'x{j+1}' for j in range(n)])[:colunas]
+        if isinstance(modelo.A, MatrizCSC):
+            # Só o canto exibido é densificado, a partir das primeiras colunas
+            A = np.zeros((linhas, colunas))
+            for j in range(colunas):
+                inicio, fim = modelo.A.indptr[j], modelo.A.indptr[j + 1]
+                visiveis = modelo.A.indices[inicio:fim] < linhas
+                A[modelo.A.indices[inicio:fim][visiveis], j] = modelo.A.data[inicio:fim][visiveis]
+        else:
+            A = np.asarray(modelo.A)[:linhas, :colunas]
+        df = pd.DataFrame(A, columns=nomes,
+                          index=(modelo.nomes_restricoes or [f'R{i+1}' for i in range(m)])[:linhas])
+        df['Tipo'] = modelo.tipos[:linhas]
+        df['b'] = modelo.b[:linhas]
+        st.markdown("**Função objetivo:** " + ", ".join(f"{nome}: {valor:g}" for nome, valor in zip(nomes, modelo.c)))
+        st.dataframe(df, use_container_width=True)
+
+def botao_exportar(modelo, container=st):
+    """
+    Oferece o download do modelo atual no formato escolhido (MPS, LP ou CSV).
+
+    :param modelo: Modelo a exportar.
+    :type modelo: ModeloPL
+    :param container: Onde desenhar os controles (ex.: um expander da barra lateral).
+    """
+    formato = container.selectbox("Exportar como:", FORMATOS, format_func=str.upper, key="formato_exportacao")
+    container.download_button(
+        "💾 Baixar modelo",
+        data=exportar_modelo(modelo, formato),
+        file_name=f"{modelo.nome.lower()}.{formato}",
+        mime="text/csv" if formato == 'csv' else "text/plain",
+        use_container_width=True,
+    )
+
+# Desfechos da varredura paramétrica além do último ponto
+AVISOS_PARAMETRICA = {
+    'infactivel': "❌ O problema fica infactível a partir de {t:g}.",
+    'ilimitado': "⚠️ A solução fica ilimitada a partir de {t:g}.",
+    'interrompido': "⚠️ Varredura interrompida em {t:g}: limite de pivôs atingido.",
+}
+
+def show_analise_parametrica(c, A, b, tipos, mode, limites=None):
+    """
+    Painel recolhível que traça Z em função de um b_i ou de um c_j.
+
+    A curva é calculada por :func:`parametrico_simplex.varrer_parametro`: uma
+    resolução e um pivô por ponto de quebra, em vez de uma resolução por ponto.
+    Como a análise de sensibilidade, só é oferecido até :data:`LIMITE_SENSIBILIDADE`
+    linhas e colunas.
+
+    :param c: Coeficientes da função objetivo.
+    :param A: Coeficientes das restrições.
+    :param b: Termos independentes.
+    :param tipos: Tipos das restrições.
+    :type tipos: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param limites: Par (inferior, superior) de cada variável (None se não houver).
+    :type limites: list[tuple] or None
+    """
+    if max(len(b), len(c)) > LIMITE_SENSIBILIDADE:
         return
+    with st.expander("📈 Análise paramétrica"):
+        col_par, col_ind, col_ini, col_fim = st.columns(4)
+        parametro = col_par.radio("Parâmetro:", ("b", "c"), horizontal=True, key="param_alvo",
+                                  format_func={"b": "b (recurso)", "c": "c (custo)"}.get)
+        valores = b if parametro == "b" else c
+        indice = col_ind.number_input("Índice", min_value=1, max_value=len(valores), value=1, key="param_indice")
+        atual = float(valores[indice - 1])
+        inicio = col_ini.number_input("De", value=0.0, key="param_inicio")
+        fim = col_fim.number_input("Até", value=max(2 * abs(atual), 10.0), key="param_fim")
+        nome = f"{parametro}{indice}"
+        chave = (parametro, indice, inicio, fim)
+        if st.button("📈 Traçar Z", use_container_width=True):
+            try:
+                curva = varrer_parametro(c, A, b, tipos, mode, parametro, indice - 1, inicio, fim, limites)
+            except ValueError as e:
+                st.error(f"Não foi possível varrer {nome}: {e}")
+                return
+            st.session_state["curva_parametrica"] = {"chave": chave, "curva": curva}
+        guardada = st.session_state.get("curva_parametrica")
+        if not guardada or guardada["chave"] != chave:
+            st.caption(f"Valor atual de {nome}: {atual:g}. Escolha a faixa e clique em **Traçar Z**.")
+            return
+        curva = guardada["curva"]
+        st.line_chart(pd.DataFrame({nome: curva.pontos, "Z": curva.z}), x=nome, y="Z")
+        if curva.status in AVISOS_PARAMETRICA:
+            st.warning(AVISOS_PARAMETRICA[curva.status].format(t=curva.pontos[-1]))
+        st.dataframe(pd.DataFrame({
+            "De": [s["inicio"] for s in curva.segmentos],
+            "Até": [s["fim"] for s in curva.segmentos],
+            "dZ/d" + nome: [s["inclinacao"] for s in curva.segmentos],
+            "Base": [", ".join(s["base"]) for s in curva.segmentos],
+        }), use_container_width=True, hide_index=True)
+        st.caption(f"{len(curva.quebras)} ponto(s) de quebra, {curva.pivos} pivô(s) após uma única resolução.")
+
+# Rótulos das etapas medidas pelo PerfilSimplex
+NOMES_ETAPAS = {
+    'presolve': "Presolve",
+    'montagem': "Montagem do quadro",
+    'precificacao': "Precificação",
+    'teste_razao': "Teste da razão",
+    'pivoteamento': "Pivoteamento",
+    'fatoracao': "Fatoração LU",
+    'pos_solve': "Pós-solve",
+    'renderizacao': "Renderização",
+    'outros': "Outros",
+}
+
+def show_metricas(resultado, tempo_renderizacao=None):
+    """
+    Painel recolhível com o perfil da resolução: tempo por etapa, pivôs e exportação em JSON.
 
-    A_norm = A_np.copy()
-    b_norm = b_np.copy()
-    tipos_convertidos = False
-    
-    for i, tipo in enumerate(tipos):
-        if tipo == "≥":
-            A_norm[i] = -A_norm[i]
-            b_norm[i] = -b_norm[i]
-            tipos_convertidos = True
-            
-    primal_factivel = np.all(b_norm >= 0)
-    
-    z_row = -c_np if mode == 'max' else c_np
-    dual_factivel = np.all(z_row >= 0) if mode == 'max' else np.all(z_row <= 0)
-
-    if primal_factivel and not tipos_convertidos:
-        st.success("✅ Problema Padrão. Usando **Primal Simplex**.")
-        solve_simplex_step_by_step(c, A_norm.tolist(), b_norm.tolist(), mode)
-        
-    elif not primal_factivel and dual_factivel:
-        st.success("✅ RHS Negativo e Z Ótimo. Usando **Dual Simplex**.")
-        solve_dual_simplex_step_by_step(c, A_norm.tolist(), b_norm.tolist(), mode)
-        
-    else:
-        st.warning("🔄 Problema Misto. Usando **Método Big M**.")
-        solve_big_m_step_by_step(c, A, b, tipos, mode)
\ No newline at end of file
+    :param resultado: Resultado da resolução (com ``estatisticas['perfil']``).
+    :type resultado: ResultadoSimplex
+    :param tempo_renderizacao: Segundos gastos exibindo o resultado na página.
+    :type tempo_renderizacao: float or None
+    """
+    perfil = resultado.estatisticas.get('perfil')
+    if not perfil:
+        return
+    with st.expander("⏱️ Métricas do solver"):
+        contadores = perfil['contadores']
+        col_iter, col_deg, col_linhas, col_fat = st.columns(4)
+        col_iter.metric("Pivôs", contadores['pivos'])
+        col_deg.metric("Degenerados", contadores['pivos_degenerados'])
+        col_linhas.metric("Linhas por pivô", f"{perfil['linhas_por_pivo_media']:.1f}")
+        col_fat.metric("Refatorações", contadores['refatoracoes'])
+        if contadores['trocas_de_limite']:
+            st.caption(f"Trocas de limite: {contadores['trocas_de_limite']}.")
+
+        tempos = dict(perfil['tempos_s'], outros=perfil['outros_s'])
+        if tempo_renderizacao is not None:
+            tempos['renderizacao'] = tempo_renderizacao
+        df = pd.DataFrame({
+            'Etapa': [NOMES_ETAPAS.get(nome, nome) for nome in tempos],
+            'Tempo (ms)': [segundos * 1e3 for segundos in tempos.values()],
+            'Chamadas': [perfil['chamadas'].get(nome) for nome in tempos],
+        })
+        st.bar_chart(df, x='Etapa', y='Tempo (ms)', horizontal=True)
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.caption(f"Tempo do solver: {perfil['tempo_total_s'] * 1e3:.2f} ms. Resultados vindos do cache "
+                   "mostram as medições da resolução original.")
+
+        exportado = dict(perfil, renderizacao_s=tempo_renderizacao)
+        st.download_button("💾 Exportar métricas (JSON)", data=json.dumps(exportado, indent=2, ensure_ascii=False),
+                           file_name="metricas_simplex.json", mime="application/json", use_container_width=True)
+
+def _tabela_lote(resultados):
+    """Uma linha por tarefa concluída, com status e tempos."""
+    return pd.DataFrame({
+        'Modelo': [r.nome for r in resultados],
+        'Status': [r.status for r in resultados],
+        'Z': [r.z for r in resultados],
+        'Método': [r.metodo for r in resultados],
+        'Iterações': [r.iteracoes for r in resultados],
+        'Forma': [f"{r.forma[0]}×{r.forma[1]}" if r.forma else None for r in resultados],
+        'Leitura (ms)': [r.tempo_leitura_s * 1e3 for r in resultados],
+        'Resolução (ms)': [r.tempo_s * 1e3 for r in resultados],
+        'Erro': [r.erro for r in resultados],
+    })
+
+def show_lote(arquivos, processos, precificacao='dantzig', presolve=False):
+    """
+    Seção da resolução em lote: resolve os modelos enviados em um pool de processos,
+    com barra de progresso e status por tarefa, e oferece o pacote de resultados.
+
+    :param arquivos: Arquivos enviados (modelos ou pacotes zip/tar com modelos).
+    :type arquivos: list
+    :param processos: Tamanho do pool de processos.
+    :type processos: int
+    :param precificacao: Regra de escolha da coluna que entra (ver :data:`precificacao_simplex.REGRAS`).
+    :type precificacao: str
+    :param presolve: Reduz e escala cada modelo antes de resolver (ver :mod:`presolve_simplex`).
+    :type presolve: bool
+    """
+    st.markdown("---")
+    st.markdown("## 🗂️ Resolução em lote")
+    tarefas = []
+    for arquivo in arquivos:
+        try:
+            tarefas += tarefas_do_arquivo(arquivo.getvalue(), arquivo.name)
+        except ValueError as e:
+            st.error(f"❌ `{arquivo.name}` ignorado: {e}")
+    st.caption(f"{len(tarefas)} modelo(s) em {len(arquivos)} arquivo(s). Cada modelo é resolvido no modo "
+               f"Automático (branch-and-bound se tiver inteiras), em até {processos} processo(s).")
+
+    if st.button("▶️ Resolver lote", use_container_width=True, disabled=not tarefas):
+        barra = st.progress(0.0, text="Iniciando o pool de processos...")
+        tabela = st.empty()
+        concluidas = []
+        ultima_atualizacao = [0.0]
+
+        def progresso(resultado, quantidade, total):
+            concluidas.append(resultado)
+            barra.progress(quantidade / total, text=f"{quantidade}/{total} · `{resultado.nome}`: {resultado.status}")
+            agora = time.perf_counter()
+            if agora - ultima_atualizacao[0] >= INTERVALO_TABELA_LOTE_S or quantidade == total:
+                ultima_atualizacao[0] = agora
+                tabela.dataframe(_tabela_lote(concluidas), use_container_width=True, hide_index=True)
+
+        st.session_state["relatorio_lote"] = resolver_lote(tarefas, processos, progresso, method='automatico',
+                                                           precificacao=precificacao, presolve=presolve,
+                                                           max_iteracoes=LIMITE_ITERACOES,
+                                                           tempo_limite=TEMPO_LIMITE_S)
+        barra.empty()
+        tabela.empty()
+
+    relatorio = st.session_state.get("relatorio_lote")
+    if relatorio is None:
+        return
+    col_modelos, col_parede, col_soma, col_aceleracao = st.columns(4)
+    col_modelos.metric("Modelos", len(relatorio.resultados))
+    col_parede.metric("Tempo de parede", f"{relatorio.tempo_s:.2f} s")
+    col_soma.metric("Soma das tarefas", f"{relatorio.tempo_tarefas_s:.2f} s")
+    col_aceleracao.metric("Aceleração", f"{relatorio.aceleracao:.1f}x")
+    st.caption(" · ".join(f"{status}: {n}" for status, n in sorted(relatorio.contagem().items()))
+               + f" · {relatorio.processos} processo(s).")
+    st.dataframe(_tabela_lote(relatorio.resultados), use_container_width=True, hide_index=True)
+    st.download_button("💾 Baixar resultados (zip)", data=relatorio.exportar(), file_name="resultados_lote.zip",
+                       mime="application/zip", use_container_width=True,
+                       help="resumo.csv com uma linha por modelo e resultados.json com os valores das variáveis.")
@@ -0,0 +1,295 @@
+"""
+Programação inteira mista por branch-and-bound sobre o Simplex.
+
+Cada nó da árvore é o PL relaxado com limites mais apertados nas variáveis
+inteiras: o ramo esquerdo recebe ``x_j ≤ ⌊v⌋`` e o direito ``x_j ≥ ⌈v⌉``, em que
+``v`` é o valor fracionário de ``x_j`` no pai. Os filhos partem da base ótima do
+pai (``base_inicial`` de :func:`nucleo_simplex.solve`): a base continua
+dual-factível e é reotimizada em poucos pivôs do Dual Simplex.
+
+Os nós abertos são avaliados em lotes por um :class:`ProcessPoolExecutor` (um
+nó por processo); o modelo é enviado uma única vez a cada processo e cada
+tarefa leva apenas os limites do nó e a base do pai::
+
+    r = resolver_inteiro(c, A, b, tipos, 'max', inteiras=[0, 2])
+    r.x, r.z, r.estatisticas['branch_and_bound']['gap']
+"""
+import heapq
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from nucleo_simplex import ResultadoSimplex, _limites_variaveis, solve
+from orcamento_simplex import STATUS_INTERROMPIDO
+
+SELECOES = ('melhor_limite', 'profundidade')
+TOL_INTEIRO = 1e-6
+
+
+@dataclass(order=True)
+class _No:
+    """
+    Nó aberto da árvore, ordenado pela prioridade de :data:`SELECOES`.
+
+    :ivar prioridade: Chave do heap (menor sai primeiro).
+    :ivar limite: Valor do PL do pai no sentido de maximização (limitante do nó).
+    :ivar profundidade: Distância até a raiz.
+    :ivar inferiores: Limites inferiores das variáveis no nó.
+    :ivar superiores: Limites superiores das variáveis no nó.
+    :ivar base: Base ótima do pai (partida quente).
+    """
+    prioridade: tuple
+    limite: float = field(compare=False)
+    profundidade: int = field(compare=False)
+    inferiores: np.ndarray = field(compare=False)
+    superiores: np.ndarray = field(compare=False)
+    base: list = field(compare=False, default=None)
+
+
+def _avaliar_no(modelo, inferiores, superiores, base):
+    """
+    Resolve o PL relaxado de um nó.
+
+    :return: Status, z, x, base final, iterações e o tipo de partida.
+    :rtype: tuple
+    """
+    c, A, b, tipos, mode, opcoes = modelo
+    limites = [(l, u if np.isfinite(u) else None) for l, u in zip(inferiores, superiores)]
+    try:
+        resultado = solve(c, A, b, tipos, mode, limites=limites, base_inicial=base, **opcoes)
+    except ValueError:
+        if base is None:
+            raise
+        # A base do pai não pôde ser instalada e o método deduzido dela não parte do zero
+        resultado = solve(c, A, b, tipos, mode, limites=limites, **opcoes)
+    return (resultado.status, resultado.z, resultado.x, resultado.base, resultado.iteracoes,
+            resultado.estatisticas.get('partida'))
+
+# Modelo de cada processo do pool, recebido uma única vez na inicialização
+_MODELO = None
+
+def _iniciar_processo(modelo):
+    global _MODELO
+    _MODELO = modelo
+
+def _avaliar_no_no_processo(inferiores, superiores, base):
+    return _avaliar_no(_MODELO, inferiores, superiores, base)
+
+
+class _Arvore:
+    """Nós abertos, incumbente e contadores do branch-and-bound."""
+
+    def __init__(self, selecao, sinal):
+        self.selecao = selecao
+        self.sinal = sinal
+        self.abertos = []
+        self.ordem = 0
+        self.incumbente = -math.inf    # no sentido de maximização
+        self.x = None
+        self.nos = self.podados = self.partidas_quentes = self.iteracoes = self.profundidade = 0
+        self.maior_podado = -math.inf   # maior limitante descartado pela tolerância do gap
+        self.melhorias = []
+
+    def empilhar(self, limite, profundidade, inferiores, superiores, base):
+        self.ordem += 1
+        if self.selecao == 'melhor_limite':
+            prioridade = (-limite, -self.ordem)
+        else:
+            prioridade = (-profundidade, -self.ordem)
+        heapq.heappush(self.abertos, _No(prioridade, limite, profundidade, inferiores, superiores, base))
+
+    def retirar(self, quantidade, tolerancia):
+        """Retira até ``quantidade`` nós que ainda podem superar a incumbente."""
+        lote = []
+        while self.abertos and len(lote) < quantidade:
+            no = heapq.heappop(self.abertos)
+            if no.limite > self.incumbente + tolerancia:
+                lote.append(no)
+            else:
+                self.podar(no.limite)
+        return lote
+
+    def podar(self, limite):
+        self.podados += 1
+        self.maior_podado = max(self.maior_podado, limite)
+
+    def limitante(self):
+        """Melhor valor possível entre os nós abertos, os podados pelo gap e a incumbente (maximização)."""
+        return max([self.incumbente, self.maior_podado] + [no.limite for no in self.abertos])
+
+    def gap(self, limitante):
+        if not np.isfinite(self.incumbente):
+            return math.inf
+        return max(0.0, limitante - self.incumbente) / max(1.0, abs(self.incumbente))
+
+
+def _ramificar(arvore, no, z, x, base, inteiras, tolerancia, inicio):
+    """Poda o nó, atualiza a incumbente ou cria os dois filhos na variável mais fracionária."""
+    valor = arvore.sinal * z
+    if valor <= arvore.incumbente + tolerancia:
+        arvore.podar(valor)
+        return
+    fracoes = np.abs(x[inteiras] - np.round(x[inteiras]))
+    k = int(np.argmax(fracoes)) if len(inteiras) else 0
+    if len(inteiras) == 0 or fracoes[k] <= TOL_INTEIRO:
+        arvore.incumbente, arvore.x = valor, x
+        arvore.melhorias.append({'no': arvore.nos, 'tempo_s': time.perf_counter() - inicio,
+                                 'z': arvore.sinal * valor})
+        return
+    j, v = inteiras[k], x[inteiras[k]]
+    esquerdo = no.superiores.copy()
+    esquerdo[j] = math.floor(v)
+    direito = no.inferiores.copy()
+    direito[j] = math.ceil(v)
+    filhos = [(direito, no.superiores), (no.inferiores, esquerdo)]
+    if v - math.floor(v) > 0.5:
+        filhos.reverse()
+    # O ramo do arredondamento mais próximo de v é empilhado por último e sai primeiro
+    for inferiores, superiores in filhos:
+        arvore.empilhar(valor, no.profundidade + 1, inferiores, superiores, base)
+
+def resolver_inteiro(c, A, b, tipos=None, mode='max', inteiras=None, limites=None, selecao='melhor_limite',
+                     processos=None, max_nos=10000, tempo_limite=None, gap_relativo=1e-6, **opcoes):
+    """
+    Resolve um PL inteiro misto por branch-and-bound.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Coeficientes das restrições (densos ou esparsos).
+    :type A: list or np.ndarray or MatrizCSC
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '='). Se None, todas são '≤'.
+    :type tipos: list[str] or None
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param inteiras: Índices (a partir de 0) das variáveis inteiras; None torna todas inteiras.
+    :type inteiras: list[int] or None
+    :param limites: Par (inferior, superior) de cada variável de decisão.
+    :type limites: list[tuple] or None
+    :param selecao: 'melhor_limite' (nó de maior limitante primeiro) ou 'profundidade'.
+    :type selecao: str
+    :param processos: Processos que avaliam os nós em paralelo (padrão: número de
+        núcleos); com 1, os nós são avaliados no próprio processo.
+    :type processos: int or None
+    :param max_nos: Número máximo de nós avaliados.
+    :type max_nos: int
+    :param tempo_limite: Tempo máximo em segundos (None para não limitar).
+    :type tempo_limite: float or None
+    :param gap_relativo: A busca para quando (limitante - incumbente) / max(1, |incumbente|) ≤ gap_relativo.
+    :type gap_relativo: float
+    :param opcoes: Demais argumentos de :func:`nucleo_simplex.solve` para os PLs dos
+        nós (``method``, ``precificacao``, ``dtype``, ``max_iteracoes`` por nó). O
+        ``cancelamento`` é consultado entre os lotes de nós.
+    :return: Resultado com ``metodo='branch_and_bound'``; o status é 'otimo',
+        'infactivel', 'ilimitado' (relaxação ilimitada), 'limite_nos', 'limite_tempo',
+        'limite_iteracoes' (um nó esgotou ``max_iteracoes``) ou 'cancelado' (os quatro
+        últimos com a melhor solução encontrada, se houver). Nós, gap, limitante e
+        vazão ficam em ``estatisticas['branch_and_bound']``.
+    :rtype: ResultadoSimplex
+    :raises ValueError: Se a seleção, os índices das inteiras ou os limites forem inválidos.
+    """
+    inicio = time.perf_counter()
+    if selecao not in SELECOES:
+        raise ValueError(f"Seleção de nós desconhecida: {selecao!r}. Use uma de {SELECOES}.")
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    inteiras = np.array(sorted(set(range(n) if inteiras is None else inteiras)), dtype=int)
+    if len(inteiras) and not (0 <= inteiras[0] and inteiras[-1] < n):
+        raise ValueError(f"Índices de variáveis inteiras devem estar entre 0 e {n - 1}.")
+    inferiores, superiores = _limites_variaveis(limites, n)
+    inferiores[inteiras] = np.ceil(inferiores[inteiras] - TOL_INTEIRO)
+    superiores[inteiras] = np.floor(superiores[inteiras] + TOL_INTEIRO)
+
+    # A ficha de cancelamento não atravessa processos: é consultada aqui, entre os lotes
+    cancelamento = opcoes.pop('cancelamento', None)
+    modelo = (c, A, b, tipos, mode, opcoes)
+    processos = (os.cpu_count() or 1) if processos is None else max(1, processos)
+    executor = None
+    if processos > 1:
+        executor = ProcessPoolExecutor(processos, initializer=_iniciar_processo, initargs=(modelo,))
+    sinal = 1.0 if mode == 'max' else -1.0
+    arvore = _Arvore(selecao, sinal)
+    if np.all(inferiores <= superiores):
+        arvore.empilhar(math.inf, 0, inferiores, superiores, None)
+    status = None
+    try:
+        while arvore.abertos and status is None:
+            if arvore.nos >= max_nos:
+                status = 'limite_nos'
+                break
+            if tempo_limite is not None and time.perf_counter() - inicio >= tempo_limite:
+                status = 'limite_tempo'
+                break
+            if cancelamento is not None and cancelamento.cancelado:
+                status = 'cancelado'
+                break
+            tolerancia = gap_relativo * max(1.0, abs(arvore.incumbente)) if np.isfinite(arvore.incumbente) else 0.0
+            lote = arvore.retirar(min(processos, max_nos - arvore.nos), tolerancia)
+            if not lote:
+                break
+            argumentos = ([no.inferiores for no in lote], [no.superiores for no in lote], [no.base for no in lote])
+            if executor is None:
+                avaliacoes = [_avaliar_no(modelo, *args) for args in zip(*argumentos)]
+            else:
+                avaliacoes = list(executor.map(_avaliar_no_no_processo, *argumentos))
+            for no, (status_no, z, x, base, iteracoes, partida) in zip(lote, avaliacoes):
+                arvore.nos += 1
+                arvore.iteracoes += iteracoes
+                arvore.partidas_quentes += partida == 'quente'
+                arvore.profundidade = max(arvore.profundidade, no.profundidade)
+                if status_no == 'ilimitado':
+                    status = 'ilimitado'
+                    break
+                if status_no in STATUS_INTERROMPIDO:
+                    # O nó não foi resolvido: volta aberto para o limitante continuar válido
+                    arvore.empilhar(no.limite, no.profundidade, no.inferiores, no.superiores, no.base)
+                    status = status_no
+                    continue
+                if status_no != 'otimo':
+                    arvore.podar(-math.inf)
+                    continue
+                _ramificar(arvore, no, z, x, base, inteiras, tolerancia, inicio)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if status is None:
+        status = 'otimo' if arvore.x is not None else 'infactivel'
+    limitante = arvore.limitante()
+    x = arvore.x
+    if x is not None:
+        x = x.copy()
+        x[inteiras] = np.round(x[inteiras])
+    tempo = time.perf_counter() - inicio
+    resumo = {
+        'nos': arvore.nos,
+        'nos_por_segundo': arvore.nos / tempo if tempo > 0 else 0.0,
+        'podados': arvore.podados,
+        'abertos': len(arvore.abertos),
+        'profundidade_max': arvore.profundidade,
+        'iteracoes_simplex': arvore.iteracoes,
+        'partidas_quentes': arvore.partidas_quentes,
+        'incumbente': float(c @ x) if x is not None else None,
+        'limitante': sinal * limitante if np.isfinite(limitante) else None,
+        'gap': arvore.gap(limitante),
+        'selecao': selecao,
+        'processos': processos,
+        'melhorias': arvore.melhorias,
+        'tempo_s': tempo,
+    }
+    return ResultadoSimplex(
+        status=status,
+        z=resumo['incumbente'] if status != 'ilimitado' else None,
+        x=x if x is not None else np.full(n, np.nan),
+        base=[],
+        iteracoes=arvore.nos,
+        metodo='branch_and_bound',
+        modo=mode,
+        motivo=f"{len(inteiras)} variável(is) inteira(s)",
+        estatisticas={'branch_and_bound': resumo, 'tempo_s': tempo},
+    )
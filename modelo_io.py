@@ -0,0 +1,838 @@
+"""
+Importação e exportação de modelos de PL nos formatos MPS livre, LP (CPLEX) e CSV.
+
+Os leitores percorrem o arquivo linha a linha e acumulam apenas as triplas
+``(linha, coluna, valor)`` dos coeficientes não nulos em arrays compactos; a
+matriz A é montada uma única vez no final (densa para modelos pequenos,
+:class:`MatrizCSC` para os grandes). Os escritores geram o arquivo linha a linha
+em um fluxo de texto, sem montar a representação intermediária.
+
+Formato CSV (``A | tipo | b``): a primeira linha traz o sentido e os custos
+(``max,3,5``); uma linha de cabeçalho opcional termina em ``b`` (``x1,x2,tipo,b``)
+e nomeia as variáveis; cada linha seguinte é ``a1,...,an,tipo,b`` com tipo
+``<=``, ``>=`` ou ``=`` (ou ``≤``, ``≥``). Com ``;`` como separador, a vírgula
+decimal é aceita.
+"""
+import csv
+import gzip
+import io
+import itertools
+import os
+import re
+from array import array
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from esparso_simplex import MatrizCSC
+from inteiro_simplex import resolver_inteiro
+from nucleo_simplex import solve
+
+#: Acima deste número de elementos (m·n), A é mantida esparsa (:class:`MatrizCSC`)
+LIMITE_DENSO = 40_000
+
+FORMATOS = ('mps', 'lp', 'csv')
+
+_TIPOS = {'<=': '≤', '=<': '≤', '<': '≤', '≤': '≤',
+          '>=': '≥', '=>': '≥', '>': '≥', '≥': '≥',
+          '=': '=', '==': '='}
+_ASCII = {'≤': '<=', '≥': '>=', '=': '='}
+_LINHAS_MPS = {'≤': 'L', '≥': 'G', '=': 'E'}
+
+
+@dataclass
+class ModeloPL:
+    """
+    Modelo de PL importado de (ou a exportar para) um arquivo.
+
+    :ivar c: Coeficientes da função objetivo.
+    :ivar A: Matriz de restrições (densa, ou :class:`MatrizCSC` se grande).
+    :ivar b: Termos independentes.
+    :ivar tipos: Tipos das restrições ('≤', '≥', '=').
+    :ivar modo: 'max' ou 'min'.
+    :ivar limites: Par (inferior, superior) de cada variável, ou None se todas forem (0, ∞).
+    :ivar nomes_variaveis: Nomes das variáveis no arquivo.
+    :ivar nomes_restricoes: Nomes das restrições no arquivo.
+    :ivar inteiras: Índices das variáveis declaradas inteiras (ignoradas por :meth:`resolver`; ver :meth:`resolver_inteiro`).
+    :ivar nome: Nome do modelo.
+    """
+    c: np.ndarray
+    A: object
+    b: np.ndarray
+    tipos: list
+    modo: str = 'max'
+    limites: list = None
+    nomes_variaveis: list = None
+    nomes_restricoes: list = None
+    inteiras: list = field(default_factory=list)
+    nome: str = 'MODELO'
+
+    @property
+    def forma(self):
+        """Dimensões (m, n) do modelo."""
+        return len(self.b), len(self.c)
+
+    @property
+    def nnz(self):
+        """Número de coeficientes não nulos de A."""
+        return self.A.nnz if isinstance(self.A, MatrizCSC) else int(np.count_nonzero(self.A))
+
+    def resolver(self, **opcoes):
+        """
+        Resolve o modelo com :func:`nucleo_simplex.solve`.
+
+        :param opcoes: Demais argumentos de :func:`nucleo_simplex.solve` (``method``, ``trace``...).
+        :rtype: ResultadoSimplex
+        """
+        return solve(self.c, self.A, self.b, self.tipos, self.modo, limites=self.limites, **opcoes)
+
+    def resolver_inteiro(self, **opcoes):
+        """
+        Resolve o modelo respeitando :attr:`inteiras`, com :func:`inteiro_simplex.resolver_inteiro`.
+
+        :param opcoes: Demais argumentos de :func:`inteiro_simplex.resolver_inteiro` (``selecao``, ``processos``...).
+        :rtype: ResultadoSimplex
+        """
+        return resolver_inteiro(self.c, self.A, self.b, self.tipos, self.modo, inteiras=self.inteiras,
+                                limites=self.limites, **opcoes)
+
+
+def _abrir(fonte):
+    """
+    Abre ``fonte`` como fluxo de texto: caminho ou bytes (compactados com gzip ou não),
+    texto ou objeto de arquivo (binário, como o ``UploadedFile`` do Streamlit, ou texto).
+    """
+    if isinstance(fonte, (str, os.PathLike)) and not (isinstance(fonte, str) and '\n' in fonte):
+        caminho = os.fspath(fonte)
+        if caminho.endswith('.gz'):
+            return gzip.open(caminho, 'rt', encoding='utf-8')
+        return open(caminho, encoding='utf-8')
+    if isinstance(fonte, str):
+        return io.StringIO(fonte)
+    if isinstance(fonte, (bytes, bytearray)):
+        conteudo = bytes(fonte)
+        if conteudo[:2] == b'\x1f\x8b':
+            conteudo = gzip.decompress(conteudo)
+        return io.StringIO(conteudo.decode('utf-8-sig'))
+    if isinstance(fonte.read(0), bytes):
+        return io.TextIOWrapper(fonte, encoding='utf-8-sig')
+    return fonte
+
+
+class _Triplas:
+    """Acumula as triplas de A em arrays compactos enquanto o arquivo é lido."""
+
+    def __init__(self):
+        self.linhas = array('q')
+        self.colunas = array('q')
+        self.valores = array('d')
+
+    def adicionar(self, linha, coluna, valor):
+        if valor != 0.0:
+            self.linhas.append(linha)
+            self.colunas.append(coluna)
+            self.valores.append(valor)
+
+    def matriz(self, m, n, densa=None):
+        """
+        Monta A a partir das triplas (duplicatas são somadas).
+
+        :param densa: Força a forma densa (True) ou esparsa (False); None decide por :data:`LIMITE_DENSO`.
+        """
+        linhas = np.frombuffer(self.linhas, dtype=np.int64)
+        colunas = np.frombuffer(self.colunas, dtype=np.int64)
+        valores = np.frombuffer(self.valores, dtype=float)
+        if densa is None:
+            densa = m * n <= LIMITE_DENSO
+        if densa:
+            A = np.zeros((m, n))
+            np.add.at(A, (linhas, colunas), valores)
+            return A
+        return MatrizCSC.de_triplas(linhas, colunas, valores, (m, n))
+
+
+def _nomes(prefixo, quantidade):
+    return [f'{prefixo}{i + 1}' for i in range(quantidade)]
+
+def _limites_do_arquivo(inferiores, superiores):
+    """Lista de limites, ou None se todas as variáveis forem (0, ∞)."""
+    if not np.any(inferiores) and not np.any(np.isfinite(superiores)):
+        return None
+    return [(float(l), None if np.isinf(u) else float(u)) for l, u in zip(inferiores, superiores)]
+
+def _numero(texto):
+    """Converte um número do arquivo, aceitando 'inf'/'infinity' com sinal."""
+    return float(texto.replace('infinity', 'inf').replace('Infinity', 'inf'))
+
+
+# ============================================================
+# MPS livre
+# ============================================================
+
+def ler_mps(fonte, densa=None):
+    """
+    Lê um modelo no formato MPS livre (campos separados por espaços).
+
+    Seções suportadas: NAME, OBJSENSE (na mesma linha ou na seguinte), ROWS,
+    COLUMNS (com marcadores de inteiras), RHS, RANGES e BOUNDS (UP, LO, FX, PL,
+    BV, LI, UI). O sentido padrão é minimização. Linhas N além da primeira
+    (linhas livres) são descartadas.
+
+    :param fonte: Caminho, conteúdo (str/bytes) ou arquivo aberto.
+    :param densa: Forma de A (None decide pelo tamanho, ver :data:`LIMITE_DENSO`).
+    :type densa: bool or None
+    :rtype: ModeloPL
+    :raises ValueError: Se o arquivo for inválido ou tiver variáveis livres (FR, MI).
+    """
+    nome, modo = 'MODELO', 'min'
+    objetivo, livres = None, set()
+    linhas_idx, tipos, nomes_rest = {}, [], []
+    colunas_idx, nomes_var = {}, []
+    custos = array('d')
+    triplas = _Triplas()
+    rhs, faixas = {}, {}
+    inferiores, superiores = {}, {}
+    inteiras, marcador_inteiro = set(), False
+    secao = None
+
+    with _abrir(fonte) as arquivo:
+        for numero, linha in enumerate(arquivo, start=1):
+            if not linha.strip() or linha.startswith('*'):
+                continue
+            campos = linha.split()
+            if not linha[0].isspace():
+                secao = campos[0].upper()
+                if secao == 'NAME':
+                    nome = campos[1] if len(campos) > 1 else nome
+                elif secao == 'OBJSENSE' and len(campos) > 1:
+                    modo = 'max' if campos[1].upper().startswith('MAX') else 'min'
+                elif secao == 'ENDATA':
+                    break
+                elif secao not in ('OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS'):
+                    raise ValueError(f"Linha {numero}: seção MPS desconhecida {campos[0]!r}.")
+                continue
+
+            if secao == 'OBJSENSE':
+                modo = 'max' if campos[0].upper().startswith('MAX') else 'min'
+            elif secao == 'ROWS':
+                tipo, nome_linha = campos[0].upper(), campos[1]
+                if tipo == 'N':
+                    if objetivo is None:
+                        objetivo = nome_linha
+                    else:
+                        livres.add(nome_linha)
+                elif tipo in ('L', 'G', 'E'):
+                    linhas_idx[nome_linha] = len(tipos)
+                    tipos.append({'L': '≤', 'G': '≥', 'E': '='}[tipo])
+                    nomes_rest.append(nome_linha)
+                else:
+                    raise ValueError(f"Linha {numero}: tipo de linha MPS desconhecido {tipo!r}.")
+            elif secao == 'COLUMNS':
+                if len(campos) >= 3 and campos[1].strip("'").upper() == 'MARKER':
+                    marcador_inteiro = campos[2].strip("'").upper() == 'INTORG'
+                    continue
+                nome_col = campos[0]
+                j = colunas_idx.get(nome_col)
+                if j is None:
+                    j = colunas_idx[nome_col] = len(nomes_var)
+                    nomes_var.append(nome_col)
+                    custos.append(0.0)
+                if marcador_inteiro:
+                    inteiras.add(j)
+                for nome_linha, valor in zip(campos[1::2], campos[2::2]):
+                    if nome_linha == objetivo:
+                        custos[j] += float(valor)
+                    elif nome_linha in linhas_idx:
+                        triplas.adicionar(linhas_idx[nome_linha], j, float(valor))
+                    elif nome_linha not in livres:
+                        raise ValueError(f"Linha {numero}: restrição {nome_linha!r} não declarada em ROWS.")
+            elif secao in ('RHS', 'RANGES'):
+                destino = rhs if secao == 'RHS' else faixas
+                pares = campos[1:] if len(campos) % 2 else campos
+                for nome_linha, valor in zip(pares[::2], pares[1::2]):
+                    if nome_linha in linhas_idx:
+                        destino[linhas_idx[nome_linha]] = float(valor)
+            elif secao == 'BOUNDS':
+                tipo = campos[0].upper()
+                com_valor = tipo in ('UP', 'LO', 'FX', 'LI', 'UI')
+                nome_col = campos[2] if len(campos) == (4 if com_valor else 3) else campos[1]
+                if nome_col not in colunas_idx:
+                    raise ValueError(f"Linha {numero}: variável {nome_col!r} não declarada em COLUMNS.")
+                j = colunas_idx[nome_col]
+                valor = _numero(campos[-1]) if com_valor else None
+                if tipo in ('UP', 'UI'):
+                    superiores[j] = valor
+                elif tipo in ('LO', 'LI'):
+                    inferiores[j] = valor
+                elif tipo == 'FX':
+                    inferiores[j] = superiores[j] = valor
+                elif tipo == 'BV':
+                    inferiores[j], superiores[j] = 0.0, 1.0
+                elif tipo in ('FR', 'MI'):
+                    raise ValueError(f"Linha {numero}: variáveis livres ({tipo} {nome_col}) não são suportadas; "
+                                     "escreva a variável como diferença de duas não negativas.")
+                elif tipo != 'PL':
+                    raise ValueError(f"Linha {numero}: tipo de limite MPS desconhecido {tipo!r}.")
+                if tipo in ('BV', 'LI', 'UI'):
+                    inteiras.add(j)
+
+    m, n = len(tipos), len(nomes_var)
+    b = np.zeros(m)
+    for i, valor in rhs.items():
+        b[i] = valor
+
+    # RANGES: a restrição vira um intervalo [inferior, superior], com uma linha a mais
+    tipos = list(tipos)
+    extras = []
+    for i, r in faixas.items():
+        if tipos[i] == '≤':
+            extras.append((i, '≥', b[i] - abs(r)))
+        elif tipos[i] == '≥':
+            extras.append((i, '≤', b[i] + abs(r)))
+        else:
+            tipos[i], b[i] = ('≥', b[i]) if r > 0 else ('≤', b[i])
+            extras.append((i, '≤' if r > 0 else '≥', b[i] + r))
+    if extras:
+        linhas_A = np.frombuffer(triplas.linhas, dtype=np.int64).copy()
+        colunas_A = np.frombuffer(triplas.colunas, dtype=np.int64).copy()
+        valores_A = np.frombuffer(triplas.valores, dtype=float).copy()
+        for k, (i, tipo, limite) in enumerate(extras):
+            da_linha = np.flatnonzero(linhas_A == i)
+            for e in da_linha:
+                triplas.adicionar(m + k, int(colunas_A[e]), float(valores_A[e]))
+            tipos.append(tipo)
+            nomes_rest.append(f'{nomes_rest[i]}_faixa')
+        b = np.concatenate([b, [limite for _, _, limite in extras]])
+        m += len(extras)
+
+    l, u = np.zeros(n), np.full(n, np.inf)
+    for j, valor in inferiores.items():
+        l[j] = valor
+    for j, valor in superiores.items():
+        u[j] = valor
+    if not np.all(np.isfinite(l)):
+        raise ValueError("Limites inferiores infinitos (variáveis livres) não são suportados.")
+
+    return ModeloPL(
+        c=np.frombuffer(custos, dtype=float).copy(),
+        A=triplas.matriz(m, n, densa),
+        b=b,
+        tipos=tipos,
+        modo=modo,
+        limites=_limites_do_arquivo(l, u),
+        nomes_variaveis=nomes_var,
+        nomes_restricoes=nomes_rest,
+        inteiras=sorted(inteiras),
+        nome=nome,
+    )
+
+def _formatar(valor):
+    """Menor representação decimal que reproduz o float exatamente."""
+    texto = repr(float(valor))
+    return texto[:-2] if texto.endswith('.0') else texto
+
+def _colunas_csc(A, n):
+    """Converte A para CSC (sem cópia se já for :class:`MatrizCSC`)."""
+    return A if isinstance(A, MatrizCSC) else MatrizCSC.de_densa(np.asarray(A, dtype=float).reshape(-1, n))
+
+def escrever_mps(modelo, destino):
+    """
+    Escreve o modelo no formato MPS livre.
+
+    :param modelo: Modelo a exportar.
+    :type modelo: ModeloPL
+    :param destino: Fluxo de texto aberto para escrita.
+    """
+    m, n = modelo.forma
+    variaveis = modelo.nomes_variaveis or _nomes('x', n)
+    restricoes = modelo.nomes_restricoes or _nomes('R', m)
+    csc = _colunas_csc(modelo.A, n)
+    inteiras = set(modelo.inteiras)
+
+    destino.write(f"NAME {modelo.nome}\n")
+    destino.write(f"OBJSENSE\n    {'MAX' if modelo.modo == 'max' else 'MIN'}\n")
+    destino.write("ROWS\n N  OBJ\n")
+    for nome, tipo in zip(restricoes, modelo.tipos):
+        destino.write(f" {_LINHAS_MPS[tipo]}  {nome}\n")
+    destino.write("COLUMNS\n")
+    em_inteiras = False
+    for j in range(n):
+        if (j in inteiras) != em_inteiras:
+            em_inteiras = not em_inteiras
+            destino.write(f"    MARKER 'MARKER' '{'INTORG' if em_inteiras else 'INTEND'}'\n")
+        # Coluna sem coeficientes ainda é declarada (com custo 0) para não sumir na leitura
+        if modelo.c[j] != 0.0 or csc.indptr[j] == csc.indptr[j + 1]:
+            destino.write(f"    {variaveis[j]} OBJ {_formatar(modelo.c[j])}\n")
+        for k in range(csc.indptr[j], csc.indptr[j + 1]):
+            destino.write(f"    {variaveis[j]} {restricoes[csc.indices[k]]} {_formatar(csc.data[k])}\n")
+    if em_inteiras:
+        destino.write("    MARKER 'MARKER' 'INTEND'\n")
+    destino.write("RHS\n")
+    for nome, valor in zip(restricoes, modelo.b):
+        if valor != 0.0:
+            destino.write(f"    RHS {nome} {_formatar(valor)}\n")
+    if modelo.limites is not None:
+        destino.write("BOUNDS\n")
+        for nome, (inferior, superior) in zip(variaveis, modelo.limites):
+            inferior = inferior or 0.0
+            if superior is not None and superior == inferior:
+                destino.write(f" FX BND {nome} {_formatar(inferior)}\n")
+                continue
+            if inferior != 0.0:
+                destino.write(f" LO BND {nome} {_formatar(inferior)}\n")
+            if superior is not None:
+                destino.write(f" UP BND {nome} {_formatar(superior)}\n")
+    destino.write("ENDATA\n")
+
+
+# ============================================================
+# LP (CPLEX)
+# ============================================================
+
+_TOKEN_LP = re.compile(r"""
+    (?P<op><=|>=|=<|=>|<|>|=)
+  | (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<sinal>[+-])
+  | (?P<dois_pontos>:)
+  | (?P<nome>[^\s\d.+\-<>=:][^\s+\-<>=:]*)
+""", re.VERBOSE)
+
+_SECOES_LP = {
+    'maximize': 'max', 'maximise': 'max', 'maximum': 'max', 'max': 'max',
+    'minimize': 'min', 'minimise': 'min', 'minimum': 'min', 'min': 'min',
+    'subject to': 'st', 'such that': 'st', 'st': 'st', 's.t.': 'st', 'st.': 'st',
+    'bounds': 'bounds', 'bound': 'bounds',
+    'general': 'general', 'generals': 'general', 'gen': 'general',
+    'integer': 'general', 'integers': 'general',
+    'binary': 'binary', 'binaries': 'binary', 'bin': 'binary',
+    'end': 'end',
+}
+
+
+def _tokens_lp(texto, numero):
+    posicao, tokens = 0, []
+    texto = texto.strip()
+    while posicao < len(texto):
+        achado = _TOKEN_LP.match(texto, posicao)
+        if not achado:
+            espacos = len(texto[posicao:]) - len(texto[posicao:].lstrip())
+            if espacos:
+                posicao += espacos
+                continue
+            raise ValueError(f"Linha {numero}: símbolo inesperado {texto[posicao]!r} no arquivo LP.")
+        tokens.append((achado.lastgroup, achado.group(achado.lastgroup)))
+        posicao = achado.end()
+    return tokens
+
+
+class _ExpressaoLP:
+    """
+    Máquina de estados que consome os tokens de uma seção do LP e devolve cada
+    expressão completa ``[rótulo:] termos [op rhs]`` assim que ela termina.
+
+    Números soltos do lado esquerdo (``x + y + 2 <= 4``) são constantes: numa
+    restrição passam para o lado direito; na função objetivo são rejeitados,
+    pois :class:`ModeloPL` não guarda deslocamento do objetivo.
+    """
+
+    def __init__(self, com_rhs):
+        self.com_rhs = com_rhs
+        self._linha = None
+        self._reiniciar()
+
+    def _reiniciar(self):
+        self.rotulo, self.termos, self.op = None, [], None
+        self.constante, self._linha_constante = 0.0, None
+        self._sinal, self._coef, self._nome = 1.0, None, None
+
+    def _fechar_termo(self):
+        if self._nome is not None:
+            coef = 1.0 if self._coef is None else self._coef
+            self.termos.append((self._nome, self._sinal * coef))
+        elif self._coef is not None:
+            self.constante += self._sinal * self._coef
+            self._linha_constante = self._linha
+        self._sinal, self._coef, self._nome = 1.0, None, None
+
+    def alimentar(self, tipo, valor, numero):
+        """Consome um token; devolve (rótulo, termos, op, rhs) quando uma restrição termina."""
+        self._linha = numero
+        if self._nome is not None and tipo == 'dois_pontos' and not self.termos and self._coef is None:
+            self.rotulo, self._nome = self._nome, None
+            return None
+        if self.op is not None:
+            # Depois do operador, só o sinal e o número do lado direito
+            if tipo == 'sinal':
+                self._sinal *= -1.0 if valor == '-' else 1.0
+                return None
+            if tipo == 'num' or (tipo == 'nome' and valor.lower() in ('inf', 'infinity')):
+                rhs = self._sinal * _numero(valor.lower()) - self.constante
+                completa = (self.rotulo, self.termos, self.op, rhs)
+                self._reiniciar()
+                return completa
+            raise ValueError(f"Linha {numero}: esperado o lado direito da restrição {self.rotulo or ''}.")
+        if tipo in ('num', 'nome') and (self._nome is not None or (tipo == 'num' and self._coef is not None)):
+            raise ValueError(f"Linha {numero}: {valor!r} inesperado; separe os termos com '+' ou '-'.")
+        if tipo == 'sinal':
+            self._fechar_termo()
+            self._sinal = -1.0 if valor == '-' else 1.0
+        elif tipo == 'num':
+            self._coef = float(valor)
+        elif tipo == 'nome':
+            self._nome = valor
+        elif tipo == 'op':
+            if not self.com_rhs:
+                raise ValueError(f"Linha {numero}: operador {valor!r} inesperado na função objetivo.")
+            self._fechar_termo()
+            self.op = _TIPOS[valor]
+            self._sinal = 1.0
+        return None
+
+    def finalizar(self):
+        """Fecha a expressão pendente (a função objetivo termina junto com a seção)."""
+        self._fechar_termo()
+        if self.constante:
+            raise ValueError(f"Linha {self._linha_constante}: constante na função objetivo não é suportada.")
+        return self.rotulo, self.termos
+
+
+def _limite_lp(tokens, numero):
+    """Interpreta uma linha da seção Bounds: devolve (nome, inferior, superior), com None para 'sem alteração'."""
+    itens = []
+    for tipo, valor in tokens:
+        if tipo == 'nome' and valor.lower() in ('inf', 'infinity'):
+            tipo, valor = 'num', 'inf'
+        if tipo == 'num' and itens and itens[-1][0] == 'sinal':
+            sinal = itens.pop()[1]
+            valor = ('-' if sinal == '-' else '') + valor
+        itens.append((tipo, valor))
+    tipos = [tipo for tipo, _ in itens]
+    if tipos == ['nome', 'nome'] and itens[1][1].lower() == 'free':
+        raise ValueError(f"Linha {numero}: variáveis livres ({itens[0][1]} free) não são suportadas.")
+    if tipos == ['num', 'op', 'nome', 'op', 'num']:
+        return itens[2][1], _numero(itens[0][1]), _numero(itens[4][1])
+    if tipos == ['nome', 'op', 'num']:
+        nome, op, valor = itens[0][1], _TIPOS[itens[1][1]], _numero(itens[2][1])
+    elif tipos == ['num', 'op', 'nome']:
+        nome, op, valor = itens[2][1], _TIPOS[itens[1][1]], _numero(itens[0][1])
+        op = {'≤': '≥', '≥': '≤', '=': '='}[op]
+    else:
+        raise ValueError(f"Linha {numero}: limite inválido no arquivo LP.")
+    if op == '≤':
+        return nome, None, valor
+    if op == '≥':
+        return nome, valor, None
+    return nome, valor, valor
+
+def ler_lp(fonte, densa=None):
+    """
+    Lê um modelo no formato LP do CPLEX.
+
+    Suporta as seções Maximize/Minimize, Subject To, Bounds, General e Binary
+    (variáveis inteiras e binárias ficam em :attr:`ModeloPL.inteiras`) e End.
+    Comentários começam com ``\\``. Expressões podem ocupar várias linhas;
+    uma constante do lado esquerdo de uma restrição passa para o lado direito.
+
+    :param fonte: Caminho, conteúdo (str/bytes) ou arquivo aberto.
+    :param densa: Forma de A (None decide pelo tamanho, ver :data:`LIMITE_DENSO`).
+    :type densa: bool or None
+    :rtype: ModeloPL
+    :raises ValueError: Se o arquivo for inválido, tiver variáveis livres ou
+        constante na função objetivo.
+    """
+    modo, secao = None, None
+    colunas_idx, nomes_var = {}, []
+    custos = {}
+    triplas = _Triplas()
+    tipos, b, nomes_rest = [], array('d'), []
+    limites = {}
+    inteiras = set()
+    objetivo = _ExpressaoLP(com_rhs=False)
+    restricao = _ExpressaoLP(com_rhs=True)
+
+    def coluna(nome):
+        j = colunas_idx.get(nome)
+        if j is None:
+            j = colunas_idx[nome] = len(nomes_var)
+            nomes_var.append(nome)
+        return j
+
+    def fechar_objetivo():
+        for nome, coef in objetivo.finalizar()[1]:
+            j = coluna(nome)
+            custos[j] = custos.get(j, 0.0) + coef
+
+    with _abrir(fonte) as arquivo:
+        for numero, linha in enumerate(arquivo, start=1):
+            linha = linha.split('\\', 1)[0].strip()
+            if not linha:
+                continue
+            # Cabeçalho de seção, possivelmente seguido de conteúdo na mesma linha
+            minuscula = linha.lower()
+            cabecalho = next((chave for chave in sorted(_SECOES_LP, key=len, reverse=True)
+                              if minuscula == chave or minuscula.startswith(chave + ' ')), None)
+            if cabecalho is not None and not (secao == 'st' and cabecalho in ('max', 'min')):
+                if secao in ('max', 'min'):
+                    fechar_objetivo()
+                secao = _SECOES_LP[cabecalho]
+                if secao in ('max', 'min'):
+                    modo = secao
+                if secao == 'end':
+                    break
+                linha = linha[len(cabecalho):].strip()
+                if not linha:
+                    continue
+
+            tokens = _tokens_lp(linha, numero)
+            if secao in ('max', 'min'):
+                for tipo, valor in tokens:
+                    objetivo.alimentar(tipo, valor, numero)
+            elif secao == 'st':
+                for tipo, valor in tokens:
+                    completa = restricao.alimentar(tipo, valor, numero)
+                    if completa is None:
+                        continue
+                    rotulo, termos, op, rhs = completa
+                    i = len(tipos)
+                    for nome, coef in termos:
+                        triplas.adicionar(i, coluna(nome), coef)
+                    tipos.append(op)
+                    b.append(rhs)
+                    nomes_rest.append(rotulo or f'R{i + 1}')
+            elif secao == 'bounds':
+                nome, inferior, superior = _limite_lp(tokens, numero)
+                atual = limites.get(coluna(nome), (0.0, np.inf))
+                limites[coluna(nome)] = (atual[0] if inferior is None else inferior,
+                                         atual[1] if superior is None else superior)
+            elif secao in ('general', 'binary'):
+                for tipo, valor in tokens:
+                    j = coluna(valor)
+                    inteiras.add(j)
+                    if secao == 'binary':
+                        limites[j] = (0.0, 1.0)
+            else:
+                raise ValueError(f"Linha {numero}: conteúdo fora de seção no arquivo LP.")
+        if secao in ('max', 'min'):
+            fechar_objetivo()
+
+    if modo is None:
+        raise ValueError("Arquivo LP sem seção Maximize/Minimize.")
+    if restricao.termos or restricao.op:
+        raise ValueError("Arquivo LP termina no meio de uma restrição.")
+    n, m = len(nomes_var), len(tipos)
+    c = np.zeros(n)
+    for j, valor in custos.items():
+        c[j] = valor
+    l, u = np.zeros(n), np.full(n, np.inf)
+    for j, (inferior, superior) in limites.items():
+        l[j], u[j] = inferior, superior
+    if not np.all(np.isfinite(l)):
+        raise ValueError("Limites inferiores infinitos (variáveis livres) não são suportados.")
+
+    return ModeloPL(
+        c=c,
+        A=triplas.matriz(m, n, densa),
+        b=np.frombuffer(b, dtype=float).copy(),
+        tipos=tipos,
+        modo=modo,
+        limites=_limites_do_arquivo(l, u),
+        nomes_variaveis=nomes_var,
+        nomes_restricoes=nomes_rest,
+        inteiras=sorted(inteiras),
+    )
+
+def _expressao_lp(termos, largura=8):
+    """Escreve os termos (nome, coeficiente) quebrando a linha a cada ``largura`` termos."""
+    partes = []
+    for k, (nome, coef) in enumerate(termos):
+        sinal = '-' if coef < 0 else '+'
+        valor = '' if abs(coef) == 1.0 else _formatar(abs(coef)) + ' '
+        parte = f"{sinal} {valor}{nome}"
+        if k and k % largura == 0:
+            parte = '\n   ' + parte
+        partes.append(parte)
+    texto = ' '.join(partes)
+    return texto[2:] if texto.startswith('+ ') else texto
+
+def escrever_lp(modelo, destino):
+    """
+    Escreve o modelo no formato LP do CPLEX.
+
+    :param modelo: Modelo a exportar.
+    :type modelo: ModeloPL
+    :param destino: Fluxo de texto aberto para escrita.
+    """
+    m, n = modelo.forma
+    variaveis = modelo.nomes_variaveis or _nomes('x', n)
+    restricoes = modelo.nomes_restricoes or _nomes('R', m)
+    csc = _colunas_csc(modelo.A, n)
+    # Percorre A por linhas: ordena os elementos da CSC pela linha
+    colunas_el = np.repeat(np.arange(n), np.diff(csc.indptr))
+    ordem = np.lexsort((colunas_el, csc.indices))
+    inicio_linha = np.searchsorted(csc.indices[ordem], np.arange(m + 1))
+
+    destino.write(f"\\ {modelo.nome}\n")
+    destino.write("Maximize\n" if modelo.modo == 'max' else "Minimize\n")
+    # Todas as colunas aparecem no objetivo (mesmo com custo 0): a leitura numera as
+    # variáveis pela ordem da primeira ocorrência
+    termos = [(variaveis[j], modelo.c[j]) for j in range(n)]
+    destino.write(f" obj: {_expressao_lp(termos)}\n")
+    destino.write("Subject To\n")
+    for i in range(m):
+        elementos = ordem[inicio_linha[i]:inicio_linha[i + 1]]
+        termos = [(variaveis[colunas_el[k]], csc.data[k]) for k in elementos]
+        expressao = _expressao_lp(termos) if termos else f"0 {variaveis[0]}"
+        destino.write(f" {restricoes[i]}: {expressao} {_ASCII[modelo.tipos[i]]} {_formatar(modelo.b[i])}\n")
+    destino.write("Bounds\n")
+    for nome, (inferior, superior) in zip(variaveis, modelo.limites or [(0.0, None)] * n):
+        inferior = inferior or 0.0
+        if superior is not None and superior == inferior:
+            destino.write(f" {nome} = {_formatar(inferior)}\n")
+        elif superior is not None:
+            destino.write(f" {_formatar(inferior)} <= {nome} <= {_formatar(superior)}\n")
+        else:
+            destino.write(f" {nome} >= {_formatar(inferior)}\n")
+    if modelo.inteiras:
+        destino.write("General\n")
+        destino.write(' ' + ' '.join(variaveis[j] for j in modelo.inteiras) + '\n')
+    destino.write("End\n")
+
+
+# ============================================================
+# CSV (A | tipo | b)
+# ============================================================
+
+def ler_csv(fonte, densa=None):
+    """
+    Lê um modelo no formato CSV ``A | tipo | b`` (ver a documentação do módulo).
+
+    :param fonte: Caminho, conteúdo (str/bytes) ou arquivo aberto.
+    :param densa: Forma de A (None decide pelo tamanho, ver :data:`LIMITE_DENSO`).
+    :type densa: bool or None
+    :rtype: ModeloPL
+    :raises ValueError: Se o arquivo for inválido.
+    """
+    triplas = _Triplas()
+    tipos, b = [], array('d')
+    modo, c, nomes_var = None, None, None
+
+    with _abrir(fonte) as arquivo:
+        primeira = arquivo.readline()
+        separador = ';' if primeira.count(';') > primeira.count(',') else ','
+
+        def numero(texto):
+            texto = texto.strip()
+            return float(texto.replace(',', '.') if separador == ';' else texto) if texto else 0.0
+
+        leitor = csv.reader(itertools.chain([primeira], arquivo), delimiter=separador)
+        for numero_linha, campos in enumerate(leitor, start=1):
+            if not campos or not any(campo.strip() for campo in campos):
+                continue
+            if modo is None:
+                modo = campos[0].strip().lower()
+                if modo not in ('max', 'min'):
+                    raise ValueError("A primeira linha do CSV deve ser 'max' ou 'min' seguida dos custos.")
+                c = np.array([numero(campo) for campo in campos[1:]])
+                continue
+            if campos[-1].strip().lower() == 'b' and nomes_var is None and not tipos:
+                nomes_var = [campo.strip() for campo in campos[:-2]]
+                continue
+            if len(campos) != len(c) + 2:
+                raise ValueError(f"Linha {numero_linha} do CSV: esperados {len(c)} coeficientes, tipo e b.")
+            tipo = _TIPOS.get(campos[-2].strip())
+            if tipo is None:
+                raise ValueError(f"Linha {numero_linha} do CSV: tipo de restrição inválido {campos[-2]!r}.")
+            i = len(tipos)
+            for j, campo in enumerate(campos[:-2]):
+                triplas.adicionar(i, j, numero(campo))
+            tipos.append(tipo)
+            b.append(numero(campos[-1]))
+
+    if modo is None:
+        raise ValueError("Arquivo CSV vazio.")
+    return ModeloPL(
+        c=c,
+        A=triplas.matriz(len(tipos), len(c), densa),
+        b=np.frombuffer(b, dtype=float).copy(),
+        tipos=tipos,
+        modo=modo,
+        nomes_variaveis=nomes_var,
+    )
+
+def escrever_csv(modelo, destino):
+    """
+    Escreve o modelo no formato CSV ``A | tipo | b``.
+
+    O CSV não tem seção de limites: limites das variáveis são escritos como
+    restrições de uma só variável (o presolve os transforma de volta em limites).
+    Variáveis inteiras não são registradas.
+
+    :param modelo: Modelo a exportar.
+    :type modelo: ModeloPL
+    :param destino: Fluxo de texto aberto para escrita.
+    """
+    m, n = modelo.forma
+    escritor = csv.writer(destino, lineterminator='\n')
+    escritor.writerow([modelo.modo] + [_formatar(v) for v in modelo.c])
+    escritor.writerow((modelo.nomes_variaveis or _nomes('x', n)) + ['tipo', 'b'])
+    A = modelo.A.densa() if isinstance(modelo.A, MatrizCSC) else np.asarray(modelo.A, dtype=float)
+    for i in range(m):
+        escritor.writerow([_formatar(v) for v in A[i]] + [_ASCII[modelo.tipos[i]], _formatar(modelo.b[i])])
+    for j, (inferior, superior) in enumerate(modelo.limites or []):
+        linha = ['0'] * n
+        linha[j] = '1'
+        if inferior:
+            escritor.writerow(linha + ['>=', _formatar(inferior)])
+        if superior is not None:
+            escritor.writerow(linha + ['<=', _formatar(superior)])
+
+
+LEITORES = {'mps': ler_mps, 'lp': ler_lp, 'csv': ler_csv}
+ESCRITORES = {'mps': escrever_mps, 'lp': escrever_lp, 'csv': escrever_csv}
+
+
+def formato_do_arquivo(nome):
+    """
+    Deduz o formato pela extensão (``.mps``, ``.lp``, ``.csv``, com ``.gz`` opcional).
+
+    :rtype: str
+    :raises ValueError: Se a extensão não for reconhecida.
+    """
+    base = nome[:-3] if nome.lower().endswith('.gz') else nome
+    extensao = os.path.splitext(base)[1].lower().lstrip('.')
+    if extensao not in FORMATOS:
+        raise ValueError(f"Extensão desconhecida {extensao!r}: use um de {FORMATOS}.")
+    return extensao
+
+def ler_modelo(fonte, formato=None, densa=None):
+    """
+    Lê um modelo, deduzindo o formato pela extensão do arquivo se não for informado.
+
+    :param fonte: Caminho ou arquivo aberto (com atributo ``name``), ou conteúdo com ``formato``.
+    :param formato: 'mps', 'lp' ou 'csv'.
+    :type formato: str or None
+    :param densa: Forma de A (None decide pelo tamanho, ver :data:`LIMITE_DENSO`).
+    :type densa: bool or None
+    :rtype: ModeloPL
+    """
+    if formato is None:
+        formato = formato_do_arquivo(os.fspath(getattr(fonte, 'name', fonte)))
+    if formato not in LEITORES:
+        raise ValueError(f"Formato desconhecido: {formato!r}. Use um de {FORMATOS}.")
+    return LEITORES[formato](fonte, densa)
+
+def exportar_modelo(modelo, formato):
+    """
+    Gera o conteúdo do arquivo do modelo no formato pedido.
+
+    :param modelo: Modelo a exportar.
+    :type modelo: ModeloPL
+    :param formato: 'mps', 'lp' ou 'csv'.
+    :type formato: str
+    :rtype: str
+    """
+    if formato not in ESCRITORES:
+        raise ValueError(f"Formato desconhecido: {formato!r}. Use um de {FORMATOS}.")
+    destino = io.StringIO()
+    ESCRITORES[formato](modelo, destino)
+    return destino.getvalue()
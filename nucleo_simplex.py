@@ -0,0 +1,1336 @@
+"""
+Núcleo numérico do Simplex, independente da interface.
+
+Este módulo depende apenas do NumPy: monta os tableaus, executa os laços do
+Simplex Primal, do Dual Simplex, do Big M e das Duas Fases e devolve um :class:`ResultadoSimplex`
+com o ótimo como valor. A renderização passo a passo no Streamlit fica em
+``funcoes_simplex.py``, que apenas percorre o ``trace`` devolvido por :func:`solve`.
+"""
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from esparso_simplex import MatrizCSC, eh_esparsa
+from orcamento_simplex import STATUS_INTERROMPIDO, DetectorCiclos, OrcamentoSimplex
+from perfil_simplex import SEM_OBSERVADOR
+from precificacao_simplex import (PrecificacaoDantzig, PrecificacaoDualSteepestEdge, criar_precificacao,
+                                  criar_precificacao_dual)
+
+# Constante para o "Grande M"
+M_CONST = 1.0e5
+
+METODOS = ('automatico', 'primal', 'dual', 'big_m', 'duas_fases', 'revisado')
+
+# Menor |αrⱼ| aceito como pivô no teste da razão dual
+TOL_PIVO_DUAL = 1e-9
+# Folga dos custos reduzidos no passe de Harris do teste da razão dual
+TOL_HARRIS = 1e-7
+
+
+@dataclass
+class PassoSimplex:
+    """
+    Registro de uma iteração do Simplex, capturado antes do pivoteamento.
+
+    :ivar iteracao: Número da iteração dentro do laço (começa em 1).
+    :ivar tipo: 'primal', 'dual' ou 'revisado', indicando o laço que gerou o passo.
+    :ivar tableau: Cópia do tableau antes do pivoteamento (None no Simplex Revisado).
+    :ivar base: Cópia das variáveis básicas antes do pivoteamento.
+    :ivar linha: Índice da linha pivô no tableau (None em uma troca de limite, sem pivô).
+    :ivar coluna: Índice da coluna pivô no tableau.
+    :ivar entra: Nome da variável que entra na base.
+    :ivar sai: Nome da variável que sai da base.
+    :ivar razoes: Teste da razão do passo primal (None no passo dual).
+    :ivar fase: 1 ou 2 no método das Duas Fases (None nos demais).
+    :ivar colunas: Nomes das colunas do quadro, quando diferem das do tableau final
+        (Fase I, que ainda tem as colunas artificiais).
+    :ivar z: Valor da função objetivo do laço antes do pivoteamento (na Fase I, a de Fase I).
+    """
+    iteracao: int
+    tipo: str
+    tableau: np.ndarray
+    base: list
+    linha: int
+    coluna: int
+    entra: str
+    sai: str
+    razoes: np.ndarray = None
+    fase: int = None
+    colunas: list = None
+    z: float = None
+
+
+class LogIteracoes(list):
+    """
+    Lista de :class:`PassoSimplex` preenchida pelos laços do Simplex.
+
+    No modo resumido (``completo=False``) os passos guardam apenas o pivô, as
+    variáveis que entram e saem e o valor de Z, sem cópias do tableau nem do teste
+    da razão: o custo do registro deixa de crescer com o tamanho do quadro.
+
+    :param completo: Se True, cada passo guarda uma cópia do tableau.
+    :type completo: bool
+    """
+
+    def __init__(self, completo=True):
+        super().__init__()
+        self.completo = completo
+
+def _copia_para_trace(trace, valores):
+    """Copia ``valores`` para um passo do ``trace``, exceto no log resumido."""
+    return valores.copy() if getattr(trace, 'completo', True) else None
+
+
+@dataclass
+class ResultadoSimplex:
+    """
+    Resultado estruturado de uma resolução.
+
+    :ivar status: 'otimo', 'ilimitado' ou 'infactivel', ou 'limite_iteracoes', 'limite_tempo' ou
+        'cancelado' se o orçamento da resolução se esgotar (ver :mod:`orcamento_simplex`).
+    :ivar z: Valor da função objetivo no último tableau (None se ilimitado ou se a
+        Fase I das Duas Fases provar a infactibilidade).
+    :ivar x: Valores das variáveis de decisão x1..xn.
+    :ivar base: Variáveis básicas do tableau final.
+    :ivar iteracoes: Número de pivoteamentos realizados (e de trocas de limite, com limites superiores).
+    :ivar metodo: Método efetivamente executado ('primal', 'dual', 'big_m', 'duas_fases' ou 'revisado').
+    :ivar modo: 'max' ou 'min'.
+    :ivar tableau: Tableau final (None no Simplex Revisado, que não o mantém).
+    :ivar colunas: Nomes das colunas do tableau final (ou da forma padrão).
+    :ivar motivo: Justificativa da escolha do método (preenchida no modo automático).
+    :ivar trace: Lista de :class:`PassoSimplex` (None se não solicitado).
+    :ivar estatisticas: Contadores adicionais da resolução.
+    :ivar sensibilidade: Relatório de :mod:`sensibilidade_simplex` (com ``solve(..., sensibilidade=True)``).
+    """
+    status: str
+    z: float
+    x: np.ndarray
+    base: list
+    iteracoes: int
+    metodo: str
+    modo: str
+    tableau: np.ndarray = None
+    colunas: list = None
+    motivo: str = None
+    trace: list = None
+    estatisticas: dict = field(default_factory=dict)
+    sensibilidade: object = None
+
+    @property
+    def otimo(self):
+        """Indica se a resolução terminou com solução ótima."""
+        return self.status == 'otimo'
+
+
+def _build_tableau(c, A_ub, b_ub, dtype=np.float64):
+    """
+    Constrói o tableau inicial padrão para o método Simplex (Primal ou Dual).
+
+    Esta função prepara a matriz para problemas que já estão na forma padrão
+    (restrições de desigualdade <=), adicionando apenas variáveis de folga.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A_ub: Matriz de coeficientes das restrições (lado esquerdo).
+    :type A_ub: list or np.ndarray
+    :param b_ub: Vetor de termos independentes das restrições (lado direito).
+    :type b_ub: list or np.ndarray
+    :param dtype: Tipo numérico do tableau.
+    :type dtype: np.dtype
+    :return: Uma tupla contendo o tableau inicial (numpy array), a lista de nomes das colunas e a lista das variáveis básicas iniciais.
+    :rtype: tuple(np.ndarray, list, list)
+    """
+    num_vars = len(c)
+    num_constraints = len(b_ub)
+    tableau = np.zeros((num_constraints + 1, num_vars + num_constraints + 2), dtype=dtype)
+    tableau[0, :num_vars] = np.negative(c)
+    tableau[0, -2] = 1
+    tableau[1:, :num_vars] = np.asarray(A_ub).reshape(num_constraints, num_vars)
+    linhas = np.arange(1, num_constraints + 1)
+    tableau[linhas, num_vars - 1 + linhas] = 1
+    tableau[1:, -1] = b_ub
+    base_vars = [f'f{i+1}' for i in range(num_constraints)]
+    columns = [f'x{i+1}' for i in range(num_vars)] + base_vars + ['Z', 'RHS']
+    return tableau, columns, base_vars
+
+def _build_tableau_artificial(c, A, b, tipos, dtype=np.float64):
+    """
+    Constrói o tableau com folgas (s) e artificiais (a) para restrições mistas (<=, >=, =).
+
+    O leiaute das colunas sai da contagem dos tipos: x, depois uma folga por
+    restrição '≤' ou '≥' e uma artificial por restrição '≥' ou '='. O tableau é
+    alocado uma única vez e os blocos identidade são preenchidos por índices.
+    A linha Z recebe apenas -c; cabe ao método (Big M ou Duas Fases) tratar as
+    variáveis artificiais na função objetivo.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Matriz de coeficientes das restrições.
+    :type A: list or np.ndarray
+    :param b: Termos independentes das restrições.
+    :type b: list or np.ndarray
+    :param tipos: Lista de strings indicando o tipo de cada restrição ('<=', '>=', '=').
+    :type tipos: list[str]
+    :param dtype: Tipo numérico do tableau.
+    :type dtype: np.dtype
+    :return: Tableau montado, lista completa de nomes das colunas e lista de variáveis básicas iniciais.
+    :rtype: tuple(np.ndarray, list, list)
+    """
+    num_vars = len(c)
+    num_rest = len(tipos)
+    tipos = np.asarray(tipos, dtype=object)
+    linhas_folga = np.flatnonzero(tipos != '=')
+    linhas_artificiais = np.flatnonzero(tipos != '≤')
+    num_folgas, num_artificiais = len(linhas_folga), len(linhas_artificiais)
+    inicio_artificiais = num_vars + num_folgas
+
+    tableau = np.zeros((num_rest + 1, inicio_artificiais + num_artificiais + 2), dtype=dtype)
+    tableau[0, :num_vars] = np.negative(c)
+    tableau[0, -2] = 1
+    tableau[1:, :num_vars] = np.asarray(A).reshape(num_rest, num_vars)
+    tableau[1:, -1] = b
+    # Folga +1 em '≤' e -1 em '≥'; artificial +1 em '≥' e '='
+    tableau[linhas_folga + 1, num_vars + np.arange(num_folgas)] = np.where(tipos[linhas_folga] == '≥', -1, 1)
+    tableau[linhas_artificiais + 1, inicio_artificiais + np.arange(num_artificiais)] = 1
+
+    s_names = [f's{k+1}' for k in range(num_folgas)]
+    a_names = [f'a{k+1}' for k in range(num_artificiais)]
+    base_vars = [None] * num_rest
+    for i, nome in zip(linhas_folga, s_names):
+        base_vars[i] = nome
+    for i, nome in zip(linhas_artificiais, a_names):
+        base_vars[i] = nome
+
+    full_col_names = [f'x{i+1}' for i in range(num_vars)] + s_names + a_names + ['Z', 'RHS']
+    return tableau, full_col_names, base_vars
+
+def _build_big_m_tableau(c, A, b, tipos, mode='max', dtype=np.float64):
+    """
+    Constrói o tableau inicial para o Método Big M, lidando com restrições mistas (<=, >=, =).
+
+    Adiciona automaticamente variáveis de folga (s) e variáveis artificiais (a)
+    conforme necessário para cada tipo de restrição. Também aplica a penalidade M
+    na função objetivo para as variáveis artificiais, somando de uma vez as
+    linhas das restrições com artificial.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Matriz de coeficientes das restrições.
+    :type A: list or np.ndarray
+    :param b: Termos independentes das restrições.
+    :type b: list or np.ndarray
+    :param tipos: Lista de strings indicando o tipo de cada restrição ('<=', '>=', '=').
+    :type tipos: list[str]
+    :param mode: Modo de otimização ('max' ou 'min'). O padrão é 'max'.
+    :type mode: str
+    :param dtype: Tipo numérico do tableau.
+    :type dtype: np.dtype
+    :return: Tableau montado, lista completa de nomes das colunas e lista de variáveis básicas iniciais.
+    :rtype: tuple(np.ndarray, list, list)
+    """
+    tableau, full_col_names, base_vars = _build_tableau_artificial(c, A, b, tipos, dtype)
+
+    # Ajuste Big M na Função Objetivo: Z -= M·Σ(linhas com artificial) (max) ou += (min)
+    com_artificial = np.asarray(tipos, dtype=object) != '≤'
+    sinal = -M_CONST if mode == 'max' else M_CONST
+    tableau[0] += sinal * (com_artificial.astype(tableau.dtype) @ tableau[1:])
+
+    # Artificiais começam na base: seus custos reduzidos devem ser nulos
+    tableau[0, len(full_col_names) - 2 - int(com_artificial.sum()):-2] = 0
+    tableau[0, -2] = 1
+
+    return tableau, full_col_names, base_vars
+
+class MotorPivo:
+    """
+    Motor de pivoteamento vetorizado para um tableau fixo.
+
+    A eliminação de Gauss-Jordan é feita como uma atualização de posto 1
+    (produto externo entre a coluna e a linha pivô), in-place e em blocos de
+    linhas sobre um buffer de trabalho alocado uma única vez. Linhas cujo
+    elemento na coluna pivô já é zero não são tocadas.
+
+    :param tableau: Tableau que será modificado in-place a cada pivoteamento.
+    :type tableau: np.ndarray
+    :param bloco: Número de linhas atualizadas por produto externo.
+    :type bloco: int
+    """
+
+    def __init__(self, tableau, bloco=128):
+        self.tableau = tableau
+        self.bloco = bloco
+        self._coluna = np.empty(tableau.shape[0], dtype=tableau.dtype)
+        self._produto = np.empty((min(bloco, tableau.shape[0]), tableau.shape[1]), dtype=tableau.dtype)
+        self.linhas_tocadas = 0
+
+    def pivotar(self, pivot_row, pivot_col):
+        """
+        Pivoteia o tableau no elemento (pivot_row, pivot_col).
+
+        :param pivot_row: Índice da linha do elemento pivô.
+        :type pivot_row: int
+        :param pivot_col: Índice da coluna do elemento pivô.
+        :type pivot_col: int
+        :return: Número de linhas atualizadas pela eliminação.
+        :rtype: int
+        """
+        tableau = self.tableau
+        linha = tableau[pivot_row]
+        linha /= linha[pivot_col]
+
+        coluna = self._coluna
+        np.copyto(coluna, tableau[:, pivot_col])
+        coluna[pivot_row] = 0.0
+        ativas = np.flatnonzero(coluna)
+
+        for inicio in range(0, len(ativas), self.bloco):
+            linhas = ativas[inicio:inicio + self.bloco]
+            produto = self._produto[:len(linhas)]
+            if linhas[-1] - linhas[0] + 1 == len(linhas):
+                # Bloco contíguo: atualiza uma fatia (view) sem cópias
+                fatia = slice(linhas[0], linhas[-1] + 1)
+                np.multiply(coluna[fatia, None], linha, out=produto)
+                tableau[fatia] -= produto
+            else:
+                np.multiply(coluna[linhas, None], linha, out=produto)
+                tableau[linhas] -= produto
+
+        # Remove o resíduo de ponto flutuante da coluna que entrou na base
+        tableau[:, pivot_col] = 0.0
+        tableau[pivot_row, pivot_col] = 1.0
+        self.linhas_tocadas += len(ativas)
+        return len(ativas)
+
+def _pivot(tableau, pivot_row, pivot_col):
+    """
+    Realiza a operação de pivoteamento Gaussiano no tableau.
+
+    Altera o tableau in-place, tornando a coluna pivô um vetor unitário. Para
+    laços com vários pivoteamentos, prefira reaproveitar um :class:`MotorPivo`.
+
+    :param tableau: Matriz do tableau a ser modificada.
+    :type tableau: np.ndarray
+    :param pivot_row: Índice da linha do elemento pivô.
+    :type pivot_row: int
+    :param pivot_col: Índice da coluna do elemento pivô.
+    :type pivot_col: int
+    """
+    MotorPivo(tableau).pivotar(pivot_row, pivot_col)
+
+class LimitesSuperiores:
+    """
+    Limites superiores das colunas do tableau (Simplex com variáveis canalizadas).
+
+    Uma variável que vai ao limite superior é complementada: xⱼ = uⱼ - x̄ⱼ. A coluna
+    troca de sinal e o RHS absorve uⱼ·aⱼ, de modo que toda não básica continua em
+    zero e o tableau mantém a forma usual. Assim cada limite vive no teste da razão,
+    e não como uma linha e uma folga a mais no tableau.
+
+    :param superiores: Limite superior de cada coluna (``np.inf`` se não houver).
+    :type superiores: np.ndarray
+    :ivar complementada: Indica as colunas trocadas por uⱼ - xⱼ.
+    :ivar trocas: Número de trocas de limite sem pivoteamento (bound flips).
+    """
+
+    def __init__(self, superiores):
+        self.superior = np.asarray(superiores, dtype=float)
+        self.complementada = np.zeros(len(self.superior), dtype=bool)
+        self.trocas = 0
+
+    @classmethod
+    def para_colunas(cls, columns, superiores):
+        """
+        Distribui os limites das variáveis de decisão pelas colunas do tableau.
+
+        :param columns: Nomes das colunas do tableau (com 'Z' e 'RHS').
+        :type columns: list[str]
+        :param superiores: Limite superior de x1..xn.
+        :type superiores: np.ndarray
+        :rtype: LimitesSuperiores
+        """
+        limites = np.full(len(columns) - 2, np.inf)
+        for j, nome in enumerate(columns[:-2]):
+            if nome.startswith('x'):
+                limites[j] = superiores[int(nome[1:]) - 1]
+        return cls(limites)
+
+    def complementar(self, tableau, coluna, linha=None):
+        """
+        Troca a variável da coluna por uⱼ - xⱼ (in-place).
+
+        :param tableau: Tableau a ser modificado.
+        :type tableau: np.ndarray
+        :param coluna: Índice da coluna.
+        :type coluna: int
+        :param linha: Linha do tableau em que a coluna é básica (None se não básica).
+        :type linha: int or None
+        """
+        tableau[:, -1] -= self.superior[coluna] * tableau[:, coluna]
+        tableau[:, coluna] *= -1.0
+        if linha is not None:
+            # Restaura o pivô unitário da coluna básica
+            tableau[linha] *= -1.0
+        self.complementada[coluna] = not self.complementada[coluna]
+
+    def ajustar_linha(self, linha):
+        """
+        Aplica as complementações atuais a uma linha montada para as variáveis originais (in-place).
+
+        :param linha: Linha completa do tableau (ex.: a linha Z original na Fase II).
+        :type linha: np.ndarray
+        """
+        indices = np.flatnonzero(self.complementada)
+        linha[-1] -= linha[indices] @ self.superior[indices]
+        linha[indices] *= -1.0
+
+    def restringir(self, indices):
+        """
+        Mantém apenas as colunas indicadas (ex.: ao descartar as artificiais).
+
+        :param indices: Índices das colunas mantidas, na nova ordem.
+        :type indices: list[int]
+        """
+        self.superior = self.superior[indices]
+        self.complementada = self.complementada[indices]
+
+def _run_simplex_loop(tableau, columns, base_vars, mode, trace=None, motor=None, precificacao=None,
+                     limites=None, observador=None, orcamento=None):
+    """
+    Loop principal genérico do algoritmo Simplex (Primal).
+
+    Itera sobre o tableau (in-place) até encontrar a solução ótima ou ilimitada.
+    Com limites superiores, o teste da razão também considera a básica que sobe
+    até o limite e a própria variável que entra: se o limite dela for o menor
+    passo, ela apenas troca de limite, sem pivoteamento. Se uma base se repetir
+    em uma sequência de pivôs degenerados (ciclo), a regra de Bland é fixada.
+
+    :param tableau: Matriz do tableau inicial.
+    :type tableau: np.ndarray
+    :param columns: Nomes das colunas.
+    :type columns: list[str]
+    :param base_vars: Nomes das variáveis básicas iniciais (atualizada in-place).
+    :type base_vars: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param trace: Lista onde cada :class:`PassoSimplex` é anexado (opcional).
+    :type trace: list or None
+    :param motor: Motor de pivoteamento do tableau (criado se não informado).
+    :type motor: MotorPivo or None
+    :param precificacao: Regra de escolha da coluna que entra (padrão: Dantzig).
+    :type precificacao: Precificacao or None
+    :param limites: Limites superiores das colunas (None se não houver).
+    :type limites: LimitesSuperiores or None
+    :param observador: Recebe o tempo de cada etapa e os eventos de pivô (ver :mod:`perfil_simplex`).
+    :type observador: ObservadorSimplex or None
+    :param orcamento: Iterações, tempo e cancelamento, consultados antes de cada pivô.
+    :type orcamento: OrcamentoSimplex or None
+    :return: Status final ('otimo', 'ilimitado' ou um de :data:`STATUS_INTERROMPIDO`) e número de iterações.
+    :rtype: tuple(str, int)
+    """
+    motor = motor or MotorPivo(tableau)
+    regra = precificacao or PrecificacaoDantzig()
+    detector = DetectorCiclos()
+    observador = observador or SEM_OBSERVADOR
+    num_colunas = tableau.shape[1] - 2
+    corpo = tableau[1:, :-2]
+    regra.iniciar(num_colunas, 1.0 + np.einsum('ij,ij->j', corpo, corpo) if regra.usa_pesos else None)
+    # Custos reduzidos na convenção de minimização: na maximização a linha Z já está nela
+    sentido = 1.0 if mode == 'max' else -1.0
+    indices_base = np.array([columns.index(nome) for nome in base_vars]) if limites is not None else None
+    iteration = 1
+    while True:
+        if orcamento is not None and orcamento.verificar():
+            return orcamento.interrupcao, iteration - 1
+        linha_z = tableau[0, :-2]
+
+        # Critério de parada: nenhuma coluna atrativa para a regra de precificação
+        pivot_col = None
+        with observador.fase('precificacao'):
+            for candidatas in regra.varredura(num_colunas):
+                d = sentido * (linha_z if candidatas is None else linha_z[candidatas])
+                pivot_col = regra.escolher(d, candidatas, 1e-5)
+                if pivot_col is not None:
+                    break
+        if pivot_col is None:
+            break
+
+        # Razão
+        col = tableau[1:, pivot_col]
+        rhs = tableau[1:, -1]
+
+        with observador.fase('teste_razao'), np.errstate(divide='ignore', invalid='ignore'):
+            ratios = np.where(col > 1e-9, rhs / col, np.inf)
+            if limites is not None:
+                # Básicas que crescem com a entrante param no limite superior
+                ate_limite = np.where(col < -1e-9, (limites.superior[indices_base] - rhs) / -col, np.inf)
+                sobe = ate_limite < ratios
+                ratios = np.where(sobe, ate_limite, ratios)
+
+        limite_entrante = limites.superior[pivot_col] if limites is not None else np.inf
+        if np.all(ratios == np.inf) and limite_entrante == np.inf:
+            return 'ilimitado', iteration - 1
+
+        if limite_entrante <= ratios.min():
+            # Troca de limite: a entrante vai ao limite superior sem mudar a base
+            if trace is not None:
+                trace.append(PassoSimplex(iteration, 'primal', _copia_para_trace(trace, tableau), list(base_vars),
+                                          None, pivot_col, columns[pivot_col], columns[pivot_col],
+                                          _copia_para_trace(trace, ratios), z=float(tableau[0, -1])))
+            with observador.fase('pivoteamento'):
+                limites.complementar(tableau, pivot_col)
+            limites.trocas += 1
+            observador.ao_trocar_limite(pivot_col)
+            if orcamento is not None:
+                orcamento.contar()
+            iteration += 1
+            continue
+
+        pivot_row = np.argmin(ratios) + 1
+        if regra.bland:
+            # Bland: entre os empates, sai a variável de menor índice
+            empates = np.flatnonzero(ratios == ratios[pivot_row - 1])
+            pivot_row = min(empates, key=lambda i: columns.index(base_vars[i])) + 1
+        entering_var, leaving_var = columns[pivot_col], base_vars[pivot_row - 1]
+
+        if trace is not None:
+            trace.append(PassoSimplex(iteration, 'primal', _copia_para_trace(trace, tableau), list(base_vars),
+                                      pivot_row, pivot_col, entering_var, leaving_var,
+                                      _copia_para_trace(trace, ratios), z=float(tableau[0, -1])))
+
+        with observador.fase('precificacao'):
+            alpha_r = tableau[pivot_row, :-2].copy() if regra.usa_linha_pivo else None
+            alpha_q = col.copy() if regra.usa_linha_pivo or regra.usa_produtos else None
+            produtos = alpha_q @ corpo if regra.usa_produtos else None
+        theta = ratios[pivot_row - 1]
+
+        base_vars[pivot_row - 1] = entering_var
+        with observador.fase('pivoteamento'):
+            tocadas = motor.pivotar(pivot_row, pivot_col)
+            if limites is not None:
+                saiu = indices_base[pivot_row - 1]
+                indices_base[pivot_row - 1] = pivot_col
+                if sobe[pivot_row - 1]:
+                    # A variável que saiu está no limite superior
+                    limites.complementar(tableau, saiu)
+        observador.ao_pivotar('primal', pivot_row, pivot_col, tocadas, theta <= 1e-12)
+        with observador.fase('precificacao'):
+            regra.atualizar(pivot_row - 1, pivot_col, columns.index(leaving_var), theta, alpha_r, alpha_q,
+                            produtos)
+        if detector.repetiu(base_vars, theta <= 1e-12):
+            regra.fixar_bland()
+            if orcamento is not None:
+                orcamento.ciclos += 1
+        if orcamento is not None:
+            orcamento.contar()
+        iteration += 1
+
+    return 'otimo', iteration - 1
+
+def _teste_razao_dual(d, alpha, violacao, superiores=None, bland=False):
+    """
+    Teste da razão dual (vetorizado), com trocas de limite e a tolerância de Harris.
+
+    Candidatas são as colunas com αrⱼ < 0; a razão de cada uma é dⱼ/|αrⱼ|, o passo
+    dual em que o custo reduzido dela zera. Com limites superiores, o passo pode
+    atravessar a quebra de uma coluna canalizada: ela vai ao limite superior, o
+    que reduz a violação da linha em uⱼ|αrⱼ|, e a busca continua enquanto a linha
+    seguir violada (teste da razão com bound flipping, "passo longo"). Entre as
+    colunas restantes, o passe de Harris aceita razões até o menor (dⱼ + tol)/|αrⱼ|
+    e escolhe o maior |αrⱼ|, o pivô numericamente mais estável.
+
+    :param d: Custos reduzidos das colunas na convenção de minimização (≥ 0).
+    :type d: np.ndarray
+    :param alpha: Linha pivô (sem as colunas Z e RHS), com a básica abaixo de zero.
+    :type alpha: np.ndarray
+    :param violacao: Quanto a básica da linha está abaixo de zero (positivo).
+    :type violacao: float
+    :param superiores: Limites superiores das colunas (None se não houver).
+    :type superiores: np.ndarray or None
+    :param bland: Escolhe a menor razão, com empates pelo menor índice (sem Harris).
+    :type bland: bool
+    :return: Coluna que entra (None se a linha não pode ser corrigida: problema
+        infactível), colunas que vão ao limite superior e as razões de todas as colunas.
+    :rtype: tuple(int or None, np.ndarray, np.ndarray)
+    """
+    candidatas = np.flatnonzero(alpha < -TOL_PIVO_DUAL)
+    razoes = np.full(len(alpha), np.inf)
+    trocadas = candidatas[:0]
+    if not len(candidatas):
+        return None, trocadas, razoes
+    passos = d[candidatas] / -alpha[candidatas]
+    razoes[candidatas] = passos
+
+    if superiores is not None:
+        ordem = np.argsort(passos, kind='stable')
+        candidatas, passos = candidatas[ordem], passos[ordem]
+        # Violação que resta depois de levar ao limite cada prefixo de candidatas (monótona)
+        reducao = np.cumsum(superiores[candidatas] * -alpha[candidatas])
+        atravessadas = int(np.count_nonzero(violacao - reducao > TOL_PIVO_DUAL))
+        if atravessadas == len(candidatas):
+            return None, trocadas, razoes
+        trocadas = candidatas[:atravessadas]
+        candidatas, passos = candidatas[atravessadas:], passos[atravessadas:]
+
+    if bland:
+        return int(candidatas[np.argmin(passos)]), trocadas, razoes
+    maximo = np.min((d[candidatas] + TOL_HARRIS) / -alpha[candidatas])
+    elegiveis = candidatas[passos <= maximo]
+    return int(elegiveis[np.argmax(-alpha[elegiveis])]), trocadas, razoes
+
+def _run_dual_simplex_loop(tableau, columns, base_vars, mode, trace=None, motor=None, limites=None,
+                          observador=None, orcamento=None, precificacao=None):
+    """
+    Loop do Dual Simplex: remove a infactibilidade do RHS mantendo a linha Z.
+
+    A linha que sai é escolhida pela regra dual (padrão: dual steepest edge) e a
+    coluna que entra pelo teste da razão de :func:`_teste_razao_dual`. Com limites
+    superiores, uma básica acima do limite é complementada antes do pivoteamento,
+    o que a transforma em uma linha de RHS negativo, e o teste da razão pode levar
+    colunas canalizadas ao limite superior em vez de pivotear nelas. Se uma base se
+    repetir em uma sequência de pivôs degenerados (ciclo), a regra de Bland dual é fixada.
+
+    :param tableau: Matriz do tableau inicial.
+    :type tableau: np.ndarray
+    :param columns: Nomes das colunas.
+    :type columns: list[str]
+    :param base_vars: Nomes das variáveis básicas iniciais (atualizada in-place).
+    :type base_vars: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param trace: Lista onde cada :class:`PassoSimplex` é anexado (opcional).
+    :type trace: list or None
+    :param motor: Motor de pivoteamento do tableau (criado se não informado).
+    :type motor: MotorPivo or None
+    :param limites: Limites superiores das colunas (None se não houver).
+    :type limites: LimitesSuperiores or None
+    :param observador: Recebe o tempo de cada etapa e os eventos de pivô (ver :mod:`perfil_simplex`).
+    :type observador: ObservadorSimplex or None
+    :param orcamento: Iterações, tempo e cancelamento, consultados antes de cada pivô.
+    :type orcamento: OrcamentoSimplex or None
+    :param precificacao: Regra de escolha da linha que sai (padrão: dual steepest edge).
+    :type precificacao: PrecificacaoDual or None
+    :return: Status final ('otimo', 'infactivel' ou um de :data:`STATUS_INTERROMPIDO`) e número de iterações.
+    :rtype: tuple(str, int)
+    """
+    motor = motor or MotorPivo(tableau)
+    regra = precificacao or PrecificacaoDualSteepestEdge()
+    observador = observador or SEM_OBSERVADOR
+    indices_base = np.array([columns.index(nome) for nome in base_vars])
+    corpo = tableau[1:, :-2]
+    regra.iniciar(len(base_vars), np.einsum('ij,ij->i', corpo, corpo) if regra.usa_pesos else None)
+    # Custos reduzidos na convenção de minimização: na maximização a linha Z já está nela
+    sentido = 1.0 if mode == 'max' else -1.0
+    superiores = limites.superior if limites is not None else None
+    detector = DetectorCiclos()
+    iteration = 1
+
+    while True:
+        if orcamento is not None and orcamento.verificar():
+            return orcamento.interrupcao, iteration - 1
+        # Precificação dual: escolhe a linha violada que sai da base
+        with observador.fase('precificacao'):
+            violacao = -tableau[1:, -1]
+            if limites is not None:
+                excesso = tableau[1:, -1] - superiores[indices_base]
+                violacao = np.maximum(violacao, excesso)
+            linha = regra.escolher(violacao, indices_base, 1e-9)
+        if linha is None:
+            break
+        pivot_row = linha + 1
+        if limites is not None and excesso[linha] > 0:
+            # Básica acima do limite: passa a uⱼ - xⱼ, que está abaixo de zero
+            with observador.fase('pivoteamento'):
+                limites.complementar(tableau, indices_base[linha], pivot_row)
+            observador.ao_trocar_limite(indices_base[linha])
+
+        with observador.fase('teste_razao'):
+            d = sentido * tableau[0, :-2]
+            if d.min() < -1e-5:
+                # Linha Z não dual-factível (Dual forçado): razão pelo módulo, o Primal completa depois
+                d = np.abs(d)
+            else:
+                # Resíduos negativos do passe de Harris contam como zero
+                d = np.maximum(d, 0.0)
+            pivot_col, trocadas, ratios_dual = _teste_razao_dual(d, tableau[pivot_row, :-2], violacao[linha],
+                                                                 superiores, regra.bland)
+        if pivot_col is None:
+            return 'infactivel', iteration - 1
+
+        entering_var, leaving_var = columns[pivot_col], base_vars[linha]
+        if trace is not None:
+            trace.append(PassoSimplex(iteration, 'dual', _copia_para_trace(trace, tableau), list(base_vars),
+                                      pivot_row, pivot_col, entering_var, leaving_var, z=float(tableau[0, -1])))
+
+        if len(trocadas):
+            # Colunas cuja quebra o passo atravessou vão ao limite superior
+            with observador.fase('pivoteamento'):
+                for coluna in trocadas:
+                    limites.complementar(tableau, coluna)
+                    observador.ao_trocar_limite(coluna)
+            limites.trocas += len(trocadas)
+            regra.estatisticas['trocas_de_limite'] += len(trocadas)
+
+        with observador.fase('precificacao'):
+            alpha_q = tableau[1:, pivot_col].copy() if regra.usa_pesos else None
+            produtos = corpo @ tableau[pivot_row, :-2] if regra.usa_pesos else None
+        theta = ratios_dual[pivot_col]
+
+        base_vars[linha] = entering_var
+        indices_base[linha] = pivot_col
+        with observador.fase('pivoteamento'):
+            tocadas = motor.pivotar(pivot_row, pivot_col)
+        observador.ao_pivotar('dual', pivot_row, pivot_col, tocadas, theta <= 1e-12)
+        with observador.fase('precificacao'):
+            regra.atualizar(linha, theta, alpha_q, produtos)
+        if detector.repetiu(base_vars, theta <= 1e-12):
+            regra.fixar_bland()
+            if orcamento is not None:
+                orcamento.ciclos += 1
+        if orcamento is not None:
+            orcamento.contar()
+        iteration += 1
+
+    return 'otimo', iteration - 1
+
+def _partida_quente(tableau, columns, base_vars, base_inicial, mode, motor, limites=None):
+    """
+    Instala uma base salva no tableau e indica qual laço deve reotimizá-lo.
+
+    A base é instalada por Gauss-Jordan sobre uma cópia do tableau; o tableau e
+    ``base_vars`` só são alterados se a base for compatível, não singular e
+    primal ou dual factível.
+
+    :param tableau: Tableau inicial (alterado in-place em caso de sucesso).
+    :type tableau: np.ndarray
+    :param columns: Nomes das colunas.
+    :type columns: list[str]
+    :param base_vars: Variáveis básicas iniciais (alterada in-place em caso de sucesso).
+    :type base_vars: list[str]
+    :param base_inicial: Nomes das variáveis da base salva.
+    :type base_inicial: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param motor: Motor de pivoteamento do tableau.
+    :type motor: MotorPivo
+    :param limites: Limites superiores das colunas (None se não houver).
+    :type limites: LimitesSuperiores or None
+    :return: 'primal' ou 'dual', ou None se a base foi descartada.
+    :rtype: str or None
+    """
+    if len(base_inicial) != len(base_vars) or not set(base_inicial) <= set(columns[:-2]):
+        return None
+
+    copia = tableau.copy()
+    motor_copia = MotorPivo(copia)
+    nova_base = list(base_vars)
+    livres = np.ones(len(base_vars), dtype=bool)
+    for nome in base_inicial:
+        if nome in nova_base:
+            livres[nova_base.index(nome)] = False
+            continue
+        col = columns.index(nome)
+        candidatos = np.where(livres, np.abs(copia[1:, col]), 0.0)
+        linha = int(np.argmax(candidatos))
+        if candidatos[linha] < 1e-9:
+            return None   # base singular para o modelo atual
+        motor_copia.pivotar(linha + 1, col)
+        nova_base[linha] = nome
+        livres[linha] = False
+
+    linha_z = copia[0, :-2]
+    sentido = 1.0 if mode == 'max' else -1.0
+    indices_base = [columns.index(nome) for nome in nova_base]
+    superiores = np.inf if limites is None else limites.superior[indices_base]
+    trocadas = np.array([], dtype=int)
+    if np.all(copia[1:, -1] >= -1e-9) and np.all(copia[1:, -1] <= superiores + 1e-9):
+        reotimizacao = 'primal'
+    else:
+        if limites is not None:
+            # Não básicas canalizadas com custo reduzido de sinal errado vão ao limite superior
+            # (no ótimo do modelo anterior elas já estavam lá), o que recupera a factibilidade dual
+            erradas = (sentido * linha_z < -1e-5) & np.isfinite(limites.superior)
+            erradas[indices_base] = False
+            trocadas = np.flatnonzero(erradas)
+            copia[:, -1] -= copia[:, trocadas] @ limites.superior[trocadas]
+            copia[:, trocadas] *= -1.0
+        if not np.all(sentido * linha_z >= -1e-5):
+            return None
+        reotimizacao = 'dual'
+
+    tableau[:] = copia
+    base_vars[:] = nova_base
+    if len(trocadas):
+        limites.complementada[trocadas] = ~limites.complementada[trocadas]
+    return reotimizacao
+
+def _precificar_base(tableau, columns, base_vars):
+    """
+    Zera na linha Z os custos reduzidos das variáveis básicas (in-place).
+
+    :param tableau: Tableau cujas linhas 1..m já estão na forma canônica da base.
+    :type tableau: np.ndarray
+    :param columns: Nomes das colunas.
+    :type columns: list[str]
+    :param base_vars: Variáveis básicas, na ordem das linhas.
+    :type base_vars: list[str]
+    """
+    indices = [columns.index(nome) for nome in base_vars]
+    coeficientes = tableau[0, indices].copy()
+    tableau[0] -= coeficientes @ tableau[1:]
+
+def _sem_artificiais(tableau, columns):
+    """
+    Remove as colunas artificiais do tableau.
+
+    :return: Cópia do tableau sem as colunas 'a' e os nomes das colunas restantes.
+    :rtype: tuple(np.ndarray, list)
+    """
+    manter = [j for j, nome in enumerate(columns) if not nome.startswith('a')]
+    return tableau[:, manter], [columns[j] for j in manter]
+
+def _fase_um(tableau, columns, base_vars, trace=None, precificacao=None, limites=None, observador=None,
+             orcamento=None):
+    """
+    Fase I do método das Duas Fases: minimiza a soma das variáveis artificiais.
+
+    A linha Z é trocada por max -Σa e resolvida pelo Primal. Se a soma chegar a
+    zero, as artificiais que ficaram na base em nível zero saem por pivôs
+    degenerados (ou a linha é descartada, se for redundante), as colunas
+    artificiais são removidas e a linha Z original (-c) é reprecificada para a
+    base obtida, que serve de partida para a Fase II.
+
+    :param tableau: Tableau de :func:`_build_tableau_artificial` (alterado in-place).
+    :type tableau: np.ndarray
+    :param columns: Nomes das colunas.
+    :type columns: list[str]
+    :param base_vars: Variáveis básicas iniciais (atualizada in-place).
+    :type base_vars: list[str]
+    :param trace: Lista onde cada :class:`PassoSimplex` é anexado (opcional).
+    :type trace: list or None
+    :param precificacao: Regra de escolha da coluna que entra (padrão: Dantzig).
+    :type precificacao: Precificacao or None
+    :param limites: Limites superiores das colunas (None se não houver); são
+        restringidos in-place às colunas da Fase II.
+    :type limites: LimitesSuperiores or None
+    :param observador: Recebe o tempo de cada etapa e os eventos de pivô (ver :mod:`perfil_simplex`).
+    :type observador: ObservadorSimplex or None
+    :param orcamento: Iterações, tempo e cancelamento, consultados antes de cada pivô.
+    :type orcamento: OrcamentoSimplex or None
+    :return: Status ('otimo', 'infactivel' ou um de :data:`STATUS_INTERROMPIDO`), iterações e o
+        tableau, as colunas e a base da Fase II (os da Fase I, se o problema for infactível
+        ou a Fase I for interrompida).
+    :rtype: tuple(str, int, np.ndarray, list, list)
+    """
+    observador = observador or SEM_OBSERVADOR
+    linha_objetivo = tableau[0].copy()
+    artificiais = [j for j, nome in enumerate(columns) if nome.startswith('a')]
+    tableau[0] = 0.0
+    tableau[0, artificiais] = 1.0
+    tableau[0, -2] = 1.0
+    _precificar_base(tableau, columns, base_vars)
+    # Tolerância relativa à soma inicial das artificiais (-Σa começa em tableau[0, -1])
+    tolerancia = 1e-7 * max(1.0, abs(float(tableau[0, -1])))
+
+    motor = MotorPivo(tableau)
+    inicio = len(trace) if trace is not None else 0
+    status, iteracoes = _run_simplex_loop(tableau, columns, base_vars, 'max', trace, motor, precificacao, limites,
+                                          observador, orcamento)
+    if trace is not None:
+        for passo in trace[inicio:]:
+            passo.fase, passo.colunas = 1, columns
+    if status in STATUS_INTERROMPIDO:
+        return status, iteracoes, tableau, columns, base_vars
+
+    if tableau[0, -1] < -tolerancia:
+        return 'infactivel', iteracoes, tableau, columns, base_vars
+
+    # Artificiais básicas em nível zero saem por pivôs degenerados
+    redundantes = []
+    for i, nome in enumerate(base_vars):
+        if not nome.startswith('a'):
+            continue
+        candidatos = np.abs(tableau[i + 1, :-2])
+        candidatos[artificiais] = 0.0
+        coluna = int(np.argmax(candidatos))
+        if candidatos[coluna] > 1e-9:
+            with observador.fase('pivoteamento'):
+                tocadas = motor.pivotar(i + 1, coluna)
+            observador.ao_pivotar('primal', i + 1, coluna, tocadas, True)
+            base_vars[i] = columns[coluna]
+            iteracoes += 1
+        else:
+            redundantes.append(i)   # linha combinação das demais
+
+    linhas = [0] + [i + 1 for i in range(len(base_vars)) if i not in redundantes]
+    tableau_f2, colunas_f2 = _sem_artificiais(tableau[linhas], columns)
+    base_f2 = [nome for i, nome in enumerate(base_vars) if i not in redundantes]
+    manter = [columns.index(nome) for nome in colunas_f2]
+    if limites is not None:
+        limites.ajustar_linha(linha_objetivo)
+        limites.restringir(manter[:-2])
+    tableau_f2[0] = linha_objetivo[manter]
+    _precificar_base(tableau_f2, colunas_f2, base_f2)
+    return 'otimo', iteracoes, tableau_f2, colunas_f2, base_f2
+
+def _normalizar_restricoes(A, b, tipos):
+    """
+    Converte restrições '≥' em '≤' multiplicando a linha por -1.
+
+    :param A: Coeficientes das restrições.
+    :type A: list or np.ndarray
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Lista de tipos das restrições.
+    :type tipos: list[str]
+    :return: Matriz e vetor normalizados e um indicador de conversão.
+    :rtype: tuple(np.ndarray, np.ndarray, bool)
+    """
+    A_norm = np.array(A, dtype=float)
+    b_norm = np.array(b, dtype=float)
+    maiores = np.asarray(tipos, dtype=object) == "≥"
+    tipos_convertidos = bool(maiores.any())
+    if tipos_convertidos:
+        A_norm[maiores] *= -1
+        b_norm[maiores] *= -1
+
+    return A_norm, b_norm, tipos_convertidos
+
+def _rhs_nao_negativo(A, b, tipos):
+    """
+    Multiplica por -1 as linhas com RHS negativo, invertendo o tipo da restrição.
+
+    O Big M parte das folgas e artificiais como base, o que só é factível com b >= 0.
+
+    :param A: Coeficientes das restrições.
+    :type A: list or np.ndarray
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Lista de tipos das restrições.
+    :type tipos: list[str]
+    :return: Matriz, vetor e tipos com RHS não negativo.
+    :rtype: tuple(np.ndarray, np.ndarray, list)
+    """
+    A_pos = np.array(A, dtype=float)
+    b_pos = np.array(b, dtype=float)
+    tipos_pos = list(tipos)
+    inverso = {'≤': '≥', '≥': '≤', '=': '='}
+
+    negativas = np.flatnonzero(b_pos < 0)
+    if len(negativas):
+        A_pos[negativas] *= -1
+        b_pos[negativas] *= -1
+        for i in negativas:
+            tipos_pos[i] = inverso[tipos_pos[i]]
+
+    return A_pos, b_pos, tipos_pos
+
+def _dual_factivel(c, mode):
+    """
+    Verifica se a linha Z inicial (-c) já satisfaz o critério de parada do modo.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: np.ndarray
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :rtype: bool
+    """
+    z_row = -np.asarray(c, dtype=float)
+    return bool(np.all(z_row >= 0)) if mode == 'max' else bool(np.all(z_row <= 0))
+
+def escolher_metodo(c, A, b, tipos, mode='max'):
+    """
+    Analisa o problema e escolhe o algoritmo mais adequado (Primal, Dual ou Duas Fases).
+
+    1. Se houver igualdades ('='), escolhe Duas Fases.
+    2. Converte restrições '>=' para '<=' multiplicando por -1.
+    3. Analisa a factibilidade Primal (b >= 0) e Dual (otimalidade de Z).
+    4. Escolhe entre Primal Simplex, Dual Simplex ou Duas Fases.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list
+    :param A: Coeficientes das restrições.
+    :type A: list
+    :param b: Termos independentes.
+    :type b: list
+    :param tipos: Lista de tipos das restrições.
+    :type tipos: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :return: Chave do método ('primal', 'dual' ou 'duas_fases') e o motivo da escolha.
+    :rtype: tuple(str, str)
+    """
+    if "=" in tipos:
+        return 'duas_fases', "Igualdades detectadas"
+
+    _, b_norm, tipos_convertidos = _normalizar_restricoes(A, b, tipos)
+    primal_factivel = np.all(b_norm >= 0)
+    dual_factivel = _dual_factivel(c, mode)
+
+    if primal_factivel and not tipos_convertidos:
+        return 'primal', "Problema Padrão"
+    elif not primal_factivel and dual_factivel:
+        return 'dual', "RHS Negativo e Z Ótimo"
+    return 'duas_fases', "Problema Misto"
+
+def _valores_primais(tableau, base_vars, num_vars, columns=None, limites=None):
+    """
+    Lê os valores das variáveis de decisão x1..xn no tableau.
+
+    :param tableau: Tableau final.
+    :type tableau: np.ndarray
+    :param base_vars: Variáveis básicas do tableau.
+    :type base_vars: list[str]
+    :param num_vars: Número de variáveis de decisão.
+    :type num_vars: int
+    :param columns: Nomes das colunas (necessário apenas com ``limites``).
+    :type columns: list[str] or None
+    :param limites: Limites superiores das colunas; desfaz as complementações.
+    :type limites: LimitesSuperiores or None
+    :rtype: np.ndarray
+    """
+    x = np.zeros(num_vars)
+    for i in range(num_vars):
+        var_name = f'x{i+1}'
+        if var_name in base_vars:
+            # Pega o valor da coluna RHS (-1) na linha correspondente à variável básica
+            x[i] = tableau[base_vars.index(var_name) + 1, -1]
+        if limites is not None and limites.complementada[columns.index(var_name)]:
+            x[i] = limites.superior[columns.index(var_name)] - x[i]
+    return x
+
+def _limites_variaveis(limites, num_vars):
+    """
+    Valida os limites das variáveis de decisão.
+
+    :param limites: Par (inferior, superior) de cada variável; None em um par ou em
+        um dos lados equivale a (0, ∞).
+    :type limites: list[tuple] or None
+    :param num_vars: Número de variáveis de decisão.
+    :type num_vars: int
+    :return: Limites inferiores e superiores.
+    :rtype: tuple(np.ndarray, np.ndarray)
+    :raises ValueError: Se houver limite inferior infinito ou superior menor que o inferior.
+    """
+    inferiores, superiores = np.zeros(num_vars), np.full(num_vars, np.inf)
+    if limites is None:
+        return inferiores, superiores
+    if len(limites) != num_vars:
+        raise ValueError(f"São necessários {num_vars} pares de limites (um por variável).")
+    for j, par in enumerate(limites):
+        inferior, superior = (None, None) if par is None else par
+        inferiores[j] = 0.0 if inferior is None else inferior
+        superiores[j] = np.inf if superior is None else superior
+    if not np.all(np.isfinite(inferiores)):
+        raise ValueError("Os limites inferiores das variáveis devem ser finitos.")
+    invalidas = np.flatnonzero(superiores < inferiores)
+    if len(invalidas):
+        raise ValueError(f"O limite superior de x{invalidas[0] + 1} é menor que o inferior.")
+    return inferiores, superiores
+
+def _limites_como_restricoes(A, b, tipos, superiores):
+    """
+    Acrescenta uma restrição xⱼ ≤ uⱼ para cada limite superior finito.
+
+    Usado pelo Simplex Revisado, que não trata limites no teste da razão.
+
+    :return: Matriz (no mesmo formato, densa ou :class:`MatrizCSC`), RHS e tipos ampliados.
+    :rtype: tuple
+    """
+    limitadas = np.flatnonzero(np.isfinite(superiores))
+    m, n = len(b), len(superiores)
+    b = np.concatenate([np.asarray(b, dtype=float), superiores[limitadas]])
+    tipos = list(tipos) + ['≤'] * len(limitadas)
+    if isinstance(A, MatrizCSC):
+        colunas = np.repeat(np.arange(n), np.diff(A.indptr))
+        linhas = np.concatenate([A.indices, m + np.arange(len(limitadas))])
+        colunas = np.concatenate([colunas, limitadas])
+        valores = np.concatenate([A.data, np.ones(len(limitadas))])
+        return MatrizCSC.de_triplas(linhas, colunas, valores, (len(b), n)), b, tipos
+    linhas_limite = np.zeros((len(limitadas), n))
+    linhas_limite[np.arange(len(limitadas)), limitadas] = 1.0
+    return np.vstack([np.asarray(A, dtype=float).reshape(m, n), linhas_limite]), b, tipos
+
+def _artificiais_positivas(tableau, base_vars):
+    """
+    Verifica se alguma variável artificial permanece positiva na base.
+
+    :rtype: bool
+    """
+    for row_idx, var in enumerate(base_vars, start=1):
+        if var.startswith('a') and tableau[row_idx, -1] > 1e-5:
+            return True
+    return False
+
+def solve(c, A, b, tipos=None, mode='max', method='automatico', trace=False, base_inicial=None,
+          precificacao='dantzig', presolve=False, escala='geometrica', limites=None, observador=None,
+          dtype=np.float64, sensibilidade=False, max_iteracoes=None, tempo_limite=None, cancelamento=None,
+          precificacao_dual='steepest_edge'):
+    """
+    Resolve um problema de Programação Linear sem qualquer dependência de interface.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Coeficientes das restrições: matriz densa, :class:`MatrizCSC`, matriz
+        esparsa do SciPy ou triplas ``(linhas, colunas, valores)``. Entradas esparsas
+        são resolvidas pelo Simplex Revisado no modo automático.
+    :type A: list or np.ndarray or MatrizCSC or tuple
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '='). Se None, todas são '≤'.
+    :type tipos: list[str] or None
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param method: 'automatico', 'primal', 'dual', 'big_m', 'duas_fases' ou 'revisado'.
+    :type method: str
+    :param trace: Se True, registra cada iteração em ``resultado.trace`` com uma cópia
+        do tableau; com 'resumo', registra apenas o log compacto (pivô, variáveis que
+        entram e saem e Z), sem cópias.
+    :type trace: bool or str
+    :param base_inicial: Base final (``resultado.base``) de uma resolução anterior do
+        mesmo modelo. Se ainda for primal-factível, reotimiza com o Primal (mudança em
+        ``c``); se for apenas dual-factível, com o Dual Simplex (mudança em ``b``).
+        Bases incompatíveis com o modelo atual são descartadas (partida a frio).
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra no Simplex Primal:
+        'dantzig', 'devex', 'steepest_edge', 'parcial', 'multipla' ou uma instância
+        de :class:`precificacao_simplex.Precificacao`. As estatísticas da regra ficam
+        em ``resultado.estatisticas['precificacao']``.
+    :type precificacao: str or Precificacao
+    :param presolve: Se True, reduz e escala o modelo antes de resolvê-lo
+        (:mod:`presolve_simplex`); ``x`` e ``z`` continuam referindo-se às variáveis
+        originais e o resumo da redução fica em ``resultado.estatisticas['presolve']``.
+    :type presolve: bool
+    :param escala: Escala aplicada pelo presolve: 'geometrica', 'equilibrio' ou None.
+    :type escala: str or None
+    :param limites: Par (inferior, superior) de cada variável de decisão (None em um
+        dos lados equivale a 0 ou ∞). O inferior é tratado por translação e o superior
+        no teste da razão dos métodos de tableau, sem linhas extras; o Simplex
+        Revisado recebe os limites superiores como restrições '≤'.
+    :type limites: list[tuple] or None
+    :param observador: Recebe o tempo de cada etapa (montagem, precificação, teste
+        da razão, pivoteamento) e os eventos de pivô e de refatoração; um
+        :class:`perfil_simplex.PerfilSimplex` grava o resumo em ``resultado.estatisticas['perfil']``.
+    :type observador: ObservadorSimplex or None
+    :param dtype: Tipo numérico do tableau nos métodos de tableau. ``np.float32``
+        reduz pela metade a memória e o tempo de montagem de modelos grandes, ao
+        custo de precisão: as tolerâncias continuam as de ``float64`` e o Big M, que
+        mistura M = 10⁵ com os custos, perde os dígitos de ``c`` (prefira Duas Fases).
+        O Simplex Revisado sempre usa ``float64``.
+    :type dtype: np.dtype
+    :param sensibilidade: Se True e a solução for ótima, calcula a partir da base final
+        os preços sombra, os custos reduzidos e as faixas de b e de c
+        (:func:`sensibilidade_simplex.analisar_sensibilidade`) em ``resultado.sensibilidade``.
+    :type sensibilidade: bool
+    :param max_iteracoes: Número máximo de pivôs, somando todas as fases (None para não limitar).
+    :type max_iteracoes: int or None
+    :param tempo_limite: Tempo máximo de pivoteamento em segundos (None para não limitar).
+    :type tempo_limite: float or None
+    :param cancelamento: Ficha consultada antes de cada pivô; acioná-la de outra thread
+        interrompe a resolução.
+    :type cancelamento: CancelamentoSimplex or None
+    :param precificacao_dual: Regra de escolha da linha que sai no Dual Simplex:
+        'steepest_edge', 'dantzig' (RHS mais violado) ou uma instância de
+        :class:`precificacao_simplex.PrecificacaoDual`. As estatísticas da regra, com as
+        trocas de limite do teste da razão, ficam em ``resultado.estatisticas['precificacao_dual']``.
+    :type precificacao_dual: str or PrecificacaoDual
+    :return: Resultado estruturado da resolução. Se o orçamento se esgotar, o status é
+        'limite_iteracoes', 'limite_tempo' ou 'cancelado' e ``x``, ``z`` e ``base`` são os do
+        último quadro (no Dual Simplex e na Fase I, um ponto ainda infactível); o consumo
+        e os ciclos detectados ficam em ``resultado.estatisticas['orcamento']``.
+    :rtype: ResultadoSimplex
+    :raises ValueError: Se o método, o modo, a regra de precificação, os limites ou o
+        orçamento forem inválidos, se o Primal ou o Dual Simplex receberem restrições
+        '=', ou se o Primal Simplex receber um problema sem base inicial factível.
+    """
+    if sensibilidade:
+        resultado = solve(c, A, b, tipos, mode, method, trace, base_inicial, precificacao, presolve, escala, limites,
+                          observador, dtype, max_iteracoes=max_iteracoes, tempo_limite=tempo_limite,
+                          cancelamento=cancelamento, precificacao_dual=precificacao_dual)
+        if resultado.otimo:
+            from sensibilidade_simplex import analisar_sensibilidade
+            resultado.sensibilidade = analisar_sensibilidade(c, A, b, tipos, mode, resultado, limites)
+        return resultado
+
+    inicio = time.perf_counter()
+    if method not in METODOS:
+        raise ValueError(f"Método desconhecido: {method!r}. Use um de {METODOS}.")
+    if mode not in ('max', 'min'):
+        raise ValueError(f"Modo desconhecido: {mode!r}. Use 'max' ou 'min'.")
+    if method in ('primal', 'dual') and tipos is not None and '=' in list(tipos):
+        # A base de folgas não cobre igualdades: tratá-las como '≤' devolveria pontos infactíveis
+        raise ValueError(f"O método {method!r} não aceita restrições '='. "
+                         "Use 'duas_fases', 'big_m' ou 'automatico'.")
+    orcamento = OrcamentoSimplex(max_iteracoes, tempo_limite, cancelamento)
+
+    c = np.asarray(c, dtype=float)
+    num_vars = len(c)
+    inferiores, superiores = _limites_variaveis(limites, num_vars)
+
+    if presolve:
+        from presolve_simplex import resolver_com_presolve
+        return resolver_com_presolve(c, A, b, tipos, mode, method, escala, limites, trace=trace,
+                                     base_inicial=base_inicial, precificacao=precificacao, observador=observador,
+                                     dtype=dtype, max_iteracoes=max_iteracoes, tempo_limite=tempo_limite,
+                                     cancelamento=cancelamento, precificacao_dual=precificacao_dual)
+
+    if tipos is None:
+        tipos = ['≤'] * len(b)
+
+    observador = observador or SEM_OBSERVADOR
+    motivo = None
+    if eh_esparsa(A):
+        A = MatrizCSC.converter(A, (len(b), num_vars))
+        if method == 'automatico':
+            method, motivo = 'revisado', "Matriz esparsa"
+        elif method != 'revisado':
+            # Os métodos de tableau trabalham sobre a matriz densa
+            A = A.densa()
+
+    if np.any(inferiores):
+        # Translação x = l + x': o modelo passa a ter 0 ≤ x' ≤ u - l
+        produto = A.matvec(inferiores) if isinstance(A, MatrizCSC) else np.asarray(A, dtype=float) @ inferiores
+        b = np.asarray(b, dtype=float) - produto
+        superiores = superiores - inferiores
+    limitadas = bool(np.any(np.isfinite(superiores)))
+
+    rota, crash = None, False
+    if method == 'automatico':
+        from rota_simplex import escolher_rota
+        rota = escolher_rota(c, A, b, tipos, mode, superiores if limitadas else None, base_inicial is None)
+        method, motivo = rota.metodo, rota.motivo
+        if method == 'crash':
+            # A base de crash é instalada como uma base salva do leiaute das Duas Fases
+            method, crash, base_inicial = 'duas_fases', True, rota.base_crash
+        elif base_inicial is not None:
+            # A base salva determina o leiaute do tableau: folgas s/artificiais a ou padrão (f)
+            if any(nome[0] in 'sa' for nome in base_inicial):
+                method = 'duas_fases'
+            elif any(nome[0] == 'f' for nome in base_inicial) and "=" not in tipos:
+                method = 'primal'
+
+    regra = criar_precificacao(precificacao)
+    regra_dual = criar_precificacao_dual(precificacao_dual)
+    if method == 'revisado':
+        from revisado_simplex import resolver_revisado
+        if limitadas:
+            A, b, tipos = _limites_como_restricoes(A, b, tipos, superiores)
+        resultado = resolver_revisado(c, A, b, tipos, mode, trace, base_inicial=base_inicial, precificacao=regra,
+                                      observador=observador, orcamento=orcamento)
+        # Como no tableau: o motivo do roteamento, ou o da partida quente
+        quente = resultado.estatisticas.get('partida') == 'quente'
+        resultado.motivo = "Base anterior reaproveitada" if quente else motivo
+        resultado = _desfazer_translacao(resultado, c, inferiores)
+        observador.ao_terminar(resultado)
+        return resultado
+
+    passos = LogIteracoes(completo=trace != 'resumo') if trace else None
+    estatisticas = {} if rota is None else {'rota': rota.como_dict()}
+
+    with observador.fase('montagem'):
+        if method in ('big_m', 'duas_fases'):
+            A_pos, b_pos, tipos_pos = _rhs_nao_negativo(A, b, tipos)
+            if method == 'big_m':
+                tableau, columns, base_vars = _build_big_m_tableau(c, A_pos, b_pos, tipos_pos, mode, dtype)
+            else:
+                tableau, columns, base_vars = _build_tableau_artificial(c, A_pos, b_pos, tipos_pos, dtype)
+        else:
+            A_norm, b_norm, _ = _normalizar_restricoes(A, b, tipos)
+            tableau, columns, base_vars = _build_tableau(c, A_norm, b_norm, dtype)
+        motor = MotorPivo(tableau)
+        limites_tab = LimitesSuperiores.para_colunas(columns, superiores) if limitadas else None
+
+    reotimizacao = None
+    if base_inicial is not None:
+        with observador.fase('montagem'):
+            if method == 'duas_fases':
+                # A base salva é da Fase II: é instalada direto no tableau sem artificiais
+                tableau_f2, colunas_f2 = _sem_artificiais(tableau, columns)
+                motor_f2 = MotorPivo(tableau_f2)
+                limites_f2 = LimitesSuperiores.para_colunas(colunas_f2, superiores) if limitadas else None
+                reotimizacao = _partida_quente(tableau_f2, colunas_f2, base_vars, base_inicial, mode, motor_f2,
+                                               limites_f2)
+                if reotimizacao:
+                    tableau, columns, motor, limites_tab = tableau_f2, colunas_f2, motor_f2, limites_f2
+            else:
+                reotimizacao = _partida_quente(tableau, columns, base_vars, base_inicial, mode, motor, limites_tab)
+        if crash:
+            if reotimizacao:
+                estatisticas['partida'] = 'crash'
+            else:
+                # Base de crash não instalada: segue pelas Duas Fases a partir das artificiais
+                motivo = "Base de crash rejeitada"
+        else:
+            estatisticas['partida'] = 'quente' if reotimizacao else 'fria'
+            if reotimizacao:
+                motivo = "Base anterior reaproveitada"
+    if method == 'primal' and reotimizacao is None and np.any(tableau[1:, -1] < 0):
+        raise ValueError("O Primal Simplex exige uma base inicial factível (b ≥ 0 após normalização).")
+
+    status, iteracoes = 'otimo', 0
+    if method == 'duas_fases' and reotimizacao is None:
+        status, iteracoes, tableau, columns, base_vars = _fase_um(tableau, columns, base_vars, passos, regra,
+                                                                 limites_tab, observador, orcamento)
+        estatisticas['iteracoes_fase1'] = iteracoes
+        motor = MotorPivo(tableau)
+    if reotimizacao == 'dual' or (reotimizacao is None and method == 'dual'):
+        status, iteracoes = _run_dual_simplex_loop(tableau, columns, base_vars, mode, passos, motor, limites_tab,
+                                                   observador, orcamento, regra_dual)
+        estatisticas['precificacao_dual'] = dict(regra_dual.estatisticas)
+    if status == 'otimo':
+        # Completa a otimalidade (no Dual, caso a linha Z inicial não fosse dual-factível)
+        inicio_fase2 = len(passos) if trace else 0
+        status, iteracoes_primal = _run_simplex_loop(tableau, columns, base_vars, mode, passos, motor, regra,
+                                                     limites_tab, observador, orcamento)
+        iteracoes += iteracoes_primal
+        if method == 'duas_fases' and trace:
+            for passo in passos[inicio_fase2:]:
+                passo.fase = 2
+
+    if method == 'big_m':
+        if status == 'otimo' and _artificiais_positivas(tableau, base_vars):
+            status = 'infactivel'
+    elif reotimizacao:
+        method = reotimizacao
+
+    if limitadas:
+        estatisticas['trocas_de_limite'] = limites_tab.trocas
+    estatisticas['precificacao'] = dict(regra.estatisticas)
+    estatisticas['orcamento'] = orcamento.como_dict()
+    estatisticas['tempo_s'] = time.perf_counter() - inicio
+    x = _valores_primais(tableau, base_vars, num_vars, columns, limites_tab)
+    if status in STATUS_INTERROMPIDO:
+        # Progresso parcial: Z do ponto do último quadro (o Z da Fase I ou do Big M não é o de c)
+        z = float(c @ x)
+    else:
+        sem_valor = status == 'ilimitado' or (status == 'infactivel' and method == 'duas_fases')
+        z = None if sem_valor else float(tableau[0, -1])
+    resultado = ResultadoSimplex(
+        status=status,
+        z=z,
+        x=x,
+        base=base_vars,
+        iteracoes=iteracoes,
+        metodo=method,
+        modo=mode,
+        tableau=tableau,
+        colunas=columns,
+        motivo=motivo,
+        trace=passos,
+        estatisticas=estatisticas,
+    )
+    resultado = _desfazer_translacao(resultado, c, inferiores)
+    observador.ao_terminar(resultado)
+    return resultado
+
+def _desfazer_translacao(resultado, c, inferiores):
+    """
+    Devolve x e z às variáveis originais após a translação x = l + x' (in-place).
+
+    :rtype: ResultadoSimplex
+    """
+    if np.any(inferiores):
+        resultado.x = resultado.x + inferiores
+        if resultado.z is not None:
+            resultado.z += float(c @ inferiores)
+    return resultado
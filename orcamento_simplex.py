@@ -0,0 +1,136 @@
+"""
+Orçamento de execução do Simplex: limite de iterações, limite de tempo,
+cancelamento cooperativo e detecção de ciclos.
+
+Os laços do núcleo consultam o :class:`OrcamentoSimplex` antes de cada pivô e,
+se ele estiver esgotado, param com o status correspondente ('limite_iteracoes',
+'limite_tempo' ou 'cancelado'), devolvendo o ponto em que estavam. O
+cancelamento é uma ficha (:class:`CancelamentoSimplex`) que outra thread pode
+acionar a qualquer momento::
+
+    cancelamento = CancelamentoSimplex()
+    r = solve(c, A, b, max_iteracoes=10_000, tempo_limite=5.0, cancelamento=cancelamento)
+    # em outra thread: cancelamento.cancelar()
+
+O :class:`DetectorCiclos` guarda as bases visitadas durante uma sequência de
+pivôs degenerados; se uma delas se repete, o laço está ciclando e passa à regra
+de Bland, que não cicla, até o fim.
+"""
+import threading
+import time
+
+# Status de uma resolução interrompida antes do fim
+STATUS_INTERROMPIDO = ('limite_iteracoes', 'limite_tempo', 'cancelado')
+
+
+class CancelamentoSimplex:
+    """Ficha de cancelamento cooperativo, segura para uso entre threads."""
+
+    def __init__(self):
+        self._evento = threading.Event()
+
+    def __repr__(self):
+        return f"CancelamentoSimplex(cancelado={self.cancelado})"
+
+    def cancelar(self):
+        """Pede a interrupção; o laço para antes do próximo pivô."""
+        self._evento.set()
+
+    @property
+    def cancelado(self):
+        """Indica se o cancelamento foi pedido."""
+        return self._evento.is_set()
+
+
+class OrcamentoSimplex:
+    """
+    Iterações e tempo disponíveis para uma resolução, compartilhados por todas as fases.
+
+    :param max_iteracoes: Número máximo de pivôs (e trocas de limite); None para não limitar.
+    :type max_iteracoes: int or None
+    :param tempo_limite: Segundos disponíveis a partir da criação; None para não limitar.
+    :type tempo_limite: float or None
+    :param cancelamento: Ficha de cancelamento consultada a cada pivô.
+    :type cancelamento: CancelamentoSimplex or None
+    :ivar iteracoes: Pivôs contados até agora.
+    :ivar ciclos: Ciclos detectados (bases repetidas em sequência degenerada).
+    :ivar interrupcao: Status da interrupção, ou None se a resolução não foi interrompida.
+    """
+
+    def __init__(self, max_iteracoes=None, tempo_limite=None, cancelamento=None):
+        if max_iteracoes is not None and max_iteracoes < 0:
+            raise ValueError("O limite de iterações não pode ser negativo.")
+        if tempo_limite is not None and tempo_limite < 0:
+            raise ValueError("O tempo limite não pode ser negativo.")
+        self.max_iteracoes = max_iteracoes
+        self.tempo_limite = tempo_limite
+        self.cancelamento = cancelamento
+        self.inicio = time.perf_counter()
+        self.prazo = None if tempo_limite is None else self.inicio + tempo_limite
+        self.iteracoes = 0
+        self.ciclos = 0
+        self.interrupcao = None
+
+    def verificar(self):
+        """
+        Consulta o orçamento antes de um pivô.
+
+        :return: 'cancelado', 'limite_iteracoes' ou 'limite_tempo', ou None se ainda há orçamento.
+        :rtype: str or None
+        """
+        if self.cancelamento is not None and self.cancelamento.cancelado:
+            self.interrupcao = 'cancelado'
+        elif self.max_iteracoes is not None and self.iteracoes >= self.max_iteracoes:
+            self.interrupcao = 'limite_iteracoes'
+        elif self.prazo is not None and time.perf_counter() >= self.prazo:
+            self.interrupcao = 'limite_tempo'
+        return self.interrupcao
+
+    def contar(self):
+        """Registra um pivô (ou troca de limite) realizado."""
+        self.iteracoes += 1
+
+    def como_dict(self):
+        """Limites, consumo e interrupção, para ``resultado.estatisticas['orcamento']``."""
+        return {
+            'max_iteracoes': self.max_iteracoes,
+            'tempo_limite': self.tempo_limite,
+            'iteracoes': self.iteracoes,
+            'tempo_s': time.perf_counter() - self.inicio,
+            'ciclos_detectados': self.ciclos,
+            'interrupcao': self.interrupcao,
+        }
+
+
+class DetectorCiclos:
+    """
+    Bases visitadas desde o último pivô não degenerado de um laço.
+
+    Só pivôs degenerados (Z parado) podem fechar um ciclo, então o conjunto é
+    esvaziado a cada pivô com passo positivo e o custo fica restrito às
+    sequências degeneradas.
+    """
+
+    def __init__(self):
+        self._vistas = set()
+
+    def repetiu(self, base, degenerado):
+        """
+        Registra a base obtida após um pivô.
+
+        :param base: Identificação das variáveis básicas (nomes ou índices).
+        :type base: list
+        :param degenerado: Indica se o pivô foi degenerado.
+        :type degenerado: bool
+        :return: True se a base já tinha sido visitada na sequência degenerada atual.
+        :rtype: bool
+        """
+        if not degenerado:
+            self._vistas.clear()
+            return False
+        chave = frozenset(base)
+        if chave in self._vistas:
+            self._vistas.clear()
+            return True
+        self._vistas.add(chave)
+        return False
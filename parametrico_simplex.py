@@ -0,0 +1,298 @@
+"""
+Programação paramétrica: Z em função de um termo independente ou de um custo.
+
+Em vez de resolver o modelo em cada ponto de uma grade, :func:`varrer_parametro`
+resolve uma única vez no início da faixa e caminha com o parâmetro, trocando de
+base só nos pontos de quebra em que a base ótima deixa de sê-lo:
+
+- parâmetro ``b_k``: dentro de uma base, ``x_B`` varia linearmente e Z tem
+  inclinação igual ao preço sombra; quando uma básica atinge um limite, ela sai
+  por um pivô do Dual Simplex;
+- parâmetro ``c_j``: dentro de uma base, o vértice não muda e Z tem inclinação
+  ``x_j``; quando um custo reduzido troca de sinal, a coluna entra por um pivô
+  do Simplex Primal.
+
+Cada base é visitada uma vez e a curva resultante é linear por partes::
+
+    curva = varrer_parametro(c, A, b, tipos, 'max', 'b', indice=2, inicio=0, fim=10_000)
+    curva.quebras          # valores de b_3 em que a base muda
+    curva.avaliar(2500.0)  # Z em b_3 = 2500
+
+O modelo é tratado na forma densa ``A·x + s = b`` de :mod:`sensibilidade_simplex`.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from nucleo_simplex import solve
+from sensibilidade_simplex import TOL, _FormaAumentada, _nao_basicas
+
+PARAMETROS = ('b', 'c')
+
+
+@dataclass
+class CurvaParametrica:
+    """
+    Curva linear por partes de Z em função do parâmetro varrido.
+
+    :ivar parametro: 'b' (termo independente) ou 'c' (custo).
+    :ivar indice: Índice (a partir de 0) da restrição ou da variável.
+    :ivar pontos: Valores do parâmetro no início, em cada quebra e no fim do trecho percorrido.
+    :ivar z: Valor ótimo de Z em cada ponto.
+    :ivar segmentos: Um dicionário por base visitada, com 'inicio', 'fim',
+        'inclinacao' (dZ/dt) e 'base' (nomes: 'x' para variáveis e 'f' para as folgas das linhas).
+    :ivar status: 'otimo' se a faixa inteira foi percorrida; 'infactivel' ou
+        'ilimitado' se o problema deixa de ter ótimo após ``pontos[-1]``;
+        'interrompido' se o limite de pivôs foi atingido.
+    :ivar pivos: Trocas de base (e de limite) realizadas na varredura.
+    """
+    parametro: str
+    indice: int
+    pontos: np.ndarray
+    z: np.ndarray
+    segmentos: list = field(default_factory=list)
+    status: str = 'otimo'
+    pivos: int = 0
+
+    @property
+    def quebras(self):
+        """Pontos internos em que a base ótima muda."""
+        return self.pontos[1:-1]
+
+    def avaliar(self, t):
+        """
+        Z ótimo para o parâmetro em ``t`` (NaN fora do trecho percorrido).
+
+        :param t: Valor (ou valores) do parâmetro.
+        :type t: float or np.ndarray
+        :rtype: float or np.ndarray
+        """
+        ordem = np.argsort(self.pontos, kind='stable')
+        pontos, z = self.pontos[ordem], self.z[ordem]
+        valores = np.interp(t, pontos, z)
+        return np.where((np.asarray(t) >= pontos[0]) & (np.asarray(t) <= pontos[-1]), valores, np.nan)
+
+    def como_dict(self):
+        """
+        Curva serializável em JSON.
+
+        :rtype: dict
+        """
+        return {
+            'parametro': self.parametro,
+            'indice': self.indice,
+            'pontos': [float(t) for t in self.pontos],
+            'z': [float(v) for v in self.z],
+            'segmentos': [dict(s, inicio=float(s['inicio']), fim=float(s['fim']),
+                               inclinacao=float(s['inclinacao'])) for s in self.segmentos],
+            'status': self.status,
+            'pivos': self.pivos,
+        }
+
+
+def _menor_razao(variacao, x_base, inferiores, superiores):
+    """
+    Maior passo t ≥ 0 com ``inferiores ≤ x_base + t·variacao ≤ superiores``.
+
+    :return: Passo (∞ se nada bloqueia), posição que bloqueia e se ela atinge o limite superior.
+    :rtype: tuple(float, int or None, bool)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        razoes = np.where(variacao > TOL, (superiores - x_base) / variacao,
+                          np.where(variacao < -TOL, (inferiores - x_base) / variacao, np.inf))
+    razoes = np.maximum(razoes, 0.0)
+    if len(razoes) == 0 or not np.isfinite(razoes.min()):
+        return np.inf, None, False
+    r = int(np.argmin(razoes))
+    return float(razoes[r]), r, bool(variacao[r] > 0)
+
+class _Varredura:
+    """Estado da varredura: base, valores de todas as colunas e o parâmetro atual."""
+
+    def __init__(self, forma, parametro, indice, inicio, fim, resultado):
+        self.forma = forma
+        self.parametro, self.indice = parametro, indice
+        self.t, self.fim = float(inicio), float(fim)
+        self.sentido = 1.0 if fim >= inicio else -1.0
+        self.valores = forma.valores(resultado.x)
+        self.base, _, _, _ = forma.base_otima(resultado, self.valores)
+        self.pontos, self.z, self.segmentos = [self.t], [self._z()], []
+        self.pivos = 0
+
+    def _z(self):
+        return float(self.forma.c @ self.valores[:self.forma.n])
+
+    def _avancar(self, passo, inclinacao):
+        """Fecha o segmento da base atual após andar ``passo`` com o parâmetro."""
+        inicio = self.t
+        self.t += self.sentido * passo
+        forma = self.forma
+        if self.parametro == 'b':
+            forma.b[self.indice] = self.t
+        else:
+            forma.c[self.indice] = self.t
+            forma.custo[self.indice] = forma.sinal * self.t
+        if passo > 0:
+            self.pontos.append(self.t)
+            self.z.append(self._z())
+            self.segmentos.append({'inicio': inicio, 'fim': self.t, 'inclinacao': inclinacao,
+                                   'base': self.forma.nomes(self.base)})
+
+    def passo_rhs(self):
+        """
+        Anda com b_k até a próxima quebra e troca a base por um pivô dual.
+
+        :return: None enquanto houver faixa a percorrer, ou o status final.
+        :rtype: str or None
+        """
+        forma, base = self.forma, self.base
+        B = forma.K[:, base]
+        e_k = np.zeros(forma.m)
+        e_k[self.indice] = 1.0
+        variacao = self.sentido * np.linalg.solve(B, e_k)
+        y = np.linalg.solve(B.T, forma.custo[base])
+        inclinacao = forma.sinal * y[self.indice]
+        x_base = self.valores[base]
+        passo, r, superior = _menor_razao(variacao, x_base, forma.inferiores[base], forma.superiores[base])
+        restante = abs(self.fim - self.t)
+        if passo >= restante:
+            self.valores[base] = x_base + restante * variacao
+            self._avancar(restante, inclinacao)
+            return 'otimo'
+        self.valores[base] = x_base + passo * variacao
+        sai = base[r]
+        self.valores[sai] = forma.superiores[sai] if superior else forma.inferiores[sai]
+        self._avancar(passo, inclinacao)
+
+        # Teste da razão dual na linha que sai: a coluna que entra mantém os custos reduzidos no sinal
+        alpha = np.linalg.solve(B.T, np.eye(forma.m)[r]) @ forma.K
+        d = forma.custo - forma.K.T @ y
+        no_inferior, no_superior = _nao_basicas(self.valores, forma.inferiores, forma.superiores, base)
+        if superior:
+            candidatas = (no_inferior & (alpha > TOL)) | (no_superior & (alpha < -TOL))
+        else:
+            candidatas = (no_inferior & (alpha < -TOL)) | (no_superior & (alpha > TOL))
+        candidatas[sai] = False
+        if not candidatas.any():
+            return 'infactivel'
+        razoes = np.full(len(d), np.inf)
+        razoes[candidatas] = np.abs(d[candidatas] / alpha[candidatas])
+        base[r] = int(np.argmin(razoes))
+        self.pivos += 1
+        return None
+
+    def passo_custo(self):
+        """
+        Anda com c_j até a próxima quebra e troca a base por um pivô primal.
+
+        :return: None enquanto houver faixa a percorrer, ou o status final.
+        :rtype: str or None
+        """
+        forma, base, j = self.forma, self.base, self.indice
+        B = forma.K[:, base]
+        y = np.linalg.solve(B.T, forma.custo[base])
+        d = forma.custo - forma.K.T @ y
+        # Variação dos custos reduzidos por unidade do parâmetro
+        variacao = np.zeros(len(d))
+        variacao[j] = 1.0
+        if j in base:
+            variacao -= np.linalg.solve(B.T, np.eye(forma.m)[base.index(j)]) @ forma.K
+            variacao[j] = 0.0
+        variacao *= forma.sinal * self.sentido
+        no_inferior, no_superior = _nao_basicas(self.valores, forma.inferiores, forma.superiores, base)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razoes = np.where((no_inferior & (variacao > TOL)) | (no_superior & (variacao < -TOL)),
+                              np.maximum(-d / variacao, 0.0), np.inf)
+        q = int(np.argmin(razoes))
+        passo = razoes[q]
+        inclinacao = self.valores[j]
+        restante = abs(self.fim - self.t)
+        if passo >= restante:
+            self._avancar(restante, inclinacao)
+            return 'otimo'
+        self._avancar(passo, inclinacao)
+
+        # Teste da razão primal com a coluna q entrando (ou trocando de limite)
+        sentido_q = 1.0 if no_inferior[q] else -1.0
+        direcao = -sentido_q * np.linalg.solve(B, forma.K[:, q])
+        x_base = self.valores[base]
+        t_max, r, superior = _menor_razao(direcao, x_base, forma.inferiores[base], forma.superiores[base])
+        troca_limite = forma.superiores[q] - forma.inferiores[q]
+        if not np.isfinite(min(t_max, troca_limite)):
+            return 'ilimitado'
+        self.pivos += 1
+        if troca_limite <= t_max:
+            self.valores[base] = x_base + troca_limite * direcao
+            self.valores[q] = forma.superiores[q] if sentido_q > 0 else forma.inferiores[q]
+            return None
+        self.valores[base] = x_base + t_max * direcao
+        self.valores[q] += sentido_q * t_max
+        sai = base[r]
+        self.valores[sai] = forma.superiores[sai] if superior else forma.inferiores[sai]
+        base[r] = q
+        return None
+
+def varrer_parametro(c, A, b, tipos=None, mode='max', parametro='b', indice=0, inicio=0.0, fim=1.0, limites=None,
+                     max_pivos=None):
+    """
+    Calcula Z ótimo em função de ``b[indice]`` ou ``c[indice]`` no intervalo [inicio, fim].
+
+    O modelo é resolvido uma única vez, com o parâmetro em ``inicio``; a partir
+    daí, cada quebra custa um pivô (dual para ``b``, primal para ``c``). O
+    intervalo também pode ser percorrido em ordem decrescente (``fim < inicio``).
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Coeficientes das restrições (densos ou esparsos).
+    :type A: list or np.ndarray or MatrizCSC
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '='). Se None, todas são '≤'.
+    :type tipos: list[str] or None
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param parametro: 'b' (termo independente da restrição ``indice``) ou 'c' (custo da variável ``indice``).
+    :type parametro: str
+    :param indice: Índice (a partir de 0) da restrição ou da variável.
+    :type indice: int
+    :param inicio: Valor inicial do parâmetro.
+    :type inicio: float
+    :param fim: Valor final do parâmetro.
+    :type fim: float
+    :param limites: Par (inferior, superior) de cada variável de decisão.
+    :type limites: list[tuple] or None
+    :param max_pivos: Limite de trocas de base (padrão: 10·(m + n) + 100).
+    :type max_pivos: int or None
+    :rtype: CurvaParametrica
+    :raises ValueError: Se o parâmetro ou o índice forem inválidos, ou se o modelo
+        não tiver ótimo no início da faixa.
+    """
+    if parametro not in PARAMETROS:
+        raise ValueError(f"Parâmetro desconhecido: {parametro!r}. Use um de {PARAMETROS}.")
+    c = np.array(c, dtype=float)
+    b = np.array(b, dtype=float)
+    tamanho = len(b) if parametro == 'b' else len(c)
+    if not 0 <= indice < tamanho:
+        raise ValueError(f"Índice {indice} fora do intervalo de {parametro} (0 a {tamanho - 1}).")
+    (b if parametro == 'b' else c)[indice] = inicio
+
+    resultado = solve(c, A, b, tipos, mode, limites=limites)
+    if not resultado.otimo:
+        raise ValueError(f"O modelo não tem ótimo com {parametro}{indice + 1} = {inicio:g} ({resultado.status}).")
+    forma = _FormaAumentada(c, A, b, tipos, mode, limites)
+    varredura = _Varredura(forma, parametro, indice, inicio, fim, resultado)
+    passo = varredura.passo_rhs if parametro == 'b' else varredura.passo_custo
+    limite = max_pivos if max_pivos is not None else 10 * (forma.m + forma.n) + 100
+
+    status = None
+    while status is None and varredura.pivos <= limite:
+        status = passo()
+    return CurvaParametrica(
+        parametro=parametro,
+        indice=indice,
+        pontos=np.array(varredura.pontos),
+        z=np.array(varredura.z),
+        segmentos=varredura.segmentos,
+        status=status or 'interrompido',
+        pivos=varredura.pivos,
+    )
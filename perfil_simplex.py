@@ -0,0 +1,212 @@
+"""
+Ganchos de instrumentação dos laços do Simplex e um perfilador por etapa.
+
+Os laços de :mod:`nucleo_simplex` e :mod:`revisado_simplex` avisam um
+:class:`ObservadorSimplex` a cada etapa (montagem, precificação, teste da razão,
+pivoteamento, refatoração) e a cada pivô. O observador padrão não faz nada; para
+medir uma resolução, passe um :class:`PerfilSimplex`::
+
+    perfil = PerfilSimplex()
+    r = solve(c, A, b, tipos, observador=perfil)
+    print(perfil.como_dict()['tempos_s'])
+    perfil.exportar_json('perfil.json')
+
+Para reagir aos eventos (ex.: registrar cada pivô em outro lugar), herde de
+:class:`ObservadorSimplex` e sobrescreva apenas os ganchos desejados.
+"""
+import json
+import time
+from array import array
+from contextlib import nullcontext
+from pathlib import Path
+
+# Etapas cronometradas, na ordem em que aparecem no relatório
+ETAPAS = ('presolve', 'montagem', 'precificacao', 'teste_razao', 'pivoteamento', 'fatoracao', 'pos_solve',
+          'renderizacao')
+
+_SEM_MEDICAO = nullcontext()
+
+
+class ObservadorSimplex:
+    """
+    Observador dos laços do Simplex; todos os ganchos são vazios.
+
+    As etapas podem ser aninhadas, mas o tempo de uma resolução se divide entre
+    elas sem sobreposição; o restante (controle dos laços, cópias para o ``trace``)
+    fica fora de todas.
+    """
+
+    def fase(self, nome):
+        """
+        Delimita uma etapa da resolução (usado como ``with observador.fase('pivoteamento'):``).
+
+        :param nome: Uma de :data:`ETAPAS`.
+        :type nome: str
+        :return: Gerenciador de contexto.
+        """
+        return _SEM_MEDICAO
+
+    def ao_pivotar(self, tipo, linha, coluna, linhas_tocadas, degenerado):
+        """
+        Chamado após cada pivô.
+
+        :param tipo: 'primal', 'dual' ou 'revisado'.
+        :type tipo: str
+        :param linha: Linha (posição na base) do pivô.
+        :type linha: int
+        :param coluna: Coluna que entrou na base.
+        :type coluna: int
+        :param linhas_tocadas: Linhas do tableau (ou elementos da coluna eta) atualizadas pelo pivô.
+        :type linhas_tocadas: int
+        :param degenerado: Se o passo foi nulo (a função objetivo não mudou).
+        :type degenerado: bool
+        """
+
+    def ao_trocar_limite(self, coluna):
+        """
+        Chamado quando uma variável troca de limite sem pivoteamento.
+
+        :param coluna: Coluna da variável.
+        :type coluna: int
+        """
+
+    def ao_refatorar(self):
+        """Chamado a cada refatoração da base no Simplex Revisado."""
+
+    def ao_terminar(self, resultado):
+        """
+        Chamado com o resultado final da resolução.
+
+        :param resultado: Resultado da resolução.
+        :type resultado: ResultadoSimplex
+        """
+
+
+#: Observador usado quando nenhum é informado
+SEM_OBSERVADOR = ObservadorSimplex()
+
+
+class _Cronometro:
+    """
+    Gerenciador de contexto que acumula o tempo de uma etapa no perfil.
+
+    Uma etapa aberta dentro de outra (ex.: a refatoração disparada por um pivô)
+    pausa a externa, de modo que cada segundo é contado em uma única etapa.
+    """
+
+    __slots__ = ('perfil', 'nome', 'inicio')
+
+    def __init__(self, perfil, nome):
+        self.perfil = perfil
+        self.nome = nome
+
+    def _acumular(self, agora):
+        tempos = self.perfil.tempos
+        tempos[self.nome] = tempos.get(self.nome, 0.0) + agora - self.inicio
+
+    def __enter__(self):
+        agora = time.perf_counter()
+        pilha = self.perfil._pilha
+        if pilha:
+            pilha[-1]._acumular(agora)
+        pilha.append(self)
+        self.inicio = agora
+
+    def __exit__(self, *excecao):
+        agora = time.perf_counter()
+        pilha = self.perfil._pilha
+        self._acumular(agora)
+        pilha.pop()
+        if pilha:
+            pilha[-1].inicio = agora
+        chamadas = self.perfil.chamadas
+        chamadas[self.nome] = chamadas.get(self.nome, 0) + 1
+
+
+class PerfilSimplex(ObservadorSimplex):
+    """
+    Acumula tempo por etapa e contadores de uma resolução.
+
+    Ao fim da resolução, o resumo (:meth:`como_dict`) também é gravado em
+    ``resultado.estatisticas['perfil']``. O tempo total vai da primeira etapa
+    medida até o fim da resolução; use um perfil novo para cada resolução.
+
+    :ivar tempos: Segundos acumulados por etapa.
+    :ivar chamadas: Número de vezes que cada etapa foi executada.
+    :ivar contadores: Pivôs, pivôs degenerados, trocas de limite, refatorações e
+        linhas tocadas.
+    :ivar linhas_por_pivo: Linhas atualizadas em cada pivô, na ordem.
+    """
+
+    def __init__(self):
+        self.tempos = {}
+        self.chamadas = {}
+        self.contadores = {'pivos': 0, 'pivos_degenerados': 0, 'trocas_de_limite': 0, 'refatoracoes': 0,
+                           'linhas_tocadas': 0}
+        self.pivos_por_tipo = {}
+        self.linhas_por_pivo = array('l')
+        self.tempo_total_s = 0.0
+        self._inicio = None
+        self._cronometros = {}
+        self._pilha = []
+
+    def fase(self, nome):
+        if self._inicio is None:
+            self._inicio = time.perf_counter()
+        cronometro = self._cronometros.get(nome)
+        if cronometro is None:
+            cronometro = self._cronometros[nome] = _Cronometro(self, nome)
+        return cronometro
+
+    def ao_pivotar(self, tipo, linha, coluna, linhas_tocadas, degenerado):
+        self.contadores['pivos'] += 1
+        self.contadores['pivos_degenerados'] += bool(degenerado)
+        self.contadores['linhas_tocadas'] += linhas_tocadas
+        self.pivos_por_tipo[tipo] = self.pivos_por_tipo.get(tipo, 0) + 1
+        self.linhas_por_pivo.append(linhas_tocadas)
+
+    def ao_trocar_limite(self, coluna):
+        self.contadores['trocas_de_limite'] += 1
+
+    def ao_refatorar(self):
+        self.contadores['refatoracoes'] += 1
+
+    def ao_terminar(self, resultado):
+        if self._inicio is not None:
+            self.tempo_total_s = time.perf_counter() - self._inicio
+        resultado.estatisticas['perfil'] = self.como_dict()
+
+    def como_dict(self):
+        """
+        Resumo serializável em JSON.
+
+        :return: Tempos e chamadas por etapa (na ordem de :data:`ETAPAS`), tempo fora
+            das etapas, contadores, pivôs por tipo e linhas tocadas por pivô.
+        :rtype: dict
+        """
+        ordem = [nome for nome in ETAPAS if nome in self.tempos] + sorted(set(self.tempos) - set(ETAPAS))
+        pivos = self.contadores['pivos']
+        return {
+            'tempos_s': {nome: self.tempos[nome] for nome in ordem},
+            'chamadas': {nome: self.chamadas[nome] for nome in ordem},
+            'tempo_total_s': self.tempo_total_s,
+            'outros_s': max(0.0, self.tempo_total_s - sum(self.tempos.values())),
+            'contadores': dict(self.contadores),
+            'pivos_por_tipo': dict(self.pivos_por_tipo),
+            'linhas_por_pivo_media': self.contadores['linhas_tocadas'] / pivos if pivos else 0.0,
+            'linhas_por_pivo': list(self.linhas_por_pivo),
+        }
+
+    def exportar_json(self, destino=None):
+        """
+        Serializa o perfil em JSON.
+
+        :param destino: Caminho do arquivo a gravar (opcional).
+        :type destino: str or Path or None
+        :return: O texto JSON.
+        :rtype: str
+        """
+        texto = json.dumps(self.como_dict(), indent=2, ensure_ascii=False)
+        if destino is not None:
+            Path(destino).write_text(texto, encoding='utf-8')
+        return texto
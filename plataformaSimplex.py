@@ -3,11 +3,11 @@ from funcoes_simplex import *
 # ==============================
 # CONFIGURAÇÕES DA PÁGINA
 # ==============================
-st.set_page_config(page_title="Simplex Interativo (Primal / Dual / Big M)", page_icon="🧮", layout="wide")
-st.title("🧮 Simplex Interativo — Primal, Dual & Big M")
+st.set_page_config(page_title="Simplex Interativo (Primal / Dual / Duas Fases)", page_icon="🧮", layout="wide")
+st.title("🧮 Simplex Interativo — Primal, Dual & Duas Fases")
 st.markdown(
     "Resolva problemas de Programação Linear de qualquer tipo. "
-    "O modo **Automático** identifica a melhor estratégia (incluindo Big M para igualdades)."
+    "O modo **Automático** identifica a melhor estratégia (incluindo Duas Fases para igualdades)."
 )
 
 st.markdown("---")
@@ -20,100 +20,259 @@ st.sidebar.header("⚙️ Configurações do Problema")
 # Seletor de Método com a nova opção Automático
 metodo = st.sidebar.selectbox(
     "Método:", 
-    ("Automático", "Primal Simplex", "Dual Simplex")
+    ("Automático", "Primal Simplex", "Dual Simplex", "Duas Fases", "Simplex Revisado")
 )
 
 modo = st.sidebar.radio("Modo de otimização:", ("max", "min"))
+
+# Regra de precificação: escolha da variável que entra na base no Simplex Primal
+regra = st.sidebar.selectbox(
+    "Regra de precificação:",
+    list(NOMES_PRECIFICACAO),
+    format_func=NOMES_PRECIFICACAO.get,
+    help="Dantzig escolhe o custo reduzido mais negativo; Devex e Steepest Edge ponderam pela "
+         "norma da aresta (menos iterações); Parcial e Múltipla precificam só parte das colunas "
+         "(problemas largos). Todas passam à regra de Bland se houver degeneração.",
+)
 num_vars = st.sidebar.number_input("Número de variáveis (x)", min_value=1, max_value=20, value=2)
 num_rest = st.sidebar.number_input("Número de restrições", min_value=1, max_value=20, value=2)
 st.sidebar.markdown("---")
 
+# Partida quente: reaproveita a base ótima da última resolução (mesmo método e dimensões)
+partida_quente = st.sidebar.checkbox(
+    "♻️ Partida quente",
+    help="Reaproveita a base ótima da última resolução. Após pequenas mudanças em c ou b, "
+         "o problema é reotimizado em poucos pivôs em vez de recomeçar do zero.",
+)
+
+# Presolve: remove linhas vazias, duplicadas e unitárias e escala o modelo antes do Simplex
+presolve = st.sidebar.checkbox(
+    "🧹 Presolve e escala",
+    value=False,
+    help="Reduz o modelo (linhas vazias, duplicadas e unitárias, variáveis fixas) e escala os "
+         "coeficientes antes de montar o quadro. Os quadros exibidos passam a ser os do modelo "
+         "reduzido; a solução final é sempre dada nas variáveis originais.",
+)
+
+# Passo a passo: quadros paginados ou apenas o log compacto das iterações
+resumo = st.sidebar.radio(
+    "Passo a passo:",
+    ("Quadros paginados", "Somente resumo"),
+    help="No modo resumo, apenas o log das iterações (pivô, variáveis e Z) é registrado e exibido, "
+         "sem montar os quadros; indicado para problemas maiores.",
+) == "Somente resumo"
+
+# Variáveis inteiras: ordem de exploração e tamanho da árvore do branch-and-bound
+painel_inteiras = st.sidebar.expander("🌳 Variáveis inteiras")
+selecao = painel_inteiras.selectbox(
+    "Seleção de nós:",
+    list(NOMES_SELECAO),
+    format_func=NOMES_SELECAO.get,
+    help="Melhor limitante explora primeiro o nó de maior potencial (prova o ótimo com menos nós); "
+         "Profundidade mergulha na árvore e encontra soluções inteiras mais cedo.",
+)
+max_nos = painel_inteiras.number_input("Máximo de nós", min_value=1, value=10000, step=1000)
+
+# Importação de modelos: um arquivo MPS, LP ou CSV substitui os campos de entrada
+painel_io = st.sidebar.expander("📂 Importar / exportar modelo")
+arquivo = painel_io.file_uploader(
+    "Modelo (MPS, LP ou CSV):",
+    type=["mps", "lp", "csv", "gz"],
+    help="MPS livre, LP do CPLEX ou CSV 'A | tipo | b' (primeira linha: max/min e os custos). "
+         "Não há limite de tamanho: o modelo importado substitui os campos da tela.",
+)
+modelo_importado = None
+if arquivo is not None:
+    try:
+        modelo_importado = importar_modelo(arquivo.getvalue(), arquivo.name)
+    except (ValueError, UnicodeDecodeError) as e:
+        painel_io.error(f"Não foi possível ler o arquivo: {e}")
+
+# Resolução em lote: vários modelos independentes, distribuídos por um pool de processos
+painel_lote = st.sidebar.expander("🗂️ Resolução em lote")
+arquivos_lote = painel_lote.file_uploader(
+    "Modelos ou pacotes (zip/tar):",
+    type=["mps", "lp", "csv", "gz", "zip", "tar", "tgz"],
+    accept_multiple_files=True,
+    help="Envie vários modelos ou um pacote com uma pasta de modelos; eles são resolvidos em paralelo "
+         "e o resultado de todos pode ser baixado de uma vez.",
+)
+processos_lote = painel_lote.number_input("Processos", min_value=1, max_value=64, value=os.cpu_count() or 1)
+
+# Cache de resultados: problemas idênticos não são resolvidos de novo
+cache = cache_de_resultados()
+painel_cache = st.sidebar.expander("📦 Cache de resultados")
+if painel_cache.button("🗑️ Limpar cache", use_container_width=True):
+    cache.limpar()
+
 
 st.markdown("## ⚙️ Entradas do Problema")
 
-# ==============================
-# Função Objetivo
-# ==============================
-st.markdown("### Função Objetivo (Z):")
-coef_c = []
-cols = st.columns(num_vars)
-for i in range(num_vars):
-    coef_c.append(cols[i].number_input(f"Coef. de x{i+1}", value=1.0, key=f"c{i}"))
+bloqueado = False
+if modelo_importado is not None:
+    # O modelo do arquivo define o sentido, as restrições e os limites
+    show_modelo_importado(modelo_importado, arquivo.name)
+    modo = modelo_importado.modo
+    coef_c, A, b = modelo_importado.c, modelo_importado.A, modelo_importado.b
+    tipos_rest, limites = modelo_importado.tipos, modelo_importado.limites
+    inteiras = modelo_importado.inteiras
+    if max(modelo_importado.forma) > LIMITE_QUADROS and not resumo:
+        resumo = True
+        st.caption(f"Modelo com mais de {LIMITE_QUADROS} linhas ou colunas: exibindo somente o log das iterações.")
+    if not inteiras and metodo in ("Primal Simplex", "Dual Simplex") and any(tipo != "≤" for tipo in tipos_rest):
+        st.error(f"❌ O {metodo} aceita apenas restrições '≤'. Escolha Automático, Duas Fases ou Simplex Revisado.")
+        bloqueado = True
+else:
+    # ==============================
+    # Função Objetivo
+    # ==============================
+    st.markdown("### Função Objetivo (Z):")
+    coef_c = []
+    cols = st.columns(num_vars)
+    for i in range(num_vars):
+        coef_c.append(cols[i].number_input(f"Coef. de x{i+1}", value=1.0, key=f"c{i}"))
+    # Variáveis marcadas como inteiras levam a resolução ao branch-and-bound
+    inteiras = [i for i in range(num_vars) if cols[i].checkbox(f"x{i+1} inteira", key=f"int{i}")]
 
-# ==============================
-# Restrições (Lógica Condicional)
-# ==============================
-st.markdown("### Restrições:")
-A, b = [], []
-tipos_rest = [] # Lista para guardar os tipos (≤, ≥, =)
+    # ==============================
+    # Restrições (Lógica Condicional)
+    # ==============================
+    st.markdown("### Restrições:")
+    A, b = [], []
+    tipos_rest = [] # Lista para guardar os tipos (≤, ≥, =)
 
-if metodo == "Automático":
-    st.info("💡 No Modo Automático, você pode misturar restrições de diferentes tipos.")
+    if metodo in ("Automático", "Duas Fases", "Simplex Revisado"):
+        st.info(f"💡 No modo {metodo}, você pode misturar restrições de diferentes tipos.")
     
-    for j in range(num_rest):
-        # Cria colunas: Uma para cada variável + 1 para o Símbolo + 1 para o Valor b
-        # A proporção das colunas pode ser ajustada, mas o padrão do Streamlit funciona bem
-        cols = st.columns(num_vars + 2) 
-        linha = []
+        for j in range(num_rest):
+            # Cria colunas: Uma para cada variável + 1 para o Símbolo + 1 para o Valor b
+            # A proporção das colunas pode ser ajustada, mas o padrão do Streamlit funciona bem
+            cols = st.columns(num_vars + 2) 
+            linha = []
         
-        # 1. Inputs dos Coeficientes das Variáveis (A)
-        for i in range(num_vars):
-            val = cols[i].number_input(f"x{i+1} (R{j+1})", value=1.0, key=f"a{j}{i}", label_visibility="visible")
-            linha.append(val)
-        A.append(linha)
+            # 1. Inputs dos Coeficientes das Variáveis (A)
+            for i in range(num_vars):
+                val = cols[i].number_input(f"x{i+1} (R{j+1})", value=1.0, key=f"a{j}{i}", label_visibility="visible")
+                linha.append(val)
+            A.append(linha)
         
-        # 2. Selectbox para o Tipo de Desigualdade/Igualdade
-        # key=f"tipo{j}" garante que cada linha tenha seu próprio seletor
-        tipo = cols[num_vars].selectbox(
-            "Tipo", 
-            options=["≤", "≥", "="], 
-            key=f"tipo{j}", 
-            label_visibility="visible"
-        )
-        tipos_rest.append(tipo)
+            # 2. Selectbox para o Tipo de Desigualdade/Igualdade
+            # key=f"tipo{j}" garante que cada linha tenha seu próprio seletor
+            tipo = cols[num_vars].selectbox(
+                "Tipo", 
+                options=["≤", "≥", "="], 
+                key=f"tipo{j}", 
+                label_visibility="visible"
+            )
+            tipos_rest.append(tipo)
         
-        # 3. Input do Lado Direito (b)
-        val_b = cols[-1].number_input(f"RHS (b{j+1})", value=10.0, key=f"b{j}", label_visibility="visible")
-        b.append(val_b)
+            # 3. Input do Lado Direito (b)
+            val_b = cols[-1].number_input(f"RHS (b{j+1})", value=10.0, key=f"b{j}", label_visibility="visible")
+            b.append(val_b)
 
-else:
-    # Modos Manuais (Primal ou Dual) - Interface Simplificada (Tudo ≤)
-    st.warning(f"⚠️ Modo Manual ({metodo}): O sistema assume que todas as restrições são do tipo '≤'.")
+    else:
+        # Modos Manuais (Primal ou Dual) - Interface Simplificada (Tudo ≤)
+        st.warning(f"⚠️ Modo Manual ({metodo}): O sistema assume que todas as restrições são do tipo '≤'.")
     
-    for j in range(num_rest):
-        cols = st.columns(num_vars + 1)
-        linha = []
-        for i in range(num_vars):
-            linha.append(cols[i].number_input(f"A{j+1}{i+1}", value=1.0, key=f"a{j}{i}"))
-        A.append(linha)
+        for j in range(num_rest):
+            cols = st.columns(num_vars + 1)
+            linha = []
+            for i in range(num_vars):
+                linha.append(cols[i].number_input(f"A{j+1}{i+1}", value=1.0, key=f"a{j}{i}"))
+            A.append(linha)
         
-        # Define padrão como '≤' para manter compatibilidade
-        tipos_rest.append("≤")
+            # Define padrão como '≤' para manter compatibilidade
+            tipos_rest.append("≤")
         
-        b.append(cols[-1].number_input(f"b{j+1}", value=10.0, key=f"b{j}"))
+            b.append(cols[-1].number_input(f"b{j+1}", value=10.0, key=f"b{j}"))
+
+    # ==============================
+    # Limites das Variáveis
+    # ==============================
+    # Limites entram no teste da razão (Simplex com variáveis canalizadas), sem linhas extras
+    with st.expander("📏 Limites das variáveis (opcional)"):
+        st.caption("Deixe o limite superior em branco para ∞. Limites não acrescentam restrições ao quadro.")
+        limites = []
+        for i in range(num_vars):
+            col_inf, col_sup = st.columns(2)
+            inferior = col_inf.number_input(f"Inferior de x{i+1}", value=0.0, key=f"li{i}")
+            superior = col_sup.number_input(f"Superior de x{i+1}", value=None, placeholder="∞", key=f"ls{i}")
+            limites.append((inferior, superior))
+    if all(inferior == 0 and superior is None for inferior, superior in limites):
+        limites = None
 
 # ==============================
 # Botão de Ação
 # ==============================
 st.markdown("---")
-if st.button("🚀 Resolver", use_container_width=True):
+if st.button("🚀 Resolver", use_container_width=True, disabled=bloqueado):
+    st.session_state["pagina_quadros"] = 1
     with st.spinner("Processando..."):
         try:
             # Validação básica de dimensões
-            A_np = np.array(A)
-            if A_np.shape != (num_rest, num_vars):
+            if modelo_importado is None and np.array(A).shape != (num_rest, num_vars):
                 st.error("Erro nas dimensões da matriz A.")
             else:
+                # Base da última resolução ótima com o mesmo método
+                anterior = st.session_state.get("ultima_base")
+                base_inicial = anterior["base"] if partida_quente and anterior and anterior["metodo"] == metodo else None
+
                 # Roteamento para as funções do backend
-                if metodo == "Automático":
-                    solve_automatico(coef_c, A, b, tipos_rest, modo)
+                if inteiras:
+                    resultado = solve_inteiro(coef_c, A, b, tipos_rest, modo, inteiras, selecao, limites, max_nos)
+                elif metodo == "Automático":
+                    resultado = solve_automatico(coef_c, A, b, tipos_rest, modo, base_inicial, regra, presolve, limites, resumo)
                 elif metodo == "Primal Simplex":
-                    solve_simplex_step_by_step(coef_c, A, b, modo)
+                    resultado = solve_simplex_step_by_step(coef_c, A, b, modo, base_inicial, regra, presolve, limites, resumo)
                 elif metodo == "Dual Simplex":
-                    solve_dual_simplex_step_by_step(coef_c, A, b, modo)
+                    resultado = solve_dual_simplex_step_by_step(coef_c, A, b, modo, base_inicial, regra, presolve, limites, resumo)
+                elif metodo == "Duas Fases":
+                    resultado = solve_duas_fases_step_by_step(coef_c, A, b, tipos_rest, modo, base_inicial, regra, presolve, limites, resumo)
+                elif metodo == "Simplex Revisado":
+                    resultado = solve_revisado_step_by_step(coef_c, A, b, tipos_rest, modo, base_inicial, regra, presolve, limites, resumo)
+
+                if resultado.otimo and resultado.base:
+                    st.session_state["ultima_base"] = {"metodo": metodo, "base": list(resultado.base)}
+                # Guarda o resultado para reexibi-lo nas próximas execuções (ex.: troca de página)
+                st.session_state["exibicao"] = {"resultado": resultado, "aviso_rota": metodo == "Automático" and not inteiras}
                 
         except Exception as e:
+            st.session_state.pop("exibicao", None)
             st.error(f"Ocorreu um erro: {e}")
+elif "exibicao" in st.session_state:
+    st.caption("Resultado da última resolução (clique em **Resolver** após alterar os dados).")
+    exibir_resultado(**st.session_state["exibicao"])
+
+# Perfil da resolução exibida: tempo por etapa do solver e da renderização
+if "exibicao" in st.session_state:
+    show_metricas(st.session_state["exibicao"]["resultado"], st.session_state.get("tempo_renderizacao"))
+    # Z em função de um recurso ou de um custo do problema atual (relaxação contínua)
+    if not inteiras:
+        show_analise_parametrica(coef_c, A, b, tipos_rest, modo, limites)
+
+# Lote de modelos enviados pela barra lateral
+if arquivos_lote:
+    show_lote(arquivos_lote, processos_lote, regra, presolve)
+
+# Exportação do problema atual (importado ou digitado nos campos)
+with painel_io:
+    if modelo_importado is not None:
+        botao_exportar(modelo_importado)
+    else:
+        botao_exportar(ModeloPL(np.array(coef_c), np.array(A), np.array(b), tipos_rest, modo, limites,
+                                inteiras=inteiras))
+
+# Contadores do cache, preenchidos após a resolução para refletir esta execução
+with painel_cache:
+    est_cache = cache.estatisticas()
+    col_acertos, col_falhas = st.columns(2)
+    col_acertos.metric("Acertos", est_cache["acertos"])
+    col_falhas.metric("Falhas", est_cache["falhas"])
+    st.caption(
+        f"Taxa de acerto: {est_cache['taxa_acerto']:.0%} · "
+        f"Ocupação: {est_cache['tamanho']}/{est_cache['capacidade']} · "
+        f"Descartes: {est_cache['descartes']}"
+    )
 
 # Rodapé
 st.markdown("<br><hr><center>Desenvolvido por <b>Edy</b> 🧠</center>", unsafe_allow_html=True)
\ No newline at end of file
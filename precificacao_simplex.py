@@ -0,0 +1,486 @@
+"""
+Regras de precificação (escolha da coluna que entra na base) do Simplex Primal.
+
+As regras não conhecem o motor que as usa (tableau ou Simplex Revisado). A cada
+iteração o motor pede à regra quais colunas precificar (:meth:`Precificacao.varredura`),
+calcula os custos reduzidos ``d`` dessas colunas na convenção de minimização
+(colunas com ``d < -tolerancia`` melhoram a função objetivo) e chama
+:meth:`Precificacao.escolher`. Depois do pivoteamento, :meth:`Precificacao.atualizar`
+recebe a linha e a coluna pivô para manter os pesos das regras que os usam.
+
+Todas as regras passam para a regra de Bland (menor índice) após uma sequência
+de pivôs degenerados, e voltam à regra original no primeiro pivô não degenerado.
+Se o motor detectar um ciclo (base repetida), :meth:`Precificacao.fixar_bland`
+mantém a regra de Bland até o fim do laço.
+
+O Dual Simplex escolhe primeiro a linha que sai; as regras dessa escolha
+(:class:`PrecificacaoDual` e derivadas, em :data:`REGRAS_DUAL`) seguem o mesmo
+protocolo, com as violações das básicas no lugar dos custos reduzidos.
+"""
+import abc
+import time
+
+import numpy as np
+
+
+class _RegraComBland(abc.ABC):
+    """
+    Estado comum às regras primais e duais: o retorno a Bland após pivôs
+    degenerados seguidos, a Bland fixa após um ciclo e as estatísticas.
+
+    :param limite_degenerados: Pivôs degenerados seguidos que ativam a regra de Bland.
+    :type limite_degenerados: int
+    :ivar bland: Indica se a regra de Bland está ativa.
+    :ivar estatisticas: Iterações, tempo gasto na regra, pivôs degenerados e
+        ativações da regra de Bland.
+    """
+
+    nome = 'base'
+    #: O motor deve informar os pesos iniciais da regra em :meth:`iniciar`
+    usa_pesos = False
+
+    def __init__(self, limite_degenerados=20):
+        self.limite_degenerados = limite_degenerados
+        self.bland = False
+        self._bland_fixo = False
+        self._degenerados_seguidos = 0
+        self.estatisticas = {'regra': self.nome, 'iteracoes': 0, 'tempo_s': 0.0,
+                             'pivos_degenerados': 0, 'ativacoes_bland': 0}
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def iniciar(self, tamanho, pesos=None):
+        """
+        Prepara a regra para um novo laço (nova fase ou novo tableau).
+
+        :param tamanho: Número de colunas precificáveis (primal) ou de linhas do tableau (dual).
+        :type tamanho: int
+        :param pesos: Pesos iniciais da regra (apenas se ``usa_pesos``).
+        :type pesos: np.ndarray or None
+        """
+        self.bland = False
+        self._bland_fixo = False
+        self._degenerados_seguidos = 0
+
+    def fixar_bland(self):
+        """Ativa a regra de Bland até o próximo :meth:`iniciar` (o motor detectou um ciclo)."""
+        if not self.bland:
+            self.estatisticas['ativacoes_bland'] += 1
+        self.bland = self._bland_fixo = True
+
+    def _registrar_pivo(self, theta):
+        """Conta o pivô e passa para Bland (ou volta dela) conforme ele seja degenerado."""
+        self.estatisticas['iteracoes'] += 1
+        if theta <= 1e-12:
+            self.estatisticas['pivos_degenerados'] += 1
+            self._degenerados_seguidos += 1
+            if not self.bland and self._degenerados_seguidos >= self.limite_degenerados:
+                self.bland = True
+                self.estatisticas['ativacoes_bland'] += 1
+        else:
+            self._degenerados_seguidos = 0
+            self.bland = self._bland_fixo
+
+
+class Precificacao(_RegraComBland):
+    """
+    Base das regras de precificação, com o retorno a Bland em caso de degeneração.
+
+    :param limite_degenerados: Pivôs degenerados seguidos que ativam a regra de Bland.
+    :type limite_degenerados: int
+    :ivar bland: Indica se a regra de Bland está ativa (o motor também deve
+        desempatar o teste da razão pelo menor índice).
+    :ivar estatisticas: Iterações, tempo gasto na regra, pivôs degenerados e
+        ativações da regra de Bland.
+    """
+
+    #: O motor deve informar os pesos iniciais 1 + ||B⁻¹aⱼ||² em :meth:`iniciar`
+    usa_pesos = False
+    #: O motor deve informar a linha pivô (linha r de B⁻¹A) em :meth:`atualizar`
+    usa_linha_pivo = False
+    #: O motor deve informar os produtos αqᵀB⁻¹aⱼ de todas as colunas em :meth:`atualizar`
+    usa_produtos = False
+
+    def varredura(self, num_colunas):
+        """
+        Gera os conjuntos de colunas a precificar, em ordem, até que um deles tenha candidata.
+
+        :param num_colunas: Número de colunas precificáveis.
+        :type num_colunas: int
+        :return: Índices das colunas de cada conjunto (None significa todas).
+        :rtype: Iterator[np.ndarray or None]
+        """
+        if self.bland:
+            yield None
+        else:
+            yield from self._varredura(num_colunas)
+
+    def _varredura(self, num_colunas):
+        yield None
+
+    def escolher(self, d, candidatas, tolerancia):
+        """
+        Escolhe a coluna que entra na base.
+
+        :param d: Custos reduzidos (convenção de minimização) das colunas ``candidatas``;
+            colunas básicas ou bloqueadas devem vir com zero.
+        :type d: np.ndarray
+        :param candidatas: Índices globais das posições de ``d`` (None se ``d`` cobre todas).
+        :type candidatas: np.ndarray or None
+        :param tolerancia: Custo reduzido mínimo (em módulo) para uma coluna ser atrativa.
+        :type tolerancia: float
+        :return: Índice global da coluna, ou None se nenhuma for atrativa.
+        :rtype: int or None
+        """
+        inicio = time.perf_counter()
+        atrativas = d < -tolerancia
+        coluna = None
+        if atrativas.any():
+            if self.bland:
+                local = int(np.argmax(atrativas))
+            else:
+                local = self._escolher(d, candidatas, atrativas)
+            coluna = local if candidatas is None else int(candidatas[local])
+        self.estatisticas['tempo_s'] += time.perf_counter() - inicio
+        return coluna
+
+    @abc.abstractmethod
+    def _escolher(self, d, candidatas, atrativas):
+        """Posição (em ``d``) da coluna que entra, entre as ``atrativas``; só chamada fora da regra de Bland."""
+
+    def atualizar(self, linha, entra, sai, theta, alpha_r=None, alpha_q=None, produtos=None):
+        """
+        Registra o pivoteamento realizado (chamado após a troca de base).
+
+        :param linha: Posição da base (0..m-1) que mudou.
+        :type linha: int
+        :param entra: Índice da coluna que entrou na base.
+        :type entra: int
+        :param sai: Índice da coluna que saiu da base.
+        :type sai: int
+        :param theta: Passo primal do pivô (zero em pivô degenerado).
+        :type theta: float
+        :param alpha_r: Linha pivô de B⁻¹A antes do pivô (se ``usa_linha_pivo``).
+        :type alpha_r: np.ndarray or None
+        :param alpha_q: Coluna B⁻¹a_q da variável que entra (se ``usa_linha_pivo`` ou ``usa_produtos``).
+        :type alpha_q: np.ndarray or None
+        :param produtos: αqᵀB⁻¹aⱼ de todas as colunas (se ``usa_produtos``).
+        :type produtos: np.ndarray or None
+        """
+        inicio = time.perf_counter()
+        self._registrar_pivo(theta)
+        self._atualizar(linha, entra, sai, alpha_r, alpha_q, produtos)
+        self.estatisticas['tempo_s'] += time.perf_counter() - inicio
+
+    def _atualizar(self, linha, entra, sai, alpha_r, alpha_q, produtos):
+        pass
+
+
+class PrecificacaoDantzig(Precificacao):
+    """Regra de Dantzig: entra a coluna de custo reduzido mais negativo."""
+
+    nome = 'dantzig'
+
+    def _escolher(self, d, candidatas, atrativas):
+        return int(np.argmin(d))
+
+
+class PrecificacaoDevex(Precificacao):
+    """
+    Devex (Forrest e Goldfarb): aproxima o steepest edge com pesos de referência.
+
+    Entra a coluna que maximiza dⱼ²/wⱼ. Os pesos começam em 1 e são reiniciados
+    quando crescem demais (a referência ficou distante da base atual).
+
+    :param limite_peso: Maior peso antes de reiniciar a referência.
+    :type limite_peso: float
+    """
+
+    nome = 'devex'
+    usa_linha_pivo = True
+
+    def __init__(self, limite_peso=1e6, **kwargs):
+        super().__init__(**kwargs)
+        self.limite_peso = limite_peso
+        self.pesos = None
+
+    def iniciar(self, num_colunas, pesos=None):
+        super().iniciar(num_colunas, pesos)
+        self.pesos = np.ones(num_colunas)
+
+    def _escolher(self, d, candidatas, atrativas):
+        pesos = self.pesos if candidatas is None else self.pesos[candidatas]
+        return int(np.argmax(np.where(atrativas, d * d / pesos, -1.0)))
+
+    def _atualizar(self, linha, entra, sai, alpha_r, alpha_q, produtos):
+        pivo = alpha_r[entra]
+        razao = alpha_r / pivo
+        peso_q = self.pesos[entra]
+        np.maximum(self.pesos, razao * razao * peso_q, out=self.pesos)
+        self.pesos[sai] = max(peso_q / (pivo * pivo), 1.0)
+        self.pesos[entra] = 1.0
+        if self.pesos.max() > self.limite_peso:
+            self.pesos[:] = 1.0
+
+
+class PrecificacaoSteepestEdge(PrecificacaoDevex):
+    """
+    Steepest edge exato: entra a coluna que maximiza dⱼ²/γⱼ, com γⱼ = 1 + ||B⁻¹aⱼ||².
+
+    Os pesos são atualizados de forma incremental (Goldfarb e Reid) a cada pivô:
+    γⱼ ← γⱼ - 2ᾱⱼpⱼ + ᾱⱼ²γq, com ᾱⱼ = αrⱼ/αrq e pⱼ = αqᵀB⁻¹aⱼ.
+    """
+
+    nome = 'steepest_edge'
+    usa_pesos = True
+    usa_produtos = True
+
+    def iniciar(self, num_colunas, pesos=None):
+        Precificacao.iniciar(self, num_colunas, pesos)
+        self.pesos = np.ones(num_colunas) if pesos is None else np.array(pesos, dtype=float)
+
+    def _atualizar(self, linha, entra, sai, alpha_r, alpha_q, produtos):
+        pivo = alpha_r[entra]
+        razao = alpha_r / pivo
+        gamma_q = 1.0 + alpha_q @ alpha_q
+        self.pesos += razao * (razao * gamma_q - 2.0 * produtos)
+        np.maximum(self.pesos, 1.0 + razao * razao, out=self.pesos)
+        self.pesos[sai] = max(gamma_q / (pivo * pivo), 1.0 + 1.0 / (pivo * pivo))
+        self.pesos[entra] = 1.0
+
+
+class PrecificacaoParcial(Precificacao):
+    """
+    Precificação parcial: as colunas são divididas em segmentos e só os segmentos
+    necessários são precificados, a partir do último que forneceu uma coluna.
+
+    No Simplex Revisado, apenas os custos reduzidos do segmento são calculados.
+
+    :param segmentos: Número de segmentos.
+    :type segmentos: int
+    """
+
+    nome = 'parcial'
+
+    def __init__(self, segmentos=8, **kwargs):
+        super().__init__(**kwargs)
+        self.segmentos = segmentos
+        self._atual = 0
+        self._varrido = 0
+
+    def iniciar(self, num_colunas, pesos=None):
+        super().iniciar(num_colunas, pesos)
+        self._atual = 0
+
+    def _varredura(self, num_colunas):
+        tamanho = -(-num_colunas // self.segmentos)
+        total = -(-num_colunas // tamanho)
+        for passo in range(total):
+            self._varrido = (self._atual + passo) % total
+            yield np.arange(self._varrido * tamanho, min(num_colunas, (self._varrido + 1) * tamanho))
+
+    def _escolher(self, d, candidatas, atrativas):
+        self._atual = self._varrido
+        return int(np.argmin(d))
+
+
+class PrecificacaoMultipla(Precificacao):
+    """
+    Precificação múltipla: uma varredura completa guarda as ``tamanho`` melhores
+    candidatas, e as iterações seguintes precificam só essa lista até esgotá-la.
+
+    :param tamanho: Número de candidatas guardadas a cada varredura completa.
+    :type tamanho: int
+    """
+
+    nome = 'multipla'
+
+    def __init__(self, tamanho=8, **kwargs):
+        super().__init__(**kwargs)
+        self.tamanho = tamanho
+        self._lista = np.empty(0, dtype=int)
+
+    def iniciar(self, num_colunas, pesos=None):
+        super().iniciar(num_colunas, pesos)
+        self._lista = np.empty(0, dtype=int)
+
+    def _varredura(self, num_colunas):
+        if len(self._lista):
+            yield self._lista
+        yield None
+
+    def _escolher(self, d, candidatas, atrativas):
+        local = int(np.argmin(d))
+        if candidatas is None:
+            indices = np.flatnonzero(atrativas)
+            melhores = indices[np.argsort(d[indices], kind='stable')[:self.tamanho + 1]]
+            self._lista = melhores[melhores != local]
+        else:
+            restantes = atrativas.copy()
+            restantes[local] = False
+            self._lista = candidatas[restantes]
+        return local
+
+
+REGRAS = {
+    'dantzig': PrecificacaoDantzig,
+    'devex': PrecificacaoDevex,
+    'steepest_edge': PrecificacaoSteepestEdge,
+    'parcial': PrecificacaoParcial,
+    'multipla': PrecificacaoMultipla,
+}
+
+
+def criar_precificacao(regra='dantzig'):
+    """
+    Devolve uma instância nova da regra (as regras guardam estado entre iterações).
+
+    :param regra: Nome em :data:`REGRAS`, instância de :class:`Precificacao` ou None (Dantzig).
+    :type regra: str or Precificacao or None
+    :rtype: Precificacao
+    :raises ValueError: Se o nome for desconhecido.
+    """
+    if regra is None:
+        return PrecificacaoDantzig()
+    if isinstance(regra, Precificacao):
+        return regra
+    if regra not in REGRAS:
+        raise ValueError(f"Regra de precificação desconhecida: {regra!r}. Use uma de {tuple(REGRAS)}.")
+    return REGRAS[regra]()
+
+
+class PrecificacaoDual(_RegraComBland):
+    """
+    Base das regras do Dual Simplex (escolha da linha que sai da base), com o
+    retorno a Bland em caso de degeneração, como em :class:`Precificacao`.
+
+    :param limite_degenerados: Pivôs degenerados seguidos que ativam a regra de Bland.
+    :type limite_degenerados: int
+    :ivar bland: Indica se a regra de Bland dual está ativa (sai a básica violada de menor índice).
+    :ivar estatisticas: Iterações, tempo gasto na regra, pivôs degenerados, ativações
+        da regra de Bland e trocas de limite feitas pelo teste da razão.
+    """
+
+    #: O motor deve informar os pesos iniciais ||eᵢᵀB⁻¹A||² em :meth:`iniciar` e os
+    #: produtos das linhas pela linha pivô em :meth:`atualizar`
+    usa_pesos = False
+
+    def __init__(self, limite_degenerados=20):
+        super().__init__(limite_degenerados)
+        self.estatisticas['trocas_de_limite'] = 0
+
+    def escolher(self, violacao, indices_base, tolerancia):
+        """
+        Escolhe a linha que sai da base.
+
+        :param violacao: Quanto cada básica está fora dos limites (positivo se violada).
+        :type violacao: np.ndarray
+        :param indices_base: Coluna de cada básica, para a regra de Bland.
+        :type indices_base: np.ndarray
+        :param tolerancia: Violação mínima para uma linha ser candidata.
+        :type tolerancia: float
+        :return: Posição da linha (0..m-1), ou None se a base é primal-factível.
+        :rtype: int or None
+        """
+        inicio = time.perf_counter()
+        violadas = violacao > tolerancia
+        linha = None
+        if violadas.any():
+            if self.bland:
+                linha = int(np.argmin(np.where(violadas, indices_base, np.iinfo(indices_base.dtype).max)))
+            else:
+                linha = self._escolher(violacao, violadas)
+        self.estatisticas['tempo_s'] += time.perf_counter() - inicio
+        return linha
+
+    @abc.abstractmethod
+    def _escolher(self, violacao, violadas):
+        """Posição da linha que sai, entre as ``violadas``; só chamada fora da regra de Bland."""
+
+    def atualizar(self, linha, theta, alpha_q=None, produtos=None):
+        """
+        Registra o pivoteamento realizado.
+
+        :param linha: Posição da base (0..m-1) que mudou.
+        :type linha: int
+        :param theta: Passo dual do pivô (zero em pivô degenerado).
+        :type theta: float
+        :param alpha_q: Coluna B⁻¹a_q da variável que entra, antes do pivô (se ``usa_pesos``).
+        :type alpha_q: np.ndarray or None
+        :param produtos: Produtos de cada linha de B⁻¹A pela linha pivô, antes do pivô (se ``usa_pesos``).
+        :type produtos: np.ndarray or None
+        """
+        inicio = time.perf_counter()
+        self._registrar_pivo(theta)
+        self._atualizar(linha, alpha_q, produtos)
+        self.estatisticas['tempo_s'] += time.perf_counter() - inicio
+
+    def _atualizar(self, linha, alpha_q, produtos):
+        pass
+
+
+class PrecificacaoDualDantzig(PrecificacaoDual):
+    """Regra clássica: sai a básica mais violada (o RHS mais negativo)."""
+
+    nome = 'dantzig'
+
+    def _escolher(self, violacao, violadas):
+        return int(np.argmax(violacao))
+
+
+class PrecificacaoDualSteepestEdge(PrecificacaoDual):
+    """
+    Dual steepest edge: sai a linha que maximiza vᵢ²/βᵢ, com βᵢ = ||eᵢᵀB⁻¹A||².
+
+    Os pesos são as normas das linhas do tableau e seguem a própria eliminação:
+    βᵢ ← βᵢ - 2ᾱᵢρᵢ + ᾱᵢ²βr, com ᾱᵢ = αᵢq/αrq e ρᵢ o produto da linha i pela linha pivô.
+    Trocas de limite só mudam sinais de colunas e não alteram os pesos.
+    """
+
+    nome = 'steepest_edge'
+    usa_pesos = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.pesos = None
+
+    def iniciar(self, num_linhas, pesos=None):
+        super().iniciar(num_linhas, pesos)
+        self.pesos = np.ones(num_linhas) if pesos is None else np.array(pesos, dtype=float)
+
+    def _escolher(self, violacao, violadas):
+        return int(np.argmax(np.where(violadas, violacao * violacao / self.pesos, -1.0)))
+
+    def _atualizar(self, linha, alpha_q, produtos):
+        pivo = alpha_q[linha]
+        razao = alpha_q / pivo
+        beta_r = self.pesos[linha]
+        self.pesos += razao * (razao * beta_r - 2.0 * produtos)
+        # Cada linha mantém o 1 da própria básica
+        np.maximum(self.pesos, 1.0, out=self.pesos)
+        self.pesos[linha] = max(beta_r / (pivo * pivo), 1.0)
+
+
+REGRAS_DUAL = {
+    'dantzig': PrecificacaoDualDantzig,
+    'steepest_edge': PrecificacaoDualSteepestEdge,
+}
+
+
+def criar_precificacao_dual(regra='steepest_edge'):
+    """
+    Devolve uma instância nova da regra de escolha da linha do Dual Simplex.
+
+    :param regra: Nome em :data:`REGRAS_DUAL`, instância de :class:`PrecificacaoDual` ou None (steepest edge).
+    :type regra: str or PrecificacaoDual or None
+    :rtype: PrecificacaoDual
+    :raises ValueError: Se o nome for desconhecido.
+    """
+    if regra is None:
+        return PrecificacaoDualSteepestEdge()
+    if isinstance(regra, PrecificacaoDual):
+        return regra
+    if regra not in REGRAS_DUAL:
+        raise ValueError(f"Regra do Dual Simplex desconhecida: {regra!r}. Use uma de {tuple(REGRAS_DUAL)}.")
+    return REGRAS_DUAL[regra]()
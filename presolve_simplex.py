@@ -0,0 +1,536 @@
+"""
+Presolve e escala do modelo antes da montagem do tableau.
+
+O presolve trabalha sobre as triplas ``(linha, coluna, valor)`` dos elementos não
+nulos de A, de modo que matrizes densas e esparsas passam pelo mesmo código, e
+repete as reduções abaixo até que nenhuma se aplique:
+
+* linhas vazias: removidas (ou o problema é infactível);
+* linhas singleton ``a·xⱼ (≤, ≥, =) b``: a igualdade fixa xⱼ; um limite inferior
+  positivo é absorvido por translação (xⱼ = l + x'ⱼ); um limite que só repete
+  xⱼ ≥ 0 é descartado; um limite superior zero fixa xⱼ = 0 e um positivo vira
+  limite superior da variável, tratado pelo Simplex sem linha extra;
+* colunas vazias: fixadas no limite inferior, ou no superior (se finito) quando o
+  custo melhora a função objetivo;
+* linhas duplicadas (proporcionais): fundidas em uma só restrição (ou em um par
+  '≤'/'≥', quando definem um intervalo).
+
+O modelo reduzido é então escalado (médias geométricas seguidas de equilíbrio,
+com fatores potências de 2, que não introduzem erro de arredondamento). O
+:class:`RegistroPresolve` guarda o necessário para o pós-solve levar a solução
+de volta às variáveis originais.
+"""
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
+from esparso_simplex import MatrizCSC, eh_esparsa
+from nucleo_simplex import LogIteracoes, ResultadoSimplex, _limites_variaveis, solve
+from perfil_simplex import SEM_OBSERVADOR, ObservadorSimplex
+
+TOL_PRESOLVE = 1e-9
+ESCALAS = ('geometrica', 'equilibrio', None)
+
+
+@dataclass
+class RegistroPresolve:
+    """
+    Modelo reduzido e escalado, com o registro para o pós-solve.
+
+    O modelo reduzido usa as variáveis x' com ``x[colunas] = deslocamento[colunas] +
+    escala_colunas * x'``; as demais variáveis originais valem ``valor_fixo``.
+
+    :ivar c: Custos do modelo reduzido.
+    :ivar A: Matriz reduzida (densa, ou :class:`MatrizCSC` se a original era esparsa).
+    :ivar b: Termos independentes reduzidos.
+    :ivar tipos: Tipos das restrições reduzidas.
+    :ivar linhas: Índices originais das linhas mantidas.
+    :ivar colunas: Índices originais das colunas mantidas.
+    :ivar valor_fixo: Valor das variáveis originais removidas (tamanho n).
+    :ivar deslocamento: Translação aplicada a cada variável original (tamanho n).
+    :ivar escala_linhas: Fator de cada linha mantida.
+    :ivar escala_colunas: Fator de cada coluna mantida.
+    :ivar superiores: Limite superior de cada variável do modelo reduzido (``np.inf`` se não houver).
+    :ivar status: 'infactivel', 'ilimitado' ou 'otimo' se o presolve já decidiu o
+        problema; None se o modelo reduzido precisa ser resolvido.
+    :ivar contadores: Número de reduções de cada tipo.
+    :ivar log: Mensagens do presolve.
+    """
+    c: np.ndarray
+    A: object
+    b: np.ndarray
+    tipos: list
+    linhas: np.ndarray
+    colunas: np.ndarray
+    valor_fixo: np.ndarray
+    deslocamento: np.ndarray
+    escala_linhas: np.ndarray
+    escala_colunas: np.ndarray
+    superiores: np.ndarray
+    forma_original: tuple
+    nnz_original: int
+    status: str = None
+    contadores: dict = field(default_factory=dict)
+    log: list = field(default_factory=list)
+
+    @property
+    def forma(self):
+        """Dimensões (m, n) do modelo reduzido."""
+        return len(self.linhas), len(self.colunas)
+
+    def resumo(self):
+        """
+        Dimensões antes e depois, número de não nulos e contadores das reduções.
+
+        :rtype: dict
+        """
+        nnz = self.A.nnz if isinstance(self.A, MatrizCSC) else int(np.count_nonzero(self.A))
+        return {'forma_original': self.forma_original, 'forma': self.forma,
+                'nnz_original': self.nnz_original, 'nnz': nnz, **self.contadores}
+
+    def x_original(self, x_reduzido):
+        """
+        Leva uma solução do modelo reduzido (escalado) às variáveis originais.
+
+        :param x_reduzido: Valores das variáveis do modelo reduzido.
+        :type x_reduzido: np.ndarray
+        :rtype: np.ndarray
+        """
+        x = self.valor_fixo.copy()
+        x[self.colunas] = self.deslocamento[self.colunas] + self.escala_colunas * np.asarray(x_reduzido, dtype=float)
+        return x
+
+    def nome_original(self, nome):
+        """Renomeia ``xk`` do modelo reduzido para o nome da variável original."""
+        if nome.startswith('x') and nome[1:].isdigit():
+            return f'x{self.colunas[int(nome[1:]) - 1] + 1}'
+        return nome
+
+    def nome_reduzido(self, nome):
+        """Renomeia uma variável original para o modelo reduzido (None se foi removida)."""
+        if nome.startswith('x') and nome[1:].isdigit():
+            k = np.flatnonzero(self.colunas == int(nome[1:]) - 1)
+            return f'x{k[0] + 1}' if len(k) else None
+        return nome
+
+
+def _triplas(A, m, n):
+    """Triplas (linhas, colunas, valores) dos não nulos de A, densa ou esparsa."""
+    if eh_esparsa(A):
+        M = MatrizCSC.converter(A, (m, n))
+        return M.indices.copy(), np.repeat(np.arange(n), np.diff(M.indptr)), M.data.copy()
+    A = np.asarray(A, dtype=float).reshape(m, n)
+    linhas, colunas = np.nonzero(A)
+    return linhas, colunas, A[linhas, colunas]
+
+def _viola(tipo, valor, b):
+    """Indica se ``valor (tipo) b`` é falso, com tolerância."""
+    folga = TOL_PRESOLVE * max(1.0, abs(b))
+    if tipo == '≤':
+        return valor > b + folga
+    if tipo == '≥':
+        return valor < b - folga
+    return abs(valor - b) > folga
+
+def _potencia_de_2(fatores):
+    """Arredonda fatores de escala para a potência de 2 mais próxima."""
+    return np.exp2(np.round(np.log2(fatores)))
+
+def _fatores_escala(linhas, colunas, valores, m, n, escala, passes=4):
+    """
+    Fatores de escala de linhas (r) e colunas (s) para A' = R·A·S.
+
+    'geometrica' alterna médias geométricas de linhas e colunas e termina com um
+    equilíbrio; 'equilibrio' faz apenas o equilíbrio (maior |a| de cada linha e
+    coluna igual a 1).
+    """
+    r, s = np.ones(m), np.ones(n)
+    if escala is None or not len(valores):
+        return r, s
+    absolutos = np.abs(valores)
+
+    def extremos(indices, tamanho, fator):
+        maior = np.zeros(tamanho)
+        menor = np.full(tamanho, np.inf)
+        np.maximum.at(maior, indices, fator)
+        np.minimum.at(menor, indices, fator)
+        vazios = maior == 0
+        maior[vazios], menor[vazios] = 1.0, 1.0
+        return maior, menor
+
+    if escala == 'geometrica':
+        for _ in range(passes):
+            maior, menor = extremos(linhas, m, absolutos * r[linhas] * s[colunas])
+            r /= np.sqrt(maior * menor)
+            maior, menor = extremos(colunas, n, absolutos * r[linhas] * s[colunas])
+            s /= np.sqrt(maior * menor)
+    maior, _ = extremos(linhas, m, absolutos * r[linhas] * s[colunas])
+    r /= maior
+    maior, _ = extremos(colunas, n, absolutos * r[linhas] * s[colunas])
+    s /= maior
+    return _potencia_de_2(r), _potencia_de_2(s)
+
+def _faixa(valores):
+    """Razão entre o maior e o menor |a| (1 se não houver elementos)."""
+    absolutos = np.abs(valores)
+    return float(absolutos.max() / absolutos.min()) if len(absolutos) else 1.0
+
+def presolve(c, A, b, tipos=None, mode='max', escala='geometrica', limites=None):
+    """
+    Reduz e escala um PL, registrando o necessário para o pós-solve.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Coeficientes das restrições (densos ou esparsos).
+    :type A: list or np.ndarray or MatrizCSC
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '='). Se None, todas são '≤'.
+    :type tipos: list[str] or None
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param escala: 'geometrica', 'equilibrio' ou None (sem escala).
+    :type escala: str or None
+    :param limites: Par (inferior, superior) de cada variável (ver :func:`nucleo_simplex.solve`).
+        Linhas singleton do tipo xⱼ ≤ uⱼ também viram limites superiores.
+    :type limites: list[tuple] or None
+    :rtype: RegistroPresolve
+    :raises ValueError: Se a escala ou os limites forem inválidos.
+    """
+    if escala not in ESCALAS:
+        raise ValueError(f"Escala desconhecida: {escala!r}. Use uma de {ESCALAS}.")
+    c = np.array(c, dtype=float)
+    b = np.array(b, dtype=float)
+    m, n = len(b), len(c)
+    tipos = ['≤'] * m if tipos is None else list(tipos)
+    esparsa = eh_esparsa(A)
+    linhas, colunas, valores = _triplas(A, m, n)
+    nnz_original = len(valores)
+    sentido = 1.0 if mode == 'max' else -1.0
+
+    linha_ativa = np.ones(m, dtype=bool)
+    coluna_ativa = np.ones(n, dtype=bool)
+    valor_fixo = np.zeros(n)
+    # Limites das variáveis originais: o inferior entra como translação inicial
+    deslocamento, superior = _limites_variaveis(limites, n)
+    if np.any(deslocamento):
+        b -= np.bincount(linhas, weights=valores * deslocamento[colunas], minlength=m)
+    contadores = {'linhas_vazias': 0, 'linhas_singleton': 0, 'linhas_duplicadas': 0,
+                  'variaveis_fixadas': 0, 'variaveis_transladadas': 0, 'colunas_vazias': 0,
+                  'limites_superiores': 0}
+    inverso = {'≤': '≥', '≥': '≤', '=': '='}
+    status = None
+
+    mudou = True
+    while mudou and status is None:
+        mudou = False
+        vivos = linha_ativa[linhas] & coluna_ativa[colunas] & (valores != 0.0)
+        linhas, colunas, valores = linhas[vivos], colunas[vivos], valores[vivos]
+        por_linha = np.bincount(linhas, minlength=m)
+
+        # Linhas vazias: 0 (tipo) b
+        for i in np.flatnonzero(linha_ativa & (por_linha == 0)):
+            if _viola(tipos[i], 0.0, b[i]):
+                status = 'infactivel'
+                break
+            linha_ativa[i] = False
+            contadores['linhas_vazias'] += 1
+            mudou = True
+        if status:
+            break
+
+        # Linhas singleton: a·xⱼ (tipo) b vira um limite de xⱼ
+        elemento = np.full(m, -1)
+        elemento[linhas] = np.arange(len(linhas))
+        passo = np.zeros(n)      # valor subtraído de xⱼ nesta rodada (fixação ou translação)
+        tocadas = np.zeros(n, dtype=bool)
+        for i in np.flatnonzero(linha_ativa & (por_linha == 1)):
+            k = elemento[i]
+            j, a = colunas[k], valores[k]
+            if tocadas[j]:
+                continue   # b desta linha muda com a outra redução de xⱼ: fica para a próxima rodada
+            limite = b[i] / a
+            tipo = tipos[i] if a > 0 else inverso[tipos[i]]
+            folga = TOL_PRESOLVE * max(1.0, abs(limite))
+            if limite < -folga and tipo != '≥':
+                status = 'infactivel'
+                break
+            linha_ativa[i] = False
+            contadores['linhas_singleton'] += 1
+            mudou = True
+            if tipo == '≤' and limite > folga:
+                # xⱼ ≤ limite: vira limite superior, tratado no teste da razão
+                superior[j] = min(superior[j], deslocamento[j] + limite)
+                contadores['limites_superiores'] += 1
+            elif tipo == '=' or tipo == '≤':
+                # xⱼ = limite (ou xⱼ ≤ 0 com xⱼ ≥ 0): variável fixada
+                valor = max(limite, 0.0) if tipo == '=' else 0.0
+                coluna_ativa[j] = False
+                valor_fixo[j] = deslocamento[j] + valor
+                passo[j] = valor
+                tocadas[j] = True
+                contadores['variaveis_fixadas'] += 1
+            elif limite > folga:
+                # xⱼ ≥ limite > 0: translação xⱼ = limite + x'ⱼ
+                deslocamento[j] += limite
+                passo[j] = limite
+                tocadas[j] = True
+                contadores['variaveis_transladadas'] += 1
+        if status:
+            break
+        if tocadas.any():
+            b -= np.bincount(linhas, weights=valores * passo[colunas], minlength=m)
+
+        # Colunas vazias ficam no limite inferior, ou no superior se melhoram a função objetivo
+        por_coluna = np.bincount(colunas[linha_ativa[linhas]], minlength=n)
+        melhora = sentido * c > 0
+        vazias = coluna_ativa & (por_coluna == 0) & (~melhora | np.isfinite(superior))
+        if vazias.any():
+            coluna_ativa[vazias] = False
+            valor_fixo[vazias] = np.where(melhora, superior, deslocamento)[vazias]
+            contadores['colunas_vazias'] += int(vazias.sum())
+            mudou = True
+
+        if not mudou:
+            mudou = _fundir_duplicadas(linhas, colunas, valores, b, tipos, linha_ativa, coluna_ativa, contadores)
+            if mudou is None:
+                status = 'infactivel'
+
+    # Fixações e translações não podem ultrapassar os limites superiores
+    folgas = TOL_PRESOLVE * np.maximum(1.0, np.abs(superior))
+    valor_minimo = np.where(coluna_ativa, deslocamento, np.maximum(deslocamento, valor_fixo))
+    if status is None and np.any(valor_minimo > superior + folgas):
+        status = 'infactivel'
+
+    vivos = linha_ativa[linhas] & coluna_ativa[colunas] & (valores != 0.0)
+    linhas, colunas, valores = linhas[vivos], colunas[vivos], valores[vivos]
+    mantidas_l = np.flatnonzero(linha_ativa)
+    mantidas_c = np.flatnonzero(coluna_ativa)
+    if status is None and not len(mantidas_l):
+        # Sem restrições: cada variável restante só depende do próprio custo (xⱼ ≥ 0)
+        status = 'ilimitado' if np.any(sentido * c[mantidas_c] > TOL_PRESOLVE) else 'otimo'
+
+    # Renumera as triplas para o modelo reduzido e aplica a escala
+    nova_linha = np.cumsum(linha_ativa) - 1
+    nova_coluna = np.cumsum(coluna_ativa) - 1
+    linhas, colunas = nova_linha[linhas], nova_coluna[colunas]
+    mr, nr = len(mantidas_l), len(mantidas_c)
+    faixa_antes = _faixa(valores)
+    r, s = _fatores_escala(linhas, colunas, valores, mr, nr, escala)
+    valores = valores * r[linhas] * s[colunas]
+
+    if esparsa:
+        A_red = MatrizCSC.de_triplas(linhas, colunas, valores, (mr, nr))
+    else:
+        A_red = np.zeros((mr, nr))
+        A_red[linhas, colunas] = valores
+
+    registro = RegistroPresolve(
+        c=c[mantidas_c] * s,
+        A=A_red,
+        b=b[mantidas_l] * r,
+        tipos=[tipos[i] for i in mantidas_l],
+        linhas=mantidas_l,
+        colunas=mantidas_c,
+        valor_fixo=valor_fixo,
+        deslocamento=deslocamento,
+        escala_linhas=r,
+        escala_colunas=s,
+        superiores=(superior[mantidas_c] - deslocamento[mantidas_c]) / s,
+        forma_original=(m, n),
+        nnz_original=nnz_original,
+        status=status,
+        contadores=contadores,
+    )
+    resumo = registro.resumo()
+    registro.log.append(
+        f"Modelo {m}×{n} → {mr}×{nr} ({m - mr} linha(s) e {n - nr} coluna(s) removidas; "
+        f"não nulos {nnz_original} → {resumo['nnz']})."
+    )
+    reducoes = ', '.join(f"{nome.replace('_', ' ')}: {qtd}" for nome, qtd in contadores.items() if qtd)
+    if reducoes:
+        registro.log.append(f"Reduções: {reducoes}.")
+    if escala:
+        registro.log.append(f"Escala {escala}: faixa dos coeficientes {faixa_antes:.1e} → {_faixa(valores):.1e}.")
+    if status:
+        registro.log.append(f"O presolve decidiu o problema: {status}.")
+    return registro
+
+def _fundir_duplicadas(linhas, colunas, valores, b, tipos, linha_ativa, coluna_ativa, contadores):
+    """
+    Funde linhas proporcionais (aᵢ = λ·aₖ) em uma só restrição (ou um par '≤'/'≥').
+
+    Altera ``valores``, ``b``, ``tipos``, ``linha_ativa`` e ``contadores`` in-place.
+
+    :return: True se alguma linha foi removida, False se não, None se os limites
+        das linhas fundidas forem incompatíveis (problema infactível).
+    :rtype: bool or None
+    """
+    if not len(linhas):
+        return False
+    ordem = np.lexsort((colunas, linhas))
+    inicio = np.flatnonzero(np.r_[True, linhas[ordem][1:] != linhas[ordem][:-1]])
+    fim = np.r_[inicio[1:], len(ordem)]
+    grupos = {}
+    for ini, fi in zip(inicio, fim):
+        posicoes = ordem[ini:fi]
+        i = linhas[posicoes[0]]
+        if len(posicoes) < 2 or not linha_ativa[i]:
+            continue
+        pivo = valores[posicoes[0]]
+        chave = (colunas[posicoes].tobytes(), np.round(valores[posicoes] / pivo, 12).tobytes())
+        grupos.setdefault(chave, []).append((i, pivo, posicoes))
+
+    removeu = False
+    for membros in grupos.values():
+        if len(membros) < 2:
+            continue
+        # Intervalo [inferior, superior] de aₖ·x (aₖ = linha do primeiro membro)
+        k, pivo_k, posicoes_k = membros[0]
+        inferior, superior = -np.inf, np.inf
+        for i, pivo, _ in membros:
+            lam = pivo / pivo_k
+            limite = b[i] / lam
+            tipo = tipos[i] if lam > 0 else {'≤': '≥', '≥': '≤', '=': '='}[tipos[i]]
+            if tipo in ('≤', '='):
+                superior = min(superior, limite)
+            if tipo in ('≥', '='):
+                inferior = max(inferior, limite)
+        folga = TOL_PRESOLVE * max(1.0, abs(inferior) if np.isfinite(inferior) else 1.0)
+        if inferior > superior + folga:
+            return None
+
+        # Reescreve os membros como múltiplos exatos de aₖ; um par '≤'/'≥' só vira '='
+        # se já havia uma igualdade (o Primal e o Dual não aceitam '=')
+        intervalo = superior - inferior > folga or all(tipos[i] != '=' for i, _, _ in membros)
+        if np.isfinite(inferior) and np.isfinite(superior) and intervalo:
+            # Intervalo: aₖ·x ≤ superior na linha k e aₖ·x ≥ inferior na segunda linha
+            i2, pivo2, posicoes2 = membros[1]
+            valores[posicoes2] /= pivo2 / pivo_k
+            tipos[k], b[k] = '≤', superior
+            tipos[i2], b[i2] = '≥', inferior
+            descartadas = membros[2:]
+        else:
+            if np.isfinite(inferior) and np.isfinite(superior):
+                tipos[k], b[k] = '=', superior
+            elif np.isfinite(superior):
+                tipos[k], b[k] = '≤', superior
+            else:
+                tipos[k], b[k] = '≥', inferior
+            descartadas = membros[1:]
+        for i, _, _ in descartadas:
+            linha_ativa[i] = False
+            contadores['linhas_duplicadas'] += 1
+            removeu = True
+    return removeu
+
+def pos_solve(resultado, registro):
+    """
+    Leva o resultado do modelo reduzido às variáveis originais.
+
+    Recalcula ``x`` e ``z`` no modelo original e renomeia as variáveis de decisão
+    da base, das colunas e do ``trace`` (folgas e artificiais continuam numeradas
+    pelas linhas do modelo reduzido).
+
+    :param resultado: Resultado da resolução do modelo reduzido.
+    :type resultado: ResultadoSimplex
+    :param registro: Registro devolvido por :func:`presolve`.
+    :type registro: RegistroPresolve
+    :rtype: ResultadoSimplex
+    """
+    nome = registro.nome_original
+    x = registro.x_original(resultado.x)
+    trace = resultado.trace
+    if trace is not None:
+        # Mantém o LogIteracoes (e o modo completo/resumido) que o renderizador pagina
+        renomeado = LogIteracoes(completo=getattr(trace, 'completo', True))
+        renomeado.extend(replace(passo, base=[nome(v) for v in passo.base], entra=nome(passo.entra),
+                                 sai=nome(passo.sai),
+                                 colunas=[nome(v) for v in passo.colunas] if passo.colunas else None)
+                         for passo in trace)
+        trace = renomeado
+    return replace(
+        resultado,
+        x=x,
+        base=[nome(v) for v in resultado.base],
+        colunas=[nome(v) for v in resultado.colunas] if resultado.colunas else None,
+        trace=trace,
+        estatisticas={**resultado.estatisticas, 'presolve': registro.resumo(), 'presolve_log': list(registro.log)},
+    )
+
+
+class _SemTermino(ObservadorSimplex):
+    """
+    Repassa os ganchos ao observador do usuário, exceto :meth:`ao_terminar`: o
+    resultado do problema reduzido ainda não é o final (falta o pós-solve).
+    """
+
+    def __init__(self, observador):
+        self.observador = observador
+
+    def fase(self, nome):
+        return self.observador.fase(nome)
+
+    def ao_pivotar(self, tipo, linha, coluna, linhas_tocadas, degenerado):
+        self.observador.ao_pivotar(tipo, linha, coluna, linhas_tocadas, degenerado)
+
+    def ao_trocar_limite(self, coluna):
+        self.observador.ao_trocar_limite(coluna)
+
+    def ao_refatorar(self):
+        self.observador.ao_refatorar()
+
+
+def resolver_com_presolve(c, A, b, tipos=None, mode='max', method='automatico', escala='geometrica', limites=None,
+                          **opcoes):
+    """
+    Aplica :func:`presolve`, resolve o modelo reduzido com :func:`solve` e faz o pós-solve.
+
+    Os limites superiores do modelo reduzido (os informados e os vindos de linhas
+    singleton) seguem para :func:`solve` como limites das variáveis.
+
+    :param opcoes: Demais argumentos de :func:`nucleo_simplex.solve` (``trace``,
+        ``base_inicial``, ``precificacao``, ``observador``, ``dtype``). A base inicial usa os nomes originais.
+    :rtype: ResultadoSimplex
+    """
+    c = np.asarray(c, dtype=float)
+    observador = opcoes.get('observador') or SEM_OBSERVADOR
+    with observador.fase('presolve'):
+        registro = presolve(c, A, b, tipos, mode, escala, limites)
+    if registro.status is not None:
+        # Decidido no presolve: as variáveis restantes ficam em zero
+        x = registro.x_original(np.zeros(len(registro.colunas)))
+        otimo = registro.status == 'otimo'
+        resultado = ResultadoSimplex(
+            status=registro.status,
+            z=float(c @ x) if otimo else None,
+            x=x,
+            base=[],
+            iteracoes=0,
+            metodo='presolve',
+            modo=mode,
+            motivo="Resolvido no presolve",
+            trace=LogIteracoes(completo=opcoes['trace'] != 'resumo') if opcoes.get('trace') else None,
+            estatisticas={'presolve': registro.resumo(), 'presolve_log': list(registro.log)},
+        )
+        observador.ao_terminar(resultado)
+        return resultado
+
+    base_inicial = opcoes.pop('base_inicial', None)
+    if base_inicial is not None:
+        base_inicial = [registro.nome_reduzido(v) for v in base_inicial]
+        if None in base_inicial:
+            base_inicial = []   # variável básica removida: a base não serve (partida a frio)
+    limites_red = None
+    if np.any(np.isfinite(registro.superiores)):
+        limites_red = [(0.0, u) for u in registro.superiores]
+    if opcoes.get('observador') is not None:
+        opcoes['observador'] = _SemTermino(observador)
+    resultado = solve(registro.c, registro.A, registro.b, registro.tipos, mode, method,
+                      base_inicial=base_inicial, limites=limites_red, **opcoes)
+    with observador.fase('pos_solve'):
+        resultado = pos_solve(resultado, registro)
+        if resultado.z is not None:
+            resultado.z = float(c @ resultado.x)
+    observador.ao_terminar(resultado)
+    return resultado
@@ -0,0 +1,667 @@
+"""
+Simplex Revisado com base fatorada (LU + arquivo eta).
+
+Em vez de manter o tableau completo, o método guarda apenas a fatoração LU da
+matriz básica B e uma sequência de matrizes eta (forma produto da inversa) com
+as trocas de base desde a última refatoração. Os custos reduzidos e a coluna
+que entra são calculados sob demanda (BTRAN/FTRAN), de modo que o custo por
+iteração e a memória crescem com o tamanho da base, e não com o do tableau.
+Com ``A`` esparsa (:class:`esparso_simplex.MatrizCSC`), a matriz de restrições
+ocupa memória proporcional aos não nulos; apenas a base é densa.
+
+O problema é levado à forma padrão com RHS não negativo; linhas '≤' recebem
+folga (base inicial), linhas '≥' recebem excesso e artificial e linhas '='
+recebem artificial. A Fase I minimiza a soma das artificiais e a Fase II
+otimiza a função objetivo original a partir da base obtida.
+"""
+import time
+
+import numpy as np
+
+from esparso_simplex import MatrizCSC
+from nucleo_simplex import LogIteracoes, PassoSimplex, ResultadoSimplex
+from orcamento_simplex import STATUS_INTERROMPIDO, DetectorCiclos
+from perfil_simplex import SEM_OBSERVADOR
+from precificacao_simplex import criar_precificacao
+
+try:
+    from scipy.linalg.lapack import dtrtrs
+except ImportError:  # o SciPy é opcional: as substituições triangulares caem para o NumPy
+    dtrtrs = None
+
+TOL_PIVO = 1e-9
+TOL_CUSTO = 1e-9
+TOL_FACTIBILIDADE = 1e-7
+
+
+def _lu_parcial(matriz, limiar=0.1):
+    """
+    Fatoração LU com pivoteamento parcial por limiar (P·B = L·U), em uma única matriz.
+
+    O pivô da diagonal é mantido sempre que ``|b_kk| >= limiar * max|b_ik|``, o que
+    preserva a estrutura das bases quase triangulares, e a atualização de posto 1
+    de cada passo só toca as linhas e colunas com elementos não nulos.
+
+    :param matriz: Matriz quadrada a fatorar.
+    :type matriz: np.ndarray
+    :param limiar: Fração do maior elemento da coluna aceita como pivô na diagonal.
+    :type limiar: float
+    :return: Matriz com L (abaixo da diagonal, diagonal unitária implícita) e U, e a permutação das linhas.
+    :rtype: tuple(np.ndarray, np.ndarray)
+    :raises np.linalg.LinAlgError: Se a matriz for singular.
+    """
+    lu = np.array(matriz, dtype=float)
+    m = lu.shape[0]
+    perm = np.arange(m)
+    for k in range(m):
+        coluna = np.abs(lu[k:, k])
+        p = k + int(np.argmax(coluna))
+        if coluna[p - k] < TOL_PIVO:
+            raise np.linalg.LinAlgError("Matriz básica singular.")
+        if coluna[0] < limiar * coluna[p - k]:
+            lu[[k, p]] = lu[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        linhas = k + 1 + np.flatnonzero(lu[k + 1:, k])
+        if len(linhas) == 0:
+            continue
+        lu[linhas, k] /= lu[k, k]
+        colunas = k + 1 + np.flatnonzero(lu[k, k + 1:])
+        if len(colunas):
+            lu[np.ix_(linhas, colunas)] -= np.outer(lu[linhas, k], lu[k, colunas])
+    return lu, perm
+
+
+def _resolver_triangular(lu, v, inferior, transposta=False):
+    """
+    Resolve T·x = v (ou Tᵀ·x = v) com um dos fatores guardados por :func:`_lu_parcial`.
+
+    Usa a rotina ``trtrs`` do LAPACK quando o SciPy está instalado e, sem ele,
+    substituição progressiva/regressiva.
+
+    :param lu: Matriz com L (abaixo da diagonal, diagonal unitária implícita) e U.
+    :type lu: np.ndarray
+    :param v: Lado direito.
+    :type v: np.ndarray
+    :param inferior: True para L, False para U.
+    :type inferior: bool
+    :param transposta: Resolve com o fator transposto.
+    :type transposta: bool
+    :rtype: np.ndarray
+    """
+    if dtrtrs is not None:
+        return dtrtrs(lu, v, lower=int(inferior), trans=int(transposta), unitdiag=int(inferior))[0]
+    fator = lu.T if transposta else lu
+    x = np.array(v, dtype=float)
+    k = len(x)
+    # Tᵀ de um fator inferior é superior, e vice-versa
+    if inferior != transposta:
+        for i in range(k):
+            x[i] -= fator[i, :i] @ x[:i]
+            if not inferior:
+                x[i] /= fator[i, i]
+    else:
+        for i in range(k - 1, -1, -1):
+            x[i] -= fator[i, i + 1:] @ x[i + 1:]
+            if not inferior:
+                x[i] /= fator[i, i]
+    return x
+
+
+class FatoracaoBase:
+    """
+    Fatoração da matriz básica com atualizações em forma produto (arquivo eta).
+
+    As colunas lógicas (folgas e artificiais) da base são vetores ±e_i e cobrem
+    suas linhas diretamente; apenas o núcleo formado pelas colunas estruturais
+    básicas nas linhas restantes é fatorado em LU. Com a base inicial de folgas
+    o núcleo é vazio, e seu tamanho cresce com o número de colunas estruturais
+    que entram na base.
+
+    :param problema: Problema na forma padrão que fornece as colunas.
+    :type problema: ProblemaPadrao
+    :param base: Índices das colunas básicas, por posição.
+    :type base: np.ndarray
+    :param refatorar_a_cada: Número máximo de etas antes de uma refatoração.
+    :type refatorar_a_cada: int
+    """
+
+    def __init__(self, problema, base, refatorar_a_cada=50):
+        self.problema = problema
+        self.refatorar_a_cada = refatorar_a_cada
+        self.refatoracoes = 0
+        self.fatorar(base)
+
+    def fatorar(self, base):
+        """
+        Refatora B do zero e descarta o arquivo eta.
+
+        Os fatores L e U do núcleo ficam em uma única matriz; FTRAN e BTRAN os
+        aplicam por substituição triangular, sem formar inversas.
+
+        :param base: Índices das colunas básicas, por posição.
+        :type base: np.ndarray
+        :raises np.linalg.LinAlgError: Se a base for singular.
+        """
+        problema = self.problema
+        m = problema.num_rest
+        logicas = base >= problema.inicio_folga
+        self._pos_logicas = np.flatnonzero(logicas)
+        self._pos_estruturais = np.flatnonzero(~logicas)
+        self._linhas_logicas, self._sinais_logicos = problema.linhas_logicas(base[self._pos_logicas])
+
+        cobertas = np.zeros(m, dtype=bool)
+        cobertas[self._linhas_logicas] = True
+        self._linhas_nucleo = np.flatnonzero(~cobertas)
+        if len(self._linhas_nucleo) != len(self._pos_estruturais):
+            raise np.linalg.LinAlgError("Matriz básica singular.")
+
+        k = len(self._pos_estruturais)
+        colunas = problema.colunas_densas(base[self._pos_estruturais]) if k else np.zeros((m, 0))
+        self._acoplamento = colunas[self._linhas_logicas]
+        self._lu, self._perm = _lu_parcial(colunas[self._linhas_nucleo])
+        self._etas = []
+        self.refatoracoes += 1
+
+    def _resolver_nucleo(self, v, transposta=False):
+        """Resolve L·U·x = v (ou Uᵀ·Lᵀ·x = v) no núcleo fatorado."""
+        if not len(v):
+            return np.zeros(0)
+        if transposta:
+            return _resolver_triangular(self._lu, _resolver_triangular(self._lu, v, False, True), True, True)
+        return _resolver_triangular(self._lu, _resolver_triangular(self._lu, v, True), False)
+
+    @property
+    def precisa_refatorar(self):
+        """Indica se o arquivo eta atingiu o limite de atualizações."""
+        return len(self._etas) >= self.refatorar_a_cada
+
+    def atualizar(self, linha, alpha):
+        """
+        Registra a troca de base na linha ``linha`` com a coluna FTRAN ``alpha``.
+
+        :param linha: Posição da base que mudou.
+        :type linha: int
+        :param alpha: Coluna que entrou, já transformada (B^-1 a_q).
+        :type alpha: np.ndarray
+        """
+        indices = np.flatnonzero(alpha)
+        indices = indices[indices != linha]
+        self._etas.append((linha, alpha[linha], indices, alpha[indices].copy()))
+
+    def ftran(self, a):
+        """
+        Resolve B·x = a.
+
+        :param a: Vetor do lado direito.
+        :type a: np.ndarray
+        :rtype: np.ndarray
+        """
+        a = np.asarray(a, dtype=float)
+        x = np.empty(len(a))
+        x_nucleo = self._resolver_nucleo(a[self._linhas_nucleo][self._perm])
+        x[self._pos_estruturais] = x_nucleo
+        x[self._pos_logicas] = (a[self._linhas_logicas] - self._acoplamento @ x_nucleo) * self._sinais_logicos
+        for linha, pivo, indices, valores in self._etas:
+            if x[linha] != 0.0:
+                x[linha] /= pivo
+                x[indices] -= valores * x[linha]
+        return x
+
+    def btran(self, c):
+        """
+        Resolve Bᵀ·y = c.
+
+        :param c: Vetor do lado direito.
+        :type c: np.ndarray
+        :rtype: np.ndarray
+        """
+        c = np.array(c, dtype=float)
+        for linha, pivo, indices, valores in reversed(self._etas):
+            c[linha] = (c[linha] - valores @ c[indices]) / pivo
+        y = np.empty(len(c))
+        y_logicas = c[self._pos_logicas] * self._sinais_logicos
+        y[self._linhas_logicas] = y_logicas
+        resto = c[self._pos_estruturais] - self._acoplamento.T @ y_logicas
+        y_nucleo = np.empty(len(resto))
+        y_nucleo[self._perm] = self._resolver_nucleo(resto, transposta=True)
+        y[self._linhas_nucleo] = y_nucleo
+        return y
+
+
+class ProblemaPadrao:
+    """
+    Forma padrão implícita: colunas estruturais de A seguidas de folgas e artificiais.
+
+    As colunas de folga/excesso e artificiais são vetores unitários (±e_i) e não
+    são armazenadas; apenas a linha e o sinal de cada uma são guardados. Se ``A``
+    for uma :class:`MatrizCSC`, a precificação e o acesso às colunas trabalham
+    apenas sobre os elementos não nulos.
+
+    :param A: Coeficientes das restrições (densos ou :class:`MatrizCSC`).
+    :type A: list or np.ndarray or MatrizCSC
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '=').
+    :type tipos: list[str]
+    """
+
+    def __init__(self, A, b, tipos):
+        self.esparsa = isinstance(A, MatrizCSC)
+        self.A = A.copy() if self.esparsa else np.array(A, dtype=float).reshape(len(b), -1)
+        self.b = np.array(b, dtype=float)
+        tipos = list(tipos)
+        inverso = {'≤': '≥', '≥': '≤', '=': '='}
+        # RHS não negativo: linhas com b < 0 são multiplicadas por -1
+        negativas = np.flatnonzero(self.b < 0)
+        sinais = np.ones(len(self.b))
+        sinais[negativas] = -1.0
+        if self.esparsa:
+            self.A.escalar_linhas(sinais)
+        else:
+            self.A *= sinais[:, None]
+        self.b *= sinais
+        for i in negativas:
+            tipos[i] = inverso[tipos[i]]
+
+        self.num_rest, self.num_vars = self.A.shape
+        self.linha_folga = np.array([i for i, t in enumerate(tipos) if t != '='], dtype=int)
+        self.sinal_folga = np.array([1.0 if tipos[i] == '≤' else -1.0 for i in self.linha_folga])
+        self.linha_artificial = np.array([i for i, t in enumerate(tipos) if t != '≤'], dtype=int)
+        self.inicio_folga = self.num_vars
+        self.inicio_artificial = self.num_vars + len(self.linha_folga)
+        self.num_colunas = self.inicio_artificial + len(self.linha_artificial)
+
+        self.nomes = ([f'x{j+1}' for j in range(self.num_vars)]
+                      + [f's{k+1}' for k in range(len(self.linha_folga))]
+                      + [f'a{k+1}' for k in range(len(self.linha_artificial))])
+
+    def base_inicial(self):
+        """
+        Base formada pelas folgas das linhas '≤' e pelas artificiais das demais.
+
+        :rtype: np.ndarray
+        """
+        base = np.empty(self.num_rest, dtype=int)
+        folgas = self.sinal_folga > 0
+        base[self.linha_folga[folgas]] = self.inicio_folga + np.flatnonzero(folgas)
+        base[self.linha_artificial] = self.inicio_artificial + np.arange(len(self.linha_artificial))
+        return base
+
+    def eh_artificial(self, j):
+        """Indica se a coluna ``j`` é artificial."""
+        return j >= self.inicio_artificial
+
+    def coluna(self, j):
+        """
+        Coluna ``j`` da forma padrão como vetor denso.
+
+        :rtype: np.ndarray
+        """
+        if j < self.inicio_folga:
+            return self.A.coluna_densa(j) if self.esparsa else self.A[:, j].copy()
+        col = np.zeros(self.num_rest)
+        if j < self.inicio_artificial:
+            k = j - self.inicio_folga
+            col[self.linha_folga[k]] = self.sinal_folga[k]
+        else:
+            col[self.linha_artificial[j - self.inicio_artificial]] = 1.0
+        return col
+
+    def linhas_logicas(self, colunas):
+        """
+        Linha e sinal (±1) das colunas lógicas (folgas e artificiais) informadas.
+
+        :param colunas: Índices de colunas lógicas.
+        :type colunas: np.ndarray
+        :rtype: tuple(np.ndarray, np.ndarray)
+        """
+        colunas = np.asarray(colunas, dtype=int)
+        linhas = np.empty(len(colunas), dtype=int)
+        sinais = np.ones(len(colunas))
+        folgas = colunas < self.inicio_artificial
+        k = colunas[folgas] - self.inicio_folga
+        linhas[folgas] = self.linha_folga[k]
+        sinais[folgas] = self.sinal_folga[k]
+        linhas[~folgas] = self.linha_artificial[colunas[~folgas] - self.inicio_artificial]
+        return linhas, sinais
+
+    def colunas_densas(self, colunas):
+        """
+        Matriz densa (m x k) com as colunas informadas da forma padrão.
+
+        :rtype: np.ndarray
+        """
+        return np.column_stack([self.coluna(j) for j in colunas])
+
+    def custos_reduzidos(self, custo, y, colunas=None):
+        """
+        Calcula d = c - Aᵀy para as colunas da forma padrão.
+
+        :param custo: Custos de todas as colunas.
+        :type custo: np.ndarray
+        :param y: Multiplicadores simplex (solução de Bᵀy = c_B).
+        :type y: np.ndarray
+        :param colunas: Índices das colunas a precificar (None precifica todas).
+        :type colunas: np.ndarray or None
+        :rtype: np.ndarray
+        """
+        if colunas is None:
+            d = custo.copy()
+            d[:self.inicio_folga] -= self.A.rmatvec(y) if self.esparsa else self.A.T @ y
+            d[self.inicio_folga:self.inicio_artificial] -= self.sinal_folga * y[self.linha_folga]
+            d[self.inicio_artificial:] -= y[self.linha_artificial]
+            return d
+
+        d = custo[colunas]
+        estruturais = colunas < self.inicio_folga
+        if estruturais.any():
+            cols = colunas[estruturais]
+            d[estruturais] -= self.A.rmatvec(y, cols) if self.esparsa else y @ self.A[:, cols]
+        logicas = ~estruturais
+        if logicas.any():
+            linhas, sinais = self.linhas_logicas(colunas[logicas])
+            d[logicas] -= sinais * y[linhas]
+        return d
+
+    def pesos_iniciais(self):
+        """
+        Pesos 1 + ||aⱼ||² de todas as colunas, exatos para o steepest edge na base lógica.
+
+        :rtype: np.ndarray
+        """
+        pesos = np.full(self.num_colunas, 2.0)
+        normas = self.A.normas_colunas() if self.esparsa else np.einsum('ij,ij->j', self.A, self.A)
+        pesos[:self.inicio_folga] = 1.0 + normas
+        return pesos
+
+    def linha_transformada(self, rho):
+        """
+        Linha ``ρᵀA`` da forma padrão, usada para retirar artificiais da base.
+
+        :param rho: Linha de B⁻¹ (solução de Bᵀρ = e_r).
+        :type rho: np.ndarray
+        :rtype: np.ndarray
+        """
+        return self.custos_reduzidos(np.zeros(self.num_colunas), -rho)
+
+
+class SimplexRevisado:
+    """
+    Executa as fases do Simplex Revisado sobre um :class:`ProblemaPadrao`.
+
+    :param problema: Problema na forma padrão.
+    :type problema: ProblemaPadrao
+    :param refatorar_a_cada: Número de atualizações eta entre refatorações.
+    :type refatorar_a_cada: int
+    :param trace: Lista onde cada :class:`PassoSimplex` é anexado (opcional).
+    :type trace: list or None
+    :param base: Índices das colunas da base inicial (padrão: folgas e artificiais).
+    :type base: np.ndarray or None
+    :param precificacao: Regra de escolha da coluna que entra (padrão: Dantzig). Os
+        pesos do steepest edge partem de 1 + ||aⱼ||², exatos na base lógica inicial e
+        apenas uma referência em partidas quentes.
+    :type precificacao: Precificacao or None
+    :param observador: Recebe o tempo de cada etapa e os eventos de pivô e de refatoração.
+    :type observador: ObservadorSimplex or None
+    :param orcamento: Iterações, tempo e cancelamento, consultados antes de cada troca de base.
+    :type orcamento: OrcamentoSimplex or None
+    :raises np.linalg.LinAlgError: Se a base informada for singular.
+    """
+
+    def __init__(self, problema, refatorar_a_cada=50, trace=None, base=None, precificacao=None, observador=None,
+                 orcamento=None):
+        self.problema = problema
+        self.trace = trace
+        self.observador = observador or SEM_OBSERVADOR
+        self.orcamento = orcamento
+        self.base = problema.base_inicial() if base is None else np.array(base, dtype=int)
+        with self.observador.fase('fatoracao'):
+            self.fatoracao = FatoracaoBase(problema, self.base, refatorar_a_cada)
+            self.x_base = self.fatoracao.ftran(problema.b)
+        self.observador.ao_refatorar()
+        self.iteracoes = 0
+        self.precificacao = criar_precificacao(precificacao)
+        self.precificacao.iniciar(problema.num_colunas,
+                                  problema.pesos_iniciais() if self.precificacao.usa_pesos else None)
+
+    def _refatorar(self):
+        """Refatora B e recalcula os valores básicos, descartando o erro acumulado."""
+        with self.observador.fase('fatoracao'):
+            self.fatoracao.fatorar(self.base)
+            self.x_base = self.fatoracao.ftran(self.problema.b)
+        self.observador.ao_refatorar()
+
+    def _trocar_base(self, linha, coluna, alpha):
+        """Substitui a variável básica da posição ``linha`` pela ``coluna`` e devolve o passo primal."""
+        regra = self.precificacao
+        alpha_r = produtos = None
+        if regra.usa_linha_pivo:
+            e_r = np.zeros(self.problema.num_rest)
+            e_r[linha] = 1.0
+            alpha_r = self.problema.linha_transformada(self.fatoracao.btran(e_r))
+        if regra.usa_produtos:
+            produtos = self.problema.linha_transformada(self.fatoracao.btran(alpha))
+        sai = self.base[linha]
+
+        theta = self.x_base[linha] / alpha[linha]
+        self.x_base -= theta * alpha
+        self.x_base[linha] = theta
+        self.base[linha] = coluna
+        self.fatoracao.atualizar(linha, alpha)
+        self.iteracoes += 1
+        self.observador.ao_pivotar('revisado', linha + 1, coluna, int(np.count_nonzero(alpha)),
+                                   abs(theta) <= TOL_PIVO)
+        regra.atualizar(linha, coluna, sai, theta, alpha_r, alpha, produtos)
+        if self.orcamento is not None:
+            self.orcamento.contar()
+        if self.fatoracao.precisa_refatorar:
+            self._refatorar()
+        return theta
+
+    def otimizar(self, custo, permitidas, sinal_z=1.0):
+        """
+        Laço do Simplex Primal revisado, com a regra de precificação do objeto.
+
+        Se uma base se repetir em uma sequência de trocas degeneradas (ciclo), a
+        regra de Bland é fixada até o fim do laço.
+
+        :param custo: Custos (minimização) de todas as colunas.
+        :type custo: np.ndarray
+        :param permitidas: Máscara das colunas que podem entrar na base.
+        :type permitidas: np.ndarray
+        :param sinal_z: Converte o custo da base no Z registrado no ``trace`` (-1 na maximização).
+        :type sinal_z: float
+        :return: 'otimo', 'ilimitado' ou um de :data:`orcamento_simplex.STATUS_INTERROMPIDO`.
+        :rtype: str
+        """
+        nomes = self.problema.nomes
+        regra = self.precificacao
+        observador = self.observador
+        orcamento = self.orcamento
+        detector = DetectorCiclos()
+        while True:
+            if orcamento is not None and orcamento.verificar():
+                return orcamento.interrupcao
+            with observador.fase('precificacao'):
+                y = self.fatoracao.btran(custo[self.base])
+                bloqueadas = ~permitidas
+                bloqueadas[self.base] = True
+                coluna = None
+                for candidatas in regra.varredura(self.problema.num_colunas):
+                    d = self.problema.custos_reduzidos(custo, y, candidatas)
+                    d[bloqueadas if candidatas is None else bloqueadas[candidatas]] = 0.0
+                    coluna = regra.escolher(d, candidatas, TOL_CUSTO)
+                    if coluna is not None:
+                        break
+            if coluna is None:
+                return 'otimo'
+
+            with observador.fase('teste_razao'), np.errstate(divide='ignore', invalid='ignore'):
+                alpha = self.fatoracao.ftran(self.problema.coluna(coluna))
+                razoes = np.where(alpha > TOL_PIVO, np.maximum(self.x_base, 0.0) / alpha, np.inf)
+            if np.all(razoes == np.inf):
+                return 'ilimitado'
+            theta = razoes.min()
+            empates = np.flatnonzero(razoes <= theta + TOL_PIVO)
+            if regra.bland:
+                # Bland: entre os empates, sai a variável de menor índice
+                linha = int(empates[np.argmin(self.base[empates])])
+            else:
+                # Entre empates, o maior |alpha| dá o pivô mais estável
+                linha = int(empates[np.argmax(alpha[empates])])
+
+            if self.trace is not None:
+                self.trace.append(PassoSimplex(self.iteracoes + 1, 'revisado', None,
+                                               [nomes[j] for j in self.base], linha + 1, coluna,
+                                               nomes[coluna], nomes[self.base[linha]],
+                                               razoes if getattr(self.trace, 'completo', True) else None,
+                                               z=sinal_z * float(custo[self.base] @ self.x_base)))
+            with observador.fase('pivoteamento'):
+                theta = self._trocar_base(linha, coluna, alpha)
+            if detector.repetiu(self.base.tolist(), abs(theta) <= TOL_PIVO):
+                regra.fixar_bland()
+                if orcamento is not None:
+                    orcamento.ciclos += 1
+
+    def retirar_artificiais(self):
+        """
+        Após a Fase I, troca artificiais básicas (de valor zero) por colunas não artificiais.
+
+        Linhas em que isso é impossível são redundantes; a artificial permanece
+        na base com valor zero e sua linha transformada é nula fora das artificiais.
+        """
+        problema = self.problema
+        for linha in range(problema.num_rest):
+            if not problema.eh_artificial(self.base[linha]):
+                continue
+            e_r = np.zeros(problema.num_rest)
+            e_r[linha] = 1.0
+            valores = problema.linha_transformada(self.fatoracao.btran(e_r))
+            valores[problema.inicio_artificial:] = 0.0
+            valores[self.base] = 0.0
+            coluna = int(np.argmax(np.abs(valores)))
+            if abs(valores[coluna]) > TOL_PIVO:
+                with self.observador.fase('pivoteamento'):
+                    self._trocar_base(linha, coluna, self.fatoracao.ftran(problema.coluna(coluna)))
+
+
+def _simplex_partida_quente(problema, base_inicial, refatorar_a_cada, passos, precificacao=None, observador=None,
+                            orcamento=None):
+    """
+    Tenta iniciar o Simplex Revisado a partir de uma base salva (nomes das colunas).
+
+    A base só é aceita se for não singular e primal-factível, caso em que a Fase I
+    é dispensada; o Simplex Revisado não tem laço dual para bases infactíveis.
+
+    :return: O :class:`SimplexRevisado` pronto para a Fase II, ou None.
+    :rtype: SimplexRevisado or None
+    """
+    if len(base_inicial) != problema.num_rest or not set(base_inicial) <= set(problema.nomes):
+        return None
+    indices = [problema.nomes.index(nome) for nome in base_inicial]
+    try:
+        simplex = SimplexRevisado(problema, refatorar_a_cada, passos, base=indices, precificacao=precificacao,
+                                  observador=observador, orcamento=orcamento)
+    except np.linalg.LinAlgError:
+        return None
+    artificiais = np.array([problema.eh_artificial(j) for j in simplex.base])
+    if np.any(simplex.x_base < -TOL_FACTIBILIDADE) or np.any(simplex.x_base[artificiais] > TOL_FACTIBILIDADE):
+        return None
+    simplex.retirar_artificiais()
+    return simplex
+
+def resolver_revisado(c, A, b, tipos, mode='max', trace=False, refatorar_a_cada=50, base_inicial=None,
+                      precificacao=None, observador=None, orcamento=None):
+    """
+    Resolve um PL pelo Simplex Revisado em duas fases.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Coeficientes das restrições (densos ou :class:`MatrizCSC`).
+    :type A: list or np.ndarray or MatrizCSC
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '=').
+    :type tipos: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param trace: Se True, registra cada troca de base (sem tableau) em ``resultado.trace``;
+        com 'resumo', também sem o teste da razão.
+    :type trace: bool or str
+    :param refatorar_a_cada: Número de atualizações eta entre refatorações.
+    :type refatorar_a_cada: int
+    :param base_inicial: Base final de uma resolução anterior; se ainda for
+        primal-factível, a Fase I é dispensada.
+    :type base_inicial: list[str] or None
+    :param precificacao: Regra de escolha da coluna que entra (nome ou instância; padrão: Dantzig).
+    :type precificacao: str or Precificacao or None
+    :param observador: Recebe o tempo de cada etapa e os eventos de pivô e de refatoração.
+    :type observador: ObservadorSimplex or None
+    :param orcamento: Iterações, tempo e cancelamento; esgotado, a resolução para com o
+        status correspondente e o ponto da base atual.
+    :type orcamento: OrcamentoSimplex or None
+    :rtype: ResultadoSimplex
+    """
+    inicio = time.perf_counter()
+    regra = criar_precificacao(precificacao)
+    c = np.asarray(c, dtype=float)
+    with (observador or SEM_OBSERVADOR).fase('montagem'):
+        problema = ProblemaPadrao(A, b, tipos)
+    passos = LogIteracoes(completo=trace != 'resumo') if trace else None
+    estatisticas = {}
+    simplex = None
+    if base_inicial is not None:
+        simplex = _simplex_partida_quente(problema, base_inicial, refatorar_a_cada, passos, regra, observador,
+                                          orcamento)
+        estatisticas['partida'] = 'quente' if simplex else 'fria'
+    partida_fria = simplex is None
+    if partida_fria:
+        simplex = SimplexRevisado(problema, refatorar_a_cada, passos, precificacao=regra, observador=observador,
+                                  orcamento=orcamento)
+    n_art = problema.num_colunas - problema.inicio_artificial
+
+    status = 'otimo'
+    iteracoes_fase1 = 0
+    if n_art and partida_fria:
+        # Fase I: minimizar a soma das artificiais
+        custo_fase1 = np.zeros(problema.num_colunas)
+        custo_fase1[problema.inicio_artificial:] = 1.0
+        status = simplex.otimizar(custo_fase1, np.ones(problema.num_colunas, dtype=bool), -1.0)
+        iteracoes_fase1 = simplex.iteracoes
+        if status == 'otimo':
+            if custo_fase1[simplex.base] @ simplex.x_base > TOL_FACTIBILIDADE:
+                status = 'infactivel'
+            else:
+                simplex.retirar_artificiais()
+
+    if status == 'otimo':
+        # Fase II: artificiais não voltam à base
+        custo = np.zeros(problema.num_colunas)
+        custo[:problema.num_vars] = -c if mode == 'max' else c
+        permitidas = np.ones(problema.num_colunas, dtype=bool)
+        permitidas[problema.inicio_artificial:] = False
+        status = simplex.otimizar(custo, permitidas, -1.0 if mode == 'max' else 1.0)
+
+    x = np.zeros(problema.num_vars)
+    estruturais = simplex.base < problema.num_vars
+    x[simplex.base[estruturais]] = simplex.x_base[estruturais]
+    return ResultadoSimplex(
+        status=status,
+        # Fora do ótimo, só o ponto de uma resolução interrompida tem Z significativo
+        z=float(c @ x) if status == 'otimo' or status in STATUS_INTERROMPIDO else None,
+        x=x,
+        base=[problema.nomes[j] for j in simplex.base],
+        iteracoes=simplex.iteracoes,
+        metodo='revisado',
+        modo=mode,
+        colunas=list(problema.nomes),
+        trace=passos,
+        estatisticas={
+            **estatisticas,
+            'iteracoes_fase1': iteracoes_fase1,
+            'refatoracoes': simplex.fatoracao.refatoracoes,
+            'precificacao': dict(regra.estatisticas),
+            **({'orcamento': orcamento.como_dict()} if orcamento is not None else {}),
+            'tempo_s': time.perf_counter() - inicio,
+        },
+    )
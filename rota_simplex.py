@@ -0,0 +1,323 @@
+"""
+Roteamento do modo automático pelo custo estimado de cada método, com base de crash.
+
+A regra fixa de :func:`nucleo_simplex.escolher_metodo` tem três saídas: Primal se
+a base de folgas é factível, Dual se a linha Z já é ótima e Duas Fases nos demais
+casos, com uma artificial por restrição '≥' ou '='. :func:`escolher_rota` estima,
+a partir da forma e do padrão de sinais do modelo, os pivôs e as operações de
+cada método aplicável e fica com o mais barato. Antes, tenta uma base de crash:
+cada linha que a folga não cobre recebe uma variável estrutural, escolhida de
+modo que a base fique triangular nessas linhas (:func:`base_crash`). Se a base for
+factível, a resolução a instala e vai direto ao Primal, sem Fase I::
+
+    rota = escolher_rota(c, A, b, tipos, 'min')
+    rota.metodo, rota.motivo, rota.economia()
+
+O registro da escolha (estimativas, rota da regra fixa e economia de pivôs) fica
+em ``resultado.estatisticas['rota']``.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from nucleo_simplex import _dual_factivel, _normalizar_restricoes, _rhs_nao_negativo, escolher_metodo
+
+ROTAS = ('primal', 'dual', 'crash', 'duas_fases')
+NOMES_ROTA = {
+    'primal': "Primal Simplex",
+    'dual': "Dual Simplex",
+    'crash': "Base de crash + Primal",
+    'duas_fases': "Duas Fases",
+}
+
+# Menor pivô aceito na base de crash, relativo ao maior elemento da coluna
+TOL_PIVO_CRASH = 0.01
+TOL_CRASH = 1e-9
+
+
+@dataclass
+class EstimativaRota:
+    """
+    Custo estimado de um método para um modelo.
+
+    :ivar metodo: Rota em :data:`ROTAS`.
+    :ivar aplicavel: Indica se o método pode partir da base que teria.
+    :ivar iteracoes: Pivôs estimados (na base de crash, incluindo os de instalação).
+    :ivar custo: Operações de ponto flutuante estimadas (pivôs × tamanho do quadro).
+    :ivar detalhe: Por que o método é ou não aplicável.
+    """
+    metodo: str
+    aplicavel: bool
+    iteracoes: float = np.inf
+    custo: float = np.inf
+    detalhe: str = ''
+
+
+@dataclass
+class RotaSimplex:
+    """
+    Rota escolhida pelo modo automático e as alternativas consideradas.
+
+    :ivar metodo: Rota escolhida (ver :data:`ROTAS`).
+    :ivar motivo: Motivo exibido ao usuário.
+    :ivar estimativas: Estimativa de cada rota, na ordem de :data:`ROTAS`.
+    :ivar regra_fixa: Método que a regra fixa de :func:`nucleo_simplex.escolher_metodo` escolheria.
+    :ivar base_crash: Base de crash factível (nomes no leiaute das Duas Fases), se houver.
+    """
+    metodo: str
+    motivo: str
+    estimativas: dict = field(default_factory=dict)
+    regra_fixa: str = None
+    base_crash: list = None
+
+    def economia(self):
+        """
+        Pivôs estimados que a rota escolhida poupa em relação a cada alternativa aplicável.
+
+        :rtype: dict[str, float]
+        """
+        escolhida = self.estimativas[self.metodo].iteracoes
+        return {metodo: est.iteracoes - escolhida for metodo, est in self.estimativas.items()
+                if est.aplicavel and metodo != self.metodo}
+
+    def como_dict(self):
+        """Rota, motivo, estimativas e economia, para ``resultado.estatisticas['rota']``."""
+        return {
+            'metodo': self.metodo,
+            'motivo': self.motivo,
+            'regra_fixa': self.regra_fixa,
+            'estimativas': {metodo: dict(vars(est)) for metodo, est in self.estimativas.items()},
+            'economia': self.economia(),
+        }
+
+
+def _folgas_apos(A, b, x, maiores, livres, passos):
+    """
+    Folgas das linhas ``livres`` depois do passo de cada coluna (uma coluna por candidata).
+
+    :return: Matriz linhas livres × colunas.
+    :rtype: np.ndarray
+    """
+    sinal = np.where(maiores[livres], -1.0, 1.0)[:, None]
+    passos = np.where(np.isfinite(passos), passos, 0.0)
+    return sinal * (b[livres] - A[livres] @ x)[:, None] - sinal * A[livres] * passos
+
+
+def _fixar_igualdades(A, b, tipos, ordem, superiores, escala, bem_condicionadas):
+    """
+    Torna básica em cada linha '=' (na ordem dada) uma estrutural com o valor que a fecha.
+
+    :return: Ponto, colunas bloqueadas e estrutural básica de cada linha fixada,
+        ou None se alguma igualdade não tiver candidata factível.
+    :rtype: tuple(np.ndarray, np.ndarray, dict) or None
+    """
+    n = A.shape[1]
+    maiores = tipos == '≥'
+    menores = tipos == '≤'
+    x = np.zeros(n)
+    bloqueadas = np.zeros(n, dtype=bool)
+    basica_da_linha = {}
+    for i in ordem:
+        residuo = b[i] - A[i] @ x
+        validas = ~bloqueadas & bem_condicionadas[i]
+        if abs(residuo) > TOL_CRASH:
+            validas &= np.sign(A[i]) == np.sign(residuo)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            passos = np.where(validas, residuo / A[i], np.inf)
+        validas &= passos <= superiores + TOL_CRASH
+        folgas = _folgas_apos(A, b, x, maiores, menores, passos)
+        validas &= np.all(folgas >= -TOL_CRASH, axis=0)
+        if not validas.any():
+            return None
+        # Entre os pivôs relativos próximos do maior (base bem condicionada), o que
+        # deixa mais folga na linha '≤' mais apertada entre as que a coluna ocupa
+        folga_minima = np.where(A[menores] != 0, folgas, np.inf).min(axis=0, initial=np.inf)
+        relativo = np.where(validas, np.abs(A[i]) / np.maximum(escala, TOL_CRASH), -1.0)
+        proximos = relativo >= 0.5 * relativo.max()
+        j = int(np.argmax(np.where(proximos, folga_minima, -np.inf)))
+        x[j] = max(passos[j], 0.0)
+        basica_da_linha[int(i)] = j
+        bloqueadas |= A[i] != 0
+    return x, bloqueadas, basica_da_linha
+
+
+def base_crash(A, b, tipos, superiores=None, custos=None):
+    """
+    Procura uma base factível triangular para o modelo com RHS não negativo.
+
+    As folgas cobrem as linhas '≤' e as '≥' já satisfeitas; cada linha restante
+    ('=' primeiro, depois as '≥' com déficit) recebe uma estrutural que ainda é
+    nula nas linhas já fixadas, o que mantém a base triangular e a torna não
+    singular. As igualdades são fixadas da de maior termo independente para a
+    menor (e, se a escolha gulosa emperrar, na ordem das linhas), cada uma pela
+    estrutural que deixa mais folga nas linhas '≤' entre as de pivô próximo do
+    maior. Em uma linha '≥', a estrutural sobe até satisfazer todas as linhas
+    '≥' pendentes que ela ajuda e fica básica na que exigiu o maior passo. Só são
+    candidatas as colunas de pivô bem condicionado cujo passo não deixa negativa
+    nenhuma folga já factível; delas, fica a que cobre mais linhas pendentes e,
+    no empate, a de menor custo.
+
+    :param A: Coeficientes das restrições, com ``b ≥ 0`` (ver :func:`nucleo_simplex._rhs_nao_negativo`).
+    :type A: np.ndarray
+    :param b: Termos independentes não negativos.
+    :type b: np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '=').
+    :type tipos: list[str]
+    :param superiores: Limite superior de cada variável de decisão (None se não houver).
+    :type superiores: np.ndarray or None
+    :param custos: Custos na convenção de minimização (c na minimização, -c na
+        maximização), usados no desempate; None os ignora.
+    :type custos: np.ndarray or None
+    :return: Nomes da base no leiaute de :func:`nucleo_simplex._build_tableau_artificial`
+        e número de estruturais nela, ou (None, 0) se o crash não encontrar base factível.
+    :rtype: tuple(list[str] or None, int)
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    tipos = np.asarray(tipos, dtype=object)
+    m, n = A.shape
+    superiores = np.full(n, np.inf) if superiores is None else np.asarray(superiores, dtype=float)
+    custos = np.zeros(n) if custos is None else np.asarray(custos, dtype=float)
+    maiores = tipos == '≥'
+    escala = np.abs(A).max(axis=0, initial=0.0)
+    bem_condicionadas = np.abs(A) >= np.maximum(TOL_PIVO_CRASH * escala, TOL_CRASH)
+    # Igualdades: maiores termos independentes primeiro; se a escolha gulosa
+    # emperrar, tenta de novo na ordem das linhas
+    igualdades = np.flatnonzero(tipos == '=')
+    decrescente = igualdades[np.argsort(-b[igualdades], kind='stable')]
+    inicio = _fixar_igualdades(A, b, tipos, decrescente, superiores, escala, bem_condicionadas)
+    if inicio is None and not np.array_equal(decrescente, igualdades):
+        inicio = _fixar_igualdades(A, b, tipos, igualdades, superiores, escala, bem_condicionadas)
+    if inicio is None:
+        return None, 0
+    x, bloqueadas, basica_da_linha = inicio
+
+    # '≥' com déficit: cobertura gulosa
+    while True:
+        deficit = np.where(maiores, b - A @ x, 0.0)
+        deficit[list(basica_da_linha)] = 0.0
+        pendentes = np.flatnonzero(deficit > TOL_CRASH)
+        if not len(pendentes):
+            break
+        ajudam = bem_condicionadas[pendentes] & (A[pendentes] > 0) & ~bloqueadas
+        with np.errstate(divide='ignore', invalid='ignore'):
+            passos_linha = np.where(ajudam, deficit[pendentes, None] / A[pendentes], -np.inf)
+        passos = passos_linha.max(axis=0)
+        cobertas = ajudam.sum(axis=0)
+        validas = (cobertas > 0) & (passos <= superiores + TOL_CRASH)
+        livres = (tipos != '=') & (deficit <= TOL_CRASH)
+        livres[list(basica_da_linha)] = False
+        validas &= np.all(_folgas_apos(A, b, x, maiores, livres, passos) >= -TOL_CRASH, axis=0)
+        if not validas.any():
+            return None, 0
+        # Mais linhas cobertas primeiro; no empate, o menor acréscimo de custo
+        acrescimo = np.where(validas, custos * np.where(validas, passos, 0.0), np.inf)
+        ordem = np.lexsort((acrescimo, -np.where(validas, cobertas, -1)))
+        j = int(ordem[0])
+        i = int(pendentes[np.argmax(passos_linha[:, j])])
+        x[j] += passos[j]
+        basica_da_linha[i] = j
+        bloqueadas |= A[i] != 0
+
+    folgas = np.where(maiores, A @ x - b, b - A @ x)
+    if np.any(folgas[tipos != '='] < -TOL_CRASH) or np.any(x > superiores + TOL_CRASH):
+        return None, 0
+
+    linhas_folga = np.flatnonzero(tipos != '=')
+    nome_folga = {int(i): f's{k+1}' for k, i in enumerate(linhas_folga)}
+    base = [f'x{basica_da_linha[i] + 1}' if i in basica_da_linha else nome_folga[i] for i in range(m)]
+    return base, len(basica_da_linha)
+
+
+def _pivos_fase(m, n):
+    """Pivôs típicos de uma fase do Simplex tableau a partir de uma base factível."""
+    return 0.5 * min(m, n) + 1.0
+
+
+def escolher_rota(c, A, b, tipos, mode='max', superiores=None, tentar_crash=True):
+    """
+    Estima o custo de cada método para o modelo e escolhe o mais barato.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: np.ndarray
+    :param A: Coeficientes das restrições (densos).
+    :type A: np.ndarray
+    :param b: Termos independentes.
+    :type b: np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '=').
+    :type tipos: list[str]
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param superiores: Limite superior de cada variável (None se não houver).
+    :type superiores: np.ndarray or None
+    :param tentar_crash: Procura a base de crash (dispensável quando há uma base salva para reaproveitar).
+    :type tentar_crash: bool
+    :rtype: RotaSimplex
+    """
+    A = np.asarray(A, dtype=float).reshape(len(b), len(c))
+    m, n = A.shape
+    regra_fixa, _ = escolher_metodo(c, A, b, tipos, mode)
+    tem_igualdade = '=' in tipos
+    estimativas = {}
+
+    # Primal e Dual partem da base de folgas do modelo com '≥' convertidas em '≤'
+    if tem_igualdade:
+        estimativas['primal'] = EstimativaRota('primal', False, detalhe="igualdades não têm folga")
+        estimativas['dual'] = EstimativaRota('dual', False, detalhe="igualdades não têm folga")
+    else:
+        _, b_norm, _ = _normalizar_restricoes(A, b, tipos)
+        violadas = int(np.count_nonzero(b_norm < 0))
+        tamanho = (m + 1) * (n + m)
+        if violadas == 0:
+            pivos = _pivos_fase(m, n)
+            estimativas['primal'] = EstimativaRota('primal', True, pivos, pivos * tamanho,
+                                                   "base de folgas factível")
+        else:
+            estimativas['primal'] = EstimativaRota('primal', False, detalhe=f"{violadas} folga(s) negativa(s)")
+        if violadas and _dual_factivel(c, mode):
+            pivos = 0.5 * violadas + 1.0
+            estimativas['dual'] = EstimativaRota('dual', True, pivos, pivos * tamanho,
+                                                 f"linha Z ótima, {violadas} linha(s) a corrigir")
+        else:
+            detalhe = "base de folgas já factível" if not violadas else "linha Z não é ótima"
+            estimativas['dual'] = EstimativaRota('dual', False, detalhe=detalhe)
+
+    # Crash e Duas Fases trabalham no leiaute com RHS não negativo
+    A_pos, b_pos, tipos_pos = _rhs_nao_negativo(A, b, tipos)
+    artificiais = sum(t != '≤' for t in tipos_pos)
+    folgas = sum(t != '=' for t in tipos_pos)
+    tamanho_fase2 = (m + 1) * (n + folgas)
+    custos = np.asarray(c, dtype=float) * (-1.0 if mode == 'max' else 1.0)
+    dual = estimativas['dual']
+    # Sem chance de vencer o Dual (mesmo instalando a base sem custo), o crash nem é tentado
+    inutil = dual.aplicavel and dual.custo <= (artificiais + _pivos_fase(m, n)) * tamanho_fase2
+    base, estruturais = None, 0
+    if artificiais and tentar_crash and not inutil:
+        base, estruturais = base_crash(A_pos, b_pos, tipos_pos, superiores, custos)
+    if base is not None:
+        # Instalação: um pivô por variável que entra no lugar de uma artificial
+        instalacao = artificiais
+        pivos = instalacao + _pivos_fase(m, n)
+        estimativas['crash'] = EstimativaRota('crash', True, pivos, pivos * tamanho_fase2,
+                                              f"{estruturais} estrutural(is) na base, sem artificiais")
+    else:
+        detalhe = ("não há artificiais" if artificiais == 0 else
+                   "base salva reaproveitada" if not tentar_crash else
+                   "o Dual é mais barato" if inutil else "crash sem base factível")
+        estimativas['crash'] = EstimativaRota('crash', False, detalhe=detalhe)
+    fase1 = 3.0 * artificiais
+    pivos = fase1 + _pivos_fase(m, n)
+    custo = fase1 * (m + 1) * (n + folgas + artificiais) + _pivos_fase(m, n) * tamanho_fase2
+    estimativas['duas_fases'] = EstimativaRota('duas_fases', True, pivos, custo,
+                                               f"Fase I com {artificiais} artificial(is)")
+
+    aplicaveis = [est for est in estimativas.values() if est.aplicavel]
+    escolhida = min(aplicaveis, key=lambda est: est.custo)
+    motivo = {
+        'primal': "Base de folgas factível",
+        'dual': "RHS negativo e Z ótimo",
+        'crash': f"Base de crash factível ({estruturais} estrutural(is), sem Fase I)",
+        'duas_fases': "Igualdades detectadas" if tem_igualdade else "Problema misto",
+    }[escolhida.metodo]
+    return RotaSimplex(escolhida.metodo, motivo, estimativas, regra_fixa,
+                       base if escolhida.metodo == 'crash' else None)
@@ -0,0 +1,332 @@
+"""
+Análise de sensibilidade (pós-otimização) a partir da base ótima.
+
+Com a base final de uma resolução, calcula sem novos pivôs os preços sombra das
+restrições, os custos reduzidos das variáveis e as faixas em que cada termo
+independente (b) e cada custo (c) podem variar, isoladamente, sem que a base
+deixe de ser ótima::
+
+    r = solve(c, A, b, tipos, sensibilidade=True)
+    r.sensibilidade.precos_sombra      # ∂z/∂b_i
+    r.sensibilidade.faixa_rhs          # [mínimo, máximo] de cada b_i
+
+A análise trabalha sobre o modelo original na forma ``A·x + s = b``, com uma
+variável lógica ``s_i`` por restrição (s ≥ 0 em '≤', s ≤ 0 em '≥' e s = 0 em '=').
+A base vem dos nomes de ``resultado.base``; quando eles não descrevem uma base do
+modelo original (presolve, limites como restrições no Simplex Revisado), ela é
+reconstruída a partir do vértice ótimo ``resultado.x`` e completada por pivôs
+degenerados até ser dual-factível.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from esparso_simplex import eh_esparsa, MatrizCSC
+from nucleo_simplex import _limites_variaveis
+
+TOL = 1e-9
+
+
+@dataclass
+class RelatorioSensibilidade:
+    """
+    Relatório de sensibilidade de uma solução ótima, no sentido original do problema.
+
+    :ivar precos_sombra: Variação de z por unidade de aumento em cada b_i.
+    :ivar folgas: Folga (≤) ou excesso (≥) de cada restrição; zero em restrições ativas.
+    :ivar faixa_rhs: Mínimo e máximo de cada b_i mantendo a base ótima (m x 2).
+    :ivar custos_reduzidos: c_j - yᵀa_j de cada variável de decisão.
+    :ivar faixa_custos: Mínimo e máximo de cada c_j mantendo a base ótima (n x 2).
+    :ivar basicas: Indica as variáveis de decisão básicas.
+    :ivar degenerada: Se alguma variável básica está no limite (as faixas podem ser unilaterais).
+    :ivar reconstruida: Se a base foi reconstruída a partir de ``x`` em vez de ``resultado.base``.
+    """
+    precos_sombra: np.ndarray
+    folgas: np.ndarray
+    faixa_rhs: np.ndarray
+    custos_reduzidos: np.ndarray
+    faixa_custos: np.ndarray
+    basicas: np.ndarray
+    degenerada: bool
+    reconstruida: bool
+
+    def como_dict(self):
+        """
+        Relatório serializável em JSON (limites infinitos viram None).
+
+        :rtype: dict
+        """
+        def lista(v):
+            return [None if not np.isfinite(a) else float(a) for a in np.ravel(v)]
+
+        return {
+            'precos_sombra': lista(self.precos_sombra),
+            'folgas': lista(self.folgas),
+            'faixa_rhs': [lista(par) for par in self.faixa_rhs],
+            'custos_reduzidos': lista(self.custos_reduzidos),
+            'faixa_custos': [lista(par) for par in self.faixa_custos],
+            'basicas': [bool(v) for v in self.basicas],
+            'degenerada': self.degenerada,
+            'reconstruida': self.reconstruida,
+        }
+
+
+class _FormaAumentada:
+    """
+    Modelo original na forma ``A·x + s = b``, com uma lógica ``s_i`` por restrição.
+
+    A lógica tem limites [0, ∞) em '≤', (-∞, 0] em '≥' e [0, 0] em '='; os custos
+    ficam no sentido de maximização (``custo = sinal·c``).
+    """
+
+    def __init__(self, c, A, b, tipos, mode, limites):
+        self.c = np.asarray(c, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.n, self.m = len(self.c), len(self.b)
+        if eh_esparsa(A):
+            A = MatrizCSC.converter(A, (self.m, self.n)).densa()
+        self.A = np.asarray(A, dtype=float).reshape(self.m, self.n)
+        self.tipos = np.asarray(['≤'] * self.m if tipos is None else list(tipos), dtype=object)
+        self.inferiores_x, superiores_x = _limites_variaveis(limites, self.n)
+        self.K = np.hstack([self.A, np.eye(self.m)])
+        self.inferiores = np.concatenate([self.inferiores_x, np.where(self.tipos == '≥', -np.inf, 0.0)])
+        self.superiores = np.concatenate([superiores_x, np.where(self.tipos == '≤', np.inf, 0.0)])
+        self.sinal = 1.0 if mode == 'max' else -1.0
+        self.custo = np.concatenate([self.sinal * self.c, np.zeros(self.m)])
+
+    def valores(self, x):
+        """Valores de x e das lógicas (s = b - A·x)."""
+        x = np.asarray(x, dtype=float)
+        return np.concatenate([x, self.b - self.A @ x])
+
+    def base_otima(self, resultado, valores):
+        """
+        Base ótima de ``[A | I]`` no vértice de ``resultado``: a do solver, se os nomes
+        a descreverem, ou uma reconstruída a partir de ``valores``.
+
+        :return: Base, multiplicadores y, custos reduzidos d e se a base foi reconstruída.
+        :rtype: tuple(list, np.ndarray, np.ndarray, bool)
+        """
+        K, m = self.K, self.m
+        base = None
+        if 'presolve' not in resultado.estatisticas and len(resultado.base) == m:
+            base = _base_dos_nomes(resultado.base, self.n, list(self.tipos), self.b - self.A @ self.inferiores_x)
+            if base is not None and (len(set(base)) != m or np.linalg.matrix_rank(K[:, base]) < m):
+                base = None
+        reconstruida = base is None
+        if reconstruida:
+            base = _base_do_ponto(K, valores, self.inferiores, self.superiores)
+        base, y, d = _reparar_base(K, self.custo, valores, self.inferiores, self.superiores, base,
+                                   max_pivos=10 * (self.n + m))
+        return base, y, d, reconstruida
+
+    def nomes(self, base):
+        """Nomes das colunas básicas: 'x' para as variáveis e 'f' para as lógicas."""
+        return [f'x{j+1}' if j < self.n else f'f{j - self.n + 1}' for j in base]
+
+
+def _base_dos_nomes(nomes, num_vars, tipos, b):
+    """
+    Traduz ``resultado.base`` para colunas de ``[A | I]``.
+
+    Nomes 'x' são colunas de A; 'f' (Primal/Dual), 's' e 'a' (Big M, Duas Fases e
+    Simplex Revisado) são a lógica da linha correspondente. As artificiais seguem
+    os tipos após a inversão das linhas com b < 0, como na montagem do tableau.
+
+    :return: Índices das colunas básicas, ou None se algum nome não corresponder.
+    :rtype: list[int] or None
+    """
+    inverso = {'≤': '≥', '≥': '≤', '=': '='}
+    invertidos = [inverso[t] if bi < 0 else t for t, bi in zip(tipos, b)]
+    linhas = {
+        'x': None,
+        'f': list(range(len(tipos))),
+        's': [i for i, t in enumerate(tipos) if t != '='],
+        'a': [i for i, t in enumerate(invertidos) if t != '≤'],
+    }
+    base = []
+    for nome in nomes:
+        prefixo, numero = nome[:1], nome[1:]
+        if prefixo not in linhas or not numero.isdigit():
+            return None
+        k = int(numero) - 1
+        if prefixo == 'x':
+            if k >= num_vars:
+                return None
+            base.append(k)
+        elif k < len(linhas[prefixo]):
+            base.append(num_vars + linhas[prefixo][k])
+        else:
+            return None
+    return base
+
+def _base_do_ponto(K, valores, inferiores, superiores):
+    """
+    Base que contém todas as colunas estritamente entre os limites, completada por lógicas.
+
+    A escolha é uma eliminação de Gauss-Jordan sobre as colunas candidatas: cada
+    uma entra se ainda tiver pivô em uma linha livre. As lógicas (e_i) completam
+    qualquer posto, de modo que a base resultante é sempre não singular.
+
+    :rtype: list[int]
+    """
+    m = K.shape[0]
+    livres = np.flatnonzero((valores > inferiores + TOL) & (valores < superiores - TOL))
+    candidatas = list(livres) + [K.shape[1] - m + i for i in range(m)]
+    base, linhas_pivo = [], []
+    vetores = np.zeros((0, m))
+    for j in candidatas:
+        if len(base) == m:
+            break
+        if j in base:
+            continue
+        coluna = K[:, j] - vetores.T @ K[linhas_pivo, j] if base else K[:, j].copy()
+        coluna[linhas_pivo] = 0.0
+        linha = int(np.argmax(np.abs(coluna)))
+        if abs(coluna[linha]) <= TOL:
+            continue
+        u = coluna / coluna[linha]
+        vetores -= np.outer(vetores[:, linha], u)
+        vetores = np.vstack([vetores, u])
+        base.append(j)
+        linhas_pivo.append(linha)
+    return base
+
+def _nao_basicas(valores, inferiores, superiores, base):
+    """
+    Situação das colunas não básicas: no limite inferior, no superior ou fixas.
+
+    :rtype: tuple(np.ndarray, np.ndarray)
+    """
+    nao_basica = np.ones(len(valores), dtype=bool)
+    nao_basica[base] = False
+    fixas = superiores - inferiores <= TOL
+    no_superior = nao_basica & ~fixas & (valores >= superiores - TOL) & np.isfinite(superiores)
+    no_inferior = nao_basica & ~fixas & ~no_superior
+    return no_inferior, no_superior
+
+def _reparar_base(K, custo, valores, inferiores, superiores, base, max_pivos):
+    """
+    Pivôs degenerados (regra de Bland) até que a base seja dual-factível no mesmo vértice.
+
+    :return: A base final e os multiplicadores y e custos reduzidos d dessa base.
+    :rtype: tuple(list, np.ndarray, np.ndarray)
+    """
+    base = list(base)
+    for _ in range(max_pivos):
+        B = K[:, base]
+        y = np.linalg.solve(B.T, custo[base])
+        d = custo - K.T @ y
+        no_inferior, no_superior = _nao_basicas(valores, inferiores, superiores, base)
+        violadas = np.flatnonzero((no_inferior & (d > TOL)) | (no_superior & (d < -TOL)))
+        if len(violadas) == 0:
+            return base, y, d
+        entra = int(violadas[0])
+        sentido = 1.0 if no_inferior[entra] else -1.0
+        # As básicas variam de -sentido·t·w; o passo é nulo nas que já estão no limite
+        variacao = -sentido * np.linalg.solve(B, K[:, entra])
+        x_base = valores[base]
+        bloqueiam = [(base[r], r) for r in range(len(base))
+                     if (variacao[r] < -TOL and x_base[r] <= inferiores[base[r]] + TOL)
+                     or (variacao[r] > TOL and x_base[r] >= superiores[base[r]] - TOL)]
+        if not bloqueiam:
+            break
+        base[min(bloqueiam)[1]] = entra
+    B = K[:, base]
+    y = np.linalg.solve(B.T, custo[base])
+    return base, y, custo - K.T @ y
+
+def _faixas(delta_por_unidade, folga_acima, folga_abaixo):
+    """
+    Maior intervalo [Δmin, Δmax] tal que folga_abaixo ≤ Δ·w ≤ folga_acima em cada linha.
+
+    :param delta_por_unidade: Matriz w (linhas: restrições do intervalo; colunas: parâmetros).
+    :type delta_por_unidade: np.ndarray
+    :param folga_acima: Quanto cada linha pode aumentar (≥ 0, pode ser ∞).
+    :type folga_acima: np.ndarray
+    :param folga_abaixo: Quanto cada linha pode diminuir (≤ 0, pode ser -∞).
+    :type folga_abaixo: np.ndarray
+    :rtype: tuple(np.ndarray, np.ndarray)
+    """
+    w = delta_por_unidade
+    positivos, negativos = w > TOL, w < -TOL
+    acima, abaixo = folga_acima[:, None], folga_abaixo[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        maximo = np.where(positivos, acima / w, np.where(negativos, abaixo / w, np.inf)).min(axis=0, initial=np.inf)
+        minimo = np.where(positivos, abaixo / w, np.where(negativos, acima / w, -np.inf)).max(axis=0,
+                                                                                               initial=-np.inf)
+    return np.minimum(minimo, 0.0), np.maximum(maximo, 0.0)
+
+def analisar_sensibilidade(c, A, b, tipos=None, mode='max', resultado=None, limites=None):
+    """
+    Calcula preços sombra, custos reduzidos e faixas de b e de c de uma solução ótima.
+
+    As faixas valem para um parâmetro por vez, com os demais fixos. Em bases
+    degeneradas, uma das extremidades pode coincidir com o valor atual.
+
+    :param c: Coeficientes da função objetivo.
+    :type c: list or np.ndarray
+    :param A: Coeficientes das restrições (densos ou esparsos; a análise usa a forma densa).
+    :type A: list or np.ndarray or MatrizCSC
+    :param b: Termos independentes.
+    :type b: list or np.ndarray
+    :param tipos: Tipos das restrições ('≤', '≥', '='). Se None, todas são '≤'.
+    :type tipos: list[str] or None
+    :param mode: 'max' ou 'min'.
+    :type mode: str
+    :param resultado: Resultado ótimo de :func:`nucleo_simplex.solve` para este modelo.
+    :type resultado: ResultadoSimplex
+    :param limites: Os mesmos limites das variáveis passados a :func:`solve`.
+    :type limites: list[tuple] or None
+    :rtype: RelatorioSensibilidade
+    :raises ValueError: Se o resultado não for ótimo.
+    """
+    if resultado is None or not resultado.otimo:
+        raise ValueError("A análise de sensibilidade exige uma solução ótima.")
+    forma = _FormaAumentada(c, A, b, tipos, mode, limites)
+    K, inferiores, superiores, sinal = forma.K, forma.inferiores, forma.superiores, forma.sinal
+    c, b, n = forma.c, forma.b, forma.n
+    valores = forma.valores(resultado.x)
+    base, y, d, reconstruida = forma.base_otima(resultado, valores)
+
+    B_inv = np.linalg.inv(K[:, base])
+    x_base = valores[base]
+    no_inferior, no_superior = _nao_basicas(valores, inferiores, superiores, base)
+
+    # Termos independentes: x_B + Δ·B⁻¹e_i deve respeitar os limites das básicas
+    delta_min, delta_max = _faixas(B_inv, superiores[base] - x_base, inferiores[base] - x_base)
+    faixa_rhs = np.column_stack([b + delta_min, b + delta_max])
+
+    # Custos: as não básicas só mudam o próprio custo reduzido; as básicas mudam os de todas
+    d_x = d[:n]
+    baixo = np.where(no_superior[:n], -d_x, -np.inf)
+    alto = np.where(no_inferior[:n], -d_x, np.inf)
+    posicao = {j: r for r, j in enumerate(base) if j < n}
+    if posicao:
+        linhas = np.array(list(posicao.values()))
+        tableau = B_inv[linhas] @ K    # linhas de B⁻¹[A | I] das básicas estruturais
+        # d_k(Δ) = d_k - Δ·α_k deve manter o sinal: ≤ 0 no inferior e ≥ 0 no superior
+        minimo, maximo = _faixas(-tableau.T, np.where(no_inferior, -d, np.inf), np.where(no_superior, -d, -np.inf))
+        colunas = np.array(list(posicao))
+        baixo[colunas], alto[colunas] = minimo, maximo
+    if sinal > 0:
+        faixa_custos = np.column_stack([c + baixo, c + alto])
+    else:
+        faixa_custos = np.column_stack([c - alto, c - baixo])
+
+    folgas = np.abs(valores[n:])
+    folgas[forma.tipos == '='] = 0.0
+    finitos = np.isfinite(inferiores[base]) | np.isfinite(superiores[base])
+    no_limite = (np.abs(x_base - inferiores[base]) <= TOL) | (np.abs(x_base - superiores[base]) <= TOL)
+    basicas = np.zeros(n, dtype=bool)
+    basicas[[j for j in base if j < n]] = True
+    return RelatorioSensibilidade(
+        precos_sombra=sinal * y + 0.0,
+        folgas=folgas,
+        faixa_rhs=faixa_rhs,
+        custos_reduzidos=sinal * d_x + 0.0,
+        faixa_custos=faixa_custos,
+        basicas=basicas,
+        degenerada=bool(np.any(finitos & no_limite)),
+        reconstruida=reconstruida,
+    )